@@ -1,14 +1,19 @@
 """
 ASV Benchmarks for Calculations
 """
+
 import copy
 import os.path
 import pathlib
 import pickle
 import tempfile
 
+import numpy as np
+import pandas as pd
+
 import power_balance.calc.efficiencies as pbm_eff
 import power_balance.profiles as pbm_prof
+import power_balance.screening as pbm_screen
 
 
 class EfficiencyCalcs:
@@ -65,3 +70,25 @@ class EfficiencyCalcs:
             del _args["average_profile"]
 
             pbm_eff.calc_heating_to_elec_eff(**_args)
+
+
+class ScreeningEvaluation:
+    pretty_name = "Steady-State Screening"
+    params = [1, 1000, 100000]
+    param_names = ["rows"]
+
+    def setup(self, rows):
+        _rng = np.random.default_rng(0)
+        self.evaluator = pbm_screen.ScreeningEvaluator()
+        self.table = pd.DataFrame(
+            {
+                "thermalpower": _rng.uniform(500, 2000, rows),
+                "powergenequations.powergenoutlettemp": _rng.uniform(400, 800, rows),
+                "tokamak.primarycoolanttype": _rng.choice(
+                    list(pbm_screen.POWER_GENERATION_MODELS), rows
+                ),
+            }
+        )
+
+    def time_evaluate(self, rows):
+        self.evaluator.evaluate(self.table)
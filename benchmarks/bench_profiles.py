@@ -1,12 +1,23 @@
 """
 ASV Benchmarks for Model Profile Input Generation
 """
+
 import glob
 import os.path
 import re
 import tempfile
 
+import numpy as np
+import pandas as pd
+import scipy.io as sio
+import toml
+
+import power_balance.configs as pbm_config
+import power_balance.core as pbm_core
 import power_balance.profiles as pbm_prof
+import power_balance.profiles.knots as pbm_knots
+import power_balance.profiles.timeseries as pbm_ts
+import power_balance.tuning as pbm_tuning
 
 
 class ProfileGeneration:
@@ -34,3 +45,91 @@ class ProfileToDataframe:
 
     def time_profile_to_dataframe(self):
         pbm_prof.read_profile_to_df(self.example_prof)
+
+
+class ProfileCompression:
+    pretty_name = "Profile Knot Compression"
+    params = list(pbm_prof.PROFILE_NAMES)
+    param_names = ["profile"]
+    prof_dir = tempfile.TemporaryDirectory()
+
+    def setup(self, profile):
+        pbm_prof.generate_all(self.prof_dir.name)
+        self.data = sio.loadmat(os.path.join(self.prof_dir.name, f"{profile}.mat"))[
+            "data"
+        ]
+
+    def time_compress(self, profile):
+        pbm_knots.compress(self.data)
+
+    def track_rows_retained(self, profile):
+        return len(pbm_knots.compress(self.data)) / len(self.data)
+
+
+class KnotProfileRead:
+    pretty_name = "Knot Profile Read"
+    prof_dir = tempfile.TemporaryDirectory()
+
+    def setup(self):
+        pbm_prof.generate_all(self.prof_dir.name, knots=True)
+        self.example_prof = os.path.join(self.prof_dir.name, "NBI_Heat.mat")
+
+    def time_knot_profile_read(self):
+        pbm_ts.clear_cache()
+        pbm_prof.read_profile_to_df(self.example_prof)
+
+
+def _profile_format_session(
+    profile_format: str, directory: str
+) -> pbm_core.PowerBalance:
+    _config = toml.load(pbm_config.config_default)
+    _config["profile_format"] = profile_format
+    _config["profiles_directory"] = os.path.join(directory, profile_format)
+    _config_file = os.path.join(directory, f"{profile_format}_config.toml")
+
+    with open(_config_file, "w") as out_f:
+        toml.dump(_config, out_f)
+
+    return pbm_core.PowerBalance(config=_config_file, no_browser=True)
+
+
+class ProfileFormatSimulation:
+    pretty_name = "Simulation with Dense and Knot Profiles"
+    params = ["dense", "knots"]
+    param_names = ["profile_format"]
+    timeout = 600
+
+    def setup_cache(self):
+        # The dense table simulation forms the reference for the accuracy
+        # of the knot table simulation
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _results = {}
+            for profile_format in self.params:
+                with _profile_format_session(profile_format, temp_dir) as session:
+                    _outputs = session._run_models()
+                    _results[profile_format] = pd.concat(
+                        {
+                            model: pbm_tuning.flat_top_averages(
+                                data, session.plasma_scenario
+                            )
+                            for model, data in _outputs.items()
+                        }
+                    )
+        return _results
+
+    def setup(self, results, profile_format):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session = _profile_format_session(profile_format, self.temp_dir.name)
+
+    def teardown(self, results, profile_format):
+        self.session.clear_cache()
+        self.temp_dir.cleanup()
+
+    def time_simulation(self, results, profile_format):
+        self.session._run_models()
+
+    def track_flat_top_error(self, results, profile_format):
+        _errors = pbm_tuning.compare_averages(results[profile_format], results["dense"])
+        return float(np.max(_errors))
+
+    track_flat_top_error.unit = "relative error"
@@ -0,0 +1,120 @@
+"""
+ASV Benchmarks for Sweep Result Access
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import power_balance.exceptions as pbm_exc
+import power_balance.results.dense as pbm_dense
+import power_balance.results.storage as pbm_storage
+import power_balance.results.sweep as pbm_sweep
+
+_N_TIME = 200
+_VARIABLES = [
+    "magnetpower",
+    "hcdsystem",
+    "cryogenicpower",
+    "wasteheatpower",
+    "netpowerconsumption",
+    "powergenerated",
+    "netpowergeneration",
+]
+
+
+def _sweep_frame(n_a: int, n_b: int) -> pd.DataFrame:
+    _time = np.linspace(0, 100, _N_TIME)
+    _frames = []
+    for a, b in itertools.product(range(n_a), range(n_b)):
+        _frame = pd.DataFrame(
+            np.random.random((_N_TIME, len(_VARIABLES))), columns=_VARIABLES
+        )
+        _frame["time"] = _time
+        _frame["param.a"] = float(a)
+        _frame["param.b"] = float(b)
+        _frames.append(_frame)
+    return pd.concat(_frames, ignore_index=True)
+
+
+class SweepCutSelection:
+    pretty_name = "Sweep cut selection (1000 cuts)"
+
+    def setup(self):
+        self._frame = _sweep_frame(40, 25)
+        self._cuts = [
+            {"param.a": float(a), "param.b": float(b)}
+            for a, b in itertools.product(range(40), range(25))
+        ]
+        self._dense = pbm_dense.DenseSweepResults.from_frame(
+            self._frame, ["param.a", "param.b"]
+        )
+
+    def time_boolean_filter(self):
+        for cut in self._cuts:
+            _frame = self._frame
+            for param, value in cut.items():
+                _frame = _frame[_frame[param] == value]
+
+    def time_sweep_index(self):
+        _index = pbm_sweep.SweepIndex(self._frame, ["param.a", "param.b"])
+        for cut in self._cuts:
+            _index.cut(cut)
+
+    def time_dense_cut(self):
+        for cut in self._cuts:
+            self._dense.cut(cut)
+
+    def peakmem_sweep_index(self):
+        _index = pbm_sweep.SweepIndex(self._frame, ["param.a", "param.b"])
+        for cut in self._cuts:
+            _index.cut(cut)
+
+
+class ResultStorage:
+    pretty_name = "Result storage back-ends (100 cuts)"
+    params = ["hdf5", "parquet", "zarr", "npz"]
+    param_names = ["format"]
+
+    def setup(self, storage_format):
+        try:
+            self._backend = pbm_storage.storage_backend({"format": storage_format})
+        except pbm_exc.InternalError:
+            raise NotImplementedError(f"{storage_format} storage not installed")
+        self._frame = _sweep_frame(10, 10)
+        self._parameters = ["param.a", "param.b"]
+        self._directory = tempfile.mkdtemp()
+        self._backend.write(self._directory, "model", self._frame, self._parameters)
+
+    def teardown(self, storage_format):
+        shutil.rmtree(self._directory)
+
+    def time_write(self, storage_format):
+        self._backend.write(self._directory, "model", self._frame, self._parameters)
+
+    def time_read_all(self, storage_format):
+        self._backend.read(self._directory, "model")
+
+    def time_read_cut(self, storage_format):
+        self._backend.read(
+            self._directory,
+            "model",
+            ["time", "netpowergeneration"],
+            [("param.a", "==", 5.0), ("param.b", "==", 5.0)],
+        )
+
+    def track_file_size(self, storage_format):
+        _path = self._backend.path(self._directory, "model")
+        if os.path.isfile(_path):
+            return os.path.getsize(_path)
+        return sum(
+            os.path.getsize(os.path.join(root, f))
+            for root, _, files in os.walk(_path)
+            for f in files
+        )
+
+    track_file_size.unit = "bytes"
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Power Balance Analysis
+======================
+
+Studies requiring many evaluations of scalar metrics of the model outputs,
+such as flat-top averages, across points in the parameter space of a PBM
+session.
+
+Contents
+========
+
+Submodules
+----------
+
+    evaluation - parallel, memoised evaluation of metrics at parameter points
+    optimisation - constrained optimisation of a metric over design variables
+    sensitivity - one-at-a-time and elementary effects sensitivity analysis
+    surrogate - surrogate models of metrics fitted to sweep results
+
+"""
+
+__date__ = "2026-10-19"
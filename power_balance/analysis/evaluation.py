@@ -0,0 +1,487 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Parallel Evaluation
+===================
+
+Evaluation of scalar metrics of the model outputs at many points in the
+parameter space of a PBM session. Each point is a mapping of parameter
+overrides, parameters absent from a point taking their value within the
+session parameter set.
+
+Points are evaluated by a pool of worker threads, each holding a private
+copy of the compiled model binaries and of the parameter set of the session
+so that the models are never recompiled and the parameter files read by each
+simulation executable are not shared. Workers simulate concurrently, each
+recording solver statistics to its own collection, merged into that of the
+session when the evaluator is closed, and timings to the session timer.
+
+Metric values are memoised for every point evaluated, the memo optionally
+being persisted to a JSON file so that repeated studies of the same session
+inputs, identified by the input manifest of the session, do not re-simulate
+points.
+
+Metrics are given as '<aggregation>(<output>)' where the output is a column
+of 'PowerBalance.get_power', optionally prefixed by the model name, e.g.
+'max(Tokamak.Interdependencies.netpowerconsumption)'. An output without an
+aggregation is averaged across the flat-top.
+
+Contents
+========
+
+Classes
+-------
+
+    EvaluationCache - memoised metric values of evaluated points
+    ParallelEvaluator - concurrent evaluation of metrics at parameter points
+
+Functions
+---------
+
+    point_key - canonical hash of a parameter point
+    parse_metric - split a metric into its aggregation and output
+    metric_value - evaluate a metric from the outputs of a simulation
+
+"""
+
+__date__ = "2026-10-19"
+
+import concurrent.futures
+import copy
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import tempfile
+import threading
+import typing
+
+import numpy as np
+import pandas as pd
+import pydelica.exception
+
+import power_balance.calc.summary as pbm_summary
+import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation.solver as pbm_solver
+import power_balance.pydelica_internals as pbm_pydelica
+import power_balance.results.manifest as pbm_manifest
+
+if typing.TYPE_CHECKING:
+    import power_balance.core
+
+# Column of an evaluation table giving how each point was evaluated
+STATUS_COLUMN = "status"
+
+# Failures of a single simulation which invalidate the point rather than
+# terminating the evaluation
+SIMULATION_ERRORS = (
+    pydelica.exception.OMExecutionError,
+    pydelica.exception.OMAssertionError,
+    ZeroDivisionError,
+    pbm_exc.InvalidInputError,
+)
+
+AGGREGATIONS: typing.Dict[
+    str, typing.Callable[[np.ndarray, np.ndarray, typing.Mapping[str, float]], float]
+] = {
+    "flat_top": lambda t, v, s: float(pbm_summary.flat_top_average(t, v, s)),
+    "max": lambda t, v, s: float(np.max(v)),
+    "min": lambda t, v, s: float(np.min(v)),
+    "mean": lambda t, v, s: float(np.mean(v)),
+}
+
+_METRIC_PATTERN = re.compile(r"^\s*(\w+)\s*\(\s*(.+?)\s*\)\s*$")
+
+
+def _canonical(value: typing.Any) -> typing.Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def point_key(point: typing.Mapping[str, typing.Any]) -> str:
+    """Canonical hash of a parameter point
+
+    Parameter names are case insensitive and numeric values compared by
+    value, such that '5' and '5.0' address the same point.
+
+    Parameters
+    ----------
+    point : typing.Mapping[str, typing.Any]
+        parameter values by name
+
+    Returns
+    -------
+    str
+        hexadecimal digest identifying the point
+    """
+    _point = {str(name).lower(): _canonical(value) for name, value in point.items()}
+    return hashlib.sha256(
+        json.dumps(_point, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def parse_metric(metric: str) -> typing.Tuple[str, str]:
+    """Split a metric into its aggregation and output
+
+    Parameters
+    ----------
+    metric : str
+        metric of the form '<aggregation>(<output>)' or '<output>'
+
+    Returns
+    -------
+    typing.Tuple[str, str]
+        aggregation and output name
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the aggregation is not recognised
+    """
+    if not (_match := _METRIC_PATTERN.match(metric)):
+        return "flat_top", metric.strip()
+
+    _aggregation, _output = _match.groups()
+
+    if _aggregation not in AGGREGATIONS:
+        raise pbm_exc.InvalidInputError(
+            f"Unrecognised aggregation '{_aggregation}' for metric '{metric}', "
+            f"options are: {', '.join(AGGREGATIONS)}"
+        )
+
+    return _aggregation, _output
+
+
+def metric_value(
+    metric: str,
+    outputs: typing.Mapping[str, pd.DataFrame],
+    plasma_scenario: typing.Mapping[str, float],
+) -> float:
+    """Evaluate a metric from the outputs of a simulation
+
+    Parameters
+    ----------
+    metric : str
+        metric of the form '<aggregation>(<output>)' or '<output>'
+    outputs : typing.Mapping[str, pd.DataFrame]
+        outputs of each model as returned by 'PowerBalance.get_power'
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario defining the flat-top
+
+    Returns
+    -------
+    float
+        value of the metric
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the output is not found within the outputs of any model
+    """
+    _aggregation, _output = parse_metric(metric)
+
+    _candidates = [
+        (data, _output[len(model) + 1 :].lower())
+        for model, data in outputs.items()
+        if _output.lower().startswith(f"{model.lower()}.")
+    ] or [(data, _output.lower()) for data in outputs.values()]
+
+    for data, column in _candidates:
+        if column in data.columns and column != "time":
+            return AGGREGATIONS[_aggregation](
+                data["time"].to_numpy(),
+                data[column].to_numpy(dtype=float),
+                plasma_scenario,
+            )
+
+    raise pbm_exc.InvalidInputError(
+        f"Cannot evaluate metric '{metric}', output '{_output}' not found in "
+        f"the outputs of models: {', '.join(outputs)}"
+    )
+
+
+class EvaluationCache:
+    """Memoised metric values of evaluated points"""
+
+    def __init__(self, context: str, file_name: typing.Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        context : str
+            identifier of the session configuration the points are relative
+            to, entries for other configurations being ignored
+        file_name : str, optional
+            JSON file from which entries are loaded and to which they are
+            saved, by default entries are held in memory only
+        """
+        self._context = context
+        self._file_name = file_name
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[str, typing.Dict[str, float]] = {}
+
+        if file_name and os.path.exists(file_name):
+            with open(file_name) as in_f:
+                self._entries = json.load(in_f)
+
+    def _key(self, point: typing.Mapping[str, typing.Any]) -> str:
+        return point_key({**point, "__context__": self._context})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, point: typing.Mapping[str, typing.Any], metrics: typing.Sequence[str]
+    ) -> typing.Optional[typing.Dict[str, float]]:
+        """Retrieve the metric values of a point if all have been evaluated
+
+        Parameters
+        ----------
+        point : typing.Mapping[str, typing.Any]
+            parameter values by name
+        metrics : typing.Sequence[str]
+            metrics required
+
+        Returns
+        -------
+        typing.Dict[str, float], optional
+            values of the requested metrics, None if any are absent
+        """
+        _entry = self._entries.get(self._key(point), {})
+
+        if not all(metric in _entry for metric in metrics):
+            return None
+
+        return {metric: _entry[metric] for metric in metrics}
+
+    def put(
+        self, point: typing.Mapping[str, typing.Any], values: typing.Mapping[str, float]
+    ) -> None:
+        """Record the metric values of a point
+
+        Parameters
+        ----------
+        point : typing.Mapping[str, typing.Any]
+            parameter values by name
+        values : typing.Mapping[str, float]
+            metric values
+        """
+        with self._lock:
+            self._entries.setdefault(self._key(point), {}).update(values)
+
+    def save(self) -> None:
+        """Write all entries to the cache file if one was given"""
+        if not self._file_name:
+            return
+
+        with self._lock, open(self._file_name, "w") as out_f:
+            json.dump(self._entries, out_f)
+
+
+class ParallelEvaluator:
+    """Concurrent, memoised evaluation of metrics at parameter points"""
+
+    def __init__(
+        self,
+        power_balance: "power_balance.core.PowerBalance",
+        metrics: typing.Sequence[str],
+        workers: int = 1,
+        cache_file: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        power_balance : power_balance.core.PowerBalance
+            session with the models already built, the parameter values of
+            which form the base for every point
+        metrics : typing.Sequence[str]
+            metrics to evaluate at each point
+        workers : int, optional
+            number of worker threads simulating concurrently, by default 1
+        cache_file : str, optional
+            JSON file in which evaluated points are memoised between
+            sessions, by default points are memoised for this evaluator only
+        """
+        self._logger = logging.getLogger("PowerBalance.Analysis")
+        self._power_balance = power_balance
+        self._metrics = list(metrics)
+        self._workers = max(workers, 1)
+        self._base_values: typing.Dict[str, typing.Any] = {}
+        self._replicas: "queue.Queue[power_balance.core.PowerBalance]" = queue.Queue()
+        self._n_replicas = 0
+        self._lock = threading.Lock()
+        self._directory: typing.Optional[tempfile.TemporaryDirectory] = None
+
+        for metric in self._metrics:
+            parse_metric(metric)
+
+        # Profiles and model sources are identified by their contents such
+        # that memoised points are discarded when either are modified
+        self._cache = EvaluationCache(
+            pbm_manifest.manifest_hash(power_balance.input_manifest()), cache_file
+        )
+
+    @property
+    def metrics(self) -> typing.List[str]:
+        """Metrics evaluated at each point"""
+        return list(self._metrics)
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *_, **__) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Save the cache, merge the solver statistics of the workers into
+        those of the session and remove the worker copies of the binaries"""
+        self._cache.save()
+
+        while not self._replicas.empty():
+            self._power_balance.solver_statistics.merge(
+                self._replicas.get_nowait().solver_statistics
+            )
+
+        if self._directory:
+            self._directory.cleanup()
+            self._directory = None
+            self._replicas = queue.Queue()
+            self._n_replicas = 0
+
+    def _replicate(self) -> "power_balance.core.PowerBalance":
+        with self._lock:
+            if not self._directory:
+                self._directory = tempfile.TemporaryDirectory()
+            _directory = os.path.join(self._directory.name, f"{self._n_replicas}")
+            self._n_replicas += 1
+
+        self._logger.debug("Creating evaluation worker in '%s'", _directory)
+
+        _worker = copy.copy(self._power_balance)
+        _worker.pydelica_session = pbm_pydelica.replicate_session(
+            self._power_balance.pydelica_session, _directory
+        )
+        _worker._parameter_set = copy.deepcopy(self._power_balance._parameter_set)
+        _worker.power_data = {}
+        _worker.solver_statistics = pbm_solver.SolverStatistics()
+
+        return _worker
+
+    def _acquire(self) -> "power_balance.core.PowerBalance":
+        try:
+            return self._replicas.get_nowait()
+        except queue.Empty:
+            return self._replicate()
+
+    def _simulate(
+        self, point: typing.Mapping[str, typing.Any]
+    ) -> typing.Tuple[typing.Dict[str, float], str]:
+        _worker = self._acquire()
+
+        try:
+            # Parameters overridden by any previous point are reset
+            for name, value in {**self._base_values, **point}.items():
+                _worker.set_parameter_value(name, value)
+
+            for model, entry in _worker._models_list.items():
+                if entry.binary_folder:
+                    _worker.set_model_parameters(model_name=model)
+
+            _outputs = _worker._run_models()
+
+            _values = {
+                metric: metric_value(
+                    metric, _outputs, self._power_balance.plasma_scenario
+                )
+                for metric in self._metrics
+            }
+        except SIMULATION_ERRORS as e:
+            return {metric: np.nan for metric in self._metrics}, (
+                f"{type(e).__name__}: {e}".splitlines()[0]
+            )
+        finally:
+            self._replicas.put(_worker)
+
+        self._cache.put(point, _values)
+
+        return _values, "simulated"
+
+    def evaluate(
+        self, points: typing.Sequence[typing.Mapping[str, typing.Any]]
+    ) -> pd.DataFrame:
+        """Evaluate the metrics at each point
+
+        Points already evaluated, including repeats within the given points,
+        are not re-simulated.
+
+        Parameters
+        ----------
+        points : typing.Sequence[typing.Mapping[str, typing.Any]]
+            parameter overrides for each point
+
+        Returns
+        -------
+        pd.DataFrame
+            the parameter overrides, metric values and status of each point,
+            failed simulations having NaN metric values
+
+        Raises
+        ------
+        power_balance.exceptions.UnidentifiedParameterError
+            if a parameter is not within the session parameter set
+        """
+        _points = [{str(k).lower(): v for k, v in point.items()} for point in points]
+
+        for name in set().union(*_points):
+            if name not in self._base_values:
+                self._base_values[name] = (
+                    self._power_balance._parameter_set.get_parameter(name)
+                )
+
+        _values: typing.List[typing.Optional[typing.Dict[str, float]]] = [
+            self._cache.get(point, self._metrics) for point in _points
+        ]
+        _status = ["cached" if value else "" for value in _values]
+
+        _pending: typing.Dict[str, typing.List[int]] = {}
+
+        for i, point in enumerate(_points):
+            if _values[i] is None:
+                _pending.setdefault(point_key(point), []).append(i)
+
+        self._logger.info(
+            "Evaluating %s points, %s to simulate using %s worker(s)",
+            len(_points),
+            len(_pending),
+            self._workers,
+        )
+
+        with concurrent.futures.ThreadPoolExecutor(self._workers) as executor:
+            _futures = {
+                executor.submit(self._simulate, _points[indices[0]]): indices
+                for indices in _pending.values()
+            }
+
+            for n, future in enumerate(concurrent.futures.as_completed(_futures), 1):
+                _result, _result_status = future.result()
+
+                for i in _futures[future]:
+                    _values[i] = _result
+                    _status[i] = _result_status
+
+                self._logger.info("Simulated point %s/%s", n, len(_futures))
+
+        self._cache.save()
+
+        _table = pd.DataFrame(_points, index=pd.RangeIndex(len(_points)))
+
+        for metric in self._metrics:
+            _table[metric] = [value[metric] for value in _values]
+
+        _table[STATUS_COLUMN] = _status
+
+        return _table
@@ -0,0 +1,411 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Design Optimisation
+===================
+
+Optimisation of a metric of the model outputs over a set of design
+variables chosen from the session parameters, subject to constraints on
+other metrics, e.g. maximising the flat-top net power generation while
+keeping the peak power consumption below a cap.
+
+Candidate designs are generated by differential evolution, each generation
+being evaluated as a single batch by a 'ParallelEvaluator' such that the
+members of a generation are simulated concurrently on copies of the
+compiled models and repeated designs are not re-simulated. Constraints are
+given as '<metric> <= <value>' or '<metric> >= <value>', designs for which
+the simulation fails being treated as infeasible.
+
+Every evaluated design is recorded in the optimisation history.
+
+Contents
+========
+
+Classes
+-------
+
+    Optimiser - differential evolution of designs evaluated in batches
+
+Functions
+---------
+
+    parse_constraint - split a constraint into its metric, sense and bound
+
+"""
+
+__date__ = "2026-10-19"
+
+import logging
+import re
+import typing
+
+import numpy as np
+import pandas as pd
+import scipy.optimize
+
+import power_balance.analysis.evaluation as pbm_eval
+import power_balance.analysis.sensitivity as pbm_sens
+import power_balance.exceptions as pbm_exc
+
+if typing.TYPE_CHECKING:
+    import power_balance.core
+
+SENSES: typing.Tuple[str, ...] = ("maximise", "minimise")
+
+# Key of the optimisation history within the session HDF5 file
+HISTORY_KEY = "optimisation"
+
+# Column of the history giving the generation in which a design was evaluated
+GENERATION_COLUMN = "generation"
+
+# Column of the history giving whether a design satisfies all constraints
+FEASIBLE_COLUMN = "feasible"
+
+_CONSTRAINT_PATTERN = re.compile(r"^\s*(.+?)\s*(<=|>=)\s*(\S+)\s*$")
+
+
+def parse_constraint(constraint: str) -> typing.Tuple[str, str, float]:
+    """Split a constraint into its metric, sense and bound
+
+    Parameters
+    ----------
+    constraint : str
+        constraint of the form '<metric> <= <value>' or '<metric> >= <value>'
+
+    Returns
+    -------
+    typing.Tuple[str, str, float]
+        metric, sense ('<=' or '>=') and bound
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the constraint is not of the expected form
+    """
+    _match = _CONSTRAINT_PATTERN.match(constraint)
+
+    try:
+        _metric, _sense, _bound = _match.groups()  # type: ignore
+        pbm_eval.parse_metric(_metric)
+        return _metric, _sense, float(_bound)
+    except (AttributeError, ValueError) as e:
+        raise pbm_exc.InvalidInputError(
+            f"Invalid constraint '{constraint}', expected the form "
+            "'<metric> <= <value>' or '<metric> >= <value>'"
+        ) from e
+
+
+class Optimiser:
+    """Differential evolution of designs evaluated in parallel batches"""
+
+    def __init__(
+        self,
+        power_balance: "power_balance.core.PowerBalance",
+        variables: typing.Union[
+            typing.Sequence[str],
+            typing.Mapping[str, typing.Optional[typing.Sequence[float]]],
+        ],
+        objective: str = "netpowergeneration",
+        sense: str = "maximise",
+        constraints: typing.Sequence[str] = (),
+        step: float = 0.1,
+        population: int = 5,
+        generations: int = 20,
+        tolerance: float = 1e-2,
+        seed: typing.Optional[int] = None,
+        workers: int = 1,
+        cache_file: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        power_balance : power_balance.core.PowerBalance
+            session with the models already built
+        variables : typing.Sequence[str] | typing.Mapping[str, typing.Sequence[float]]
+            design variables either as parameter names or as a mapping of
+            parameter names to lower and upper bounds, variables without
+            bounds being varied by the relative step
+        objective : str, optional
+            metric to optimise, by default the flat-top average of
+            'netpowergeneration'
+        sense : str, optional
+            'maximise' or 'minimise' the objective, by default 'maximise'
+        constraints : typing.Sequence[str], optional
+            constraints of the form '<metric> <= <value>'
+        step : float, optional
+            relative step either side of the parameter value defining the
+            bounds of variables given without bounds, by default 0.1
+        population : int, optional
+            population size as a multiple of the number of variables,
+            by default 5
+        generations : int, optional
+            maximum number of generations, by default 20
+        tolerance : float, optional
+            relative convergence tolerance of the population, by default 1E-2
+        seed : int, optional
+            seed of the random number generator
+        workers : int, optional
+            number of worker threads simulating concurrently, by default 1
+        cache_file : str, optional
+            JSON file memoising evaluated designs between sessions
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the sense is not recognised or a variable is not numeric
+        """
+        if sense not in SENSES:
+            raise pbm_exc.InvalidInputError(
+                f"Unrecognised objective sense '{sense}', "
+                f"options are: {', '.join(SENSES)}"
+            )
+
+        self._logger = logging.getLogger("PowerBalance.Optimisation")
+        self._power_balance = power_balance
+        self._objective = objective
+        self._sign = -1.0 if sense == "maximise" else 1.0
+        self._constraints = [parse_constraint(i) for i in constraints]
+        self._population = population
+        self._generations = generations
+        self._tolerance = tolerance
+        self._seed = seed
+        self._workers = workers
+        self._cache_file = cache_file
+
+        _bounds = (
+            {k.lower(): v for k, v in variables.items() if v is not None}
+            if isinstance(variables, typing.Mapping)
+            else {}
+        )
+
+        self._base: typing.Dict[str, typing.Any] = {}
+
+        for name in (i.lower() for i in variables):
+            self._base[name] = power_balance._parameter_set.get_parameter(name)
+
+            if not pbm_sens._is_numeric(self._base[name]):
+                raise pbm_exc.InvalidInputError(
+                    f"Design variable '{name}' is not numeric"
+                )
+
+        self._bounds = pbm_sens.parameter_bounds(self._base, step, _bounds)
+        self._history: typing.List[pd.DataFrame] = []
+        self._generation: typing.Dict[str, pd.Series] = {}
+        self._evaluator: typing.Optional[pbm_eval.ParallelEvaluator] = None
+
+    @property
+    def metrics(self) -> typing.List[str]:
+        """Objective followed by each distinct constrained metric"""
+        return list(
+            dict.fromkeys([self._objective, *(i[0] for i in self._constraints)])
+        )
+
+    @property
+    def bounds(self) -> typing.Dict[str, typing.Tuple[typing.Any, typing.Any]]:
+        """Lower and upper bound of each design variable"""
+        return dict(self._bounds)
+
+    def _points(self, x: np.ndarray) -> typing.List[typing.Dict[str, typing.Any]]:
+        return [
+            {
+                name: pbm_sens._cast(value, self._base[name])
+                for name, value in zip(self._bounds, column)
+            }
+            for column in np.atleast_2d(x.T)
+        ]
+
+    def _evaluate(self, x: np.ndarray) -> pd.DataFrame:
+        _points = self._points(x)
+        _keys = [pbm_eval.point_key(point) for point in _points]
+
+        # Constraints are evaluated for the whole generation and the
+        # objective for the feasible members only, of which there may be none
+        if not _points:
+            return self.history().iloc[:0]
+
+        if all(key in self._generation for key in _keys):
+            return pd.DataFrame([self._generation[key] for key in _keys])
+
+        if not self._evaluator:
+            raise pbm_exc.InternalError("Designs evaluated outside of optimisation")
+
+        _table = self._evaluator.evaluate(_points)
+        _table[FEASIBLE_COLUMN] = self.feasible(_table)
+        _table.insert(0, GENERATION_COLUMN, len(self._history))
+
+        self._history.append(_table)
+        self._generation = {key: row for key, (_, row) in zip(_keys, _table.iterrows())}
+
+        _feasible = _table[_table[FEASIBLE_COLUMN]]
+
+        self._logger.info(
+            "Generation %s: %s/%s feasible designs, best %s = %s",
+            len(self._history) - 1,
+            len(_feasible),
+            len(_table),
+            self._objective,
+            (self._sign * _feasible[self._objective]).min() * self._sign
+            if not _feasible.empty
+            else np.nan,
+        )
+
+        return _table
+
+    def feasible(self, table: pd.DataFrame) -> np.ndarray:
+        """Whether each evaluated design satisfies all constraints
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            metric values of each design
+
+        Returns
+        -------
+        np.ndarray
+            feasibility of each design, failed designs being infeasible
+        """
+        _feasible = table[self._objective].notna().to_numpy()
+
+        for metric, sense, bound in self._constraints:
+            _values = table[metric].to_numpy(dtype=float)
+            with np.errstate(invalid="ignore"):
+                _feasible &= _values <= bound if sense == "<=" else _values >= bound
+
+        return _feasible
+
+    def _objective_values(self, x: np.ndarray) -> np.ndarray:
+        _values = self._sign * self._evaluate(x)[self._objective].to_numpy(float)
+        return np.where(np.isnan(_values), np.inf, _values)
+
+    def _constraint_values(self, x: np.ndarray) -> np.ndarray:
+        # Normalised such that a constraint is satisfied for values <= 0
+        _table = self._evaluate(x)
+        _values = np.array(
+            [
+                _table[metric].to_numpy(float) - bound
+                if sense == "<="
+                else bound - _table[metric].to_numpy(float)
+                for metric, sense, bound in self._constraints
+            ]
+        )
+        return np.where(np.isnan(_values), np.inf, _values)
+
+    def run(self) -> typing.Dict[str, typing.Any]:
+        """Perform the optimisation
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            best feasible design found, the objective metric and its value,
+            whether any feasible design was found, the number of generations
+            and of designs simulated
+        """
+        self._history = []
+        self._generation = {}
+
+        self._logger.info(
+            "Optimising '%s' over %s variables subject to %s constraint(s)",
+            self._objective,
+            len(self._bounds),
+            len(self._constraints),
+        )
+
+        _constraints = (
+            [scipy.optimize.NonlinearConstraint(self._constraint_values, -np.inf, 0.0)]
+            if self._constraints
+            else ()
+        )
+
+        with pbm_eval.ParallelEvaluator(
+            self._power_balance, self.metrics, self._workers, self._cache_file
+        ) as self._evaluator:
+            _result = scipy.optimize.differential_evolution(
+                self._objective_values,
+                list(self._bounds.values()),
+                constraints=_constraints,
+                popsize=self._population,
+                maxiter=self._generations,
+                tol=self._tolerance,
+                rng=self._seed,
+                integrality=[pbm_sens._is_integer(v) for v in self._base.values()],
+                polish=False,
+                updating="deferred",
+                vectorized=True,
+            )
+
+        self._evaluator = None
+
+        self._logger.info("Optimisation finished: %s", _result.message)
+
+        return self.best(self.history()) | {
+            "metric": self._objective,
+            "message": _result.message,
+            "generations": len(self._history),
+            "simulations": int(
+                (self.history()[pbm_eval.STATUS_COLUMN] == "simulated").sum()
+            ),
+        }
+
+    def best(self, history: pd.DataFrame) -> typing.Dict[str, typing.Any]:
+        """Best feasible design within an optimisation history
+
+        Parameters
+        ----------
+        history : pd.DataFrame
+            evaluated designs as returned by 'history'
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            design variable values, objective value and whether the design
+            is feasible, the design with the best objective being returned
+            if no design satisfies all constraints
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if no design was successfully evaluated
+        """
+        _candidates = history[history[FEASIBLE_COLUMN]]
+
+        if _candidates.empty:
+            _candidates = history.dropna(subset=[self._objective])
+
+        if _candidates.empty:
+            raise pbm_exc.InvalidInputError(
+                "No design could be evaluated, all simulations failed"
+            )
+
+        _best = _candidates.loc[(self._sign * _candidates[self._objective]).idxmin()]
+
+        return {
+            "variables": {
+                name: _best[name].item()
+                if isinstance(_best[name], np.generic)
+                else _best[name]
+                for name in self._bounds
+            },
+            "objective": float(_best[self._objective]),
+            "feasible": bool(_best[FEASIBLE_COLUMN]),
+        }
+
+    def history(self) -> pd.DataFrame:
+        """Every design evaluated during the optimisation
+
+        Returns
+        -------
+        pd.DataFrame
+            the generation, design variable values, metric values,
+            feasibility and evaluation status of each design
+        """
+        if not self._history:
+            return pd.DataFrame(
+                columns=[
+                    GENERATION_COLUMN,
+                    *self._bounds,
+                    *self.metrics,
+                    pbm_eval.STATUS_COLUMN,
+                    FEASIBLE_COLUMN,
+                ]
+            )
+        return pd.concat(self._history, ignore_index=True)
@@ -0,0 +1,594 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Sensitivity Analysis
+====================
+
+Sensitivity of a scalar metric of the model outputs, such as the flat-top
+net power generation, to the modifiable parameters of a PBM session.
+
+Two methods are available:
+
+    oat - one-at-a-time central differences, each parameter being moved to
+          the lower and upper bounds of its range with all others at their
+          base values
+    morris - Morris elementary effects, the mean absolute effect of a step
+             in each parameter being evaluated along random trajectories
+             through a grid spanning the parameter ranges
+
+Unless given explicitly the range of each parameter is its base value
+plus or minus a relative step. Only numeric parameters with a non-zero base
+value are varied by default, integer parameters remaining integers.
+
+Contents
+========
+
+Classes
+-------
+
+    SensitivityAnalysis - ranked sensitivity of a metric to session parameters
+
+Functions
+---------
+
+    select_parameters - numeric parameters matching a set of patterns
+    parameter_bounds - range over which each parameter is varied
+    oat_points - points for a one-at-a-time analysis
+    oat_report - ranked one-at-a-time sensitivities
+    morris_points - random trajectories for an elementary effects analysis
+    morris_report - ranked elementary effect statistics
+    report_table - sensitivity report as a printable table
+    plot_tornado - tornado plot of a sensitivity report
+
+"""
+
+__date__ = "2026-10-19"
+
+import fnmatch
+import logging
+import typing
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import prettytable
+
+import power_balance.analysis.evaluation as pbm_eval
+import power_balance.exceptions as pbm_exc
+
+if typing.TYPE_CHECKING:
+    import power_balance.core
+
+METHODS: typing.Tuple[str, ...] = ("oat", "morris")
+
+OAT_COLUMNS: typing.List[str] = [
+    "parameter",
+    "base",
+    "low",
+    "high",
+    "metric_low",
+    "metric_high",
+    "swing",
+    "elasticity",
+]
+
+MORRIS_COLUMNS: typing.List[str] = [
+    "parameter",
+    "low",
+    "high",
+    "mu",
+    "mu_star",
+    "sigma",
+]
+
+# A step within a Morris trajectory, the indices of the points either side
+# of the step, the parameter moved and the signed step in the unit interval
+_MorrisStep = typing.Tuple[int, int, str, float]
+
+
+def _is_numeric(value: typing.Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def _is_integer(value: typing.Any) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def select_parameters(
+    parameters: typing.Mapping[str, typing.Any],
+    patterns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.List[str]:
+    """Numeric parameters with a non-zero value matching a set of patterns
+
+    Parameters
+    ----------
+    parameters : typing.Mapping[str, typing.Any]
+        parameter values by name
+    patterns : typing.Sequence[str], optional
+        parameter names or shell-style wildcard patterns, e.g.
+        'tokamak.interdependencies.magnetpower.*', by default all parameters
+
+    Returns
+    -------
+    typing.List[str]
+        matching parameter names
+    """
+    _patterns = [i.lower() for i in patterns or ["*"]]
+
+    return [
+        name
+        for name, value in parameters.items()
+        if _is_numeric(value)
+        and value != 0
+        and any(fnmatch.fnmatchcase(name.lower(), i) for i in _patterns)
+    ]
+
+
+def _cast(value: float, base: typing.Any) -> typing.Any:
+    return int(round(value)) if _is_integer(base) else float(value)
+
+
+def parameter_bounds(
+    base: typing.Mapping[str, typing.Any],
+    step: float = 0.1,
+    bounds: typing.Optional[typing.Mapping[str, typing.Sequence[float]]] = None,
+) -> typing.Dict[str, typing.Tuple[typing.Any, typing.Any]]:
+    """Range over which each parameter is varied
+
+    Integer parameters are moved by at least one either side of the base.
+
+    Parameters
+    ----------
+    base : typing.Mapping[str, typing.Any]
+        base value of each parameter to vary
+    step : float, optional
+        relative step either side of the base value, by default 0.1
+    bounds : typing.Mapping[str, typing.Sequence[float]], optional
+        explicit lower and upper bounds for any of the parameters
+
+    Returns
+    -------
+    typing.Dict[str, typing.Tuple[typing.Any, typing.Any]]
+        lower and upper bound of each parameter
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if a lower bound exceeds an upper bound
+    """
+    _bounds = {k.lower(): v for k, v in (bounds or {}).items()}
+    _ranges: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {}
+
+    for name, value in base.items():
+        if name.lower() in _bounds:
+            _low, _high = _bounds[name.lower()]
+        else:
+            _low, _high = sorted((value * (1 - step), value * (1 + step)))
+
+        _low, _high = _cast(_low, value), _cast(_high, value)
+
+        if _is_integer(value) and name.lower() not in _bounds:
+            _low, _high = min(_low, value - 1), max(_high, value + 1)
+
+        if _low > _high:
+            raise pbm_exc.InvalidInputError(
+                f"Lower bound {_low} exceeds upper bound {_high} for '{name}'"
+            )
+
+        _ranges[name] = (_low, _high)
+
+    return _ranges
+
+
+def oat_points(
+    bounds: typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Points for a one-at-a-time analysis
+
+    Parameters
+    ----------
+    bounds : typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]]
+        lower and upper bound of each parameter
+
+    Returns
+    -------
+    typing.List[typing.Dict[str, typing.Any]]
+        the base point followed by the lower and upper point of each
+        parameter in turn
+    """
+    _points: typing.List[typing.Dict[str, typing.Any]] = [{}]
+
+    for name, (low, high) in bounds.items():
+        _points.extend(({name: low}, {name: high}))
+
+    return _points
+
+
+def oat_report(
+    base: typing.Mapping[str, typing.Any],
+    bounds: typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]],
+    values: typing.Sequence[float],
+) -> pd.DataFrame:
+    """Ranked one-at-a-time sensitivities
+
+    Parameters
+    ----------
+    base : typing.Mapping[str, typing.Any]
+        base value of each parameter
+    bounds : typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]]
+        lower and upper bound of each parameter
+    values : typing.Sequence[float]
+        metric values at the points given by 'oat_points'
+
+    Returns
+    -------
+    pd.DataFrame
+        metric at the bounds of each parameter, the absolute difference
+        between these (swing) and the elasticity (relative change in the
+        metric per relative change in the parameter) ordered by swing
+    """
+    _values = np.asarray(values, dtype=float)
+    _base_value = _values[0]
+    _low_values, _high_values = _values[1::2], _values[2::2]
+
+    _report = pd.DataFrame(
+        {
+            "parameter": list(bounds),
+            "base": [base[name] for name in bounds],
+            "low": [low for low, _ in bounds.values()],
+            "high": [high for _, high in bounds.values()],
+            "metric_low": _low_values,
+            "metric_high": _high_values,
+        }
+    )
+
+    _report["swing"] = (_report["metric_high"] - _report["metric_low"]).abs()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _report["elasticity"] = (
+            (_report["metric_high"] - _report["metric_low"])
+            / (_report["high"] - _report["low"]).astype(float)
+            * _report["base"].astype(float)
+            / _base_value
+        )
+
+    _report = _report[OAT_COLUMNS]
+    _report.attrs["base_value"] = _base_value
+
+    return _report.sort_values(
+        "swing", ascending=False, kind="stable", na_position="last"
+    ).reset_index(drop=True)
+
+
+def morris_points(
+    bounds: typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]],
+    trajectories: int = 10,
+    levels: int = 4,
+    seed: typing.Optional[int] = None,
+) -> typing.Tuple[typing.List[typing.Dict[str, typing.Any]], typing.List[_MorrisStep]]:
+    """Random trajectories for an elementary effects analysis
+
+    Each trajectory starts at a random point of a grid of the given number
+    of levels spanning the range of every parameter, and moves each
+    parameter in turn, in random order, by a fixed step of 'levels /
+    (2 (levels - 1))' of its range. The number of levels must be even such
+    that every step lands on the grid within the range.
+
+    Parameters
+    ----------
+    bounds : typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]]
+        lower and upper bound of each parameter
+    trajectories : int, optional
+        number of trajectories, by default 10
+    levels : int, optional
+        number of grid levels, an even number, by default 4
+    seed : int, optional
+        seed of the random number generator
+
+    Returns
+    -------
+    typing.Tuple[typing.List[typing.Dict[str, typing.Any]], typing.List[_MorrisStep]]
+        the points of all trajectories and each step between them as the
+        indices of the points before and after, the parameter moved and the
+        signed step as a fraction of the parameter range
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if fewer than two levels or an odd number of levels are requested
+    """
+    if levels < 2 or levels % 2:
+        raise pbm_exc.InvalidInputError(
+            f"Elementary effects require an even number of levels, got {levels}"
+        )
+
+    _rng = np.random.default_rng(seed)
+    _names = list(bounds)
+    _delta = levels / (2 * (levels - 1))
+    _grid = np.linspace(0, 1, levels)
+
+    def _point(unit: np.ndarray) -> typing.Dict[str, typing.Any]:
+        return {
+            name: _cast(low + x * (high - low), low)
+            for name, (low, high), x in zip(_names, bounds.values(), unit)
+        }
+
+    _points: typing.List[typing.Dict[str, typing.Any]] = []
+    _steps: typing.List[_MorrisStep] = []
+
+    for _ in range(trajectories):
+        _unit = _rng.choice(_grid, len(_names))
+        _points.append(_point(_unit))
+
+        for i in _rng.permutation(len(_names)):
+            _step = _delta if _unit[i] + _delta <= 1 + 1e-12 else -_delta
+            _unit[i] += _step
+            _points.append(_point(_unit))
+            _steps.append((len(_points) - 2, len(_points) - 1, _names[i], _step))
+
+    return _points, _steps
+
+
+def morris_report(
+    bounds: typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]],
+    steps: typing.Sequence[_MorrisStep],
+    values: typing.Sequence[float],
+) -> pd.DataFrame:
+    """Ranked elementary effect statistics
+
+    Parameters
+    ----------
+    bounds : typing.Mapping[str, typing.Tuple[typing.Any, typing.Any]]
+        lower and upper bound of each parameter
+    steps : typing.Sequence[_MorrisStep]
+        steps as given by 'morris_points'
+    values : typing.Sequence[float]
+        metric values at the points given by 'morris_points'
+
+    Returns
+    -------
+    pd.DataFrame
+        mean (mu), mean absolute (mu_star) and standard deviation (sigma)
+        of the elementary effects of each parameter, being the change in
+        the metric per unit fraction of the parameter range, ordered by
+        mu_star
+    """
+    _values = np.asarray(values, dtype=float)
+    _effects: typing.Dict[str, typing.List[float]] = {name: [] for name in bounds}
+
+    for before, after, name, step in steps:
+        _effects[name].append((_values[after] - _values[before]) / step)
+
+    _report = pd.DataFrame(
+        {
+            "parameter": list(bounds),
+            "low": [low for low, _ in bounds.values()],
+            "high": [high for _, high in bounds.values()],
+            "mu": [np.mean(_effects[name]) for name in bounds],
+            "mu_star": [np.mean(np.abs(_effects[name])) for name in bounds],
+            "sigma": [
+                np.std(_effects[name], ddof=1) if len(_effects[name]) > 1 else np.nan
+                for name in bounds
+            ],
+        }
+    )
+
+    return (
+        _report[MORRIS_COLUMNS]
+        .sort_values("mu_star", ascending=False, kind="stable", na_position="last")
+        .reset_index(drop=True)
+    )
+
+
+def report_table(report: pd.DataFrame) -> str:
+    """Sensitivity report as a printable table
+
+    Parameters
+    ----------
+    report : pd.DataFrame
+        report as returned by 'oat_report' or 'morris_report'
+
+    Returns
+    -------
+    str
+        table of the ranked parameters
+    """
+    _table = prettytable.PrettyTable(["Rank", *report.columns])
+    _table.align["parameter"] = "l"
+
+    for rank, row in enumerate(report.itertuples(index=False), 1):
+        _table.add_row(
+            [
+                rank,
+                *(
+                    f"{value:.4g}" if isinstance(value, (float, np.floating)) else value
+                    for value in row
+                ),
+            ]
+        )
+
+    return f"{_table}"
+
+
+def plot_tornado(
+    report: pd.DataFrame,
+    file_name: str,
+    metric: str = "",
+    max_parameters: int = 20,
+) -> None:
+    """Tornado plot of a sensitivity report
+
+    For a one-at-a-time report each bar spans the change in the metric from
+    its base value at the lower and upper bound of the parameter, for an
+    elementary effects report each bar is the mean absolute effect with the
+    standard deviation as an error bar.
+
+    Parameters
+    ----------
+    report : pd.DataFrame
+        report as returned by 'oat_report' or 'morris_report'
+    file_name : str
+        output image file
+    metric : str, optional
+        metric label for the axis
+    max_parameters : int, optional
+        number of highest ranked parameters to show, by default 20
+    """
+    _report = report.head(max_parameters).iloc[::-1]
+    _labels = [name.split(".", 2)[-1] for name in _report["parameter"]]
+
+    plt.figure(figsize=(8, 1 + 0.35 * len(_report)))
+
+    if "swing" in _report:
+        _base_value = report.attrs.get("base_value", 0.0)
+        _low = _report["metric_low"] - _base_value
+        _high = _report["metric_high"] - _base_value
+        plt.barh(_labels, _low, color="tab:blue", label="Lower bound")
+        plt.barh(_labels, _high, color="tab:orange", label="Upper bound")
+        plt.axvline(0, color="k", linewidth=0.8)
+        plt.xlabel(f"Change in {metric}" if metric else "Change in metric")
+        plt.legend()
+    else:
+        plt.barh(_labels, _report["mu_star"], xerr=_report["sigma"], color="tab:blue")
+        plt.xlabel(f"Mean absolute effect on {metric}" if metric else "mu*")
+
+    plt.grid(axis="x")
+    plt.tight_layout()
+    plt.savefig(file_name)
+    plt.close()
+
+
+class SensitivityAnalysis:
+    """Ranked sensitivity of a metric to the parameters of a PBM session"""
+
+    def __init__(
+        self,
+        power_balance: "power_balance.core.PowerBalance",
+        metric: str = "netpowergeneration",
+        parameters: typing.Optional[typing.Sequence[str]] = None,
+        method: str = "oat",
+        step: float = 0.1,
+        bounds: typing.Optional[typing.Mapping[str, typing.Sequence[float]]] = None,
+        trajectories: int = 10,
+        levels: int = 4,
+        seed: typing.Optional[int] = None,
+        workers: int = 1,
+        cache_file: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        power_balance : power_balance.core.PowerBalance
+            session with the models already built
+        metric : str, optional
+            metric of the model outputs, by default the flat-top average of
+            'netpowergeneration'
+        parameters : typing.Sequence[str], optional
+            parameter names or wildcard patterns to vary, by default all
+            numeric parameters with a non-zero value
+        method : str, optional
+            'oat' for one-at-a-time or 'morris' for elementary effects,
+            by default 'oat'
+        step : float, optional
+            relative step either side of each base value defining the range
+            of parameters without explicit bounds, by default 0.1
+        bounds : typing.Mapping[str, typing.Sequence[float]], optional
+            explicit lower and upper bounds for any of the parameters,
+            parameters with bounds always being included
+        trajectories : int, optional
+            number of elementary effects trajectories, by default 10
+        levels : int, optional
+            number of elementary effects grid levels, by default 4
+        seed : int, optional
+            seed for the elementary effects trajectories
+        workers : int, optional
+            number of worker threads simulating concurrently, by default 1
+        cache_file : str, optional
+            JSON file memoising evaluated points between sessions
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the method is not recognised or no parameters are selected
+        """
+        if method not in METHODS:
+            raise pbm_exc.InvalidInputError(
+                f"Unrecognised sensitivity method '{method}', "
+                f"options are: {', '.join(METHODS)}"
+            )
+
+        self._logger = logging.getLogger("PowerBalance.Sensitivity")
+        self._power_balance = power_balance
+        self._metric = metric
+        self._method = method
+        self._trajectories = trajectories
+        self._levels = levels
+        self._seed = seed
+        self._workers = workers
+        self._cache_file = cache_file
+
+        _parameters = dict(power_balance._parameter_set.items())
+        _names = select_parameters(_parameters, parameters)
+        _names += [name.lower() for name in bounds or {} if name.lower() not in _names]
+
+        if not _names:
+            raise pbm_exc.InvalidInputError(
+                "No numeric parameters with non-zero values match the selection "
+                f"{', '.join(parameters or [])}"
+            )
+
+        self._base = {
+            name: power_balance._parameter_set.get_parameter(name) for name in _names
+        }
+        self._bounds = parameter_bounds(self._base, step, bounds)
+
+    @property
+    def metric(self) -> str:
+        """Metric for which sensitivities are evaluated"""
+        return self._metric
+
+    @property
+    def bounds(self) -> typing.Dict[str, typing.Tuple[typing.Any, typing.Any]]:
+        """Range over which each parameter is varied"""
+        return dict(self._bounds)
+
+    def run(self) -> pd.DataFrame:
+        """Evaluate the sensitivity of the metric to each parameter
+
+        Returns
+        -------
+        pd.DataFrame
+            report ranking the parameters from most to least influential,
+            as returned by 'oat_report' or 'morris_report'
+        """
+        if self._method == "oat":
+            _points = oat_points(self._bounds)
+        else:
+            _points, _steps = morris_points(
+                self._bounds, self._trajectories, self._levels, self._seed
+            )
+
+        self._logger.info(
+            "Performing '%s' sensitivity analysis of '%s' for %s parameters",
+            self._method,
+            self._metric,
+            len(self._bounds),
+        )
+
+        with pbm_eval.ParallelEvaluator(
+            self._power_balance, [self._metric], self._workers, self._cache_file
+        ) as evaluator:
+            _values = evaluator.evaluate(_points)[self._metric].to_numpy()
+
+        if self._method == "oat":
+            _report = oat_report(self._base, self._bounds, _values)
+        else:
+            _report = morris_report(self._bounds, _steps, _values)
+
+        _report.attrs.update(metric=self._metric, method=self._method)
+
+        return _report
@@ -0,0 +1,521 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Surrogate Models
+================
+
+Fast approximations of scalar metrics of the model outputs fitted to the
+results of a parameter sweep, allowing values between the sweep points to
+be estimated without further simulation.
+
+The training data contains a row for each sweep cut giving the values of
+the sweep parameters and of each metric, metrics being given as for
+'power_balance.analysis.evaluation'. Sweep parameters which are not numeric
+or which take a single value are not inputs of the surrogate. Inputs are
+scaled to the interval [-1, 1] spanned by the sweep before fitting one of:
+
+    rbf - radial basis function interpolant through the sweep points
+    gp - Gaussian process regression with a squared exponential kernel
+    polynomial - polynomial chaos expansion in Legendre polynomials
+
+The accuracy of the surrogate is estimated by k-fold cross-validation.
+Surrogates are saved as JSON containing the training data and options, the
+fit being repeated on loading.
+
+Contents
+========
+
+Classes
+-------
+
+    Surrogate - surrogate model of metrics fitted to sweep results
+
+Functions
+---------
+
+    training_data - evaluate metrics for every cut of a parameter sweep
+
+"""
+
+__date__ = "2026-10-19"
+
+import itertools
+import json
+import logging
+import typing
+
+import numpy as np
+import numpy.polynomial.legendre
+import pandas as pd
+import scipy.interpolate
+import scipy.linalg
+import scipy.optimize
+
+import power_balance.analysis.evaluation as pbm_eval
+import power_balance.exceptions as pbm_exc
+import power_balance.results.sweep as pbm_sweep
+
+# Name of the saved surrogate within the session data directory
+SURROGATE_FILE = "surrogate.json"
+
+CROSS_VALIDATION_COLUMNS: typing.List[str] = ["metric", "rmse", "nrmse", "max_error"]
+
+# Errors raised by a fit for which the training points are insufficient
+FIT_ERRORS = (ValueError, np.linalg.LinAlgError)
+
+
+class _RadialBasis:
+    """Radial basis function interpolant"""
+
+    def __init__(
+        self, kernel: str = "thin_plate_spline", smoothing: float = 0.0
+    ) -> None:
+        self._kernel = kernel
+        self._smoothing = smoothing
+        self._interpolator: typing.Optional[scipy.interpolate.RBFInterpolator] = None
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        self._interpolator = scipy.interpolate.RBFInterpolator(
+            x, y, kernel=self._kernel, smoothing=self._smoothing
+        )
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        return self._interpolator(x)  # type: ignore
+
+
+class _GaussianProcess:
+    """Gaussian process regression with an anisotropic squared exponential
+    kernel, hyperparameters maximising the marginal likelihood of each metric"""
+
+    # Bounds of the log length scales, signal and noise standard deviations
+    _BOUNDS = ((-4.0, 4.0), (-4.0, 4.0), (-12.0, 0.0))
+
+    def __init__(self) -> None:
+        self._x = np.empty((0, 0))
+        self._fits: typing.List[typing.Tuple[np.ndarray, np.ndarray, float, float]] = []
+
+    @staticmethod
+    def _kernel(x_1: np.ndarray, x_2: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        _scale = np.exp(theta[:-2])
+        _distance = ((x_1[:, None, :] - x_2[None, :, :]) / _scale) ** 2
+        return np.exp(2 * theta[-2]) * np.exp(-0.5 * _distance.sum(axis=-1))
+
+    def _factor(self, theta: np.ndarray) -> typing.Tuple[np.ndarray, bool]:
+        _covariance = self._kernel(self._x, self._x, theta)
+        _covariance[np.diag_indices_from(_covariance)] += np.exp(2 * theta[-1]) + 1e-10
+        return scipy.linalg.cho_factor(_covariance, lower=True)
+
+    def _negative_log_likelihood(self, theta: np.ndarray, y: np.ndarray) -> float:
+        try:
+            _factor = self._factor(theta)
+        except np.linalg.LinAlgError:
+            return np.inf
+        _alpha = scipy.linalg.cho_solve(_factor, y)
+        return float(0.5 * y @ _alpha + np.log(np.diag(_factor[0])).sum())
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        self._x = x
+        self._fits = []
+
+        _bounds = [self._BOUNDS[0]] * x.shape[1] + list(self._BOUNDS[1:])
+
+        for column in y.T:
+            _mean = float(np.mean(column))
+            _std = float(np.std(column)) or 1.0
+            _y = (column - _mean) / _std
+
+            _theta = scipy.optimize.minimize(
+                self._negative_log_likelihood,
+                np.array([0.0] * x.shape[1] + [0.0, -6.0]),
+                args=(_y,),
+                method="L-BFGS-B",
+                bounds=_bounds,
+            ).x
+
+            _alpha = scipy.linalg.cho_solve(self._factor(_theta), _y)
+            self._fits.append((_theta, _alpha, _mean, _std))
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        return np.column_stack(
+            [
+                self._kernel(x, self._x, theta) @ alpha * std + mean
+                for theta, alpha, mean, std in self._fits
+            ]
+        )
+
+
+class _Polynomial:
+    """Polynomial chaos expansion in products of Legendre polynomials up to a
+    total degree, fitted by least squares"""
+
+    def __init__(self, degree: int = 2) -> None:
+        self._degree = degree
+        self._terms: typing.List[typing.Tuple[int, ...]] = []
+        self._coefficients = np.empty((0, 0))
+
+    def _basis(self, x: np.ndarray) -> np.ndarray:
+        _legendre = [
+            [
+                numpy.polynomial.legendre.legval(x[:, j], np.eye(self._degree + 1)[d])
+                for d in range(self._degree + 1)
+            ]
+            for j in range(x.shape[1])
+        ]
+        return np.column_stack(
+            [
+                np.prod([_legendre[j][d] for j, d in enumerate(term)], axis=0)
+                for term in self._terms
+            ]
+        )
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        self._terms = [
+            term
+            for term in itertools.product(range(self._degree + 1), repeat=x.shape[1])
+            if sum(term) <= self._degree
+        ]
+
+        if len(self._terms) > len(x):
+            raise ValueError(
+                f"Polynomial of degree {self._degree} has {len(self._terms)} "
+                f"terms, more than the {len(x)} training points"
+            )
+
+        self._coefficients = np.linalg.lstsq(self._basis(x), y, rcond=None)[0]
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        return self._basis(x) @ self._coefficients
+
+
+METHODS: typing.Dict[str, typing.Callable[..., typing.Any]] = {
+    "rbf": _RadialBasis,
+    "gp": _GaussianProcess,
+    "polynomial": _Polynomial,
+}
+
+
+def training_data(
+    indexes: typing.Mapping[str, pbm_sweep.SweepIndex],
+    metrics: typing.Sequence[str],
+    plasma_scenario: typing.Mapping[str, float],
+) -> pd.DataFrame:
+    """Evaluate metrics for every cut of a parameter sweep
+
+    Parameters
+    ----------
+    indexes : typing.Mapping[str, power_balance.results.sweep.SweepIndex]
+        sweep index of the results of each model
+    metrics : typing.Sequence[str]
+        metrics of the form '<aggregation>(<output>)' or '<output>'
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario defining the flat-top
+
+    Returns
+    -------
+    pd.DataFrame
+        sweep parameter values and metric values for each cut
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the results are not those of a parameter sweep
+    """
+    if not indexes or not any(index.parameters for index in indexes.values()):
+        raise pbm_exc.InvalidInputError(
+            "Surrogate models require the results of a parameter sweep"
+        )
+
+    _reference = max(indexes.values(), key=lambda index: len(index.parameters))
+
+    return pd.DataFrame(
+        [
+            cut
+            | {
+                metric: pbm_eval.metric_value(
+                    metric,
+                    {model: index.cut(cut) for model, index in indexes.items()},
+                    plasma_scenario,
+                )
+                for metric in metrics
+            }
+            for cut in _reference.cuts
+        ]
+    )
+
+
+class Surrogate:
+    """Surrogate model of scalar metrics fitted to parameter sweep results"""
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        metrics: typing.Sequence[str],
+        method: str = "rbf",
+        folds: int = 5,
+        **options: typing.Any,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : pd.DataFrame
+            training data as returned by 'training_data', columns other
+            than the metrics being sweep parameter values
+        metrics : typing.Sequence[str]
+            metrics to approximate
+        method : str, optional
+            'rbf', 'gp' or 'polynomial', by default 'rbf'
+        folds : int, optional
+            number of cross-validation folds, by default 5, limited to
+            the number of training points
+        **options
+            options of the method, the kernel and smoothing of 'rbf' or
+            the total degree of 'polynomial'
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the method is not recognised, no sweep parameter varies or
+            the surrogate cannot be fitted to the training data
+        """
+        if method not in METHODS:
+            raise pbm_exc.InvalidInputError(
+                f"Unrecognised surrogate method '{method}', "
+                f"options are: {', '.join(METHODS)}"
+            )
+
+        self._logger = logging.getLogger("PowerBalance.Surrogate")
+        self._metrics = list(metrics)
+        self._method = method
+        self._folds = folds
+        self._options = options
+
+        _columns = [c for c in data.columns if c not in self._metrics]
+
+        self._inputs = [
+            c
+            for c in _columns
+            if pd.api.types.is_numeric_dtype(data[c])
+            and not pd.api.types.is_bool_dtype(data[c])
+            and data[c].nunique() > 1
+        ]
+
+        if _ignored := [c for c in _columns if c not in self._inputs]:
+            self._logger.warning(
+                "Sweep parameters '%s' are not inputs of the surrogate, "
+                "being non-numeric or taking a single value",
+                "', '".join(_ignored),
+            )
+
+        if not self._inputs:
+            raise pbm_exc.InvalidInputError(
+                "Cannot fit surrogate, no numeric sweep parameter takes more "
+                "than one value"
+            )
+
+        self._data = data[self._inputs + self._metrics].dropna().reset_index(drop=True)
+
+        if len(self._data) < len(data):
+            self._logger.warning(
+                "Excluding %s sweep cut(s) for which a metric could not be evaluated",
+                len(data) - len(self._data),
+            )
+
+        _x = self._data[self._inputs].to_numpy(dtype=float)
+        self._lower = _x.min(axis=0)
+        self._upper = _x.max(axis=0)
+
+        try:
+            self._model = self._fit(self._scale(_x), self._y())
+        except FIT_ERRORS as e:
+            raise pbm_exc.InvalidInputError(
+                f"Cannot fit '{method}' surrogate to {len(self._data)} sweep cuts: {e}"
+            ) from e
+
+        self._cross_validation: typing.Optional[pd.DataFrame] = None
+
+    @property
+    def inputs(self) -> typing.List[str]:
+        """Sweep parameters which are inputs of the surrogate"""
+        return list(self._inputs)
+
+    @property
+    def metrics(self) -> typing.List[str]:
+        """Metrics approximated by the surrogate"""
+        return list(self._metrics)
+
+    @property
+    def method(self) -> str:
+        """Method used to fit the surrogate"""
+        return self._method
+
+    @property
+    def bounds(self) -> typing.Dict[str, typing.Tuple[float, float]]:
+        """Lower and upper value of each input within the training data"""
+        return {
+            name: (float(low), float(high))
+            for name, low, high in zip(self._inputs, self._lower, self._upper)
+        }
+
+    def _scale(self, x: np.ndarray) -> np.ndarray:
+        return 2 * (x - self._lower) / (self._upper - self._lower) - 1
+
+    def _y(self) -> np.ndarray:
+        return self._data[self._metrics].to_numpy(dtype=float)
+
+    def _fit(self, x: np.ndarray, y: np.ndarray) -> typing.Any:
+        _model = METHODS[self._method](**self._options)
+        _model.fit(x, y)
+        return _model
+
+    @property
+    def cross_validation(self) -> pd.DataFrame:
+        """Root mean square, normalised root mean square and maximum absolute
+        error of each metric from k-fold cross-validation, the normalised
+        error being relative to the range of the metric within the sweep"""
+        if self._cross_validation is not None:
+            return self._cross_validation
+
+        _x = self._scale(self._data[self._inputs].to_numpy(dtype=float))
+        _y = self._y()
+        _predicted = np.full_like(_y, np.nan)
+
+        _folds = np.arange(len(_x)) % min(self._folds, len(_x))
+        np.random.default_rng(0).shuffle(_folds)
+
+        for fold in np.unique(_folds):
+            _train = _folds != fold
+            try:
+                _predicted[~_train] = self._fit(_x[_train], _y[_train]).predict(
+                    _x[~_train]
+                )
+            except FIT_ERRORS as e:
+                self._logger.warning("Cross-validation fold %s failed: %s", fold, e)
+
+        _errors = _predicted - _y
+        _range = np.ptp(_y, axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            _rmse = np.sqrt(np.mean(_errors**2, axis=0))
+            self._cross_validation = pd.DataFrame(
+                {
+                    "metric": self._metrics,
+                    "rmse": _rmse,
+                    "nrmse": np.where(_range > 0, _rmse / _range, np.nan),
+                    "max_error": np.max(np.abs(_errors), axis=0),
+                },
+                columns=CROSS_VALIDATION_COLUMNS,
+            )
+
+        return self._cross_validation
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """Evaluate the surrogate for an array of input values
+
+        Parameters
+        ----------
+        x : np.ndarray
+            values of the inputs in the order of 'inputs', one row per point
+
+        Returns
+        -------
+        np.ndarray
+            values of the metrics in the order of 'metrics', one row per point
+        """
+        return self._model.predict(self._scale(np.atleast_2d(x)))
+
+    def predict(
+        self,
+        points: typing.Union[
+            typing.Mapping[str, typing.Any],
+            typing.Sequence[typing.Mapping[str, typing.Any]],
+            pd.DataFrame,
+        ],
+    ) -> pd.DataFrame:
+        """Predict the metrics at new parameter points
+
+        Parameters
+        ----------
+        points : typing.Mapping[str, Any] | typing.Sequence[typing.Mapping[str, Any]] | pd.DataFrame
+            value of each input for one or more points
+
+        Returns
+        -------
+        pd.DataFrame
+            input values and predicted metric values of each point
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if a point does not give a value for every input
+        """
+        _points = pd.DataFrame(
+            [points] if isinstance(points, typing.Mapping) else points
+        ).rename(columns=str.lower)
+
+        if _missing := [i for i in self._inputs if i not in _points.columns]:
+            raise pbm_exc.InvalidInputError(
+                f"Cannot predict metrics, missing values for inputs: "
+                f"{', '.join(_missing)}"
+            )
+
+        _x = _points[self._inputs].to_numpy(dtype=float)
+
+        if np.any((_x < self._lower) | (_x > self._upper)):
+            self._logger.warning(
+                "Predicting outside of the sweep, the surrogate is extrapolating"
+            )
+
+        _table = _points[self._inputs].copy()
+        _table[self._metrics] = self.evaluate(_x)
+        return _table
+
+    def save(self, file_name: str) -> None:
+        """Save the surrogate training data and options to a JSON file
+
+        Parameters
+        ----------
+        file_name : str
+            output JSON file
+        """
+        with open(file_name, "w") as out_f:
+            json.dump(
+                {
+                    "method": self._method,
+                    "folds": self._folds,
+                    "options": self._options,
+                    "metrics": self._metrics,
+                    "data": self._data.to_dict(orient="list"),
+                    "cross_validation": self.cross_validation.to_dict(orient="list"),
+                },
+                out_f,
+                indent=2,
+            )
+
+    @classmethod
+    def load(cls, file_name: str) -> "Surrogate":
+        """Load a surrogate saved by 'save', fitting it to the saved data
+
+        Parameters
+        ----------
+        file_name : str
+            JSON file of a saved surrogate
+
+        Returns
+        -------
+        Surrogate
+            fitted surrogate
+        """
+        with open(file_name) as in_f:
+            _saved = json.load(in_f)
+
+        _surrogate = cls(
+            pd.DataFrame(_saved["data"]),
+            _saved["metrics"],
+            _saved["method"],
+            _saved["folds"],
+            **_saved["options"],
+        )
+        _surrogate._cross_validation = pd.DataFrame(
+            _saved["cross_validation"], columns=CROSS_VALIDATION_COLUMNS
+        )
+        return _surrogate
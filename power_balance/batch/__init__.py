@@ -0,0 +1,443 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Batch Runs
+==========
+
+Running of many PBM sessions, listed within a TOML manifest, which differ in
+their configuration, parameter, profile and plasma scenario inputs:
+
+    workers = 4
+
+    [[entries]]
+    name = "baseline"
+    config = "configs/baseline.toml"
+    param_dir = "parameters/baseline"
+    profiles_dir = "profiles/baseline"
+
+Relative paths are taken relative to the manifest. All entries are
+validated before any models are built. Entries are then grouped by the
+identity of their compiled models, given by the models run, the Modelica
+sources, the structural parameters and any templated PF magnets, such that
+the models of each group are built once. Each entry simulates a private
+copy of the binaries of its group, entries being run concurrently by a
+bounded pool of worker processes, as sessions record to the process wide
+timer, capture simulation output and plot using pyplot, none of which may
+be shared between concurrent sessions.
+
+A session directory is written for every entry alongside a table of the
+status of each entry and the combined steady-state summaries of all
+entries.
+
+Contents
+========
+
+Classes
+-------
+
+    BatchRunner - validates, groups and runs the entries of a manifest
+
+Functions
+---------
+
+    read_manifest - read and validate a batch manifest
+    compiled_model_identity - hash of the inputs determining the compiled models
+
+"""
+
+__date__ = "2026-10-19"
+
+import concurrent.futures
+import datetime
+import glob
+import hashlib
+import json
+import logging
+import os
+import time
+import typing
+
+import pandas as pd
+import pydantic
+import pydelica
+import toml
+
+import power_balance.calc.summary as pbm_summary
+import power_balance.configs as pbm_config
+import power_balance.core as pbm_core
+import power_balance.exceptions as pbm_exc
+import power_balance.modelica_templating.pfmagnets as pbm_pfmagnet_templates
+import power_balance.parameters as pbm_params
+import power_balance.pydelica_internals as pbm_pydelica
+import power_balance.validation.config as pbm_valid
+import power_balance.validation.manifest as pbm_manifest
+
+# Tables of the status of each entry and of the combined summaries
+BATCH_ENTRIES_FILE = "batch_entries.csv"
+BATCH_SUMMARY_FILE = "batch_summary.csv"
+
+ENTRY_COLUMNS: typing.List[str] = [
+    "entry",
+    "group",
+    "config",
+    "param_dir",
+    "profiles_dir",
+    "status",
+    "time",
+    "session_directory",
+]
+
+# Failures of the inputs of an entry found during validation
+_INPUT_ERRORS = (
+    FileNotFoundError,
+    AssertionError,
+    KeyError,
+    ValueError,
+    toml.TomlDecodeError,
+    pbm_exc.ValidationError,
+    pbm_exc.InvalidInputError,
+    pbm_exc.InvalidConfigurationError,
+    pbm_exc.UnidentifiedParameterError,
+)
+
+# Failures of the run of an entry, recorded rather than terminating the batch
+_RUN_ERRORS = (
+    *_INPUT_ERRORS,
+    OSError,
+    RuntimeError,
+    ZeroDivisionError,
+    pbm_exc.InternalError,
+    pydelica.exception.OMBuildError,
+    pydelica.exception.OMExecutionError,
+    pydelica.exception.OMAssertionError,
+    pydelica.exception.ResultRetrievalError,
+)
+
+
+def read_manifest(manifest_file: str) -> pbm_manifest.ManifestModel:
+    """Read and validate a batch manifest
+
+    Parameters
+    ----------
+    manifest_file : str
+        TOML manifest listing the batch entries
+
+    Returns
+    -------
+    power_balance.validation.manifest.ManifestModel
+        manifest with paths relative to the manifest made absolute
+
+    Raises
+    ------
+    FileNotFoundError
+        if the manifest does not exist
+    power_balance.exceptions.ValidationError
+        if the manifest is not valid
+    """
+    if not os.path.exists(manifest_file):
+        raise FileNotFoundError(f"Batch manifest '{manifest_file}' not found")
+
+    try:
+        _manifest = pbm_manifest.ManifestModel(**toml.load(manifest_file))
+    except pydantic.ValidationError as e:
+        raise pbm_exc.ValidationError(e.json(), "batch manifest") from e
+
+    _root = os.path.dirname(os.path.abspath(manifest_file))
+
+    for entry in _manifest.entries:
+        for key in ("config", "param_dir", "profiles_dir", "model_dir"):
+            if (_path := getattr(entry, key)) != "Default":
+                setattr(entry, key, os.path.join(_root, os.path.expanduser(_path)))
+
+    return _manifest
+
+
+def compiled_model_identity(
+    configuration: typing.Mapping[str, typing.Any],
+    parameter_set: pbm_params.PBMParameterSet,
+) -> str:
+    """Hash of the inputs determining the compiled models of a session
+
+    Parameters
+    ----------
+    configuration : typing.Mapping[str, Any]
+        validated session configuration
+    parameter_set : power_balance.parameters.PBMParameterSet
+        session parameter set
+
+    Returns
+    -------
+    str
+        hash identifying the compiled models
+    """
+    _hash = hashlib.sha256()
+
+    _model_dir = configuration["modelica_file_directory"]
+    _sources = sorted(glob.glob(os.path.join(_model_dir, "*.mo"))) + sorted(
+        glob.glob(os.path.join(_model_dir, "Resources", "Include", "*"))
+    )
+
+    for file_name in _sources:
+        _hash.update(os.path.relpath(file_name, _model_dir).encode())
+        with open(file_name, "rb") as in_f:
+            _hash.update(in_f.read())
+
+    # Additional PF magnets are templated into the Magnets model
+    try:
+        _pf_magnet_ids = pbm_pfmagnet_templates.get_pfmagnet_ids_from_params(
+            parameter_set
+        )
+    except pbm_exc.InvalidInputError:
+        _pf_magnet_ids = []
+
+    _hash.update(
+        json.dumps(
+            {
+                "models": sorted(configuration["models"]),
+                "structural": parameter_set.get_structural_parameters(),
+                "magnets": pbm_pfmagnet_templates.generate_pfmagnets(parameter_set)
+                if any(i > 6 for i in _pf_magnet_ids)
+                else "",
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+
+    return _hash.hexdigest()
+
+
+def _session(
+    entry: pbm_manifest.ManifestEntryModel,
+    compiled_session: typing.Optional[pydelica.Session] = None,
+) -> pbm_core.PowerBalance:
+    return pbm_core.PowerBalance(
+        config=entry.config,
+        no_browser=True,
+        parameter_directory=entry.param_dir,
+        profiles_directory=entry.profiles_dir,
+        modelica_file_dir=entry.model_dir,
+        compiled_session=compiled_session,
+    )
+
+
+def _run_entry(
+    entry: pbm_manifest.ManifestEntryModel,
+    group: str,
+    compiled_session: typing.Optional[pydelica.Session],
+    output_directory: str,
+) -> typing.Dict[str, typing.Any]:
+    """Run a single entry within a worker process"""
+    _logger = logging.getLogger("PowerBalance.Batch")
+    _record = {
+        "entry": entry.name,
+        "group": group,
+        "config": entry.config,
+        "param_dir": entry.param_dir,
+        "profiles_dir": entry.profiles_dir,
+        "status": "completed",
+        "time": 0.0,
+        "session_directory": "",
+    }
+
+    if not compiled_session:
+        _record["status"] = "failed: models could not be built"
+        return _record
+
+    _start = time.perf_counter()
+
+    # A failed entry is recorded rather than terminating the batch
+    try:
+        with _session(entry, compiled_session) as pbm_instance:
+            _directory = os.path.join(output_directory, entry.name)  # type: ignore
+            pbm_instance.run_simulation(_directory)
+            _record["session_directory"] = os.path.join(
+                _directory, f"pbm_results_{pbm_instance._time_stamp}"
+            )
+    except _RUN_ERRORS as e:
+        _logger.error("%s: Run failed: %s", entry.name, e)
+        _record["status"] = f"failed: {e}"
+
+    _record["time"] = time.perf_counter() - _start
+
+    _logger.info("%s: %s in %.1fs", entry.name, _record["status"], _record["time"])
+
+    return _record
+
+
+class BatchRunner:
+    """Validates, groups by compiled models and runs the entries of a manifest"""
+
+    def __init__(self, manifest_file: str, workers: typing.Optional[int] = None):
+        """
+        Parameters
+        ----------
+        manifest_file : str
+            TOML manifest listing the batch entries
+        workers : int, optional
+            number of sessions run concurrently, by default that of the
+            manifest
+        """
+        self._logger = logging.getLogger("PowerBalance.Batch")
+        self._manifest = read_manifest(manifest_file)
+        self._workers = workers or self._manifest.workers
+        self._groups: typing.Dict[
+            str, typing.List[pbm_manifest.ManifestEntryModel]
+        ] = {}
+
+        self.summary: typing.Optional[pd.DataFrame] = None
+
+    @property
+    def entries(self) -> typing.List[pbm_manifest.ManifestEntryModel]:
+        """Entries of the manifest"""
+        return list(self._manifest.entries)
+
+    def _identity(self, entry: pbm_manifest.ManifestEntryModel) -> str:
+        _configuration = pbm_config.read_options_from_config(entry.config)
+        _configuration["parameters_directory"] = entry.param_dir
+        _configuration["profiles_directory"] = entry.profiles_dir
+        _configuration["modelica_file_directory"] = entry.model_dir
+
+        try:
+            _configuration = pbm_valid.ConfigModel(**_configuration).model_dump()
+        except pydantic.ValidationError as e:
+            raise pbm_exc.ValidationError(e.json(), "session config") from e
+
+        return compiled_model_identity(
+            _configuration, pbm_params.PBMParameterSet(**_configuration)
+        )
+
+    def validate(self) -> typing.Dict[str, typing.List[str]]:
+        """Validate the inputs of every entry and group the entries by the
+        identity of their compiled models
+
+        Returns
+        -------
+        typing.Dict[str, typing.List[str]]
+            names of the entries within each group
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidConfigurationError
+            if the inputs of any entry are invalid
+        """
+        self._groups = {}
+        _failures: typing.List[str] = []
+
+        for entry in self._manifest.entries:
+            try:
+                _identity = self._identity(entry)
+            except _INPUT_ERRORS as e:
+                _failures.append(f"{entry.name}: {e}")
+                continue
+
+            self._groups.setdefault(_identity[:12], []).append(entry)
+
+        if _failures:
+            raise pbm_exc.InvalidConfigurationError(
+                "Batch validation failed for entries:\n" + "\n".join(_failures)
+            )
+
+        self._logger.info(
+            "Validated %s entries requiring %s model build(s)",
+            len(self._manifest.entries),
+            len(self._groups),
+        )
+
+        return {
+            group: [entry.name for entry in entries]  # type: ignore
+            for group, entries in self._groups.items()
+        }
+
+    def _combined_summary(self, entries: pd.DataFrame) -> pd.DataFrame:
+        _summaries = []
+
+        for entry, directory in entries[["entry", "session_directory"]].itertuples(
+            index=False
+        ):
+            _file = os.path.join(directory, "data", "session_data.h5")
+            if not directory or not os.path.exists(_file):
+                continue
+            try:
+                _summary = pd.read_hdf(_file, pbm_summary.SUMMARY_KEY)
+            except KeyError:
+                continue
+            _summary.insert(0, "entry", entry)  # type: ignore
+            _summaries.append(_summary)
+
+        if not _summaries:
+            return pd.DataFrame(columns=["entry", "category", "quantity", "value"])
+
+        return pd.concat(_summaries, ignore_index=True)
+
+    def run(self, output_directory: typing.Optional[str] = None) -> pd.DataFrame:
+        """Run every entry of the manifest
+
+        Parameters
+        ----------
+        output_directory : str, optional
+            directory in which to create the batch directory, by default the
+            current directory
+
+        Returns
+        -------
+        pd.DataFrame
+            group, status, run time and session directory of each entry
+        """
+        if not self._groups:
+            self.validate()
+
+        _batch_directory = os.path.join(
+            output_directory or os.getcwd(),
+            f"pbm_batch_{datetime.datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}",
+        )
+        os.makedirs(_batch_directory, exist_ok=True)
+
+        # The models of each group are built by a session which is never
+        # simulated, the parameter files alongside its binaries are hence
+        # unchanged when copied
+        _builders: typing.Dict[str, typing.Optional[pbm_core.PowerBalance]] = {}
+
+        for group, entries in self._groups.items():
+            self._logger.info(
+                "Building models for group '%s' of %s entries", group, len(entries)
+            )
+            try:
+                _builders[group] = _session(entries[0])
+            except (RuntimeError, pydelica.exception.OMBuildError) as e:
+                self._logger.error("Build for group '%s' failed: %s", group, e)
+                _builders[group] = None
+
+        _compiled = {
+            group: pbm_pydelica.detach_compiler(builder.pydelica_session)
+            if builder
+            else None
+            for group, builder in _builders.items()
+        }
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(self._workers) as executor:
+                _futures = [
+                    executor.submit(
+                        _run_entry, entry, group, _compiled[group], _batch_directory
+                    )
+                    for group, entries in self._groups.items()
+                    for entry in entries
+                ]
+                _records = [future.result() for future in _futures]
+        finally:
+            for builder in _builders.values():
+                if builder:
+                    builder.clear_cache()
+
+        _entries = pd.DataFrame(_records, columns=ENTRY_COLUMNS)
+        self.summary = self._combined_summary(_entries)
+
+        _entries.to_csv(os.path.join(_batch_directory, BATCH_ENTRIES_FILE), index=False)
+        self.summary.to_csv(
+            os.path.join(_batch_directory, BATCH_SUMMARY_FILE), index=False
+        )
+
+        self._logger.info("Batch outputs written to '%s'", _batch_directory)
+
+        return _entries
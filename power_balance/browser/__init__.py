@@ -4,7 +4,8 @@
 PBM Output Browser
 ==================
 
-Creation of webpage display of PBM simulation outputs from a session directory.
+Creation of webpage display of PBM simulation outputs from a session directory
+or session archive.
 
 Contents
 ========
@@ -18,25 +19,27 @@ Classes
 
 __date__ = "2021-06-10"
 
-import glob
 import logging
 import os
 import typing
 import webbrowser
 
-import numpy as np
 import pandas as pd
-import scipy.io as sio
-import toml
 from bokeh.resources import CDN
 
 import power_balance
 import power_balance.browser.html_templates as pbm_html
 import power_balance.calc as pbm_calc
 import power_balance.calc.efficiencies as pbm_effs
-import power_balance.exceptions as pbm_exc
+import power_balance.calc.summary as pbm_summary
+import power_balance.instrumentation as pbm_instr
+import power_balance.instrumentation.solver as pbm_solver
+import power_balance.plotting as pbm_plot
 import power_balance.plotting.profile_plotting as pbm_plt_prof
 import power_balance.plotting.result_plotting as pbm_plt_res
+import power_balance.profiles.timeseries as pbm_ts
+import power_balance.results as pbm_results
+import power_balance.results.archive as pbm_archive
 
 
 class PBMBrowser:
@@ -48,63 +51,56 @@ class PBMBrowser:
         Parameters
         ----------
         session_dir : str
-            directory containing session output data
+            directory or archive containing session output data
         """
         self._logger = logging.getLogger("PowerBalance.PBMBrowser")
         self._session_dir = session_dir
+        self._files = pbm_archive.open_session(session_dir)
         self._plugins = self._unpack_displays()
-        self._plot_html = os.path.join(session_dir, "html", "viewer.html")
-        self._setup: typing.Dict = {}
-        self._cuts: typing.Dict[str, typing.List[typing.Dict]] = {}
-        self._data = self._get_data()
+
+        # Pages for archived sessions are written outside of the archive
+        if isinstance(self._files, pbm_archive.SessionArchive):
+            self._html_dir = pbm_plot.viewer_directory(self._files.name)
+        else:
+            self._html_dir = os.path.join(session_dir, "html")
+
+        self._plot_html = os.path.join(self._html_dir, "viewer.html")
+        self._load_session()
 
     def _unpack_displays(self) -> typing.Dict[str, str]:
-        _display_files = glob.glob(
-            os.path.join(self._session_dir, "plugin_displays", "plugin_*")
-        )
+        _display_files = self._files.glob("plugin_displays/plugin_*")
         return {
             os.path.splitext(os.path.basename(i))[0]
             .replace("plugin_", "")
-            .replace("_", " "): open(i).read()
+            .replace("_", " "): self._files.read_text(i)
             for i in _display_files
         }
 
-    def _get_data(self) -> typing.Dict[str, pd.DataFrame]:
-        """Retrieve all data from the session directory."""
-        self._configuration = toml.load(
-            os.path.join(self._session_dir, "configs", "configuration.toml")
-        )
-
-        _toml_files = glob.glob(os.path.join(self._session_dir, "parameters", "*.toml"))
-
-        _toml_dicts: typing.Dict[str, typing.MutableMapping] = {
-            os.path.basename(os.path.splitext(f)[0]): toml.load(f) for f in _toml_files
-        }
-
-        _dict_labels = _toml_dicts.keys()
-
-        _setup_keys = [
-            "startTime",
-            "stopTime",
-            "solver",
-            "stepSize",
-            "tolerance",
-        ]
+    @pbm_instr.timed("browser_load")
+    def _load_session(self) -> None:
+        """Open the session, model outputs being read when displayed"""
+        self._session = pbm_results.Session(self._session_dir)
+        self._profiles_dir = self._files.local_path("profiles")
+        self._configuration = self._session.configuration
+        self._setup: typing.Dict = self._session.simulation_options
+        self._parameters = self._session.parameters
 
-        for param_dict in _dict_labels:
-            if any(i in _toml_dicts[param_dict] for i in _setup_keys):
-                self._setup = dict(_toml_dicts[param_dict])
-                del _toml_dicts[param_dict]
-                break
+    def _summary_data(self, model: str) -> pd.DataFrame:
+        """Retrieve the outputs used for efficiency and steady-state summaries
 
-        self._parameters = _toml_dicts
+        For a parameter sweep the summaries are calculated from the first cut.
 
-        _dataframe_keys = self._configuration["models"]
-        _dataframe_keys = [i.lower().replace(".", "_") for i in _dataframe_keys]
-
-        _h5_file = glob.glob(os.path.join(self._session_dir, "data", "*.h5"))[0]
+        Parameters
+        ----------
+        model : str
+            key for the model within the session data
 
-        return {i: pd.read_hdf(_h5_file, key=i) for i in _dataframe_keys}
+        Returns
+        -------
+        pd.DataFrame
+            model outputs for a single run
+        """
+        return self._session.cut(model)
 
     def _create_efficiencies(
         self, plasma_scenario: dict
@@ -123,40 +119,41 @@ class PBMBrowser:
 
         _root_model: str = "Tokamak.Interdependencies"
 
-        if "tokamak_interdependencies" in self._data:
+        if "tokamak_interdependencies" in self._session.models:
+            _data = self._summary_data("tokamak_interdependencies")
             _efficiencies[_root_model] = {
                 "Thermal to Electric": pbm_effs.calc_thermal_to_elec_eff(
-                    os.path.join(self._session_dir, "profiles", "ThermalPowerOut.mat"),
-                    self._data["tokamak_interdependencies"]["time"],
-                    self._data["tokamak_interdependencies"]["powergenerated"],
+                    os.path.join(self._profiles_dir, "ThermalPowerOut.mat"),
+                    _data["time"].to_numpy(),
+                    _data["powergenerated"].to_numpy(),
                     plasma_scenario,
                 )
             }
 
-            rf_profile = os.path.join(self._session_dir, "profiles", "RF_Heat.mat")
-            nbi_profile = os.path.join(self._session_dir, "profiles", "NBI_Heat.mat")
+            rf_profile = os.path.join(self._profiles_dir, "RF_Heat.mat")
+            nbi_profile = os.path.join(self._profiles_dir, "NBI_Heat.mat")
 
             if (
                 os.path.exists(rf_profile)
-                and max(sio.loadmat(rf_profile)["data"][:, 1]) != 0.0
+                and max(pbm_ts.read_profile(rf_profile).values) != 0.0
             ):
                 _efficiencies[_root_model]["RF to Electric"] = (
                     pbm_effs.calc_heating_to_elec_eff(
-                        os.path.join(self._session_dir, "profiles", "RF_Heat.mat"),
-                        self._data["tokamak_interdependencies"]["time"],
-                        self._data["tokamak_interdependencies"]["hcdsystem"],
+                        os.path.join(self._profiles_dir, "RF_Heat.mat"),
+                        _data["time"].to_numpy(),
+                        _data["hcdsystem"].to_numpy(),
                         plasma_scenario,
                     )
                 )
             if (
                 os.path.exists(nbi_profile)
-                and max(sio.loadmat(nbi_profile)["data"][:, 1]) != 0.0
+                and max(pbm_ts.read_profile(nbi_profile).values) != 0.0
             ):
                 _efficiencies[_root_model]["NBI to Electric"] = (
                     pbm_effs.calc_heating_to_elec_eff(
-                        os.path.join(self._session_dir, "profiles", "NBI_Heat.mat"),
-                        self._data["tokamak_interdependencies"]["time"],
-                        self._data["tokamak_interdependencies"]["hcdsystem"],
+                        os.path.join(self._profiles_dir, "NBI_Heat.mat"),
+                        _data["time"].to_numpy(),
+                        _data["hcdsystem"].to_numpy(),
                         plasma_scenario,
                     )
                 )
@@ -174,55 +171,20 @@ class PBMBrowser:
         typing.Dict[str, float]
             dictionary of steady-state values
         """
-        averages = {}
-
-        if "tokamak_interdependencies" in self._data:
-            flat_top_start = np.asarray(
-                self._data["tokamak_interdependencies"]["time"]
-                == plasma_scenario["plasma_flat_top_start"]
-            ).nonzero()[0][0]
-            flat_top_end = np.asarray(
-                self._data["tokamak_interdependencies"]["time"]
-                == plasma_scenario["plasma_flat_top_end"]
-            ).nonzero()[0][0]
-
-            thermal_in_profile = os.path.join(
-                self._session_dir, "profiles", "ThermalPowerOut.mat"
+        averages: typing.Dict[str, float] = {}
+
+        if "tokamak_interdependencies" in self._session.models:
+            _summary = pbm_summary.summarise_frame(
+                self._summary_data("tokamak_interdependencies"),
+                [],
+                self._profiles_dir,
+                plasma_scenario,
             )
-            if not os.path.exists(thermal_in_profile):
-                raise pbm_exc.InvalidInputError(
-                    f"Cannot load thermal power profile from '{thermal_in_profile}', "
-                    "file not found"
-                )
-
-            var_dict = {
-                "Average Magnet Systems Electricity Consumption (MW)": "magnetpower",
-                "Average Heating and Current Drive Electricity Consumption (MW)": "hcdsystem",
-                "Average Cryogenic System Electricity Consumption (MW)": "cryogenicpower",
-                "Average Waste Heat Electricity Consumption (MW)": "wasteheatpower",
-                "Average Coolant Detritiation Electricity Consumption (MW)": "coolantdetritpower",
-                "Average Blanket Detritiation Electricity Consumption (MW)": "blanketdetritpower",
-                "Average Air-Gas Detritiation Electricity Consumption (MW)": "air_gas_power",
-                "Average Water Detritiation Electricity Consumption (MW)": "water_detrit_power",
-                "Average Vacuum Pump Electricity Consumption (MW)": "total_vacuumpump_power",
-                "Average Total Electrical Power Consumption (MW)": "netpowerconsumption",
-                "Average Electrical Power Generation (MW)": "powergenerated",
-                "Average Net Electrical Power Output (MW)": "netpowergeneration",
-            }
+            _summary = _summary[_summary["category"] == "average"]
+            averages = dict(zip(_summary["quantity"], _summary["value"]))
 
-            for var, value in var_dict.items():
-                try:
-                    averages[var] = (
-                        np.average(
-                            self._data["tokamak_interdependencies"][var_dict[var]][
-                                int(flat_top_start * 1.1) : int(
-                                    flat_top_end - flat_top_start * 0.1
-                                )
-                            ]
-                        )
-                        / 1e6
-                    )
-                except KeyError:
+            for var, value in pbm_summary.STEADY_STATE_VARIABLES.items():
+                if var not in averages:
                     self._logger.warning(
                         "\nModel output key not found: '%s'."
                         "It corresponds to data set named '%s'; this is most likely because a model has been removed.",
@@ -230,20 +192,34 @@ class PBMBrowser:
                         value,
                     )
 
-            thermal_time = sio.loadmat(thermal_in_profile)["data"][:, 0]
-            thermal_data = sio.loadmat(thermal_in_profile)["data"][:, 1]
-            flat_top_start_thermal = np.asarray(
-                thermal_time == plasma_scenario["plasma_flat_top_start"]
-            ).nonzero()[0][0]
-            flat_top_end_thermal = np.asarray(
-                thermal_time == plasma_scenario["plasma_flat_top_end"]
-            ).nonzero()[0][0]
-            averages["Average Plasma Thermal Power Generation (MW)"] = (
-                np.average(thermal_data[flat_top_start_thermal:flat_top_end_thermal])
-                / 1e6
+        return averages
+
+    def _create_solver_statistics(self) -> typing.Dict[str, pd.DataFrame]:
+        """Create a dictionary of solver statistics for displaying
+
+        For a parameter sweep the combinations are ordered by simulation
+        time such that the slowest regions of the parameter space are
+        listed first.
+
+        Returns
+        -------
+        typing.Dict[str, pd.DataFrame]
+            solver statistics of each simulation for each model
+        """
+        _statistics = self._session.table(pbm_solver.SOLVER_STATS_KEY)
+
+        if _statistics is None:
+            return {}
+
+        if "simulation_time" in _statistics:
+            _statistics = _statistics.sort_values(
+                "simulation_time", ascending=False, kind="stable"
             )
 
-        return averages
+        return {
+            model: statistics.drop(columns="model").dropna(axis=1, how="all")
+            for model, statistics in _statistics.groupby("model", sort=False)
+        }
 
     def _build_parameters_table(self) -> str:
         """Create table of parameters.
@@ -255,9 +231,10 @@ class PBMBrowser:
         """
         return pbm_html.render_parameter_table(self._parameters)
 
+    @pbm_instr.timed("browser_build")
     def build(self, plasma_scenario: dict) -> None:
         """Build the main webpage for plot display."""
-        _ts_component = os.path.basename(self._session_dir).replace("pbm_results", "")
+        _ts_component = self._files.name.replace("pbm_results", "")
         _id = _ts_component.replace("_", "")
         _ts_component_ls = _ts_component.split("_")[1:]
         _time_stamp = ":".join(
@@ -267,14 +244,19 @@ class PBMBrowser:
             [_ts_component_ls[2], _ts_component_ls[1], _ts_component_ls[0]]
         )
 
-        _profile_plot_build = pbm_plt_prof.ProfilePlotBuilder(
-            os.path.join(self._session_dir, "profiles")
-        )
+        _profile_plot_build = pbm_plt_prof.ProfilePlotBuilder(self._profiles_dir)
 
         _output_plot_build = pbm_plt_res.OutputPlotBuilder(
-            self._configuration, self._data
+            self._configuration, self._session
         )
 
+        _solver_tab = ""
+
+        if _solver_statistics := self._create_solver_statistics():
+            _solver_tab = pbm_html.solver_stats_tab.render(
+                stats_dict=_solver_statistics
+            )
+
         _page_str = pbm_html.browser_display_page.render(
             version=power_balance.__version__,
             time_stamp=_time_stamp,
@@ -292,10 +274,11 @@ class PBMBrowser:
                 effs_dict=self._create_efficiencies(plasma_scenario),
                 steady_state_dict=self._create_steady_state(plasma_scenario),
             ),
+            solver_tab_content=_solver_tab,
         )
 
-        if not os.path.exists(os.path.join(self._session_dir, "html")):
-            os.mkdir(os.path.join(self._session_dir, "html"))
+        if not os.path.exists(self._html_dir):
+            os.mkdir(self._html_dir)
 
         with open(self._plot_html, "w") as plot_html_f:
             plot_html_f.write(_page_str)
@@ -16,6 +16,8 @@ Module variables
     config_table - configuration table template
     plot_scroller - plot scroller template
     browser_display_page - full plot page template
+    steady_state_tab - steady-state outputs tab template
+    solver_stats_tab - solver statistics tab template
 
 
 Functions
@@ -88,3 +90,4 @@ config_table = _load_html_template("config_table.jinja")
 plot_scroller = _load_html_template("plot_scroller.jinja")
 browser_display_page = _load_html_template("browser.jinja")
 steady_state_tab = _load_html_template("steady_state_tab.jinja")
+solver_stats_tab = _load_html_template("solver_stats_tab.jinja")
@@ -13,6 +13,7 @@ Submodules
 ----------
 
     efficiency - model efficiency calculations
+    summary - batched steady-state averages and efficiencies for sweep cuts
 
 Classes
 -------
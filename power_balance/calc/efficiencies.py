@@ -16,10 +16,11 @@ calc_thermal_to_elec_eff - calculates efficiency of power_generated/thermal_powe
 import os
 
 import numpy as np
-import scipy.io as sio
 
 import power_balance.calc as pbm_calc
+import power_balance.calc.summary as pbm_summary
 import power_balance.exceptions as pbm_exc
+import power_balance.profiles.timeseries as pbm_ts
 
 
 def calc_thermal_to_elec_eff(
@@ -51,23 +52,13 @@ def calc_thermal_to_elec_eff(
             "file not found"
         )
 
-    _time = sio.loadmat(thermal_in_profile)["data"][:, 0]
-    _profile_data = sio.loadmat(thermal_in_profile)["data"][:, 1]
-    flat_top_start = np.asarray(
-        _time == plasma_scenario["plasma_flat_top_start"]
-    ).nonzero()[0][0]
-    flat_top_end = np.asarray(
-        _time == plasma_scenario["plasma_flat_top_end"]
-    ).nonzero()[0][0]
-    _avg_prof: float = np.average(_profile_data[flat_top_start:flat_top_end])
-
-    flat_top_start = np.asarray(
-        sim_time == plasma_scenario["plasma_flat_top_start"]
-    ).nonzero()[0][0]
-    flat_top_end = np.asarray(
-        sim_time == plasma_scenario["plasma_flat_top_end"]
-    ).nonzero()[0][0]
-    _avg_gen: float = np.average(total_generated[flat_top_start:flat_top_end])
+    _avg_prof: float = (
+        pbm_ts.read_profile(thermal_in_profile).flat_top(plasma_scenario).average()
+    )
+
+    _avg_gen = float(
+        pbm_summary.flat_top_average(sim_time, total_generated, plasma_scenario)
+    )
 
     _desc = "Ratio of electrical energy output to input thermal energy from Tokamak."
 
@@ -111,23 +102,11 @@ def calc_heating_to_elec_eff(
             "file not found"
         )
 
-    _time = sio.loadmat(heating_profile)["data"][:, 0]
-    _profile_data = sio.loadmat(heating_profile)["data"][:, 1]
-    flat_top_start = np.asarray(
-        _time == plasma_scenario["plasma_flat_top_start"]
-    ).nonzero()[0][0]
-    flat_top_end = np.asarray(
-        _time == plasma_scenario["plasma_flat_top_end"]
-    ).nonzero()[0][0]
-    _avg_prof: float = np.average(_profile_data[flat_top_start:flat_top_end])
-
-    flat_top_start = np.asarray(
-        sim_time == plasma_scenario["plasma_flat_top_start"]
-    ).nonzero()[0][0]
-    flat_top_end = np.asarray(
-        sim_time == plasma_scenario["plasma_flat_top_end"]
-    ).nonzero()[0][0]
-    _avg_gen: float = np.average(elec_in[flat_top_start:flat_top_end])
+    _avg_prof: float = (
+        pbm_ts.read_profile(heating_profile).flat_top(plasma_scenario).average()
+    )
+
+    _avg_gen = float(pbm_summary.flat_top_average(sim_time, elec_in, plasma_scenario))
 
     _desc = "Ratio of plasma heating to electrical power input."
 
@@ -0,0 +1,302 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Steady-State Summaries
+======================
+
+Batched calculation of flat-top averages and efficiencies. The flat-top
+window is located once for the shared time axis of a set of results and
+the averages for every subsystem and every sweep cut are then computed in
+a single pass over the results array. Results on a non-equidistant time
+axis are averaged using the trapezoidal rule.
+
+Contents
+========
+
+Functions
+---------
+
+    flat_top_indices - locate the plasma flat-top within a time series
+    flat_top_average - average values across the plasma flat-top
+    summarise - calculate averages and efficiencies for all sweep cuts
+    summarise_frame - calculate averages and efficiencies for a results dataframe
+
+"""
+
+__date__ = "2026-10-19"
+
+import logging
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+import power_balance.exceptions as pbm_exc
+import power_balance.profiles.timeseries as pbm_ts
+import power_balance.results.dense as pbm_dense
+
+SUMMARY_KEY = "summary"
+
+STEADY_STATE_VARIABLES: typing.Dict[str, str] = {
+    "Average Magnet Systems Electricity Consumption (MW)": "magnetpower",
+    "Average Heating and Current Drive Electricity Consumption (MW)": "hcdsystem",
+    "Average Cryogenic System Electricity Consumption (MW)": "cryogenicpower",
+    "Average Waste Heat Electricity Consumption (MW)": "wasteheatpower",
+    "Average Coolant Detritiation Electricity Consumption (MW)": "coolantdetritpower",
+    "Average Blanket Detritiation Electricity Consumption (MW)": "blanketdetritpower",
+    "Average Air-Gas Detritiation Electricity Consumption (MW)": "air_gas_power",
+    "Average Water Detritiation Electricity Consumption (MW)": "water_detrit_power",
+    "Average Vacuum Pump Electricity Consumption (MW)": "total_vacuumpump_power",
+    "Average Total Electrical Power Consumption (MW)": "netpowerconsumption",
+    "Average Electrical Power Generation (MW)": "powergenerated",
+    "Average Net Electrical Power Output (MW)": "netpowergeneration",
+}
+
+PLASMA_THERMAL_LABEL = "Average Plasma Thermal Power Generation (MW)"
+
+# Heating profiles and the label of the resulting efficiency
+HEATING_PROFILES: typing.Dict[str, str] = {
+    "RF_Heat.mat": "RF to Electric",
+    "NBI_Heat.mat": "NBI to Electric",
+}
+
+THERMAL_PROFILE = "ThermalPowerOut.mat"
+
+
+def flat_top_indices(
+    time: np.ndarray, plasma_scenario: typing.Mapping[str, float], atol: float = 1e-8
+) -> typing.Tuple[int, int]:
+    """Locate the start and end of the plasma flat-top within a time series
+
+    Each boundary is the first time point lying within the given tolerance
+    of the corresponding plasma scenario value.
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically increasing time values
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario containing the flat-top start and end times
+    atol : float, optional
+        absolute tolerance when matching times, by default 1E-8
+
+    Returns
+    -------
+    typing.Tuple[int, int]
+        indices of the flat-top start and end
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if either boundary is not present within the time series
+    """
+    _time = np.asarray(time, dtype=float)
+    return (
+        pbm_ts.time_index(_time, plasma_scenario["plasma_flat_top_start"], atol),
+        pbm_ts.time_index(_time, plasma_scenario["plasma_flat_top_end"], atol),
+    )
+
+
+def flat_top_average(
+    time: np.ndarray,
+    values: np.ndarray,
+    plasma_scenario: typing.Mapping[str, float],
+    steady_state: bool = False,
+) -> np.ndarray:
+    """Average of values across the plasma flat-top
+
+    For an equidistant time axis the average is taken over the points
+    within the flat-top. For any other axis, such as one containing event
+    points, the time weighted average is calculated using the trapezoidal
+    rule.
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically increasing time values
+    values : np.ndarray
+        values with time along the last axis
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario containing the flat-top start and end times
+    steady_state : bool, optional
+        exclude transients at either end of the flat-top by removing a tenth
+        of the time before the flat-top from each end, by default False
+
+    Returns
+    -------
+    np.ndarray
+        flat-top average for each series along the leading axes
+    """
+    _time = np.asarray(time, dtype=float)
+    _values = np.asarray(values, dtype=float)
+
+    if not pbm_ts.is_equidistant(_time):
+        _start = plasma_scenario["plasma_flat_top_start"]
+        _end = plasma_scenario["plasma_flat_top_end"]
+        _margin = 0.1 * (_start - _time[0]) if steady_state else 0.0
+        return pbm_ts.trapezoid_average(
+            _time, _values, _start + _margin, _end - _margin
+        )
+
+    _start, _end = flat_top_indices(_time, plasma_scenario)
+
+    _window = (
+        slice(int(_start * 1.1), int(_end - _start * 0.1))
+        if steady_state
+        else slice(_start, _end)
+    )
+
+    return np.average(np.ascontiguousarray(_values[..., _window]), axis=-1)
+
+
+def summarise(
+    results: pbm_dense.DenseSweepResults,
+    profiles_directory: str,
+    plasma_scenario: typing.Mapping[str, float],
+) -> pd.DataFrame:
+    """Calculate steady-state averages and efficiencies for all sweep cuts
+
+    Parameters
+    ----------
+    results : power_balance.results.dense.DenseSweepResults
+        outputs of the 'Tokamak.Interdependencies' model for each cut
+    profiles_directory : str
+        directory containing the input profiles used for the run
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario defining the flat-top
+
+    Returns
+    -------
+    pd.DataFrame
+        tidy table containing the sweep parameter values, a category of
+        either 'average' or 'efficiency', the quantity name and its value
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the thermal power profile does not exist
+    """
+    _thermal_profile = os.path.join(profiles_directory, THERMAL_PROFILE)
+
+    if not os.path.exists(_thermal_profile):
+        raise pbm_exc.InvalidInputError(
+            f"Cannot load thermal power profile from '{_thermal_profile}', "
+            "file not found"
+        )
+
+    _thermal_average = (
+        pbm_ts.read_profile(_thermal_profile).flat_top(plasma_scenario).average()
+    )
+    _columns: typing.Dict[typing.Tuple[str, str], np.ndarray] = {}
+
+    for label, variable in STEADY_STATE_VARIABLES.items():
+        if variable not in results.variables:
+            continue
+        _columns[("average", label)] = (
+            flat_top_average(
+                results.time,
+                results.variable(variable),
+                plasma_scenario,
+                steady_state=True,
+            )
+            / 1e6
+        )
+
+    _columns[("average", PLASMA_THERMAL_LABEL)] = np.full(
+        len(results), _thermal_average / 1e6
+    )
+
+    def _cut_averages(variable: str) -> np.ndarray:
+        return flat_top_average(
+            results.time, results.variable(variable), plasma_scenario
+        )
+
+    if "powergenerated" in results.variables:
+        _columns[("efficiency", "Thermal to Electric")] = (
+            _cut_averages("powergenerated") / _thermal_average
+        )
+
+    for file_name, label in HEATING_PROFILES.items():
+        _heating_profile = os.path.join(profiles_directory, file_name)
+        if "hcdsystem" not in results.variables or not os.path.exists(_heating_profile):
+            continue
+        _heating = pbm_ts.read_profile(_heating_profile)
+        if max(_heating.values) == 0.0:
+            continue
+        _columns[("efficiency", label)] = _heating.flat_top(
+            plasma_scenario
+        ).average() / _cut_averages("hcdsystem")
+
+    _combinations = results.combinations
+
+    _tables = []
+
+    for (category, quantity), values in _columns.items():
+        _table = _combinations.copy()
+        _table["category"] = category
+        _table["quantity"] = quantity
+        _table["value"] = values
+        _tables.append(_table)
+
+    return pd.concat(_tables, ignore_index=True)
+
+
+def summarise_frame(
+    dataframe: pd.DataFrame,
+    parameters: typing.Sequence[str],
+    profiles_directory: str,
+    plasma_scenario: typing.Mapping[str, float],
+) -> pd.DataFrame:
+    """Calculate steady-state averages and efficiencies for a results dataframe
+
+    Where the cuts of a sweep do not share a time axis each cut is
+    summarised separately.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        long form outputs of the 'Tokamak.Interdependencies' model
+    parameters : typing.Sequence[str]
+        names of the sweep parameter columns, empty if not a sweep
+    profiles_directory : str
+        directory containing the input profiles used for the run
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario defining the flat-top
+
+    Returns
+    -------
+    pd.DataFrame
+        tidy table of averages and efficiencies for each cut
+    """
+    if not parameters:
+        return summarise(
+            pbm_dense.DenseSweepResults.from_cuts([({}, dataframe)]),
+            profiles_directory,
+            plasma_scenario,
+        )
+
+    try:
+        _results = pbm_dense.DenseSweepResults.from_frame(dataframe, parameters)
+    except pbm_exc.InvalidInputError:
+        logging.getLogger("PowerBalance").debug(
+            "Sweep cuts do not share a time axis, summarising each separately"
+        )
+    else:
+        return summarise(_results, profiles_directory, plasma_scenario)
+
+    _parameters = [p.lower() for p in parameters]
+
+    return pd.concat(
+        [
+            summarise(
+                pbm_dense.DenseSweepResults.from_cuts(
+                    [(dict(zip(_parameters, np.atleast_1d(key))), cut)]
+                ),
+                profiles_directory,
+                plasma_scenario,
+            )
+            for key, cut in dataframe.groupby(_parameters, sort=False)
+        ],
+        ignore_index=True,
+    )
@@ -0,0 +1,402 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Operating Campaigns
+===================
+
+Simulation of a campaign of many pulses by periodic stitching. Rather than
+simulating the whole campaign as a single Modelica run, one representative
+pulse is simulated for each distinct set of inputs, pulses differing only
+where parameter overrides are given. The end state of each simulated pulse
+is compared to its initial state to confirm that the pulse can be repeated,
+and the campaign time series is then assembled by repeating the simulated
+pulses, each followed by a dwell during which the end of pulse state is
+held.
+
+Energy metrics for the campaign are obtained by integrating each simulated
+pulse once and indexing the result for every pulse of the campaign.
+
+Contents
+========
+
+Classes
+-------
+
+    CampaignResults - simulated pulses and their arrangement within a campaign
+
+Functions
+---------
+
+    pulse_variants - group the pulses of a campaign by their input overrides
+    periodicity_error - mismatch between the initial and final state of a pulse
+    pulse_energy - energy of each output over a pulse and dwell
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+import power_balance.exceptions as pbm_exc
+
+CAMPAIGN_DATA_FILE = "campaign_data.h5"
+CAMPAIGN_ENERGY_KEY = "campaign_energy"
+
+# Column identifying the simulated pulse within the results of a campaign
+VARIANT_COLUMN = "campaign.variant"
+PULSE_COLUMN = "pulse"
+
+
+def pulse_variants(
+    n_pulses: int,
+    overrides: typing.Optional[
+        typing.Mapping[typing.Union[str, int], typing.Mapping[str, typing.Any]]
+    ] = None,
+) -> typing.Tuple[typing.List[typing.Dict[str, typing.Any]], np.ndarray]:
+    """Group the pulses of a campaign by their parameter overrides
+
+    Parameters
+    ----------
+    n_pulses : int
+        number of pulses within the campaign
+    overrides : typing.Mapping[str | int, typing.Mapping[str, typing.Any]], optional
+        parameter values for individual pulses, keyed by pulse number
+        starting from 1
+
+    Returns
+    -------
+    typing.Tuple[typing.List[typing.Dict[str, typing.Any]], np.ndarray]
+        parameter overrides for each distinct pulse, the first being the
+        unmodified pulse, and the index of the distinct pulse for every
+        pulse of the campaign
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if an override is given for a pulse outside of the campaign
+    """
+    _variants: typing.List[typing.Dict[str, typing.Any]] = [{}]
+    _pulse_variant = np.zeros(n_pulses, dtype=int)
+
+    for pulse, parameters in (overrides or {}).items():
+        _pulse = int(pulse)
+
+        if not 1 <= _pulse <= n_pulses:
+            raise pbm_exc.InvalidInputError(
+                f"Cannot override inputs for pulse {_pulse}, campaign "
+                f"contains pulses 1 to {n_pulses}"
+            )
+
+        _parameters = dict(sorted(parameters.items()))
+
+        if _parameters not in _variants:
+            _variants.append(_parameters)
+
+        _pulse_variant[_pulse - 1] = _variants.index(_parameters)
+
+    return _variants, _pulse_variant
+
+
+def periodicity_error(pulse: pd.DataFrame, atol: float = 1.0) -> pd.Series:
+    """Mismatch between the initial and final state of a pulse
+
+    Parameters
+    ----------
+    pulse : pd.DataFrame
+        outputs of a single pulse including a 'time' column
+    atol : float, optional
+        absolute value below which the relative error is measured against
+        this value to avoid division by near zero values, by default 1.0
+
+    Returns
+    -------
+    pd.Series
+        relative difference between the last and first value of each output
+    """
+    _outputs = pulse.drop(columns="time").select_dtypes("number")
+    _first, _last = _outputs.iloc[0], _outputs.iloc[-1]
+    return (_last - _first).abs() / _first.abs().clip(lower=atol)
+
+
+def pulse_energy(
+    time: np.ndarray, values: np.ndarray, dwell: float = 0.0
+) -> np.ndarray:
+    """Energy of each output over a pulse and the dwell following it
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically non-decreasing time values of the pulse
+    values : np.ndarray
+        power values with shape (n_time, n_variables)
+    dwell : float, optional
+        duration of the dwell during which the final values are held,
+        by default 0
+
+    Returns
+    -------
+    np.ndarray
+        energy of each output
+    """
+    _time = np.asarray(time, dtype=float)
+    _values = np.asarray(values, dtype=float)
+    _energy = np.sum(
+        np.diff(_time)[:, np.newaxis] * (_values[1:] + _values[:-1]) / 2, axis=0
+    )
+    return _energy + dwell * _values[-1]
+
+
+class CampaignResults:
+    """Simulated pulses and their arrangement within a campaign"""
+
+    def __init__(
+        self,
+        pulses: typing.Sequence[pd.DataFrame],
+        pulse_variant: np.ndarray,
+        dwell: float = 0.0,
+        rtol: float = 1e-3,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        pulses : typing.Sequence[pd.DataFrame]
+            outputs of each simulated pulse including a 'time' column
+        pulse_variant : np.ndarray
+            index of the simulated pulse for every pulse of the campaign
+        dwell : float, optional
+            time between the end of one pulse and the start of the next,
+            by default 0
+        rtol : float, optional
+            maximum relative mismatch between the initial and final state of
+            a pulse for it to be considered periodic, by default 1E-3
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if a pulse does not share the outputs or duration of the first
+        """
+        if not pulses:
+            raise pbm_exc.InvalidInputError("Campaign must contain a simulated pulse")
+
+        self._variables = [
+            c for c in pulses[0].select_dtypes("number").columns if c != "time"
+        ]
+        self._times: typing.List[np.ndarray] = []
+        self._values: typing.List[np.ndarray] = []
+
+        for i, pulse in enumerate(pulses):
+            if list(pulse[self._variables].columns) != self._variables:
+                raise pbm_exc.InvalidInputError(
+                    f"Outputs of simulated pulse {i} do not match those of pulse 0"
+                )
+            self._times.append(pulse["time"].to_numpy(dtype=float))
+            self._values.append(pulse[self._variables].to_numpy(dtype=float))
+
+        self._duration = self._times[0][-1] - self._times[0][0]
+
+        if any(not np.isclose(t[-1] - t[0], self._duration) for t in self._times):
+            raise pbm_exc.InvalidInputError(
+                "Simulated pulses of a campaign must have the same duration"
+            )
+
+        self._pulse_variant = np.asarray(pulse_variant, dtype=int)
+        self._dwell = dwell
+        self._rtol = rtol
+        self._periodicity = [
+            periodicity_error(pulse[["time", *self._variables]]) for pulse in pulses
+        ]
+
+    def __len__(self) -> int:
+        return self._pulse_variant.shape[0]
+
+    @property
+    def variables(self) -> typing.List[str]:
+        """Output variable names"""
+        return self._variables
+
+    @property
+    def n_variants(self) -> int:
+        """Number of simulated pulses"""
+        return len(self._times)
+
+    @property
+    def pulse_variant(self) -> np.ndarray:
+        """Index of the simulated pulse for every pulse of the campaign"""
+        return self._pulse_variant
+
+    @property
+    def period(self) -> float:
+        """Time from the start of one pulse to the start of the next"""
+        return self._duration + self._dwell
+
+    @property
+    def duration(self) -> float:
+        """Total duration of the campaign"""
+        return len(self) * self.period
+
+    def periodicity(self) -> pd.DataFrame:
+        """Mismatch between the initial and final state of each simulated pulse
+
+        Returns
+        -------
+        pd.DataFrame
+            maximum relative mismatch, the output in which it occurs and
+            whether the pulse is periodic for each simulated pulse
+        """
+        return pd.DataFrame(
+            {
+                "max_error": [float(e.max()) for e in self._periodicity],
+                "worst_output": [str(e.idxmax()) for e in self._periodicity],
+                "periodic": [bool((e <= self._rtol).all()) for e in self._periodicity],
+            }
+        )
+
+    def time_series(
+        self, pulses: typing.Optional[typing.Sequence[int]] = None
+    ) -> pd.DataFrame:
+        """Assemble the campaign time series from the simulated pulses
+
+        The values at the end of each pulse are held until the start of the
+        next, the transition being represented by a repeated time point.
+
+        Parameters
+        ----------
+        pulses : typing.Sequence[int], optional
+            indices of the pulses to include, by default all pulses
+
+        Returns
+        -------
+        pd.DataFrame
+            outputs for the selected pulses with the pulse number
+        """
+        _pulses = np.arange(len(self)) if pulses is None else np.asarray(pulses)
+
+        _times = self._times
+        _values = self._values
+
+        # Append the end of the dwell to each simulated pulse
+        if self._dwell > 0:
+            _times = [np.append(t, t[-1] + self._dwell) for t in _times]
+            _values = [np.vstack([v, v[-1]]) for v in _values]
+
+        _variants = self._pulse_variant[_pulses]
+        _lengths = np.array([len(t) for t in _times])[_variants]
+
+        _offsets = np.repeat(
+            _pulses * self.period - np.array([t[0] for t in self._times])[_variants],
+            _lengths,
+        )
+
+        _dataframe = pd.DataFrame(
+            np.concatenate([_values[v] for v in _variants]), columns=self._variables
+        )
+        _dataframe.insert(
+            0, "time", np.concatenate([_times[v] for v in _variants]) + _offsets
+        )
+        _dataframe.insert(1, PULSE_COLUMN, np.repeat(_pulses + 1, _lengths))
+
+        return _dataframe
+
+    def energy(self) -> pd.DataFrame:
+        """Energy of each output for every pulse of the campaign
+
+        Returns
+        -------
+        pd.DataFrame
+            pulse number, simulated pulse index and energy in Joules of each
+            output for the pulse and the dwell following it
+        """
+        _energies = np.stack(
+            [pulse_energy(t, v, self._dwell) for t, v in zip(self._times, self._values)]
+        )
+        _dataframe = pd.DataFrame(
+            _energies[self._pulse_variant], columns=self._variables
+        )
+        _dataframe.insert(0, PULSE_COLUMN, np.arange(1, len(self) + 1))
+        _dataframe.insert(1, "variant", self._pulse_variant)
+        return _dataframe
+
+    def cumulative_energy(self) -> pd.DataFrame:
+        """Energy of each output accumulated over the campaign
+
+        Returns
+        -------
+        pd.DataFrame
+            pulse number, end time and energy in Joules of each output
+            accumulated up to the end of each pulse
+        """
+        _energy = self.energy()
+        _dataframe = _energy[self._variables].cumsum()
+        _dataframe.insert(0, PULSE_COLUMN, _energy[PULSE_COLUMN])
+        _dataframe.insert(1, "time", _energy[PULSE_COLUMN] * self.period)
+        return _dataframe
+
+    def summary(self) -> pd.DataFrame:
+        """Campaign level energy totals and average powers
+
+        Returns
+        -------
+        pd.DataFrame
+            total energy in MWh and average power in MW of each output
+            across the campaign
+        """
+        _totals = self.energy()[self._variables].sum()
+        return pd.DataFrame(
+            {
+                "variable": self._variables,
+                "energy_mwh": _totals.to_numpy() / 3.6e9,
+                "average_power_mw": _totals.to_numpy() / self.duration / 1e6,
+            }
+        )
+
+    def write_hdf5(self, file_name: str, key: str) -> None:
+        """Write the simulated pulses and campaign layout to a HDF5 file
+
+        Only the simulated pulses are stored, the campaign time series being
+        reassembled on reading.
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to write to
+        key : str
+            group within the file for this campaign
+        """
+        with pd.HDFStore(file_name) as hdf_store:
+            for i, (time, values) in enumerate(zip(self._times, self._values)):
+                _pulse = pd.DataFrame(values, columns=self._variables)
+                _pulse.insert(0, "time", time)
+                hdf_store.put(f"{key}/variant_{i}", _pulse)
+            hdf_store.put(f"{key}/pulse_variant", pd.Series(self._pulse_variant))
+            _attrs = hdf_store.get_storer(f"{key}/pulse_variant").attrs
+            _attrs.dwell = self._dwell
+            _attrs.rtol = self._rtol
+            _attrs.n_variants = self.n_variants
+
+    @classmethod
+    def read_hdf5(cls, file_name: str, key: str) -> "CampaignResults":
+        """Read campaign results written by 'write_hdf5'
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to read from
+        key : str
+            group within the file for the campaign
+
+        Returns
+        -------
+        CampaignResults
+            campaign results
+        """
+        with pd.HDFStore(file_name, mode="r") as hdf_store:
+            _attrs = hdf_store.get_storer(f"{key}/pulse_variant").attrs
+            return cls(
+                [hdf_store.get(f"{key}/variant_{i}") for i in range(_attrs.n_variants)],
+                hdf_store.get(f"{key}/pulse_variant").to_numpy(),
+                dwell=_attrs.dwell,
+                rtol=_attrs.rtol,
+            )
@@ -20,12 +20,21 @@ from typing import List, Optional
 import click
 
 import power_balance
+import power_balance.analysis.optimisation as pbm_opt
+import power_balance.analysis.sensitivity as pbm_sens
+import power_balance.cli.archive as pbm_archive
+import power_balance.cli.batch as pbm_batch
+import power_balance.cli.catalogue as pbm_catalogue
+import power_balance.cli.optimise as pbm_optimise
+import power_balance.cli.sensitivity as pbm_sensitivity
 import power_balance.cli.session as pbm_session
+import power_balance.cli.tune as pbm_tune
 import power_balance.configs as pbm_conf
 import power_balance.parameters as pbm_param
 import power_balance.plotting as pbm_plot
 import power_balance.plugins as pbm_plugin
 import power_balance.profiles as pbm_prof
+import power_balance.tuning as pbm_tuning
 
 
 @click.group()
@@ -77,17 +86,297 @@ def install_modelica_libraries() -> None:
 @click.option("--profiles-dir", default="Default", help="Directory containing profiles")
 @click.option(
     "--from-session",
-    help="Run Power Balance using an existing session output directory",
+    help="Run Power Balance using an existing session output directory or archive",
     default=None,
 )
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    default=False,
+    help="Record peak memory usage and allocation sites of each session phase",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Run even if the inputs match those of a previous session",
+)
 def run(*args, **kwargs):
     """Launch and run a PBM simulation session"""
     pbm_session.pbm_main(*args, **kwargs)
 
 
+def _split_option(value: str) -> List[str]:
+    return [i.strip() for i in value.split(",") if i.strip()]
+
+
+@click.command()
+@click.option(
+    "--config",
+    default=pbm_conf.config_default,
+    help="TOML configuration file.",
+)
+@click.option("--param-dir", default="Default", help="Location of parameter files")
+@click.option("--model-dir", default="Default", help="Modelica model file directory")
+@click.option("--profiles-dir", default="Default", help="Directory containing profiles")
+@click.option(
+    "--solvers",
+    default=",".join(pbm_tuning.DEFAULT_SOLVERS),
+    help="Comma separated list of candidate solvers",
+    show_default=True,
+)
+@click.option(
+    "--tolerances",
+    default=",".join(f"{i:.0e}" for i in pbm_tuning.DEFAULT_TOLERANCES),
+    help="Comma separated list of candidate tolerances",
+    show_default=True,
+)
+@click.option(
+    "--rtol",
+    default=1e-3,
+    type=float,
+    help="Maximum relative error in any flat-top average",
+    show_default=True,
+)
+@click.option(
+    "--atol",
+    default=1.0,
+    type=float,
+    help="Absolute difference below which flat-top averages are equal",
+    show_default=True,
+)
+@click.option(
+    "--repeats",
+    default=1,
+    type=int,
+    help="Number of timed runs for each setting",
+    show_default=True,
+)
+@click.option(
+    "--write/--no-write",
+    default=False,
+    help="Write the recommended setting to the parameter directory",
+    show_default=True,
+)
+@click.option("--report", default=None, help="CSV file to write the full report to")
+@click.option("--verbose/--no-verbose", default=False, help="Run in Debug Mode")
+def tune(solvers: str, tolerances: str, **kwargs) -> None:
+    """Recommend the fastest solver settings within given error bounds"""
+    pbm_tune.pbm_tune(
+        solvers=_split_option(solvers),
+        tolerances=[float(i) for i in _split_option(tolerances)],
+        **kwargs,
+    )
+
+
+@click.command()
+@click.option(
+    "--config",
+    default=pbm_conf.config_default,
+    help="TOML configuration file.",
+)
+@click.option("--param-dir", default="Default", help="Location of parameter files")
+@click.option("--model-dir", default="Default", help="Modelica model file directory")
+@click.option("--profiles-dir", default="Default", help="Directory containing profiles")
+@click.option(
+    "--outputdir",
+    default=os.getcwd(),
+    help="Output directory, default is current directory",
+)
+@click.option(
+    "--metric",
+    default="netpowergeneration",
+    help="Output metric, e.g. 'netpowergeneration' or 'max(magnetpower)'",
+    show_default=True,
+)
+@click.option(
+    "--parameters",
+    default="*",
+    help="Comma separated list of parameter names or wildcard patterns",
+    show_default=True,
+)
+@click.option(
+    "--method",
+    default="oat",
+    type=click.Choice(pbm_sens.METHODS),
+    help="One-at-a-time or Morris elementary effects",
+    show_default=True,
+)
+@click.option(
+    "--step",
+    default=0.1,
+    type=float,
+    help="Relative step either side of each parameter value",
+    show_default=True,
+)
+@click.option(
+    "--trajectories",
+    default=10,
+    type=int,
+    help="Number of elementary effects trajectories",
+    show_default=True,
+)
+@click.option(
+    "--levels",
+    default=4,
+    type=int,
+    help="Number of elementary effects grid levels, must be even",
+    show_default=True,
+)
+@click.option("--seed", default=None, type=int, help="Random seed for trajectories")
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    help="Number of worker threads simulating concurrently",
+    show_default=True,
+)
+@click.option("--cache", default=None, help="JSON file memoising evaluated points")
+@click.option("--verbose/--no-verbose", default=False, help="Run in Debug Mode")
+def sensitivity(parameters: str, **kwargs) -> None:
+    """Rank the sensitivity of an output metric to the model parameters"""
+    pbm_sensitivity.pbm_sensitivity(parameters=_split_option(parameters), **kwargs)
+
+
+@click.command()
+@click.option(
+    "--config",
+    default=pbm_conf.config_default,
+    help="TOML configuration file.",
+)
+@click.option("--param-dir", default="Default", help="Location of parameter files")
+@click.option("--model-dir", default="Default", help="Modelica model file directory")
+@click.option("--profiles-dir", default="Default", help="Directory containing profiles")
+@click.option(
+    "--outputdir",
+    default=os.getcwd(),
+    help="Output directory, default is current directory",
+)
+@click.option(
+    "--variables",
+    required=True,
+    help="Comma separated list of design variables as 'name' or 'name=low:high'",
+)
+@click.option(
+    "--objective",
+    default="netpowergeneration",
+    help="Output metric to optimise, e.g. 'netpowergeneration'",
+    show_default=True,
+)
+@click.option(
+    "--sense",
+    default="maximise",
+    type=click.Choice(pbm_opt.SENSES),
+    help="Maximise or minimise the objective",
+    show_default=True,
+)
+@click.option(
+    "--constraint",
+    "constraints",
+    multiple=True,
+    help="Constraint on a metric, e.g. 'max(netpowerconsumption) <= 500'",
+)
+@click.option(
+    "--step",
+    default=0.1,
+    type=float,
+    help="Relative step either side of variables given without bounds",
+    show_default=True,
+)
+@click.option(
+    "--population",
+    default=5,
+    type=int,
+    help="Population size as a multiple of the number of variables",
+    show_default=True,
+)
+@click.option(
+    "--generations",
+    default=20,
+    type=int,
+    help="Maximum number of generations",
+    show_default=True,
+)
+@click.option(
+    "--tolerance",
+    default=1e-2,
+    type=float,
+    help="Relative convergence tolerance of the population",
+    show_default=True,
+)
+@click.option("--seed", default=None, type=int, help="Random seed for the population")
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    help="Number of worker threads simulating concurrently",
+    show_default=True,
+)
+@click.option("--cache", default=None, help="JSON file memoising evaluated designs")
+@click.option("--verbose/--no-verbose", default=False, help="Run in Debug Mode")
+def optimise(variables: str, **kwargs) -> None:
+    """Optimise an output metric over design variables subject to constraints"""
+    pbm_optimise.pbm_optimise(variables=_split_option(variables), **kwargs)
+
+
+@click.command()
+@click.argument("manifest")
+@click.option(
+    "--outputdir",
+    default=os.getcwd(),
+    help="Output directory, default is current directory",
+)
+@click.option(
+    "--workers",
+    default=None,
+    type=int,
+    help="Number of sessions run concurrently, overrides the manifest",
+)
+@click.option("--verbose/--no-verbose", default=False, help="Run in Debug Mode")
+def batch(*args, **kwargs) -> None:
+    """Run the sessions listed within a batch manifest"""
+    pbm_batch.pbm_batch(*args, **kwargs)
+
+
+@click.command()
+@click.argument("filters", nargs=-1)
+@click.option(
+    "--metrics",
+    default=None,
+    help="Comma separated summary metrics to display, by default all",
+)
+@click.option("--catalogue", default=None, help="SQLite session catalogue file")
+@click.option("--output", default=None, help="CSV file to write matching sessions to")
+def query(filters: List[str], metrics: Optional[str], **kwargs) -> None:
+    """Find catalogued sessions matching filters such as 'name >= value'"""
+    pbm_catalogue.pbm_query(
+        filters, _split_option(metrics) if metrics else None, **kwargs
+    )
+
+
+@click.command()
+@click.argument("directories", nargs=-1, required=True)
+@click.option("--catalogue", default=None, help="SQLite session catalogue file")
+@click.option(
+    "--recursive/--no-recursive",
+    default=True,
+    help="Search subdirectories for session directories",
+    show_default=True,
+)
+def index(directories: List[str], **kwargs) -> None:
+    """Add existing session output directories to the session catalogue"""
+    pbm_catalogue.pbm_index(directories, **kwargs)
+
+
 @click.command()
 @click.option("--outdir", default=None, help="Profile output directory")
-def generate_profiles(outdir: str = "") -> None:
+@click.option(
+    "--knots",
+    is_flag=True,
+    default=False,
+    help="Write the minimal knot table for each profile",
+)
+def generate_profiles(outdir: str = "", knots: bool = False) -> None:
     """Generate profiles used as model inputs"""
     if not outdir:
         outdir = os.path.join(
@@ -97,7 +386,7 @@ def generate_profiles(outdir: str = "") -> None:
         )
     if not os.path.exists(outdir):
         os.mkdir(outdir)
-    pbm_prof.generate_all(outdir)
+    pbm_prof.generate_all(outdir, knots=knots)
 
 
 @click.command()
@@ -133,10 +422,28 @@ def view_profile(
     print(_data_frame[:head][tail:])
 
 
+@click.command()
+@click.argument("directories", nargs=-1, required=True)
+@click.option(
+    "--output",
+    default=None,
+    help="Archive file ending '.zip', else directory in which to write archives",
+)
+@click.option(
+    "--remove",
+    is_flag=True,
+    default=False,
+    help="Remove each session directory once archived",
+)
+def archive(directories: List[str], **kwargs) -> None:
+    """Write session output directories to single file archives"""
+    pbm_archive.pbm_archive_sessions(directories, **kwargs)
+
+
 @click.command("view-results")
 @click.argument("output_dir")
 def view_results(output_dir) -> None:
-    """Launch browser window from output directory"""
+    """Launch browser window from output directory or archive"""
     pbm_plot.launch_viewer(output_dir)
 
 
@@ -172,6 +479,13 @@ def remove(plugin_name: str) -> None:
 pbm_plugin.apply_modifications_to("run", run)
 powerbalance.add_command(run)
 powerbalance.add_command(new)
+powerbalance.add_command(tune)
+powerbalance.add_command(sensitivity)
+powerbalance.add_command(optimise)
+powerbalance.add_command(batch)
+powerbalance.add_command(query)
+powerbalance.add_command(index)
+powerbalance.add_command(archive)
 powerbalance.add_command(view_profile)
 powerbalance.add_command(generate_profiles)
 powerbalance.add_command(view_results)
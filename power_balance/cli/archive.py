@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Session Archive
+
+This script writes each of the given session output directories to a single
+archive file holding the data, parameters, configuration, profiles and
+displays of the session, which are read from the archive without extracting
+it by the results browser, the session reader and '--from-session'.
+
+"""
+
+import os
+import shutil
+import typing
+
+import click
+
+import power_balance.exceptions as pbm_exc
+import power_balance.results.archive as pbm_archive
+
+
+def pbm_archive_sessions(
+    directories: typing.Sequence[str],
+    output: typing.Optional[str] = None,
+    remove: bool = False,
+) -> typing.List[str]:
+    """Write session output directories to archives
+
+    Parameters
+    ----------
+    directories : typing.Sequence[str]
+        session output directories
+    output : str, optional
+        archive file for a single session if ending in '.zip', else the
+        directory in which to write the archives, by default alongside each
+        session directory
+    remove : bool, optional
+        remove each session directory once archived, by default False
+
+    Returns
+    -------
+    typing.List[str]
+        archives written
+
+    Raises
+    ------
+    FileNotFoundError
+        if a directory does not contain session outputs
+    power_balance.exceptions.InvalidInputError
+        if an archive file is given for several sessions
+    """
+    if (
+        output
+        and output.endswith(pbm_archive.ARCHIVE_EXTENSION)
+        and len(directories) > 1
+    ):
+        raise pbm_exc.InvalidInputError(
+            f"Cannot write {len(directories)} sessions to the single archive '{output}'"
+        )
+
+    for directory in directories:
+        if not os.path.exists(os.path.join(directory, "configs", "configuration.toml")):
+            raise FileNotFoundError(
+                f"Cannot archive '{directory}', not a session output directory"
+            )
+
+    _archives: typing.List[str] = []
+
+    for directory in directories:
+        _archive_file: typing.Optional[str] = None
+
+        if output and not output.endswith(pbm_archive.ARCHIVE_EXTENSION):
+            os.makedirs(output, exist_ok=True)
+            _archive_file = os.path.join(
+                output,
+                f"{os.path.basename(os.path.normpath(directory))}"
+                f"{pbm_archive.ARCHIVE_EXTENSION}",
+            )
+        elif output:
+            _archive_file = output
+
+        _archives.append(pbm_archive.write_archive(directory, _archive_file))
+
+        if remove:
+            shutil.rmtree(directory)
+
+        click.echo(f"Archived '{directory}' to '{_archives[-1]}'")
+
+    return _archives
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Batch Runs
+
+This script validates every entry of a batch manifest, builds the models of
+each group of entries sharing compiled models once, and runs the entries
+concurrently, writing a session directory per entry alongside tables of the
+status and combined summaries of all entries.
+
+"""
+
+import logging
+import os
+import typing
+
+import click
+
+import power_balance.batch as pbm_batch_run
+
+
+def pbm_batch(
+    manifest: str,
+    outputdir: str = os.getcwd(),
+    workers: typing.Optional[int] = None,
+    verbose: bool = False,
+) -> None:
+    """Run the Power Balance Models sessions listed within a batch manifest
+
+    Parameters
+    ----------
+    manifest : str
+        TOML manifest listing the batch entries
+    outputdir : str, optional
+        output data directory, by default current directory
+    workers : int, optional
+        number of sessions run concurrently, by default that of the manifest
+    verbose : bool, optional
+        increase verbosity of output, by default False
+    """
+    logging.getLogger("PowerBalance").setLevel(
+        logging.DEBUG if verbose else logging.INFO
+    )
+
+    _runner = pbm_batch_run.BatchRunner(manifest, workers)
+
+    for group, names in _runner.validate().items():
+        click.echo(f"Group {group}: {', '.join(names)}")
+
+    _entries = _runner.run(outputdir)
+
+    click.echo(
+        _entries[["entry", "group", "status", "time", "session_directory"]].to_string(
+            index=False
+        )
+    )
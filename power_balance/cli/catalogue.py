@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Session Catalogue
+
+This script queries the SQLite catalogue of session output directories
+for the sessions matching filters on their fields, parameters and summary
+metrics, and back-fills the catalogue from existing session directories.
+
+"""
+
+import os
+import typing
+
+import click
+import pandas as pd
+
+import power_balance.results.catalogue as pbm_catalogue
+
+
+def pbm_query(
+    filters: typing.Sequence[str] = (),
+    metrics: typing.Optional[typing.Sequence[str]] = None,
+    catalogue: typing.Optional[str] = None,
+    output: typing.Optional[str] = None,
+) -> pd.DataFrame:
+    """Find the sessions within the catalogue matching the given filters
+
+    Parameters
+    ----------
+    filters : typing.Sequence[str], optional
+        filters of the form '<name> <operator> <value>'
+    metrics : typing.Sequence[str], optional
+        summary metrics to include, by default all
+    catalogue : str, optional
+        SQLite catalogue file, by default the default catalogue
+    output : str, optional
+        CSV file to write the matching sessions to
+
+    Returns
+    -------
+    pd.DataFrame
+        matching sessions
+    """
+    if catalogue and not os.path.exists(catalogue):
+        raise FileNotFoundError(f"Session catalogue '{catalogue}' not found")
+
+    with pbm_catalogue.Catalogue(catalogue) as session_catalogue:
+        _sessions = session_catalogue.query(filters, metrics)
+
+    if output:
+        _sessions.to_csv(output, index=False)
+
+    if _sessions.empty:
+        click.echo("No matching sessions found")
+    else:
+        click.echo(_sessions.drop(columns=["models", "indexed"]).to_string(index=False))
+
+    return _sessions
+
+
+def pbm_index(
+    directories: typing.Sequence[str],
+    catalogue: typing.Optional[str] = None,
+    recursive: bool = True,
+) -> typing.List[str]:
+    """Add existing session directories to the catalogue
+
+    Parameters
+    ----------
+    directories : typing.Sequence[str]
+        session directories, or directories containing them
+    catalogue : str, optional
+        SQLite catalogue file, by default the default catalogue
+    recursive : bool, optional
+        search subdirectories for session directories, by default True
+
+    Returns
+    -------
+    typing.List[str]
+        session directories added
+    """
+    _indexed: typing.List[str] = []
+
+    with pbm_catalogue.Catalogue(catalogue) as session_catalogue:
+        for directory in directories:
+            if os.path.exists(os.path.join(directory, "configs", "configuration.toml")):
+                session_catalogue.index_session(directory)
+                _indexed.append(directory)
+            else:
+                _indexed += session_catalogue.index_directory(directory, recursive)
+
+        click.echo(
+            f"Indexed {len(_indexed)} session(s) in '{session_catalogue.file_name}'"
+        )
+
+    return _indexed
@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Design Optimisation
+
+This script builds the models specified within the given configuration file
+and searches the selected design variables for the design optimising a
+metric of the model outputs subject to constraints on other metrics,
+writing the history of evaluated designs to a session output directory.
+
+"""
+
+import logging
+import os
+import typing
+
+import click
+
+import power_balance.core as pbm_core
+import power_balance.exceptions as pbm_exc
+
+
+def parse_variables(
+    variables: typing.Sequence[str],
+) -> typing.Dict[str, typing.Optional[typing.Tuple[float, float]]]:
+    """Parse design variables given as 'name' or 'name=lower:upper'
+
+    Parameters
+    ----------
+    variables : typing.Sequence[str]
+        design variable specifications
+
+    Returns
+    -------
+    typing.Dict[str, typing.Optional[typing.Tuple[float, float]]]
+        bounds of each design variable, None if not specified
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the bounds of a variable cannot be parsed
+    """
+    _variables: typing.Dict[str, typing.Optional[typing.Tuple[float, float]]] = {}
+
+    for variable in variables:
+        _name, _, _bounds = variable.partition("=")
+
+        if not _bounds:
+            _variables[_name.strip()] = None
+            continue
+
+        try:
+            _lower, _upper = (float(i) for i in _bounds.split(":"))
+        except ValueError as e:
+            raise pbm_exc.InvalidInputError(
+                f"Invalid design variable '{variable}', expected the form "
+                "'name' or 'name=lower:upper'"
+            ) from e
+
+        _variables[_name.strip()] = (_lower, _upper)
+
+    return _variables
+
+
+def pbm_optimise(
+    config: str,
+    variables: typing.Sequence[str],
+    param_dir: str = "Default",
+    model_dir: str = "Default",
+    profiles_dir: str = "Default",
+    outputdir: str = os.getcwd(),
+    objective: str = "netpowergeneration",
+    sense: str = "maximise",
+    constraints: typing.Sequence[str] = (),
+    step: float = 0.1,
+    population: int = 5,
+    generations: int = 20,
+    tolerance: float = 1e-2,
+    seed: typing.Optional[int] = None,
+    workers: int = 1,
+    cache: typing.Optional[str] = None,
+    verbose: bool = False,
+) -> str:
+    """Optimise a design for a Power Balance Models session
+
+    Parameters
+    ----------
+    config : str
+        address/path of configuration file
+    variables : typing.Sequence[str]
+        design variables given as 'name' or 'name=lower:upper'
+    param_dir : str, optional
+        location of model parameter files, defaults to internal parameters
+    model_dir : str, optional
+        location of models, defaults to internal model directory
+    profiles_dir : str, optional
+        location of profiles, defaults to internal profile directory
+    outputdir : str, optional
+        output data directory, by default current directory
+    objective : str, optional
+        metric to optimise, by default the flat-top average of
+        'netpowergeneration'
+    sense : str, optional
+        'maximise' or 'minimise' the objective, by default 'maximise'
+    constraints : typing.Sequence[str], optional
+        constraints of the form '<metric> <= <value>'
+    step : float, optional
+        relative step either side of the value of variables given without
+        bounds, by default 0.1
+    population : int, optional
+        population size as a multiple of the number of variables, by default 5
+    generations : int, optional
+        maximum number of generations, by default 20
+    tolerance : float, optional
+        relative convergence tolerance of the population, by default 1E-2
+    seed : int, optional
+        seed of the random number generator
+    workers : int, optional
+        number of worker threads simulating concurrently, by default 1
+    cache : str, optional
+        JSON file memoising evaluated designs between sessions
+    verbose : bool, optional
+        increase verbosity of output, by default False
+
+    Returns
+    -------
+    str
+        session output directory
+    """
+    logging.getLogger("PowerBalance").setLevel(
+        logging.DEBUG if verbose else logging.INFO
+    )
+
+    with pbm_core.PowerBalance(
+        config=config,
+        no_browser=True,
+        parameter_directory=param_dir,
+        profiles_directory=profiles_dir,
+        modelica_file_dir=model_dir,
+    ) as pbm_instance:
+        _result = pbm_instance.optimise(
+            parse_variables(variables),
+            objective,
+            sense,
+            constraints,
+            step=step,
+            population=population,
+            generations=generations,
+            tolerance=tolerance,
+            seed=seed,
+            workers=workers,
+            cache_file=cache,
+        )
+
+        _session_directory = os.path.join(
+            outputdir, f"pbm_results_{pbm_instance._time_stamp}"
+        )
+        pbm_instance.write_optimisation(_session_directory)
+
+    for name, value in _result["variables"].items():
+        click.echo(f"{name} = {value}")
+
+    click.echo(
+        f"{objective} = {_result['objective']}"
+        + ("" if _result["feasible"] else " (no feasible design found)")
+    )
+    click.echo(f"Optimisation history written to '{_session_directory}'")
+
+    return _session_directory
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Sensitivity Analysis
+
+This script builds the models specified within the given configuration file
+and evaluates the sensitivity of a metric of the model outputs to the
+selected parameters, writing a ranked report and tornado plot to a session
+output directory.
+
+"""
+
+import logging
+import os
+import typing
+
+import click
+
+import power_balance.analysis.sensitivity as pbm_sens
+import power_balance.core as pbm_core
+
+
+def pbm_sensitivity(
+    config: str,
+    param_dir: str = "Default",
+    model_dir: str = "Default",
+    profiles_dir: str = "Default",
+    outputdir: str = os.getcwd(),
+    metric: str = "netpowergeneration",
+    parameters: typing.Optional[typing.Sequence[str]] = None,
+    method: str = "oat",
+    step: float = 0.1,
+    trajectories: int = 10,
+    levels: int = 4,
+    seed: typing.Optional[int] = None,
+    workers: int = 1,
+    cache: typing.Optional[str] = None,
+    verbose: bool = False,
+) -> str:
+    """Evaluate parameter sensitivities for a Power Balance Models session
+
+    Parameters
+    ----------
+    config : str
+        address/path of configuration file
+    param_dir : str, optional
+        location of model parameter files, defaults to internal parameters
+    model_dir : str, optional
+        location of models, defaults to internal model directory
+    profiles_dir : str, optional
+        location of profiles, defaults to internal profile directory
+    outputdir : str, optional
+        output data directory, by default current directory
+    metric : str, optional
+        metric of the model outputs, by default the flat-top average of
+        'netpowergeneration'
+    parameters : typing.Sequence[str], optional
+        parameter names or wildcard patterns to vary, by default all numeric
+        parameters with a non-zero value
+    method : str, optional
+        'oat' for one-at-a-time or 'morris' for elementary effects
+    step : float, optional
+        relative step either side of each base value, by default 0.1
+    trajectories : int, optional
+        number of elementary effects trajectories, by default 10
+    levels : int, optional
+        number of elementary effects grid levels, by default 4
+    seed : int, optional
+        seed for the elementary effects trajectories
+    workers : int, optional
+        number of worker threads simulating concurrently, by default 1
+    cache : str, optional
+        JSON file memoising evaluated points between sessions
+    verbose : bool, optional
+        increase verbosity of output, by default False
+
+    Returns
+    -------
+    str
+        session output directory
+    """
+    logging.getLogger("PowerBalance").setLevel(
+        logging.DEBUG if verbose else logging.INFO
+    )
+
+    with pbm_core.PowerBalance(
+        config=config,
+        no_browser=True,
+        parameter_directory=param_dir,
+        profiles_directory=profiles_dir,
+        modelica_file_dir=model_dir,
+    ) as pbm_instance:
+        _report = pbm_instance.sensitivity(
+            metric,
+            parameters,
+            method,
+            step=step,
+            trajectories=trajectories,
+            levels=levels,
+            seed=seed,
+            workers=workers,
+            cache_file=cache,
+        )
+
+        _session_directory = os.path.join(
+            outputdir, f"pbm_results_{pbm_instance._time_stamp}"
+        )
+        pbm_instance.write_sensitivity(_session_directory)
+
+    click.echo(pbm_sens.report_table(_report))
+    click.echo(f"Sensitivity report written to '{_session_directory}'")
+
+    return _session_directory
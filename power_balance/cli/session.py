@@ -9,12 +9,14 @@ specified in the given parameter directory, or model defaults.
 
 """
 
+import contextlib
 import logging
 import os
-from typing import Optional
+from typing import ContextManager, Optional
 
 import power_balance.core as pbm_core
 import power_balance.plugins as pbm_plugins
+import power_balance.results.archive as pbm_archive
 
 
 def pbm_main(
@@ -26,6 +28,8 @@ def pbm_main(
     model_dir: str = "Default",
     profiles_dir: str = "Default",
     from_session: Optional[str] = "",
+    profile_memory: bool = False,
+    force: bool = False,
     **kwargs,
 ) -> None:
     """Runs a Power Balance Models session
@@ -47,7 +51,13 @@ def pbm_main(
     profiles_dir : str, optional
         location of profiles, defaults to internal profile directory
     from_session : str, optional
-        start a new run from the output of a previous run, by default None
+        start a new run from the output directory or archive of a previous
+        run, by default None
+    profile_memory : bool, optional
+        record memory usage of each session phase, by default False
+    force : bool, optional
+        run even if the inputs match those of a previous session within the
+        output directory, or of the session run from, by default False
 
     Raises
     ------
@@ -63,47 +73,56 @@ def pbm_main(
 
     logging.getLogger("PowerBalance").setLevel(debug)
 
+    # Held open for the run as inputs of an archived session are read
+    # from a temporary directory which is removed on closing
+    _session_files: ContextManager = contextlib.nullcontext()
+
+    # Runs whose inputs are unchanged return the matching session
+    _previous_sessions = [_args["outputdir"]]
+
     if _args["from_session"]:
-        _check_session_directories(_args)
-
-    with pbm_core.PowerBalance(
-        config=_args["config"],
-        no_browser=_args["no_browser"],
-        parameter_directory=_args["param_dir"],
-        profiles_directory=_args["profiles_dir"],
-        modelica_file_dir=_args["model_dir"],
-        print_intro=True,
-    ) as pbm_instance:
+        _session_files = _check_session_directories(_args)
+        _previous_sessions.append(_args["from_session"])
+
+    with (
+        _session_files,
+        pbm_core.PowerBalance(
+            config=_args["config"],
+            no_browser=_args["no_browser"],
+            parameter_directory=_args["param_dir"],
+            profiles_directory=_args["profiles_dir"],
+            modelica_file_dir=_args["model_dir"],
+            print_intro=True,
+            profile_memory=_args["profile_memory"],
+            previous_sessions=None if _args["force"] else _previous_sessions,
+        ) as pbm_instance,
+    ):
         pbm_instance.run_simulation(_args["outputdir"])
 
         if not no_browser:
             pbm_instance.launch_browser()
 
 
-def _check_session_directories(_args):
+def _check_session_directories(_args) -> pbm_archive.SessionFiles:
     if not os.path.exists(_args["from_session"]):
         raise FileNotFoundError(
             "Cannot run Power Balance from '{}'," " directory not found.".format(
                 _args["from_session"]
             )
         )
-    if not os.path.exists(os.path.join(_args["from_session"], "parameters")):
-        raise FileNotFoundError(
-            "Expected directory 'parameters' in session directory"
-            " '{}', but directory not found.".format(_args["from_session"])
-        )
-    if not os.path.exists(os.path.join(_args["from_session"], "configs")):
-        raise FileNotFoundError(
-            "Expected directory 'configs' in session directory"
-            " '{}', but directory not found.".format(_args["from_session"])
-        )
-    if not os.path.exists(os.path.join(_args["from_session"], "profiles")):
-        raise FileNotFoundError(
-            "Expected directory 'profiles' in session directory"
-            " '{}', but directory not found.".format(_args["from_session"])
-        )
-    _args["profiles_dir"] = os.path.join(_args["from_session"], "profiles")
-    _args["config"] = os.path.join(
-        _args["from_session"], "configs", "configuration.toml"
-    )
-    _args["param_dir"] = os.path.join(_args["from_session"], "parameters")
+
+    _session_files = pbm_archive.open_session(_args["from_session"])
+
+    for directory in ("parameters", "configs", "profiles"):
+        if not _session_files.exists(directory):
+            _session_files.close()
+            raise FileNotFoundError(
+                f"Expected directory '{directory}' in session directory "
+                f"'{_args['from_session']}', but directory not found."
+            )
+
+    _args["profiles_dir"] = _session_files.local_path("profiles")
+    _args["config"] = _session_files.local_path("configs/configuration.toml")
+    _args["param_dir"] = _session_files.local_path("parameters")
+
+    return _session_files
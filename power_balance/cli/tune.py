@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+                    Power Balance Models Solver Tuning
+
+This script builds the models specified within the given configuration file
+and compares the outputs obtained using candidate solver and tolerance
+settings against a reference simulation using the current settings,
+recommending the fastest setting within the given error bounds.
+
+"""
+
+import logging
+import os
+import typing
+
+import click
+import toml
+
+import power_balance.core as pbm_core
+import power_balance.parameters as pbm_params
+import power_balance.tuning as pbm_tuning
+
+
+def pbm_tune(
+    config: str,
+    param_dir: str = "Default",
+    model_dir: str = "Default",
+    profiles_dir: str = "Default",
+    solvers: typing.Sequence[str] = pbm_tuning.DEFAULT_SOLVERS,
+    tolerances: typing.Sequence[float] = pbm_tuning.DEFAULT_TOLERANCES,
+    rtol: float = 1e-3,
+    atol: float = 1.0,
+    repeats: int = 1,
+    write: bool = False,
+    report: typing.Optional[str] = None,
+    verbose: bool = False,
+) -> typing.Dict[str, typing.Any]:
+    """Recommend solver settings for a Power Balance Models session
+
+    Parameters
+    ----------
+    config : str
+        address/path of configuration file
+    param_dir : str, optional
+        location of model parameter files, defaults to internal parameters
+    model_dir : str, optional
+        location of models, defaults to internal model directory
+    profiles_dir : str, optional
+        location of profiles, defaults to internal profile directory
+    solvers : typing.Sequence[str], optional
+        candidate solvers
+    tolerances : typing.Sequence[float], optional
+        candidate tolerances
+    rtol : float, optional
+        maximum relative error in the flat-top averages, by default 1E-3
+    atol : float, optional
+        absolute difference below which averages are equal, by default 1.0
+    repeats : int, optional
+        number of timed runs of each setting, by default 1
+    write : bool, optional
+        write the recommended setting to the simulation options file of
+        the parameter directory, by default False
+    report : str, optional
+        CSV file to write the full tuning report to
+    verbose : bool, optional
+        increase verbosity of output, by default False
+
+    Returns
+    -------
+    typing.Dict[str, typing.Any]
+        recommended solver and tolerance
+
+    Raises
+    ------
+    click.UsageError
+        if writing the recommendation to the internal parameter set
+    """
+    logging.getLogger("PowerBalance").setLevel(
+        logging.DEBUG if verbose else logging.INFO
+    )
+
+    with pbm_core.PowerBalance(
+        config=config,
+        no_browser=True,
+        parameter_directory=param_dir,
+        profiles_directory=profiles_dir,
+        modelica_file_dir=model_dir,
+    ) as pbm_instance:
+        _options_file = os.path.join(
+            pbm_instance.configuration["parameters_directory"],
+            pbm_instance.configuration["simulation_options_file"],
+        )
+
+        if write and os.path.samefile(
+            pbm_instance.configuration["parameters_directory"],
+            pbm_params.DEFAULT_PARAM_DIR,
+        ):
+            raise click.UsageError(
+                "Cannot write recommendation to the internal parameter set, "
+                "specify a parameter directory created with 'powerbalance new'"
+            )
+
+        _tuner = pbm_tuning.SolverTuner(
+            pbm_instance, rtol=rtol, atol=atol, repeats=repeats
+        )
+        _report = _tuner.run(solvers, tolerances)
+
+    click.echo(pbm_tuning.SolverTuner.report_table(_report))
+
+    if report:
+        _report.to_csv(report, index=False)
+
+    _recommended = pbm_tuning.SolverTuner.recommend(_report)
+
+    click.echo(
+        f"Recommended setting: solver = {_recommended['solver']}, "
+        f"tolerance = {_recommended['tolerance']:.0e}"
+    )
+
+    if write:
+        _options = toml.load(_options_file)
+        _options.update(_recommended)
+
+        with open(_options_file, "w") as out_f:
+            toml.dump(_options, out_f)
+
+        click.echo(f"Simulation options written to '{_options_file}'")
+
+    return _recommended
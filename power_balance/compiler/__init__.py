@@ -0,0 +1,429 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Persistent Modelica Compiler
+============================
+
+Compilation of Modelica models using a single long running interactive OMC
+process. The Modelica libraries defined within the environment are loaded
+once when the server starts, subsequent builds then only incur the cost of
+loading and translating the Power Balance models themselves.
+
+Servers are shared by all sessions within a process, keyed by the OMC binary
+and the library specification, so that consecutive builds of different models
+or model variants (e.g. those arising from structural parameter
+substitutions) reuse the same process.
+
+Contents
+========
+
+Classes
+-------
+
+    OMCServer - handle on an interactive OMC process
+    ServerCompiler - PyDelica compiler which builds models via an OMCServer
+
+Functions
+---------
+
+    get_server - retrieve the shared OMCServer for a given binary and libraries
+    shutdown_servers - stop all running OMCServer processes
+
+"""
+
+__date__ = "2026-10-19"
+
+import atexit
+import getpass
+import glob
+import logging
+import os
+import pathlib
+import platform
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import typing
+import uuid
+
+import pydelica.compiler
+import pydelica.exception
+
+import power_balance.exceptions as pbm_exc
+import power_balance.pydelica_internals as pbm_pydelica
+
+_SERVERS: typing.Dict[typing.Tuple, "OMCServer"] = {}
+_SERVERS_LOCK = threading.Lock()
+
+
+def _modelica_string(value: str) -> str:
+    """Convert a Python string into a quoted Modelica string literal"""
+    return '"{}"'.format(str(value).replace("\\", "/").replace('"', '\\"'))
+
+
+class OMCServer:
+    """Interactive OMC process communicated with via ZeroMQ
+
+    The server is started with the given libraries preloaded, and can then
+    be sent Modelica scripting expressions to load, translate and build
+    models without re-parsing the libraries each time.
+    """
+
+    def __init__(
+        self,
+        omc_binary: str,
+        libraries: typing.Optional[typing.Iterable[typing.Dict[str, str]]] = None,
+        startup_timeout: float = 30.0,
+        environment: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        omc_binary : str
+            location of the OMC binary
+        libraries : typing.Iterable[typing.Dict[str, str]], optional
+            library specifications to load on start, each containing the
+            keys 'name' and 'version', by default none
+        startup_timeout : float, optional
+            time in seconds to wait for the server to start, by default 30
+        environment : typing.Dict[str, str], optional
+            environment for the OMC process, by default current environment
+
+        Raises
+        ------
+        power_balance.exceptions.InternalError
+            if the ZeroMQ bindings are not installed or the server fails to start
+        """
+        try:
+            import zmq
+        except ImportError as e:
+            raise pbm_exc.InternalError(
+                "A persistent OMC compiler requires the ZeroMQ Python bindings, "
+                "install these using 'pip install power_balance[server]'"
+            ) from e
+
+        self._logger = logging.getLogger("PowerBalance.Compiler")
+        self._lock = threading.Lock()
+        self._libraries = list(libraries or [])
+        self._suffix = f"pbm{uuid.uuid4().hex}"
+        self._log_file = tempfile.NamedTemporaryFile(
+            "w", prefix="pbm_omc_", suffix=".log", delete=False
+        )
+
+        self._process = subprocess.Popen(
+            [omc_binary, "--interactive=zmq", f"-z={self._suffix}", "--locale=C"],
+            shell=False,
+            stdout=self._log_file,
+            stderr=subprocess.STDOUT,
+            env=environment or os.environ.copy(),
+        )
+
+        _port_file = self._port_file_name()
+        _start = time.time()
+
+        while not os.path.exists(_port_file):
+            if self._process.poll() is not None:
+                raise pbm_exc.InternalError(
+                    "Interactive OMC process terminated during startup, "
+                    f"see log '{self._log_file.name}'"
+                )
+            if time.time() - _start > startup_timeout:
+                self._process.kill()
+                raise pbm_exc.InternalError(
+                    f"Timed out after {startup_timeout}s waiting for OMC server"
+                )
+            time.sleep(0.05)
+
+        with open(_port_file) as in_f:
+            _address = in_f.read().strip()
+
+        self._context = zmq.Context.instance()
+        self._socket = self._context.socket(zmq.REQ)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.connect(_address)
+
+        self._logger.debug("Connected to OMC server at '%s'", _address)
+
+        for library in self._libraries:
+            _version = library.get("version", "")
+            self._check(
+                f"loadModel({library['name']}, {{{_modelica_string(_version)}}})"
+            )
+
+        self._base_classes = set(self._class_names())
+        self._user_classes: typing.Set[str] = set()
+        self.n_builds = 0
+
+    def _port_file_name(self) -> str:
+        if platform.system() == "Windows":
+            _file_name = f"openmodelica.port.{self._suffix}"
+        else:
+            _file_name = f"openmodelica.{getpass.getuser()}.port.{self._suffix}"
+        return os.path.join(tempfile.gettempdir(), _file_name)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the OMC process is still running"""
+        return self._process.poll() is None
+
+    def send(self, expression: str) -> str:
+        """Send a scripting expression to the server and return the result
+
+        Parameters
+        ----------
+        expression : str
+            Modelica scripting expression
+
+        Returns
+        -------
+        str
+            result of the expression as returned by OMC
+        """
+        if not self.alive:
+            raise pbm_exc.InternalError("Cannot send command, OMC server not running")
+        self._logger.debug("OMC: %s", expression)
+        self._socket.send_string(expression)
+        return self._socket.recv_string().strip()
+
+    def _check(self, expression: str) -> str:
+        """Send an expression which is expected to return 'true'"""
+        if (_result := self.send(expression)) != "true":
+            raise pydelica.exception.OMBuildError(
+                f"OMC command '{expression}' failed: {self.send('getErrorString()')}"
+            )
+        return _result
+
+    def _class_names(self) -> typing.List[str]:
+        _names = self.send("getClassNames()").strip("{}")
+        return [i.strip() for i in _names.split(",") if i.strip()]
+
+    def _unload_user_classes(self) -> None:
+        """Remove classes loaded by a previous build keeping the libraries"""
+        for class_name in self._user_classes:
+            self.send(f"deleteClass({class_name})")
+        self._user_classes = set()
+
+    def build(
+        self,
+        source_files: typing.List[str],
+        model_addr: str,
+        build_directory: str,
+        omc_flags: typing.Optional[typing.Dict[str, typing.Optional[str]]] = None,
+    ) -> pathlib.Path:
+        """Build a model from the given source files within a build directory
+
+        Parameters
+        ----------
+        source_files : typing.List[str]
+            Modelica files to load, any classes from a previous build
+            are replaced
+        model_addr : str
+            address of the model to build
+        build_directory : str
+            directory in which to create the model binary
+        omc_flags : typing.Dict[str, str | None], optional
+            additional OMC compiler flags
+
+        Returns
+        -------
+        pathlib.Path
+            the build directory
+
+        Raises
+        ------
+        pydelica.exception.OMBuildError
+            if loading of sources or building of the model fails
+        """
+        with self._lock:
+            self._unload_user_classes()
+
+            _files = ", ".join(_modelica_string(i) for i in source_files)
+            self._check(f"loadFiles({{{_files}}})")
+            self._user_classes = set(self._class_names()) - self._base_classes
+
+            self.send("clearCommandLineOptions()")
+            for flag, value in (omc_flags or {}).items():
+                _option = f"{flag}={value}" if value else flag
+                self.send(f"setCommandLineOptions({_modelica_string(_option)})")
+
+            self.send(f"cd({_modelica_string(build_directory)})")
+
+            _result = self.send(f"buildModel({model_addr})")
+
+            if not _result.strip("{}").replace('"', "").replace(",", "").strip():
+                raise pydelica.exception.OMBuildError(
+                    f"Failed to build model '{model_addr}': "
+                    f"{self.send('getErrorString()')}"
+                )
+
+            self.n_builds += 1
+
+        return pathlib.Path(build_directory)
+
+    def close(self) -> None:
+        """Stop the OMC process"""
+        if self.alive:
+            try:
+                self._socket.send_string("quit()")
+            finally:
+                self._process.terminate()
+                self._process.wait()
+        self._socket.close()
+        self._log_file.close()
+
+    def __enter__(self) -> "OMCServer":
+        return self
+
+    def __exit__(self, *_, **__) -> None:
+        self.close()
+
+
+def _server_key(
+    omc_binary: str, libraries: typing.Iterable[typing.Dict[str, str]]
+) -> typing.Tuple:
+    return (
+        omc_binary,
+        tuple((lib["name"], lib.get("version", "")) for lib in libraries),
+    )
+
+
+def get_server(
+    omc_binary: str,
+    libraries: typing.Optional[typing.Iterable[typing.Dict[str, str]]] = None,
+) -> OMCServer:
+    """Retrieve the shared server for the given binary and libraries
+
+    A new server is started if one does not exist or the existing
+    server process has terminated.
+
+    Parameters
+    ----------
+    omc_binary : str
+        location of the OMC binary
+    libraries : typing.Iterable[typing.Dict[str, str]], optional
+        library specifications to preload
+
+    Returns
+    -------
+    OMCServer
+        running OMC server instance
+    """
+    _libraries = list(libraries or [])
+    _key = _server_key(omc_binary, _libraries)
+
+    with _SERVERS_LOCK:
+        if _key not in _SERVERS or not _SERVERS[_key].alive:
+            _SERVERS[_key] = OMCServer(omc_binary, _libraries)
+        return _SERVERS[_key]
+
+
+def shutdown_servers() -> None:
+    """Stop all OMC servers started by this process"""
+    with _SERVERS_LOCK:
+        for server in _SERVERS.values():
+            server.close()
+        _SERVERS.clear()
+
+
+atexit.register(shutdown_servers)
+
+
+class ServerCompiler(pydelica.compiler.Compiler):
+    """PyDelica compiler which performs builds using a shared OMCServer
+
+    This is a drop in replacement for the compiler of a PyDelica session,
+    the build directories produced match those of the default compiler so
+    binaries and XML files are discovered in the same manner.
+    """
+
+    def compile(
+        self,
+        modelica_source_file: typing.Union[str, pathlib.Path],
+        model_addr: typing.Optional[str] = None,
+        c_source_dir: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        extra_models: typing.Optional[typing.List[str]] = None,
+        custom_library_spec: typing.Optional[typing.List[typing.Dict[str, str]]] = None,
+    ) -> pathlib.Path:
+        """Compile Modelica source file using the persistent OMC server
+
+        Parameters
+        ----------
+        modelica_source_file : str
+            Modelica source file to compile
+        model_addr : str, optional
+            model within source file to compile, default is first found
+        c_source_dir : str, optional
+            directory containing any additional required C sources
+        extra_models : typing.List[str], optional
+            additional other model dependencies
+        custom_library_spec : typing.List[typing.Dict[str, str]], optional
+            library versions to preload within the server
+
+        Returns
+        -------
+        pathlib.Path
+            location of output binary
+        """
+        _source_file = pathlib.Path(modelica_source_file).absolute()
+
+        if not _source_file.exists():
+            raise FileNotFoundError(
+                f"Could not compile Modelica file '{_source_file}', file does not exist"
+            )
+
+        if (
+            not c_source_dir
+            and (
+                _candidate := _source_file.parent.joinpath("Resources", "Include")
+            ).exists()
+        ):
+            c_source_dir = _candidate
+
+        if not model_addr:
+            model_addr = _source_file.stem
+
+        _build_dir = tempfile.mkdtemp()
+
+        # Sources must persist until the server has loaded them, a separate
+        # directory is used so that relative resource paths are preserved
+        _source_dir = os.path.join(_build_dir, "sources")
+        os.makedirs(_source_dir)
+
+        if c_source_dir:
+            self._prepare_c_incls(f"{c_source_dir}", _source_dir)
+
+        _sources = [os.path.join(_source_dir, _source_file.name)]
+        shutil.copy(_source_file, _sources[0])
+
+        for model in extra_models or []:
+            _orig_model = _source_file.parent.joinpath(model)
+            if not _orig_model.exists():
+                raise FileNotFoundError(
+                    f"Could not compile supplementary Modelica file '{model}',"
+                    " file does not exist"
+                )
+            _sources.append(os.path.join(_source_dir, os.path.basename(model)))
+            shutil.copy(_orig_model, _sources[-1])
+
+        if not self._omc_binary:
+            raise pydelica.exception.BinaryNotFoundError("Failed to find OMC binary")
+
+        _server = get_server(self._omc_binary, custom_library_spec)
+
+        _server.build(
+            source_files=_sources,
+            model_addr=model_addr,
+            build_directory=_build_dir,
+            omc_flags=self._omc_flags,
+        )
+
+        if not glob.glob(os.path.join(_build_dir, "*_init.xml")):
+            raise pydelica.exception.ModelicaFileGenerationError(
+                f"Failed to find model XML file in the directory: {_build_dir}"
+            )
+
+        pbm_pydelica.add_build_directory(self, _build_dir)
+
+        return pathlib.Path(_build_dir)
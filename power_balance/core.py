@@ -19,6 +19,7 @@ Session classes
 
 __date__ = "2021-06-10"
 
+import contextlib
 import datetime
 import glob
 import importlib.metadata
@@ -27,6 +28,7 @@ import logging
 import os
 import re
 import shutil
+import sqlite3
 import subprocess
 import tempfile
 import typing
@@ -39,16 +41,35 @@ import pydelica
 import toml
 
 import power_balance
+import power_balance.analysis.optimisation as pbm_opt
+import power_balance.analysis.sensitivity as pbm_sens
+import power_balance.analysis.surrogate as pbm_surr
 import power_balance.browser as pbm_browser
+import power_balance.calc.summary as pbm_summary
+import power_balance.campaign as pbm_campaign
+import power_balance.compiler as pbm_compiler
 import power_balance.configs as pbm_config
 import power_balance.environment as pbm_env
 import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation as pbm_instr
+import power_balance.instrumentation.solver as pbm_solver
 import power_balance.modelica_templating.pfmagnets as pbm_pfmagnet_templates
 import power_balance.models as pbm_models
 import power_balance.parameters as pbm_params
 import power_balance.plotting.common as pbm_plot
 import power_balance.plugins as pbm_plugin
 import power_balance.profiles as pbm_profiles
+import power_balance.profiles.knots as pbm_knots
+import power_balance.profiles.timeseries as pbm_ts
+import power_balance.pydelica_internals as pbm_pydelica
+import power_balance.results.blobs as pbm_blobs
+import power_balance.results.catalogue as pbm_catalogue
+import power_balance.results.dense as pbm_dense
+import power_balance.results.handoff as pbm_handoff
+import power_balance.results.manifest as pbm_manifest
+import power_balance.results.storage as pbm_storage
+import power_balance.results.sweep as pbm_sweep
+import power_balance.screening as pbm_screen
 import power_balance.validation.config as pbm_valid
 
 logging.basicConfig()
@@ -108,6 +129,9 @@ class PowerBalance:
         power data stored after a simulation run (else None)
     configuration : typing.Dict[str, typing.Any]
         current configuration options as dictionary
+    matching_session : str | None
+        previous session with the same inputs, the run returning this
+        session rather than building and simulating the models
     """
 
     def __init__(
@@ -118,6 +142,9 @@ class PowerBalance:
         profiles_directory: str = "Default",
         parameter_directory: str = "Default",
         print_intro: bool = False,
+        profile_memory: bool = False,
+        compiled_session: typing.Optional[pydelica.Session] = None,
+        previous_sessions: typing.Optional[typing.Sequence[str]] = None,
     ) -> None:
         """
         Parameters
@@ -139,6 +166,16 @@ class PowerBalance:
             by default 'Default'
         print_intro : bool, optional
             print intro message
+        profile_memory : bool, optional
+            record the peak memory usage and largest allocation sites of
+            each phase of the session, by default False
+        compiled_session : pydelica.Session, optional
+            session of another instance which has built the same models, copies
+            of its binaries being simulated rather than building the models
+        previous_sessions : typing.Sequence[str], optional
+            session directories or archives, or directories containing them,
+            searched for a session with the same inputs, the models not being
+            built if one is found, by default None (always run)
 
         Raises
         ------
@@ -149,6 +186,9 @@ class PowerBalance:
         AssertionError
             If 'modelica_file_directory' is None and not present in config
         """
+        pbm_instr.TIMER.reset()
+        if profile_memory:
+            pbm_instr.TIMER.profile_memory()
         self._logger = logging.getLogger("PowerBalance")
         logging.getLogger("PyDelica.Compiler").setLevel(
             self._logger.getEffectiveLevel()
@@ -158,9 +198,18 @@ class PowerBalance:
             _pde_ll = pydelica.logger.OMLogLevel.DEBUG
         self._no_browser = no_browser
         self.power_data: typing.Dict[str, pd.DataFrame] = {}
+        self.sweep_data: typing.Dict[str, pbm_dense.DenseSweepResults] = {}
+        self.campaign_data: typing.Dict[str, pbm_campaign.CampaignResults] = {}
+        self.sensitivity_data: typing.Optional[pd.DataFrame] = None
+        self.optimisation_history: typing.Optional[pd.DataFrame] = None
+        self.optimisation_result: typing.Dict[str, typing.Any] = {}
+        self.surrogate: typing.Optional[pbm_surr.Surrogate] = None
+        self.solver_statistics = pbm_solver.SolverStatistics()
+        self._handoff_directory: typing.Optional[tempfile.TemporaryDirectory] = None
         self.pydelica_session = pydelica.Session(_pde_ll)
 
         self.pydelica_session.use_libraries(pbm_env.MODELICA_ENVIRONMENT)
+        self._compiled_session = compiled_session
 
         self.configuration = pbm_config.read_options_from_config(config)
 
@@ -211,6 +260,20 @@ class PowerBalance:
         except pydantic.ValidationError as e:
             raise pbm_exc.ValidationError(e.json(), "session config") from e
 
+        # Builds are performed by a shared interactive OMC process which
+        # retains the loaded Modelica libraries between model compilations
+        if self.configuration["persistent_compiler"]:
+            self._logger.info("Using persistent OMC compiler server")
+            pbm_pydelica.set_compiler(
+                self.pydelica_session, pbm_compiler.ServerCompiler()
+            )
+
+        pbm_instr.TIMER.tracing = self.configuration["trace"]
+
+        # Created here such that missing optional dependencies of the
+        # back-end are reported before any models are simulated
+        self._storage = pbm_storage.storage_backend(self.configuration["storage"])
+
         self._profile_sweep = self._check_for_profile_sweep()
 
         self._parameter_set = pbm_params.PBMParameterSet(**self.configuration)
@@ -220,8 +283,49 @@ class PowerBalance:
         self._check_profiles()
 
         self._check_for_model_mods()
+
+        self._given_input_hash = pbm_manifest.manifest_hash(self.input_manifest())
+        self._run_manifest: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self.matching_session: typing.Optional[str] = None
+
+        if previous_sessions:
+            self.matching_session = pbm_manifest.find_session(
+                previous_sessions, self._given_input_hash
+            )
+
+        if self.matching_session:
+            self._logger.info(
+                "Inputs unchanged from session '%s', models will not be built",
+                self.matching_session,
+            )
+            return
+
         self.read_models_from_directory()
 
+        # Parameters are extended by the defaults of the built models
+        self._built_input_hash: typing.Optional[str] = pbm_manifest.manifest_hash(
+            self.input_manifest()
+        )
+
+    def input_manifest(self) -> typing.Dict[str, typing.Any]:
+        """Hashes of the current effective inputs of the session
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            hashes of the configuration, parameters, profiles and model
+            sources, and the software versions
+        """
+        return pbm_manifest.input_manifest(
+            self.configuration,
+            self._parameter_set,
+            {
+                "pbm": power_balance.__version__,
+                "openmodelica": self._om_version,
+                "pydelica": importlib.metadata.version("pydelica"),
+            },
+        )
+
     def clear_cache(self) -> None:
         """Clear the PyDelica session cache
 
@@ -236,6 +340,11 @@ class PowerBalance:
 
     def __exit__(self, *args, **kwargs):
         self.clear_cache()
+        if self._handoff_directory is not None:
+            self._handoff_directory.cleanup()
+            self._handoff_directory = None
+        if pbm_instr.TIMER.memory:
+            pbm_instr.TIMER.memory.stop()
 
     def _deduce_profile_max_values(self) -> typing.Dict[str, float]:
         """
@@ -293,12 +402,18 @@ class PowerBalance:
         _stop_time = self._parameter_set.get_simulation_options("stopTime")
         _time_step = self._parameter_set.get_simulation_options("stepSize")
 
+        # On an event-aligned grid the output step may be coarse, the profile
+        # breakpoints are still resolved to at least the default table step
+        if self.configuration["output_grid"] == "events":
+            _time_step = min(_time_step, pbm_knots.KNOT_RESOLUTION)
+
         pbm_profiles.generate_all(
             output_directory=self.configuration["profiles_directory"],
             time_range=plasma_tuple,
             stop_time=_stop_time,
             time_step=_time_step,
             max_values=self._deduce_profile_max_values(),
+            knots=self.configuration["profile_format"] == "knots",
         )
 
     def _check_for_model_mods(self) -> bool:
@@ -409,6 +524,9 @@ class PowerBalance:
         else:
             _struct_param_file = ""
 
+        if self._compiled_session:
+            self._attach_compiled_models(self._compiled_session)
+
         # Get models contained within the specified models directory
         _local_models = pbm_models.get_local_models(
             session=self.pydelica_session,
@@ -416,6 +534,7 @@ class PowerBalance:
             model_name_list=self.configuration["models"],
             model_file_dir=_mod_file_dir,
             parameter_set=self._parameter_set,
+            prebuilt=bool(self._compiled_session),
         )
 
         _binaries_folder = None
@@ -451,6 +570,34 @@ class PowerBalance:
 
         return _binaries_folder, _local_models
 
+    def _attach_compiled_models(self, compiled_session: pydelica.Session) -> None:
+        """Simulate copies of the binaries built by another session
+
+        Parameter values and simulation options applied to the other session
+        are discarded, the defaults being read from the copied XML files,
+        which are only rewritten when a model is simulated.
+
+        Parameters
+        ----------
+        compiled_session : pydelica.Session
+            session containing the built models
+        """
+        _directory = tempfile.mkdtemp()
+        self._logger.info("Using compiled models copied to '%s'", _directory)
+
+        _session = pbm_pydelica.replicate_session(compiled_session, _directory)
+
+        # Copies are removed alongside the build directories of this session
+        pbm_pydelica.share_compiler(_session, self.pydelica_session)
+        pbm_pydelica.add_build_directory(
+            pbm_pydelica.get_compiler(_session), _directory
+        )
+        pbm_pydelica.reset_models(_session, self.configuration["profiles_directory"])
+
+        _session.set_output_format("csv")
+
+        self.pydelica_session = _session
+
     def _print_intro(self, config_file_addr: str) -> None:
         """Print information message at start of session
 
@@ -744,6 +891,248 @@ class PowerBalance:
         """
         return self._parameter_set.set_parameter(parameter_name, value)
 
+    @property
+    def plasma_scenario(self) -> typing.Dict[str, typing.Any]:
+        """Plasma scenario timings for the session"""
+        return dict(self._plasma_scenario)
+
+    def screen(self, params_table: pd.DataFrame) -> pd.DataFrame:
+        """Evaluate the flat-top power of the algebraic subsystems without
+        running a simulation
+
+        The air/gas, water and blanket detritiation, waste heat and power
+        generation subsystems of 'Tokamak.Interdependencies' are evaluated
+        for every row of the table at once, see 'power_balance.screening'.
+
+        Parameters
+        ----------
+        params_table : pd.DataFrame
+            values of the parameters to vary, one evaluation per row, all
+            other parameters taking their values within the session
+
+        Returns
+        -------
+        pd.DataFrame
+            flat-top power of each subsystem for every row
+        """
+        _parameters = dict(self._parameter_set.items())
+
+        # As within the models, the detritiation systems are sized for the
+        # peak of the thermal power profile
+        _thermal_profile = os.path.join(
+            self.configuration["profiles_directory"], pbm_summary.THERMAL_PROFILE
+        )
+
+        if os.path.exists(_thermal_profile):
+            _parameters[pbm_screen.THERMAL_POWER] = (
+                np.max(pbm_ts.read_profile(_thermal_profile).values) / 1e6
+            )
+
+        return pbm_screen.ScreeningEvaluator(
+            _parameters, self._parameter_set.get_structural_parameters()
+        ).evaluate(params_table)
+
+    def sensitivity(
+        self,
+        metric: str = "netpowergeneration",
+        parameters: typing.Optional[typing.Sequence[str]] = None,
+        method: str = "oat",
+        **kwargs: typing.Any,
+    ) -> pd.DataFrame:
+        """Evaluate the sensitivity of a metric of the model outputs to the
+        session parameters, see 'power_balance.analysis.sensitivity'
+
+        Parameters
+        ----------
+        metric : str, optional
+            metric of the model outputs, by default the flat-top average of
+            'netpowergeneration'
+        parameters : typing.Sequence[str], optional
+            parameter names or wildcard patterns to vary, by default all
+            numeric parameters with a non-zero value
+        method : str, optional
+            'oat' for one-at-a-time or 'morris' for elementary effects,
+            by default 'oat'
+        **kwargs
+            additional arguments to 'SensitivityAnalysis' such as the
+            relative step, number of workers and cache file
+
+        Returns
+        -------
+        pd.DataFrame
+            report ranking the parameters from most to least influential
+        """
+        self.sensitivity_data = pbm_sens.SensitivityAnalysis(
+            self, metric, parameters, method, **kwargs
+        ).run()
+        return self.sensitivity_data
+
+    def optimise(
+        self,
+        variables: typing.Union[
+            typing.Sequence[str], typing.Mapping[str, typing.Sequence[float]]
+        ],
+        objective: str = "netpowergeneration",
+        sense: str = "maximise",
+        constraints: typing.Sequence[str] = (),
+        **kwargs: typing.Any,
+    ) -> typing.Dict[str, typing.Any]:
+        """Optimise a metric of the model outputs over a set of design
+        variables, see 'power_balance.analysis.optimisation'
+
+        Parameters
+        ----------
+        variables : typing.Sequence[str] | typing.Mapping[str, typing.Sequence[float]]
+            design variables either as parameter names or as a mapping of
+            parameter names to lower and upper bounds
+        objective : str, optional
+            metric to optimise, by default the flat-top average of
+            'netpowergeneration'
+        sense : str, optional
+            'maximise' or 'minimise' the objective, by default 'maximise'
+        constraints : typing.Sequence[str], optional
+            constraints of the form '<metric> <= <value>'
+        **kwargs
+            additional arguments to 'Optimiser' such as the population size,
+            number of generations, number of workers and cache file
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            best design found and its objective value
+        """
+        _optimiser = pbm_opt.Optimiser(
+            self, variables, objective, sense, constraints, **kwargs
+        )
+        self.optimisation_result = _optimiser.run()
+        self.optimisation_history = _optimiser.history()
+        return self.optimisation_result
+
+    def fit_surrogate(
+        self,
+        metrics: typing.Sequence[str] = ("netpowergeneration",),
+        method: str = "rbf",
+        folds: int = 5,
+        **options: typing.Any,
+    ) -> pd.DataFrame:
+        """Fit a surrogate model of metrics of the model outputs to the results
+        of the parameter sweep, see 'power_balance.analysis.surrogate'
+
+        Parameters
+        ----------
+        metrics : typing.Sequence[str], optional
+            metrics to approximate, by default the flat-top average of
+            'netpowergeneration'
+        method : str, optional
+            'rbf', 'gp' or 'polynomial', by default 'rbf'
+        folds : int, optional
+            number of cross-validation folds, by default 5
+        **options
+            options of the method such as the polynomial degree
+
+        Returns
+        -------
+        pd.DataFrame
+            cross-validation error of each metric
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the session results are not those of a parameter sweep
+        """
+        _indexes = {
+            model: pbm_sweep.SweepIndex(dataframe, self._sweep_parameters(model))
+            for model, dataframe in self.power_data.items()
+        }
+
+        self.surrogate = pbm_surr.Surrogate(
+            pbm_surr.training_data(_indexes, metrics, self._plasma_scenario),
+            metrics,
+            method,
+            folds,
+            **options,
+        )
+
+        self._logger.info(
+            "Surrogate cross-validation error:\n%s",
+            self.surrogate.cross_validation.to_string(index=False),
+        )
+
+        return self.surrogate.cross_validation
+
+    def load_surrogate(self, file_name: str) -> None:
+        """Load a surrogate model saved with the outputs of a session
+
+        Parameters
+        ----------
+        file_name : str
+            saved surrogate, 'data/surrogate.json' within a session directory
+        """
+        self.surrogate = pbm_surr.Surrogate.load(file_name)
+
+    def predict(
+        self,
+        points: typing.Union[
+            typing.Mapping[str, typing.Any],
+            typing.Sequence[typing.Mapping[str, typing.Any]],
+            pd.DataFrame,
+        ],
+    ) -> pd.DataFrame:
+        """Predict metrics of the model outputs at new values of the sweep
+        parameters using the surrogate model
+
+        Parameters
+        ----------
+        points : typing.Mapping[str, Any] | typing.Sequence[typing.Mapping[str, Any]] | pd.DataFrame
+            value of each swept parameter for one or more points
+
+        Returns
+        -------
+        pd.DataFrame
+            parameter values and predicted metric values of each point
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if no surrogate model has been fitted or loaded
+        """
+        if not self.surrogate:
+            raise pbm_exc.InvalidInputError(
+                "No surrogate model, run 'fit_surrogate' after a parameter "
+                "sweep or 'load_surrogate'"
+            )
+        return self.surrogate.predict(points)
+
+    def get_simulation_options(
+        self, option_names: Optional[typing.Union[str, typing.List[str]]] = None
+    ) -> typing.Any:
+        """Retrieve simulation options from the parameter set
+
+        Parameters
+        ----------
+        option_names : typing.Union[str, typing.List[str]], optional
+            names of simulation options to retrieve, by default all
+
+        Returns
+        -------
+        typing.Any
+            either a single option value, a list of values or all options
+        """
+        return self._parameter_set.get_simulation_options(option_names)
+
+    def set_simulation_options(self, **options: typing.Any) -> None:
+        """Modify simulation options and apply them to all session models
+
+        Parameters
+        ----------
+        **options
+            simulation option values, e.g. 'solver' and 'tolerance'
+        """
+        self._parameter_set.set_simulation_options(**options)
+
+        for model_name in self.configuration["models"]:
+            self.apply_model_configuration(model_name)
+
     def update_model_input_paths(self) -> None:
         """Replace all variables defined as 'Path' variables with an absolute
         path in order to correctly read in the required inputs.
@@ -991,6 +1380,7 @@ class PowerBalance:
                 )
         return _key
 
+    @pbm_instr.timed("apply_parameters", tags=("model_name",))
     def set_model_parameters(
         self, model_name: str, allow_param_failure: bool = False
     ) -> None:
@@ -1044,6 +1434,7 @@ class PowerBalance:
 
             self.pydelica_session.set_parameter(_modelica_param_addr, _value)
 
+    @pbm_instr.timed("save_parameters")
     def save_parameters(self, output_directory: str) -> None:
         """Save parameters for the session so they can be loaded later
 
@@ -1053,8 +1444,18 @@ class PowerBalance:
             directory to save the parameter sets to
         """
         _param_dir = os.path.join(output_directory, "parameters")
-        self._parameter_set.save_to_directory(_param_dir)
 
+        if not (_store := self._input_store()):
+            self._parameter_set.save_to_directory(_param_dir)
+            return
+
+        with tempfile.TemporaryDirectory(prefix="pbm_parameters_") as temp_dir:
+            self._parameter_set.save_to_directory(temp_dir)
+            self._store_inputs(
+                _store, output_directory, "parameters", glob.glob(f"{temp_dir}/*")
+            )
+
+    @pbm_instr.timed("save_configuration")
     def save_configuration(self, output_directory: str) -> None:
         """Save configuration for the session so it can be loaded later
 
@@ -1068,6 +1469,7 @@ class PowerBalance:
         _config_out = os.path.join(output_directory, "configs", "configuration.toml")
         toml.dump(self.configuration, open(_config_out, "w"))
 
+    @pbm_instr.timed("save_profiles")
     def save_profiles(self, output_directory: str) -> None:
         """Save profiles for the session so they can be loaded later
 
@@ -1082,10 +1484,64 @@ class PowerBalance:
         _out_dir = os.path.join(output_directory, "profiles")
         if not os.path.exists(_out_dir):
             os.mkdir(_out_dir)
+
+        if _store := self._input_store():
+            self._store_inputs(_store, output_directory, "profiles", _profiles)
+            return
+
         for profile_file in _profiles:
             _out_file = os.path.join(_out_dir, os.path.basename(profile_file))
             shutil.copy(profile_file, _out_file)
 
+    def _input_store(self) -> Optional[pbm_blobs.BlobStore]:
+        """Blob store shared by the session inputs, if enabled
+
+        Failure to open the store is logged and the inputs copied instead.
+        """
+        if not self.configuration["blob_store"]:
+            return None
+
+        _directory = self.configuration["blob_store_directory"]
+
+        if _directory == "Default":
+            _directory = pbm_blobs.default_blob_store(self._output_dir)
+
+        try:
+            return pbm_blobs.BlobStore(_directory)
+        except OSError as e:
+            self._logger.warning("Could not open input blob store: %s", e)
+            return None
+
+    def _store_inputs(
+        self,
+        store: pbm_blobs.BlobStore,
+        output_directory: str,
+        subdirectory: str,
+        input_files: typing.List[str],
+    ) -> None:
+        """Add input files to a session subdirectory through the blob store
+
+        Parameters
+        ----------
+        store : pbm_blobs.BlobStore
+            blob store shared between sessions
+        output_directory : str
+            session output directory
+        subdirectory : str
+            session subdirectory to add the files to
+        input_files : typing.List[str]
+            files to add
+        """
+        _inputs: typing.Dict[str, str] = {}
+
+        for input_file in input_files:
+            _file_name = os.path.basename(input_file)
+            _inputs[f"{subdirectory}/{_file_name}"] = store.add(
+                input_file, os.path.join(output_directory, subdirectory, _file_name)
+            )
+
+        pbm_blobs.write_inputs(output_directory, _inputs, store)
+
     def load_parameters(self, directory: str) -> None:
         """Load parameters from a given directory specifying which file is the
         simulation options file
@@ -1105,6 +1561,7 @@ class PowerBalance:
 
         self._parameter_set.load_from_directory(directory)
 
+    @pbm_instr.timed("get_power", tags=("model_name",))
     def get_power(self, model_name: str) -> pd.DataFrame:
         """Retrieve the power results from a Modelica model after simulation
 
@@ -1180,6 +1637,11 @@ class PowerBalance:
 
         _df["netpowergeneration"] = _net_power
 
+        # Event points are retained on an event-aligned grid, a repeated
+        # time point holding the values either side of a discontinuity
+        if self.configuration["output_grid"] == "events":
+            return _df.drop_duplicates(ignore_index=True)
+
         # Modelica can produce multiple values for a given value
         # only keep one for each interval
         _step_size = self._parameter_set.get_simulation_options("stepSize")
@@ -1212,15 +1674,36 @@ class PowerBalance:
                 model_name,
             )
 
-            self.pydelica_session.simulate(model_name)
+            # Solver statistics are requested from the simulation executable,
+            # whose output is captured from PyDelica and printed without them
+            _capture: typing.ContextManager[typing.List[str]] = contextlib.nullcontext(
+                []
+            )
+
+            if self.configuration["solver_statistics"]:
+                self.pydelica_session.get_runtime_options(model_name).LOG_STATS = True
+                _capture = pbm_pydelica.simulation_output(pbm_solver.strip_statistics)
+
+            with (
+                pbm_instr.TIMER.phase("simulate", model=model_name),
+                _capture as sim_output,
+            ):
+                self.pydelica_session.simulate(model_name)
+            pbm_instr.TIMER.count("simulations")
+
+            if sim_output:
+                self.solver_statistics.record(
+                    model_name,
+                    pbm_instr.TIMER.iteration,
+                    "\n".join(sim_output),
+                    sweep_dict_args,
+                )
 
             _power_data[model_name] = self.get_power(model_name)
 
             if sweep_dict_args:
                 for variable, value in sweep_dict_args.items():
-                    _power_data[model_name][variable.lower()] = [value] * len(
-                        _power_data[model_name]
-                    )
+                    _power_data[model_name][variable.lower()] = value
 
                     # Verify variable retrieval successful
                     self._get_internal_parameter_value(variable)
@@ -1254,11 +1737,54 @@ class PowerBalance:
         )
 
         for var in _iteration_dict:
-            _col = len(output_dfs[model_name]) * [_iteration_dict[var]]
-            output_dfs[model_name][var] = _col
+            output_dfs[model_name][var] = _iteration_dict[var]
 
         return _iteration_dict
 
+    def _skip_matched_run(
+        self, sweep_dict: typing.Optional[typing.Dict[str, typing.Any]]
+    ) -> bool:
+        """Whether the run is skipped as the inputs matched a previous session
+
+        Where the parameters have been modified since the session was
+        created the models are built and the run is not skipped.
+        """
+        if not self.matching_session:
+            return False
+
+        if pbm_manifest.manifest_hash(self.input_manifest()) != self._given_input_hash:
+            self._logger.info(
+                "Inputs modified since matching session '%s', building models",
+                self.matching_session,
+            )
+            self.matching_session = None
+            self.read_models_from_directory()
+            # The inputs as given no longer describe the outputs of the run
+            self._built_input_hash = None
+            return False
+
+        if sweep_dict:
+            raise pbm_exc.InvalidInputError(
+                "Cannot perform sweep, models were not built as the inputs "
+                f"matched session '{self.matching_session}'"
+            )
+
+        self._logger.info(
+            "Skipping run, outputs unchanged from session '%s'",
+            self.matching_session,
+        )
+        return True
+
+    def _record_run_inputs(
+        self, sweep_dict: typing.Optional[typing.Dict[str, typing.Any]]
+    ) -> None:
+        """Record the input manifest of the run before any sweep modifies the
+        parameter values, a sweep given as an argument being an input"""
+        self._run_manifest = self.input_manifest()
+
+        if sweep_dict:
+            self._run_manifest["sweep"] = pbm_manifest.manifest_hash(sweep_dict)
+
     def run_simulation(
         self,
         output_directory: str = "",
@@ -1279,7 +1805,13 @@ class PowerBalance:
         ------
         RuntimeError
             if retrieval of power data fails after the models have been run
+        power_balance.exceptions.InvalidInputError
+            if a sweep is given when the run matched a previous session
         """
+        if self._skip_matched_run(sweep_dict):
+            return
+
+        self._record_run_inputs(sweep_dict)
 
         self._logger.info("-------- RUNNING POWER BALANCE SIMULATIONS --------")
 
@@ -1295,39 +1827,160 @@ class PowerBalance:
         if output_directory:
             self._output_dir = output_directory
 
-        if _no_sweep := _no_sweep and not self._profile_sweep:
+        if self.configuration.get("campaign"):
+            self._run_campaign()
+        elif _no_sweep := _no_sweep and not self._profile_sweep:
             self.power_data.update(self._run_models())
         elif "sweep" not in self.configuration and self._profile_sweep:
-            self._logger.info("Performing profile only sweep in 'set' mode")
-            _n_vals = len(list(self._profile_sweep.values())[0])
-
-            for model in self._models_list.keys():
-                if not self._models_list[model].compiled:
-                    continue
-
-                for i in range(_n_vals):
-                    _output_dfs = self._run_models()
-
-                    self._sweep_on_profiles(i, _output_dfs, model)
-
-                    if model in self.power_data:
-                        self.power_data[model] = pd.concat(
-                            [
-                                self.power_data[model],
-                                _output_dfs[model],
-                            ],
-                            ignore_index=True,
-                        )
-                    else:
-                        self.power_data[model] = _output_dfs[model]
+            self._perform_profile_sweep()
         else:
             self._perform_sweeps(sweep_dict)
         if not self.power_data:
             raise RuntimeError("Failed to retrieve power data for this run.")
 
+        if _surrogate := self.configuration.get("surrogate"):
+            try:
+                self.fit_surrogate(
+                    _surrogate["metrics"],
+                    _surrogate["method"],
+                    _surrogate["folds"],
+                    **_surrogate["options"],
+                )
+            except pbm_exc.InvalidInputError as e:
+                self._logger.warning("Could not fit surrogate model: %s", e)
+
         self._write_outputs(output_directory)
 
-    def _collate_sweep_run_dfs(self, index: int, combination_dict: typing.Dict):
+    def _perform_profile_sweep(self) -> None:
+        """Run each model for each set of swept profiles"""
+        self._logger.info("Performing profile only sweep in 'set' mode")
+        _n_vals = len(list(self._profile_sweep.values())[0])
+        _sweep_cuts: typing.Dict[
+            str, typing.List[typing.Tuple[typing.Dict, pd.DataFrame]]
+        ] = {}
+
+        for model in self._models_list.keys():
+            if not self._models_list[model].compiled:
+                continue
+
+            for i in range(_n_vals):
+                pbm_instr.TIMER.iteration = i
+                _output_dfs = self._run_models()
+
+                _cut = self._sweep_on_profiles(i, _output_dfs, model)
+
+                _sweep_cuts.setdefault(model, []).append((_cut, _output_dfs[model]))
+
+        pbm_instr.TIMER.iteration = pbm_instr.NO_ITERATION
+        self._store_sweep_results(_sweep_cuts)
+
+    def _run_campaign(self) -> None:
+        """Simulate each distinct pulse of a campaign, pulses which only
+        differ from the first by their position in the campaign are not
+        re-simulated"""
+        _campaign = self.configuration["campaign"]
+        _variants, _pulse_variant = pbm_campaign.pulse_variants(
+            _campaign["pulses"], _campaign["overrides"]
+        )
+
+        self._logger.info(
+            "Performing campaign of %s pulses from %s simulated pulse(s)",
+            _campaign["pulses"],
+            len(_variants),
+        )
+
+        # Overridden parameters are returned to their original values for
+        # each pulse which does not override them
+        _base_values = {
+            name: self._parameter_set.get_parameter(name)
+            for name in set().union(*_variants)
+        }
+
+        _pulses: typing.Dict[str, typing.List[pd.DataFrame]] = {}
+
+        for i, overrides in enumerate(_variants):
+            pbm_instr.TIMER.iteration = i
+
+            if overrides:
+                self._logger.info(
+                    "Running Pulse Variant:\n\t- %s",
+                    "\n\t- ".join(f"{k}={v}" for k, v in overrides.items()),
+                )
+
+            for name, value in {**_base_values, **overrides}.items():
+                self.set_parameter_value(name, value)
+
+            for model in self._models_list:
+                # If the model is a submodel skip
+                if not self._models_list[model].binary_folder:
+                    continue
+
+                self.set_model_parameters(model_name=model)
+
+            for model, dataframe in self._run_models().items():
+                _pulses.setdefault(model, []).append(dataframe)
+
+        pbm_instr.TIMER.iteration = pbm_instr.NO_ITERATION
+
+        for name, value in _base_values.items():
+            self.set_parameter_value(name, value)
+
+        self._store_campaign_results(_pulses, _pulse_variant)
+
+    @pbm_instr.timed("store_campaign")
+    def _store_campaign_results(
+        self,
+        pulses: typing.Dict[str, typing.List[pd.DataFrame]],
+        pulse_variant: np.ndarray,
+    ) -> None:
+        """Assemble the campaign results for each model
+
+        Parameters
+        ----------
+        pulses : typing.Dict[str, typing.List[pd.DataFrame]]
+            for each model the outputs of every simulated pulse
+        pulse_variant : np.ndarray
+            index of the simulated pulse for every pulse of the campaign
+        """
+        _campaign = self.configuration["campaign"]
+
+        for model, model_pulses in pulses.items():
+            self.campaign_data[model] = pbm_campaign.CampaignResults(
+                model_pulses,
+                pulse_variant,
+                dwell=_campaign["dwell"],
+                rtol=_campaign["periodicity_rtol"],
+            )
+
+            for variant, entry in self.campaign_data[model].periodicity().iterrows():
+                if not entry["periodic"]:
+                    self._logger.warning(
+                        "%s: Pulse variant %s is not periodic, relative mismatch "
+                        "of %.2e between initial and final '%s'",
+                        model,
+                        variant,
+                        entry["max_error"],
+                        entry["worst_output"],
+                    )
+
+            # Pulse variants are distinguished within the session results
+            # in the same manner as sweep cuts
+            if len(model_pulses) > 1:
+                model_pulses = [
+                    dataframe.assign(**{pbm_campaign.VARIANT_COLUMN: i})
+                    for i, dataframe in enumerate(model_pulses)
+                ]
+
+            self.power_data[model] = pd.concat(model_pulses, ignore_index=True)
+
+    def _collate_sweep_run_dfs(
+        self,
+        index: int,
+        combination_dict: typing.Dict,
+        sweep_cuts: typing.Dict[
+            str, typing.List[typing.Tuple[typing.Dict, pd.DataFrame]]
+        ],
+    ):
         for model in self._models_list:
             # If the model is a submodel skip
             if not self._models_list[model].binary_folder:
@@ -1335,17 +1988,39 @@ class PowerBalance:
 
             _result_dict = self._run_models(combination_dict)
 
+            _cut = dict(combination_dict)
+
             # Tedious way of swapping profile files as part of a sweep
             # currently only works in 'set' mode
             if self.configuration["sweep_mode"] == "set" and self._profile_sweep:
-                self._sweep_on_profiles(index, _result_dict, model)
+                _cut.update(self._sweep_on_profiles(index, _result_dict, model))
+
+            sweep_cuts.setdefault(model, []).append((_cut, _result_dict[model]))
+
+    @pbm_instr.timed("store_sweeps")
+    def _store_sweep_results(
+        self,
+        sweep_cuts: typing.Dict[
+            str, typing.List[typing.Tuple[typing.Dict, pd.DataFrame]]
+        ],
+    ) -> None:
+        """Combine the results from all sweep combinations for each model
+
+        Parameters
+        ----------
+        sweep_cuts : typing.Dict[str, typing.List[typing.Tuple[typing.Dict, pd.DataFrame]]]
+            for each model the parameter values and outputs of each combination
+        """
+        for model, cuts in sweep_cuts.items():
+            _frames = [dataframe for _, dataframe in cuts]
 
             if model in self.power_data:
-                self.power_data[model] = pd.concat(
-                    [self.power_data[model], _result_dict[model]], ignore_index=True
-                )
-            else:
-                self.power_data[model] = _result_dict[model]
+                _frames.insert(0, self.power_data[model])
+
+            self.power_data[model] = pd.concat(_frames, ignore_index=True)
+
+            if self.configuration["sweep_storage"] == "dense":
+                self.sweep_data[model] = pbm_dense.DenseSweepResults.from_cuts(cuts)
 
     def _assemble_sweep_combos(self, sweep_dict: typing.Dict, var_len: int):
         for var_val_list in sweep_dict.values():
@@ -1381,7 +2056,12 @@ class PowerBalance:
         else:
             _all_combinations = itertools.product(*sweep_dict.values())
 
+        _sweep_cuts: typing.Dict[
+            str, typing.List[typing.Tuple[typing.Dict, pd.DataFrame]]
+        ] = {}
+
         for i, combo in enumerate(_all_combinations):
+            pbm_instr.TIMER.iteration = i
             _dict_combo = dict(zip(sweep_dict.keys(), combo))
             self._logger.info(
                 "Running Combination:\n\t- %s",
@@ -1399,7 +2079,11 @@ class PowerBalance:
 
                 self.set_model_parameters(model_name=model)
 
-            self._collate_sweep_run_dfs(i, _dict_combo)
+            self._collate_sweep_run_dfs(i, _dict_combo, _sweep_cuts)
+
+        pbm_instr.TIMER.iteration = pbm_instr.NO_ITERATION
+
+        self._store_sweep_results(_sweep_cuts)
 
     def _write_outputs(self, output_directory: str):
         """Prepare output directory structure and write outputs of a
@@ -1430,6 +2114,15 @@ class PowerBalance:
         self.save_configuration(_session_directory)
         self._logger.info("Saving profiles for session.")
         self.save_profiles(_session_directory)
+        self._logger.info("Saving steady-state summary for session.")
+        self.write_summary(_session_directory)
+        self.write_solver_statistics(_session_directory)
+        self.write_campaign(_session_directory)
+        self.write_sensitivity(_session_directory)
+        self.write_optimisation(_session_directory)
+        self.write_surrogate(_session_directory)
+
+        self._run_post_run_scripts(_session_directory)
 
         if self._plugins:
             self._logger.info("Saving plugin display files")
@@ -1438,11 +2131,69 @@ class PowerBalance:
         # Create plots
         self.plot_results(_session_directory)
 
+        self._write_timings(_session_directory)
+        self._logger.info("Session timings:\n%s", pbm_instr.TIMER.summary_table())
+
+        self.write_manifest(_session_directory)
+        self.write_catalogue(_session_directory)
+
         self._logger.info(
             "Run completed succesfully. Outputs written to '%s'",
             _session_directory,
         )
 
+    def publish_results(
+        self,
+        directory: typing.Optional[str] = None,
+        handoff_format: typing.Optional[str] = None,
+    ) -> typing.Dict[str, pbm_handoff.ResultHandle]:
+        """Publish the outputs of each model as memory-mapped files
+
+        Plugins and other processes open the published outputs without
+        copying them or reading the session data files.
+
+        Parameters
+        ----------
+        directory : str, optional
+            directory to publish the outputs to, by default a directory in
+            shared memory removed when the session is closed
+        handoff_format : str, optional
+            'arrow' or 'numpy', by default 'arrow' if 'pyarrow' is installed
+
+        Returns
+        -------
+        typing.Dict[str, pbm_handoff.ResultHandle]
+            handle to the outputs of each model by its key within the
+            session data
+        """
+        if directory is None:
+            if self._handoff_directory is None:
+                self._handoff_directory = tempfile.TemporaryDirectory(
+                    prefix="pbm_handoff_",
+                    dir=pbm_handoff.shared_memory_directory(),
+                )
+            directory = self._handoff_directory.name
+
+        return pbm_handoff.publish_results(self.power_data, directory, handoff_format)
+
+    @pbm_instr.timed("post_run_scripts")
+    def _run_post_run_scripts(self, session_directory: str) -> None:
+        """Pass the published outputs to the post-run script of each plugin
+
+        Parameters
+        ----------
+        session_directory : str
+            session output directory
+        """
+        if not (_scripts := pbm_plugin.get_post_run_scripts(self._plugins)):
+            return
+
+        _handles = self.publish_results()
+
+        for script in _scripts:
+            script(_handles, session_directory)
+
+    @pbm_instr.timed("plot_results")
     def plot_results(self, output_directory: str) -> typing.List[str]:
         """Create all plots images for all power variables.
 
@@ -1465,10 +2216,15 @@ class PowerBalance:
 
         for dataset in self.power_data:
             # In the case of a parameter sweep only plot the last entry
-            if "sweep" in self.configuration:
-                _data_frame = self.power_data[dataset].copy()
-                for param, value in self.configuration["sweep"].items():
-                    _data_frame = _data_frame[_data_frame[param.lower()] == value[-1]]
+            if dataset in self.sweep_data:
+                _data_frame = self.sweep_data[dataset].cut(-1)
+            elif dataset in self.campaign_data:
+                _data_frame = self.campaign_data[dataset].time_series()
+                _data_frame = _data_frame.drop(columns=pbm_campaign.PULSE_COLUMN)
+            elif "sweep" in self.configuration:
+                _data_frame = pbm_sweep.SweepIndex(
+                    self.power_data[dataset], list(self.configuration["sweep"])
+                ).cut({k: v[-1] for k, v in self.configuration["sweep"].items()})
             else:
                 _data_frame = self.power_data[dataset].copy()
 
@@ -1495,43 +2251,340 @@ class PowerBalance:
 
         return _plot_list
 
+    @pbm_instr.timed("write_hdf5")
     def write_data(self, output_directory: str) -> None:
-        """Write the resulting data frames to a HDF5 file which allows inclusion
-        of various key metadata alongside the datasets
+        """Write the resulting data frames using the configured storage
+        back-end alongside a single file of metadata for all models
 
         Parameters
         ----------
         output_directory : str
             location to write output data files
         """
-        _output_hdf5_file = os.path.join(output_directory, "data", "session_data.h5")
+        _data_directory = os.path.join(output_directory, "data")
+        _sweep_hdf5_file = os.path.join(_data_directory, pbm_dense.SWEEP_DATA_FILE)
 
-        _hdf_store = pd.HDFStore(_output_hdf5_file)
+        _meta_data = {
+            "pbm_version": power_balance.__version__,
+            "time": self._time_now_str,
+            "om_version": self._om_version,
+        }
+        _models: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
 
-        # Write dataset to HDF5 using the model name as a key
+        # Write dataset using the model name as a key, sweeps stored in
+        # dense form are written to a separate file
         for name, dataset in self.power_data.items():
-            _hdf_store.put(name.lower().replace(".", "_"), dataset)
+            _key = name.lower().replace(".", "_")
+            _sweep_parameters = self._sweep_parameters(name)
+
+            if name in self.sweep_data:
+                self.sweep_data[name].write_hdf5(_sweep_hdf5_file, _key, _meta_data)
+                _models[_key] = {
+                    "storage": "dense",
+                    "sweep_parameters": self.sweep_data[name].parameters,
+                }
+                continue
 
-            _meta_data = {
-                "pbm_version": power_balance.__version__,
-                "time": self._time_now_str,
-                "om_version": self._om_version,
+            self._storage.write(_data_directory, _key, dataset, _sweep_parameters)
+            _models[_key] = {
+                "storage": self._storage.name,
+                "sweep_parameters": _sweep_parameters,
             }
 
-            for key, value in _meta_data.items():
-                setattr(
-                    _hdf_store.get_storer(name.lower().replace(".", "_")).attrs,
-                    key,
-                    value,
+        pbm_storage.write_metadata(
+            _data_directory,
+            _meta_data | {"storage": self._storage.options(), "models": _models},
+        )
+
+    def _sweep_parameters(self, model_name: str) -> typing.List[str]:
+        """Retrieve the sweep parameter columns for a model's results"""
+        _parameters = [p.lower() for p in self.configuration.get("sweep") or {}]
+        _parameters += [
+            entry["param_name"]
+            for entries in self._profile_sweep.values()
+            for entry in entries[:1]
+        ]
+        _parameters.append(pbm_campaign.VARIANT_COLUMN)
+        return [p for p in _parameters if p in self.power_data[model_name].columns]
+
+    @pbm_instr.timed("write_summary")
+    def write_summary(self, output_directory: str) -> typing.Optional[pd.DataFrame]:
+        """Calculate steady-state averages and efficiencies for every sweep
+        cut and add them to the session HDF5 file
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory containing the saved profiles
+
+        Returns
+        -------
+        pd.DataFrame | None
+            tidy table of averages and efficiencies, None if the
+            'Tokamak.Interdependencies' model was not run
+        """
+        _model = "Tokamak.Interdependencies"
+
+        if _model not in self.power_data:
+            return None
+
+        _profiles_dir = os.path.join(output_directory, "profiles")
+
+        try:
+            if _model in self.sweep_data:
+                _summary = pbm_summary.summarise(
+                    self.sweep_data[_model], _profiles_dir, self._plasma_scenario
+                )
+            else:
+                _summary = pbm_summary.summarise_frame(
+                    self.power_data[_model],
+                    self._sweep_parameters(_model),
+                    _profiles_dir,
+                    self._plasma_scenario,
                 )
+        except pbm_exc.InvalidInputError as e:
+            self._logger.warning("Could not create steady-state summary: %s", e)
+            return None
+
+        with pd.HDFStore(
+            os.path.join(output_directory, "data", "session_data.h5")
+        ) as hdf_store:
+            hdf_store.put(
+                pbm_summary.SUMMARY_KEY,
+                _summary,
+                format="table",
+                data_columns=["category", "quantity"],
+            )
+
+        return _summary
+
+    @pbm_instr.timed("write_solver_stats")
+    def write_solver_statistics(self, output_directory: str) -> None:
+        """Add the solver statistics of every simulation to the session
+        HDF5 file
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory
+        """
+        if not len(self.solver_statistics):
+            return
+
+        self.solver_statistics.write_hdf5(
+            os.path.join(output_directory, "data", "session_data.h5")
+        )
+
+    @pbm_instr.timed("write_campaign")
+    def write_campaign(self, output_directory: str) -> None:
+        """Write the simulated pulses of a campaign and the energy of each
+        output for every pulse
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory
+        """
+        if not self.campaign_data:
+            return
+
+        _campaign_hdf5_file = os.path.join(
+            output_directory, "data", pbm_campaign.CAMPAIGN_DATA_FILE
+        )
+
+        for name, campaign in self.campaign_data.items():
+            _key = name.lower().replace(".", "_")
+            campaign.write_hdf5(_campaign_hdf5_file, _key)
+
+            with pd.HDFStore(
+                os.path.join(output_directory, "data", "session_data.h5")
+            ) as hdf_store:
+                hdf_store.put(
+                    f"{pbm_campaign.CAMPAIGN_ENERGY_KEY}/{_key}",
+                    campaign.cumulative_energy(),
+                )
+
+            self._logger.info(
+                "%s: Campaign energy totals:\n%s",
+                name,
+                campaign.summary().to_string(index=False),
+            )
+
+    @pbm_instr.timed("write_sensitivity")
+    def write_sensitivity(self, output_directory: str) -> None:
+        """Write the sensitivity report to the session HDF5 file alongside a
+        tornado plot of the most influential parameters
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory
+        """
+        if self.sensitivity_data is None:
+            return
+
+        for sub_directory in ("data", "plots"):
+            os.makedirs(os.path.join(output_directory, sub_directory), exist_ok=True)
+
+        with pd.HDFStore(
+            os.path.join(output_directory, "data", "session_data.h5")
+        ) as hdf_store:
+            hdf_store.put("sensitivity", self.sensitivity_data)
+            hdf_store.get_storer("sensitivity").attrs.metadata = dict(
+                self.sensitivity_data.attrs
+            )
+
+        pbm_sens.plot_tornado(
+            self.sensitivity_data,
+            os.path.join(output_directory, "plots", "sensitivity_tornado.jpg"),
+            self.sensitivity_data.attrs.get("metric", ""),
+        )
+
+        self._logger.info(
+            "Sensitivity of '%s':\n%s",
+            self.sensitivity_data.attrs.get("metric", ""),
+            pbm_sens.report_table(self.sensitivity_data),
+        )
 
-        _hdf_store.close()
+    @pbm_instr.timed("write_optimisation")
+    def write_optimisation(self, output_directory: str) -> None:
+        """Write every design evaluated during the optimisation to the session
+        HDF5 file, the best design being stored as metadata
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory
+        """
+        if self.optimisation_history is None:
+            return
+
+        os.makedirs(os.path.join(output_directory, "data"), exist_ok=True)
+
+        with pd.HDFStore(
+            os.path.join(output_directory, "data", "session_data.h5")
+        ) as hdf_store:
+            hdf_store.put(pbm_opt.HISTORY_KEY, self.optimisation_history)
+            hdf_store.get_storer(pbm_opt.HISTORY_KEY).attrs.metadata = dict(
+                self.optimisation_result
+            )
+
+        self._logger.info(
+            "Best design, %s = %s%s:\n%s",
+            self.optimisation_result["metric"],
+            self.optimisation_result["objective"],
+            "" if self.optimisation_result["feasible"] else " (infeasible)",
+            "\n".join(
+                f"\t{name} = {value}"
+                for name, value in self.optimisation_result["variables"].items()
+            ),
+        )
+
+    @pbm_instr.timed("write_surrogate")
+    def write_surrogate(self, output_directory: str) -> None:
+        """Save the surrogate model alongside the session HDF5 file
+
+        Parameters
+        ----------
+        output_directory : str
+            session output directory
+        """
+        if not self.surrogate:
+            return
+
+        os.makedirs(os.path.join(output_directory, "data"), exist_ok=True)
+
+        self.surrogate.save(
+            os.path.join(output_directory, "data", pbm_surr.SURROGATE_FILE)
+        )
+
+    def _write_timings(self, session_directory: str) -> None:
+        """Record the phase timings of the session in the session HDF5 file"""
+        pbm_instr.TIMER.write_hdf5(
+            os.path.join(session_directory, "data", "session_data.h5")
+        )
+
+        if pbm_instr.TIMER.tracing:
+            pbm_instr.TIMER.write_trace(
+                os.path.join(session_directory, "data", pbm_instr.TRACE_FILE)
+            )
+
+    def write_manifest(self, session_directory: str) -> None:
+        """Record the input manifest of the session within its metadata
+
+        Written once all other outputs have been written such that later
+        runs only match complete sessions. The hash of the inputs as given
+        is only recorded if the parameters were unchanged after the models
+        were built. The manifest is that of the inputs at the start of the
+        run, as sweeps leave the parameters at their final values.
+
+        Parameters
+        ----------
+        session_directory : str
+            session output directory
+        """
+        _data_directory = os.path.join(session_directory, "data")
+        _manifest = self._run_manifest or self.input_manifest()
+        _input_hashes = [pbm_manifest.manifest_hash(_manifest)]
+
+        if _input_hashes[0] == self._built_input_hash:
+            _input_hashes.append(self._given_input_hash)
+
+        pbm_storage.write_metadata(
+            _data_directory,
+            pbm_storage.read_metadata(_data_directory)
+            | {
+                pbm_manifest.INPUT_HASHES_KEY: _input_hashes,
+                pbm_manifest.INPUT_MANIFEST_KEY: _manifest,
+            },
+        )
+
+    def write_catalogue(self, session_directory: str) -> None:
+        """Record the session within the session catalogue
+
+        Failure to update the catalogue is logged rather than raised such
+        that the session outputs are unaffected.
+
+        Parameters
+        ----------
+        session_directory : str
+            session output directory
+        """
+        if not self.configuration["catalogue"]:
+            return
+
+        _catalogue_file = self.configuration["catalogue_file"]
+
+        try:
+            with pbm_catalogue.Catalogue(
+                None if _catalogue_file == "Default" else _catalogue_file
+            ) as catalogue:
+                catalogue.index_session(session_directory)
+                self._logger.info(
+                    "Session recorded in catalogue '%s'", catalogue.file_name
+                )
+        except (
+            sqlite3.Error,
+            OSError,
+            KeyError,
+            ValueError,
+            toml.TomlDecodeError,
+            pydantic.ValidationError,
+        ) as e:
+            self._logger.warning("Could not update session catalogue: %s", e)
 
     def launch_browser(self) -> None:
         """Opens local web browser to view result plots"""
         self._logger.info("Initialising Plot Display")
-        _browser = pbm_browser.PBMBrowser(
-            os.path.join(self._output_dir, f"pbm_results_{self._time_stamp}")
+        _session_directory = self.matching_session or os.path.join(
+            self._output_dir, f"pbm_results_{self._time_stamp}"
         )
+        _browser = pbm_browser.PBMBrowser(_session_directory)
         _browser.build(self._plasma_scenario)
+
+        # Include the browser build within the recorded session timings,
+        # the timings of a matched session being those of its own run
+        if not self.matching_session:
+            self._write_timings(_session_directory)
+
         _browser.launch()
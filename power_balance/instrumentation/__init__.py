@@ -0,0 +1,357 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Session Instrumentation
+=======================
+
+Lightweight recording of the time spent within each phase of a PBM session,
+such as model compilation, simulation and output writing. Durations are
+recorded for every entry into a phase and tagged with the current sweep
+iteration so that per-combination breakdowns can be produced.
+
+Where tracing is enabled each phase is additionally recorded as a span in
+the Chrome trace event format, tagged with the sweep iteration, any further
+tags such as the model name, and the process and thread identifiers. The
+resulting JSON file can be viewed using 'chrome://tracing' or Perfetto to
+examine the timeline of a sweep, including the activity of each worker in
+a parallel run. When tracing is disabled no span data is retained.
+
+Memory profiling of each phase can also be enabled, see the 'memory'
+submodule.
+
+Contents
+========
+
+Submodules
+----------
+
+    memory - peak memory and allocation site recording per phase
+    solver - parsing of OpenModelica solver statistics
+
+Classes
+-------
+
+    PhaseTimer - records durations of named phases, trace spans and event counters
+
+Functions
+---------
+
+    timed - decorator recording the duration of each call as a phase
+
+Attributes
+----------
+
+    TIMER - process wide PhaseTimer instance
+
+"""
+
+__date__ = "2026-10-19"
+
+import contextlib
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import typing
+
+import pandas as pd
+import prettytable
+
+import power_balance.instrumentation.memory as pbm_mem
+
+TIMINGS_KEY = "timings"
+
+TRACE_FILE = "trace.json"
+
+# Iteration value recorded for phases outside of a sweep
+NO_ITERATION = -1
+
+
+class PhaseTimer:
+    """Records the duration of named phases and counts of events"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded timings and counters and disable profiling"""
+        if getattr(self, "memory", None):
+            self.memory.stop()
+        with self._lock:
+            self._origin = time.perf_counter()
+            self._records: typing.List[typing.Tuple[str, int, float, float]] = []
+            self._counters: typing.Dict[str, int] = {}
+            self._trace: typing.List[typing.Dict[str, typing.Any]] = []
+            # Wall clock time of the origin so that spans recorded by
+            # separate processes can be placed on a common timeline
+            self._wall_origin = time.time()
+            self.iteration: int = NO_ITERATION
+            self.tracing: bool = False
+            self.memory: typing.Optional[pbm_mem.MemoryProfiler] = None
+
+    def profile_memory(self, n_sites: int = 5) -> None:
+        """Record the memory usage of all subsequent phases
+
+        Parameters
+        ----------
+        n_sites : int, optional
+            number of allocation sites recorded for each phase, by default 5
+        """
+        if self.memory:
+            self.memory.stop()
+        self.memory = pbm_mem.MemoryProfiler(n_sites)
+        self.memory.start()
+
+    @contextlib.contextmanager
+    def phase(self, name: str, **tags: typing.Any) -> typing.Iterator[None]:
+        """Record the duration of the enclosed block as the given phase
+
+        Parameters
+        ----------
+        name : str
+            name of the phase
+        **tags
+            additional values such as the model name attached to the trace
+            span for the phase, ignored if tracing is disabled
+        """
+        _iteration = self.iteration
+        _memory = self.memory
+        if _memory:
+            _memory.enter()
+        _start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _end = time.perf_counter()
+            if _memory:
+                _memory.exit(name, _iteration)
+            with self._lock:
+                self._records.append(
+                    (name, _iteration, _start - self._origin, _end - _start)
+                )
+                if self.tracing:
+                    self._trace.append(
+                        {
+                            "name": name,
+                            "cat": "pbm",
+                            "ph": "X",
+                            "ts": 1e6 * (self._wall_origin + _start - self._origin),
+                            "dur": 1e6 * (_end - _start),
+                            "pid": os.getpid(),
+                            "tid": threading.get_ident(),
+                            "args": {"iteration": _iteration, **tags},
+                        }
+                    )
+
+    def count(self, name: str, increment: int = 1) -> None:
+        """Increment a named event counter
+
+        Parameters
+        ----------
+        name : str
+            name of the counter
+        increment : int, optional
+            amount to increment the counter by, by default 1
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + increment
+
+    @property
+    def counters(self) -> typing.Dict[str, int]:
+        """Current value of each event counter"""
+        return dict(self._counters)
+
+    @property
+    def elapsed(self) -> float:
+        """Time in seconds since the timer was last reset"""
+        return time.perf_counter() - self._origin
+
+    @property
+    def trace_events(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Trace spans recorded since the timer was last reset"""
+        with self._lock:
+            return list(self._trace)
+
+    def merge_trace(
+        self, events: typing.Iterable[typing.Dict[str, typing.Any]]
+    ) -> None:
+        """Add trace spans recorded by another process such as a worker
+
+        Parameters
+        ----------
+        events : typing.Iterable[typing.Dict[str, typing.Any]]
+            trace events as returned by 'trace_events'
+        """
+        with self._lock:
+            self._trace.extend(events)
+
+    def write_trace(self, file_name: str) -> None:
+        """Write the recorded spans to a Chrome trace event JSON file
+
+        Parameters
+        ----------
+        file_name : str
+            JSON file to write to
+        """
+        _events = self.trace_events
+
+        # Label each process so that the main session and any workers
+        # can be distinguished within the viewer
+        _metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {
+                    "name": "powerbalance"
+                    if pid == os.getpid()
+                    else f"powerbalance worker {pid}"
+                },
+            }
+            for pid in sorted({event["pid"] for event in _events})
+        ]
+
+        with open(file_name, "w") as out_f:
+            json.dump(
+                {"traceEvents": _metadata + _events, "displayTimeUnit": "ms"},
+                out_f,
+            )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Recorded timings as a dataframe
+
+        Returns
+        -------
+        pd.DataFrame
+            a row per phase entry containing the phase name, sweep iteration,
+            start time relative to the timer reset and duration in seconds
+        """
+        with self._lock:
+            return pd.DataFrame(
+                self._records, columns=["phase", "iteration", "start", "duration"]
+            )
+
+    def summary(self) -> pd.DataFrame:
+        """Aggregate timings for each phase
+
+        Returns
+        -------
+        pd.DataFrame
+            number of calls, total, mean and maximum duration for each phase
+            ordered by first entry
+        """
+        _frame = self.to_frame()
+        return (
+            _frame.groupby("phase", sort=False)["duration"]
+            .agg(calls="count", total="sum", mean="mean", max="max")
+            .reset_index()
+        )
+
+    def summary_table(self) -> str:
+        """Aggregate timings for each phase as a printable table
+
+        Returns
+        -------
+        str
+            table of phase timings, and memory usage if profiled, followed
+            by any event counters
+        """
+        _elapsed = self.elapsed
+        _columns = ["Phase", "Calls", "Total/s", "Mean/s", "Max/s", "% of Run"]
+        _summary = self.summary()
+
+        if self.memory:
+            _columns += ["Peak/MiB", "Peak RSS/MiB"]
+            _summary = _summary.merge(
+                self.memory.summary()[["phase", "peak_traced", "peak_rss"]],
+                on="phase",
+                how="left",
+            )
+
+        _table = prettytable.PrettyTable(_columns)
+        _table.align["Phase"] = "l"
+
+        for row in _summary.itertuples(index=False):
+            _row = [
+                row.phase,
+                row.calls,
+                f"{row.total:.3f}",
+                f"{row.mean:.3f}",
+                f"{row.max:.3f}",
+                f"{100 * row.total / _elapsed:.1f}",
+            ]
+            if self.memory:
+                _row += [f"{row.peak_traced:.1f}", f"{row.peak_rss:.1f}"]
+            _table.add_row(_row)
+
+        _counters = "\n".join(f"{k}: {v}" for k, v in self._counters.items())
+
+        return f"{_table}\n{_counters}" if _counters else f"{_table}"
+
+    def write_hdf5(self, file_name: str) -> None:
+        """Write the raw timings to a HDF5 file
+
+        The timings are stored as a table under the key 'timings' with
+        any event counters stored as attributes. If memory profiling is
+        enabled the memory usage of each phase is also written.
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to write to
+        """
+        with pd.HDFStore(file_name) as hdf_store:
+            hdf_store.put(
+                TIMINGS_KEY,
+                self.to_frame(),
+                format="table",
+                data_columns=["phase", "iteration"],
+            )
+            _attrs = hdf_store.get_storer(TIMINGS_KEY).attrs
+            _attrs.counters = self.counters
+            _attrs.elapsed = self.elapsed
+
+        if self.memory:
+            self.memory.write_hdf5(file_name)
+
+
+TIMER = PhaseTimer()
+
+_Callable = typing.TypeVar("_Callable", bound=typing.Callable[..., typing.Any])
+
+
+def timed(
+    phase: str, tags: typing.Sequence[str] = ()
+) -> typing.Callable[[_Callable], _Callable]:
+    """Record the duration of each call to the decorated function
+
+    Parameters
+    ----------
+    phase : str
+        name of the phase to record the call as
+    tags : typing.Sequence[str], optional
+        names of arguments whose values are attached to the trace span
+        for each call when tracing is enabled
+    """
+
+    def _decorator(function: _Callable) -> _Callable:
+        _signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def _wrapper(*args, **kwargs):
+            if not tags or not TIMER.tracing:
+                with TIMER.phase(phase):
+                    return function(*args, **kwargs)
+
+            _arguments = _signature.bind(*args, **kwargs).arguments
+            _tags = {tag: _arguments[tag] for tag in tags if tag in _arguments}
+
+            with TIMER.phase(phase, **_tags):
+                return function(*args, **kwargs)
+
+        return typing.cast(_Callable, _wrapper)
+
+    return _decorator
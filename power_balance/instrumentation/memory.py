@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Memory Profiling
+================
+
+Opt-in recording of the memory used within each phase of a PBM session.
+For every phase the peak memory allocated by Python (as traced by the
+'tracemalloc' module), the net change in allocated memory and the peak
+resident set size of the process are recorded along with the source
+lines responsible for the largest allocations during the phase.
+
+Tracing allocations slows execution considerably so profiling is only
+performed when explicitly requested.
+
+Contents
+========
+
+Classes
+-------
+
+    MemoryProfiler - records peak memory and top allocation sites per phase
+
+Functions
+---------
+
+    peak_rss - peak resident set size of the current process
+
+"""
+
+__date__ = "2026-10-19"
+
+import sys
+import threading
+import tracemalloc
+import typing
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None  # type: ignore
+
+MEMORY_KEY = "memory"
+ALLOCATIONS_KEY = "memory_allocations"
+
+
+def peak_rss() -> typing.Optional[int]:
+    """Peak resident set size of the current process
+
+    Returns
+    -------
+    typing.Optional[int]
+        peak resident set size in bytes, None if it cannot be determined
+        on the current platform
+    """
+    if resource is None:
+        return None
+    _max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS but kilobytes elsewhere
+    return _max_rss if sys.platform == "darwin" else 1024 * _max_rss
+
+
+class _PhaseMemory:
+    def __init__(self, snapshot: typing.Optional[tracemalloc.Snapshot]) -> None:
+        self.current = tracemalloc.get_traced_memory()[0]
+        self.peak = self.current
+        self.snapshot = snapshot
+
+
+class MemoryProfiler:
+    """Records peak memory usage and top allocation sites for each phase"""
+
+    def __init__(self, n_sites: int = 5, frames: int = 1) -> None:
+        """
+        Parameters
+        ----------
+        n_sites : int, optional
+            number of allocation sites recorded for each phase, by default 5.
+            If zero no snapshots are taken reducing the profiling overhead
+        frames : int, optional
+            number of frames stored for each allocation, by default 1
+        """
+        self._n_sites = n_sites
+        self._frames = frames
+        self._started_tracing = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._records: typing.List[
+            typing.Tuple[str, int, int, int, typing.Optional[int]]
+        ] = []
+        self._sites: typing.List[typing.Tuple[str, int, int, str, int, int]] = []
+
+    def start(self) -> None:
+        """Begin tracing memory allocations"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracing memory allocations if started by this profiler"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @property
+    def _stack(self) -> typing.List[_PhaseMemory]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _update_peaks(self) -> None:
+        # The tracemalloc peak is shared, so propagate it to all open phases
+        # before it is reset for a nested phase
+        _peak = tracemalloc.get_traced_memory()[1]
+        for entry in self._stack:
+            entry.peak = max(entry.peak, _peak)
+
+    def enter(self) -> None:
+        """Mark the start of a phase"""
+        if not tracemalloc.is_tracing():
+            return
+        self._update_peaks()
+        _snapshot = tracemalloc.take_snapshot() if self._n_sites else None
+        self._stack.append(_PhaseMemory(_snapshot))
+        tracemalloc.reset_peak()
+
+    def exit(self, name: str, iteration: int) -> None:
+        """Mark the end of a phase and record its memory usage
+
+        Parameters
+        ----------
+        name : str
+            name of the phase
+        iteration : int
+            sweep iteration during which the phase occurred
+        """
+        if not tracemalloc.is_tracing() or not self._stack:
+            return
+
+        self._update_peaks()
+        _entry = self._stack.pop()
+        _current = tracemalloc.get_traced_memory()[0]
+
+        _sites = []
+
+        if _entry.snapshot is not None:
+            _statistics = tracemalloc.take_snapshot().compare_to(
+                _entry.snapshot, "lineno"
+            )
+            for rank, statistic in enumerate(_statistics[: self._n_sites]):
+                _frame = statistic.traceback[0]
+                _sites.append(
+                    (
+                        name,
+                        iteration,
+                        rank,
+                        f"{_frame.filename}:{_frame.lineno}",
+                        statistic.size_diff,
+                        statistic.count_diff,
+                    )
+                )
+
+        with self._lock:
+            self._records.append(
+                (
+                    name,
+                    iteration,
+                    _entry.peak - _entry.current,
+                    _current - _entry.current,
+                    peak_rss(),
+                )
+            )
+            self._sites.extend(_sites)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Memory usage of each phase as a dataframe
+
+        Returns
+        -------
+        pd.DataFrame
+            a row per phase entry containing the phase name, sweep iteration,
+            peak and net traced memory in bytes relative to the phase start
+            and the peak resident set size of the process at the phase end
+        """
+        with self._lock:
+            return pd.DataFrame(
+                self._records,
+                columns=["phase", "iteration", "peak_traced", "net_traced", "peak_rss"],
+            )
+
+    def allocations_frame(self) -> pd.DataFrame:
+        """Largest allocation sites of each phase as a dataframe
+
+        Returns
+        -------
+        pd.DataFrame
+            for each phase entry the source locations with the greatest
+            change in allocated memory in bytes and number of blocks
+        """
+        with self._lock:
+            return pd.DataFrame(
+                self._sites,
+                columns=[
+                    "phase",
+                    "iteration",
+                    "rank",
+                    "location",
+                    "size_diff",
+                    "count_diff",
+                ],
+            )
+
+    def summary(self) -> pd.DataFrame:
+        """Maximum memory usage for each phase
+
+        Returns
+        -------
+        pd.DataFrame
+            number of calls, maximum peak and net traced memory in MiB and
+            the peak resident set size in MiB for each phase
+        """
+        _frame = self.to_frame()
+        _frame[["peak_traced", "net_traced", "peak_rss"]] = (
+            _frame[["peak_traced", "net_traced", "peak_rss"]].astype(float) / 2**20
+        )
+        return (
+            _frame.groupby("phase", sort=False)
+            .agg(
+                calls=("peak_traced", "count"),
+                peak_traced=("peak_traced", "max"),
+                net_traced=("net_traced", "max"),
+                peak_rss=("peak_rss", "max"),
+            )
+            .reset_index()
+        )
+
+    def write_hdf5(self, file_name: str) -> None:
+        """Write memory usage and allocation sites to a HDF5 file
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to write to
+        """
+        with pd.HDFStore(file_name) as hdf_store:
+            hdf_store.put(
+                MEMORY_KEY,
+                self.to_frame(),
+                format="table",
+                data_columns=["phase", "iteration"],
+            )
+            hdf_store.put(
+                ALLOCATIONS_KEY,
+                self.allocations_frame(),
+                format="table",
+                data_columns=["phase", "iteration"],
+                min_itemsize={"location": 256},
+            )
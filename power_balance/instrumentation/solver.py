@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Solver Statistics
+=================
+
+Parsing of the statistics printed by an OpenModelica simulation executable
+when run with the 'LOG_STATS' log stream enabled. These describe the work
+performed by the solver such as the number of steps taken and rejected, the
+number of function and Jacobian evaluations and the number of events, as
+well as the time spent initialising and simulating the model.
+
+Contents
+========
+
+Classes
+-------
+
+    SolverStatistics - collects solver statistics for each simulation
+
+Functions
+---------
+
+    parse_statistics - extract solver statistics from simulation output
+    strip_statistics - remove the statistics from simulation output
+
+"""
+
+__date__ = "2026-10-19"
+
+import re
+import threading
+import typing
+
+import pandas as pd
+
+SOLVER_STATS_KEY = "solver_stats"
+
+# Counters within the 'LOG_STATS' output and the statistic they represent
+_COUNTERS: typing.Dict[str, str] = {
+    "steps taken": "steps",
+    "error test failures": "rejected_steps",
+    "convergence test failures": "convergence_failures",
+    "calls of functionODE": "function_evaluations",
+    "evaluations of jacobian": "jacobian_evaluations",
+    "state events": "state_events",
+    "time events": "time_events",
+}
+
+# Timers within the 'LOG_STATS' output and the statistic they represent
+_TIMERS: typing.Dict[str, str] = {
+    "initialization": "init_time",
+    "simulation": "simulation_time",
+    "total": "total_time",
+}
+
+STATISTICS: typing.Tuple[str, ...] = (
+    *_COUNTERS.values(),
+    *_TIMERS.values(),
+)
+
+_COUNTER_REGEX = re.compile(
+    r"\|\s*(\d+)\s+(" + "|".join(re.escape(k) for k in _COUNTERS) + r")\s*$",
+    re.MULTILINE,
+)
+_TIMER_REGEX = re.compile(
+    r"\|\s*([0-9.eE+-]+)s\s+(?:\[\s*[0-9.]+%\]\s+)?(" + "|".join(_TIMERS) + r")\s*$",
+    re.MULTILINE,
+)
+_SOLVER_REGEX = re.compile(r"\|\s*solver:\s*(\S+)")
+
+
+def parse_statistics(output: str) -> typing.Dict[str, typing.Any]:
+    """Extract solver statistics from the output of a simulation executable
+
+    Parameters
+    ----------
+    output : str
+        standard output of a simulation run with 'LOG_STATS' enabled
+
+    Returns
+    -------
+    typing.Dict[str, typing.Any]
+        the solver name and the value of each statistic found in the output,
+        empty if the output contains no statistics
+    """
+    _statistics: typing.Dict[str, typing.Any] = {}
+
+    if _solver := _SOLVER_REGEX.search(output):
+        _statistics["solver"] = _solver.group(1)
+
+    for value, label in _COUNTER_REGEX.findall(output):
+        _statistics[_COUNTERS[label]] = int(value)
+
+    for value, label in _TIMER_REGEX.findall(output):
+        _statistics[_TIMERS[label]] = float(value)
+
+    return _statistics
+
+
+def strip_statistics(output: str) -> str:
+    """Remove the 'LOG_STATS' output from the output of a simulation
+
+    Parameters
+    ----------
+    output : str
+        standard output of a simulation executable
+
+    Returns
+    -------
+    str
+        the output without the statistics and their continuation lines
+    """
+    _lines: typing.List[str] = []
+    _statistics = False
+
+    for line in output.splitlines(keepends=True):
+        # Continuation lines of a log message begin with a separator
+        if not line.startswith("|"):
+            _statistics = line.startswith("LOG_STATS")
+        if not _statistics:
+            _lines.append(line)
+
+    return "".join(_lines)
+
+
+class SolverStatistics:
+    """Collects the solver statistics of each simulation in a session"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: typing.List[typing.Dict[str, typing.Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(
+        self,
+        model_name: str,
+        iteration: int,
+        output: str,
+        parameters: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """Parse and record the statistics from a single simulation
+
+        Parameters
+        ----------
+        model_name : str
+            name of the simulated model
+        iteration : int
+            sweep iteration of the simulation
+        output : str
+            standard output of the simulation executable
+        parameters : typing.Mapping[str, typing.Any], optional
+            values of the sweep parameters for the simulation
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            the parsed statistics
+        """
+        _statistics = parse_statistics(output)
+        _parameters = {k.lower(): v for k, v in (parameters or {}).items()}
+
+        with self._lock:
+            self._records.append(
+                {
+                    "model": model_name,
+                    "iteration": iteration,
+                    **_parameters,
+                    **_statistics,
+                }
+            )
+
+        return _statistics
+
+    def merge(self, other: "SolverStatistics") -> None:
+        """Add the statistics collected by another instance such as a worker
+
+        Parameters
+        ----------
+        other : SolverStatistics
+            statistics to add
+        """
+        with other._lock:
+            _records = list(other._records)
+
+        with self._lock:
+            self._records.extend(_records)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Recorded statistics as a dataframe
+
+        Returns
+        -------
+        pd.DataFrame
+            a row per simulation containing the model name, sweep iteration,
+            any sweep parameter values, the solver and each statistic
+        """
+        with self._lock:
+            _frame = pd.DataFrame(self._records)
+
+        return _frame.reindex(
+            columns=[
+                *(c for c in _frame.columns if c not in STATISTICS),
+                *STATISTICS,
+            ]
+        )
+
+    def write_hdf5(self, file_name: str) -> None:
+        """Write the recorded statistics to a HDF5 file
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to write to
+        """
+        with pd.HDFStore(file_name) as hdf_store:
+            hdf_store.put(
+                SOLVER_STATS_KEY,
+                self.to_frame(),
+                format="table",
+                data_columns=["model", "iteration"],
+            )
@@ -20,6 +20,7 @@ from typing import Dict, List, Optional
 import pydelica
 
 import power_balance.exceptions
+import power_balance.instrumentation
 import power_balance.parameters
 
 _model_logger = logging.getLogger("PowerBalance.Models")
@@ -66,6 +67,7 @@ def extract_models_from_file(
     model_name_list: Optional[List[str]] = None,
     names_only: bool = False,
     quiet: bool = False,
+    prebuilt: bool = False,
 ) -> Dict[str, Model]:
     """Extracts all models from a Modelica '.mo' file
 
@@ -88,6 +90,9 @@ def extract_models_from_file(
         do not compile the models just return a list of names, by default False
     quiet : bool, optional
         suppress printouts, by default False
+    prebuilt : bool, optional
+        do not build models for which the session already holds a binary,
+        by default False
 
     Returns
     -------
@@ -201,7 +206,9 @@ def extract_models_from_file(
 
                     # Only compile the model if either no model list is given
                     # or the model name is present within the given list
-                    if not model_name_list or _name in model_name_list:
+                    if (not model_name_list or _name in model_name_list) and not (
+                        prebuilt and _is_built(session, _name)
+                    ):
                         _dependency_files = [
                             os.path.join(os.path.dirname(input_file), dependency)
                             for dependency in dependent_models
@@ -219,15 +226,19 @@ def extract_models_from_file(
                             ):
                                 _modelica_source_file = _new_file
 
-                        session.build_model(
-                            modelica_source_file=_modelica_source_file,
-                            model_addr=_name,
-                            extra_models=dependent_models,
-                            c_source_dir=os.path.join(
-                                original_model_dir, "Resources", "Include"
-                            ),
-                            update_input_paths_to=profile_dir,
-                        )
+                        with power_balance.instrumentation.TIMER.phase(
+                            "compile", model=_name
+                        ):
+                            session.build_model(
+                                modelica_source_file=_modelica_source_file,
+                                model_addr=_name,
+                                extra_models=dependent_models,
+                                c_source_dir=os.path.join(
+                                    original_model_dir, "Resources", "Include"
+                                ),
+                                update_input_paths_to=profile_dir,
+                            )
+                        power_balance.instrumentation.TIMER.count("builds")
 
                     try:
                         _bin_loc = session.get_binary_location(_name)
@@ -254,6 +265,15 @@ def extract_models_from_file(
     return _models
 
 
+def _is_built(session: pydelica.Session, model_name: str) -> bool:
+    try:
+        session.get_binary_location(model_name)
+    except pydelica.exception.BinaryNotFoundError:
+        return False
+    return True
+
+
+@power_balance.instrumentation.timed("load_models")
 def get_local_models(
     model_file_dir: str,
     parameter_set: Optional[power_balance.parameters.PBMParameterSet] = None,
@@ -262,6 +282,7 @@ def get_local_models(
     model_name_list: Optional[List[str]] = None,
     names_only: bool = False,
     quiet: bool = False,
+    prebuilt: bool = False,
 ) -> Dict[str, Model]:
     """Retrieve list of models from this directory to create an importable
     Python dictionary object. Models are stored as namedtuples
@@ -283,6 +304,9 @@ def get_local_models(
         do not compile the models just return a list of names, by default False
     quiet : bool, optional
         suppress printouts, by default False
+    prebuilt : bool, optional
+        do not build models for which the session already holds a binary,
+        by default False
 
     Returns
     -------
@@ -310,6 +334,7 @@ def get_local_models(
                 model_name_list=model_name_list,
                 names_only=names_only,
                 quiet=quiet,
+                prebuilt=prebuilt,
                 original_model_dir=model_file_dir,
             )
         )
@@ -35,6 +35,8 @@ import pydelica
 import toml
 
 import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation as pbm_instr
+import power_balance.profiles.knots as pbm_knots
 import power_balance.utilities as pbm_util
 import power_balance.validation.modelica_simulation_options as pbm_mso
 
@@ -42,6 +44,8 @@ logging.basicConfig()
 
 DEFAULT_PARAM_DIR = os.path.dirname(__file__)
 
+_PARAMETER_TYPE_REGEX = re.compile(r"parameter\s+([\w.]+)\s")
+
 
 def remove_do_not_edit_header(parameter_file: str, output_file: str) -> None:
     """Removes the DO NOT EDIT header when copying a parameter file"""
@@ -88,6 +92,7 @@ class PBMParameterSet(MutableMapping):
         plasma_scenario_file: str,
         structural_params_file: str = "",
         modelica_file_directory: str = "",
+        profile_format: str = "dense",
         **kwargs,
     ) -> None:
         """
@@ -98,8 +103,12 @@ class PBMParameterSet(MutableMapping):
                                Modelica system (base filename only)
         parameter_directory : str
             Directory containing all parameter TOML files
+        profile_format : str, optional
+            format of the input profile tables, if 'knots' the profile table
+            smoothness defaults to 'LinearSegments', by default 'dense'
         """
         self._logger = logging.getLogger("PowerBalance.Parameters")
+        self._profile_format = profile_format
         self._model_param_files: typing.List[str] = []
         self._input_files: typing.Dict[str, str] = {
             "simulation_options_file": simulation_options_file,
@@ -239,6 +248,39 @@ class PBMParameterSet(MutableMapping):
             return self._simopts[param_names]
         return self._simopts
 
+    def set_simulation_options(self, **options: typing.Any) -> None:
+        """Modify simulation options within the parameter set
+
+        Parameters
+        ----------
+        **options
+            new values for simulation options
+
+        Raises
+        ------
+        power_balance.exceptions.ValidationError
+            if the resulting simulation options are invalid
+        """
+        _simopts = {**self._simopts, **options}
+
+        try:
+            pbm_mso.SimOptsModel(**_simopts)
+        except pydantic.ValidationError as e:
+            raise pbm_exc.ValidationError(e.json(), "simulation options") from e
+
+        self._simopts = _simopts
+
+    def save_simulation_options(self, file_name: str) -> None:
+        """Write the current simulation options to a TOML file
+
+        Parameters
+        ----------
+        file_name : str
+            output TOML file
+        """
+        with open(file_name, "w") as out_f:
+            toml.dump(self._simopts, out_f)
+
     def get_plasma_scenario(
         self, param_names: Optional[typing.Union[str, typing.List[str]]] = None
     ) -> typing.Any:
@@ -261,6 +303,21 @@ class PBMParameterSet(MutableMapping):
             return self._plasma_scenario[param_names]
         return self._plasma_scenario
 
+    def get_structural_parameters(
+        self,
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Retrieve the structural parameter values by model
+
+        Returns
+        -------
+        typing.Dict[str, typing.Dict[str, typing.Any]]
+            structural parameter values for each model
+        """
+        return {
+            model: dict(values) for model, values in self._structural_parameters.items()
+        }
+
+    @pbm_instr.timed("load_parameters")
     def load_plasma_scenario(self) -> typing.MutableMapping[str, typing.Any]:
         """
         Read plasma scenario from the specified file. The values
@@ -300,6 +357,7 @@ class PBMParameterSet(MutableMapping):
 
         return _dict
 
+    @pbm_instr.timed("load_parameters")
     def load_simulation_options(self) -> typing.MutableMapping[str, typing.Any]:
         """
         Read simulation options from the specified file. These options are
@@ -346,6 +404,7 @@ class PBMParameterSet(MutableMapping):
             self._input_files["parameters_directory"], self._input_files[file_name]
         )
 
+    @pbm_instr.timed("load_parameters")
     def load_modelica_parameters(self) -> typing.Dict[str, typing.Any]:
         """Load all parameter sets from TOML files in the specified directory
 
@@ -393,6 +452,7 @@ class PBMParameterSet(MutableMapping):
 
         return _params
 
+    @pbm_instr.timed("load_parameters")
     def load_structural_parameters(self) -> typing.MutableMapping:
         """Load the structural parameters if file given
 
@@ -420,7 +480,27 @@ class PBMParameterSet(MutableMapping):
                 f"'{_struct_param_addr}', but file does not exist."
             )
 
-        return toml.load(_struct_param_addr)
+        _struct_params = toml.load(_struct_param_addr)
+
+        if self._profile_format == "knots":
+            self._set_knot_smoothness(_struct_params)
+
+        return _struct_params
+
+    def _set_knot_smoothness(self, struct_params: typing.MutableMapping) -> None:
+        # Knot tables contain duplicated time points at discontinuities which
+        # only piecewise table interpolation supports
+        for model_name, parameters in pbm_knots.SMOOTHNESS_PARAMETERS.items():
+            _model_params = struct_params.setdefault(model_name, {})
+            for parameter in parameters:
+                _smoothness = _model_params.setdefault(parameter, "LinearSegments")
+                if _smoothness.split(".")[-1] not in pbm_knots.DISCONTINUOUS_SMOOTHNESS:
+                    raise pbm_exc.InvalidConfigurationError(
+                        f"Smoothness '{_smoothness}' for structural parameter "
+                        f"'{model_name}.{parameter}' does not support knot "
+                        "profiles, expected one of "
+                        f"{', '.join(pbm_knots.DISCONTINUOUS_SMOOTHNESS)}"
+                    )
 
     def append(self, parameter_name: str, value: typing.Any):
         """Add a parameter to the parameter set.
@@ -514,7 +594,7 @@ class PBMParameterSet(MutableMapping):
                     )
                 )
 
-        if new_val:
+        if new_val is not None:
             self._parameters[param_name.lower()] = new_val
 
         return self._parameters[param_name.lower()]
@@ -660,6 +740,18 @@ class PBMParameterSet(MutableMapping):
         """
         return parameter_name.lower() in self._extra_params
 
+    @staticmethod
+    def _format_string_value(line: str, value: str) -> str:
+        # Values of enumeration parameters are written as the qualified
+        # enumeration literal, all other strings being quoted
+        _type = _PARAMETER_TYPE_REGEX.search(line)
+
+        if not _type or _type.group(1) == "String":
+            return f'"{value}"'
+
+        return value if "." in value else f"{_type.group(1)}.{value}"
+
+    @pbm_instr.timed("structural_substitution")
     def _perform_struct_subs(self, model_file: str, output_dir: str) -> str:
         self._logger.debug(
             "Checking structural parameter substitutions for input file '%s'",
@@ -697,7 +789,7 @@ class PBMParameterSet(MutableMapping):
                 )
                 # Checks type of the parameter value and formats it accordingly
                 if isinstance(new_param_value, str):
-                    new_param_value = f'"{new_param_value}"'
+                    new_param_value = self._format_string_value(line, new_param_value)
                 elif isinstance(new_param_value, bool):
                     new_param_value = str(new_param_value).lower()
                 elif isinstance(new_param_value, (int, float)):
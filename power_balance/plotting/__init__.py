@@ -11,6 +11,7 @@ Functions
 ---------
 
     launch_viewer - launch plot browser
+    viewer_directory - directory for the webpage of an archived session
 
 Submodules
 ----------
@@ -25,20 +26,62 @@ Submodules
 
 __date__ = "2021-06-10"
 
+import getpass
 import os
+import shutil
+import tempfile
 import webbrowser
 
+import power_balance.results.archive as pbm_archive
+
+
+def viewer_directory(session_name: str) -> str:
+    """Directory for the webpage of an archived session
+
+    The directory of each session is emptied whenever it is requested, such
+    that repeated views of an archive do not accumulate temporary files,
+    whilst the page remains for the browser once the process has exited.
+
+    Parameters
+    ----------
+    session_name : str
+        name of the archived session
+
+    Returns
+    -------
+    str
+        empty directory within the temporary directory of the user
+    """
+    _directory = os.path.join(
+        tempfile.gettempdir(), f"pbm_viewer_{getpass.getuser()}", session_name
+    )
+    shutil.rmtree(_directory, ignore_errors=True)
+    os.makedirs(_directory)
+    return _directory
+
 
 def launch_viewer(results_directory: str):
     """Launch the browser window with the plot webpage
 
+    For a session archive the webpage is read from the archive.
+
     Parameters
     ----------
     results_directory : str
-        directory containing output files
+        directory or archive containing output files
     """
-    _html_file = os.path.join(results_directory, "html", "viewer.html")
-    if not os.path.exists(_html_file):
+    if pbm_archive.is_archive(results_directory):
+        with pbm_archive.SessionArchive(results_directory) as archive:
+            if archive.exists("html/viewer.html"):
+                _html_file = os.path.join(viewer_directory(archive.name), "viewer.html")
+                with open(_html_file, "w") as out_f:
+                    out_f.write(archive.read_text("html/viewer.html"))
+            else:
+                _html_file = ""
+    else:
+        _html_file = os.path.join(results_directory, "html", "viewer.html")
+
+    if not _html_file or not os.path.exists(_html_file):
         raise FileNotFoundError(
             f"Cannot open viewer for directory '{results_directory}', "
             "folder does not contain valid results"
@@ -23,11 +23,11 @@ import os
 from typing import Any, Dict, Tuple
 
 import numpy as np
-import scipy.io as sio
 from bokeh.embed import components
 from bokeh.layouts import gridplot
 from bokeh.plotting import figure
 
+import power_balance.profiles.timeseries as pbm_ts
 from power_balance.plotting.common import add_plot_objects
 
 
@@ -41,7 +41,10 @@ def get_profiles_data(profile_dir: str) -> Dict[str, np.ndarray]:
     """
     _profiles = glob.glob(os.path.join(profile_dir, "*.mat"))
 
-    return {os.path.splitext(prof)[0]: sio.loadmat(prof)["data"] for prof in _profiles}
+    return {
+        os.path.splitext(prof)[0]: pbm_ts.read_profile(prof).to_array()
+        for prof in _profiles
+    }
 
 
 class ProfilePlotBuilder:
@@ -18,7 +18,6 @@ Classes
 
 __date__ = "2021-06-10"
 
-import itertools
 from typing import Any, Dict, List, MutableMapping, Tuple
 
 import numpy as np
@@ -28,6 +27,7 @@ from bokeh.models.ranges import DataRange1d
 from bokeh.plotting import figure
 
 import power_balance.plotting.common as pbm_pc
+import power_balance.results as pbm_results
 
 
 def _output_plot_title(model_name: str, var_name: str) -> str:
@@ -79,21 +79,22 @@ class OutputPlotBuilder:
     def __init__(
         self,
         configuration: MutableMapping[str, Any],
-        output_data: Dict,
+        session: pbm_results.Session,
         npoint_threshold: int = 100,
     ) -> None:
         """Create plots of PBM output data
 
         Parameters
         ----------
-        output_data : Dict
-            dictionary containing output results
         configuration: Dict
             configuration settings dictionary
+        session : power_balance.results.Session
+            session from which the outputs of each model are read, a cut at
+            a time for a parameter sweep
         npoint_threshold : int, optional
             maximum number of datapoints to be displayed, by default 100
         """
-        self._data = output_data
+        self._session = session
         self._threshold = npoint_threshold
         self._configuration = configuration
         self._cuts: Dict[str, List[Dict]] = {}
@@ -140,7 +141,7 @@ class OutputPlotBuilder:
         else:
             self._has_sweep = False
             _plots = self._no_sweep_plots()
-            for model in self._data:
+            for model in _plots:
                 _components = components(
                     gridplot(
                         list(_plots[model].values()),  # type: ignore
@@ -171,7 +172,11 @@ class OutputPlotBuilder:
         # Margin above/below lowest/highest as percentage
         _margin_percentage = 10
 
-        for model_name, dataframe in self._data.items():
+        for model_name in self._session.models:
+            dataframe = self._session.select(
+                model_name, columns=["time", *self._session.variables(model_name)]
+            )
+
             # Get list of power variables to plot
 
             _plot_dict[model_name] = {}
@@ -254,21 +259,15 @@ class OutputPlotBuilder:
         for model in self._cuts:
             _plots_dict[model] = {}
 
+            _variables = self._session.variables(model)
+
             for c_id, cut in enumerate(self._cuts[model]):
                 _plots_dict[model][c_id] = {}
-                _dataframe = self._data[model]
-                for param, value in cut.items():
-                    _dataframe = _dataframe[_dataframe[param] == value]
+                _dataframe = self._session.cut(model, cut)
 
-                _gen_params = [
-                    i for i in self._data[model].keys() if "generated" in i.lower()
-                ]
+                _gen_params = [i for i in _variables if "generated" in i.lower()]
 
-                _out_params = [
-                    i
-                    for i in self._data[model].keys()
-                    if i not in _gen_params and i != "time"
-                ]
+                _out_params = [i for i in _variables if i not in _gen_params]
 
                 # Generated first then output
                 _param_list = _gen_params + _out_params
@@ -328,37 +327,8 @@ class OutputPlotBuilder:
         return _plots_dict
 
     def _sweep_mode_plots(self) -> Dict[str, Any]:
-        _sweep_setup = {}
-        for model_name, dataframe in self._data.items():
-            # Get the sweep parameter values for this model
-            # by comparing those stated in the config with
-            # those present in the models output dataframe
-            _sweep_vars = [
-                i
-                for i in self._configuration["sweep"]
-                if i.lower() in dataframe.columns
-            ]
-
-            _first = list(self._configuration["sweep"].values())[0]
-
-            _sweep_setup[model_name] = {
-                k.lower(): self._configuration["sweep"][k] for k in _sweep_vars
-            }
-
-            _length = len(_first)
-
-            if self._configuration["sweep_mode"] == "set":
-                self._cuts[model_name] = [
-                    {
-                        param: value[i]
-                        for param, value in _sweep_setup[model_name].items()
-                    }
-                    for i in range(_length)
-                ]
-            else:
-                _combos = itertools.product(*_sweep_setup[model_name].values())
-
-                self._cuts[model_name] = [
-                    dict(zip(_sweep_setup[model_name].keys(), i)) for i in _combos
-                ]
+        # Cuts are those combinations of the sweep parameter values
+        # present in the outputs of each model
+        for model_name in self._session.models:
+            self._cuts[model_name] = self._session.cuts(model_name) or [{}]
         return self._gen_sweep_plots()
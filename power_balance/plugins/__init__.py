@@ -166,6 +166,38 @@ def prepare_from_plugins(pbmmain_call_args: typing.Dict) -> typing.List[str]:
     return list(_plugins.keys())
 
 
+def get_post_run_scripts(
+    plugin_names: typing.Sequence[str],
+) -> typing.List[typing.Callable]:
+    """Retrieve the functions run by plugins once a simulation has completed
+
+    Parameters
+    ----------
+    plugin_names : typing.Sequence[str]
+        plugins used by the session in the order they are run
+
+    Returns
+    -------
+    typing.List[typing.Callable]
+        the 'post_run_script' function of each plugin defining one
+    """
+    _plugins: typing.Dict = get_plugin_listing()
+    _scripts: typing.List[typing.Callable] = []
+
+    for plugin in plugin_names:
+        metadata = _plugins[plugin]
+        if "post_run_script" not in metadata:
+            continue
+
+        _script_addr, _function = metadata["post_run_script"].split(":")
+        _module = importlib.import_module(
+            f".{metadata['directory']}.{_script_addr}", "power_balance.plugins"
+        )
+        _scripts.append(getattr(_module, _function))
+
+    return _scripts
+
+
 def get_plugin_display_filename(plugin_name: str) -> str:
     """Returns the expected display template file for a given plugin"""
     return os.path.join(
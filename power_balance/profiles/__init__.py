@@ -25,6 +25,12 @@ Functions
     generate_all - generates all profiles
     read_profile_to_df - reads a '.mat' file profile to a data frame
 
+Submodules
+----------
+
+    timeseries - cached time series container for profiles
+    knots - compression of profiles to the knots defining them
+
 """
 
 __date__ = "2021-06-08"
@@ -37,6 +43,9 @@ import numpy as np
 import pandas as pd
 import scipy.io as sio
 
+import power_balance.profiles.knots as pbm_knots
+import power_balance.profiles.timeseries as pbm_ts
+
 # Place generated profiles within mat_profile_files folder
 # in the same location as this script
 DEFAULT_PROFILES_DIR = os.path.join(os.path.dirname(__file__), "mat_profile_files")
@@ -47,6 +56,16 @@ if not os.path.exists(DEFAULT_PROFILES_DIR):
 _time_array_default = np.linspace(0, 60, 601)
 _time_range_default = (10, 20, 40, 50)
 
+# Names of the profiles written by 'generate_all'
+PROFILE_NAMES: typing.Tuple[str, ...] = (
+    "ThermalPowerOut",
+    "NBI_Heat",
+    "RF_Heat",
+    "currentTF",
+    "currentCS",
+    *(f"currentPF{i}" for i in range(1, 7)),
+)
+
 
 def gen_thermalpowerout_profile(
     stop_time: Optional[int] = None,
@@ -1186,6 +1205,7 @@ def generate_all(
     stop_time: Optional[int] = None,
     time_step: Optional[int] = None,
     max_values: typing.Optional[typing.Dict] = None,
+    knots: bool = False,
 ) -> None:
     """Generate all the current profiles in the given directory using
     _time_array_default and _time_range_default, and also using the
@@ -1207,6 +1227,9 @@ def generate_all(
     max_values : dict, optional
         a dictionary containing information about the maximum currents and powers
         for each profile in the format {'system name': value}
+    knots : bool, optional
+        write each profile as the minimal table of knots with discontinuities
+        represented by duplicated time points, by default False
     """
     if not max_values:
         max_values = {}
@@ -1299,6 +1322,12 @@ def generate_all(
         max_power=max_values.get("thermal", None),
     )
 
+    if not knots:
+        return
+
+    for profile_name in PROFILE_NAMES:
+        pbm_knots.compress_file(os.path.join(output_directory, f"{profile_name}.mat"))
+
 
 def read_profile_to_df(filename: str) -> pd.DataFrame:
     """Open a '.mat' profile file and write contents to a Pandas
@@ -1319,11 +1348,4 @@ def read_profile_to_df(filename: str) -> pd.DataFrame:
     FileNotFoundError
         if specified input file does not exist
     """
-    if not os.path.exists(filename):
-        raise FileNotFoundError(
-            f"Could not load profile from '{filename}' no such file or directory"
-        )
-
-    _contents_array = sio.loadmat(filename)["data"]
-
-    return pd.DataFrame(_contents_array, columns=["time", "value"])
+    return pbm_ts.read_profile(filename).to_frame()
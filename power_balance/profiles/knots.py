@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Profile Knot Compression
+========================
+
+Reduction of dense '.mat' profile tables to the minimal set of knots which
+reproduces the profile under linear interpolation. The generated profiles
+are piecewise-constant or piecewise-linear, so only the points at which the
+gradient changes need to be retained.
+
+Where a profile steps between two consecutive samples the step is
+represented as a discontinuity by duplicating the time point, which the
+Modelica 'CombiTimeTable' treats as a time event rather than a steep ramp
+the solver must resolve. Such tables require the 'LinearSegments' or
+'ConstantSegments' table smoothness.
+
+The step of the original dense table is stored alongside the knots so
+that the dense profile can be reconstructed for post-processing.
+
+Contents
+========
+
+Functions
+---------
+
+    compress - reduce a dense profile table to its knots
+    expand - evaluate a knot table on a time axis
+    dense_time - reconstruct the dense time axis of a knot table
+    compress_file - rewrite a '.mat' profile file as a knot table
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import scipy.io as sio
+
+import power_balance.exceptions as pbm_exc
+
+# Variable within a knot '.mat' file holding the dense table step
+TIME_STEP_KEY = "time_step"
+
+# Largest step of the dense table from which generated knot profiles are
+# compressed, setting the resolution of the profile breakpoints
+KNOT_RESOLUTION = 1e-2
+
+# Smoothness options of the Modelica CombiTimeTable
+SMOOTHNESS_OPTIONS: typing.Tuple[str, ...] = (
+    "LinearSegments",
+    "ContinuousDerivative",
+    "ConstantSegments",
+    "MonotoneContinuousDerivative1",
+    "MonotoneContinuousDerivative2",
+    "ModifiedContinuousDerivative",
+)
+
+# Smoothness options supporting tables with duplicated time points
+DISCONTINUOUS_SMOOTHNESS: typing.Tuple[str, ...] = (
+    "LinearSegments",
+    "ConstantSegments",
+)
+
+# Structural parameters setting the table smoothness of each profile input
+SMOOTHNESS_PARAMETERS: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "Magnets": (
+        "smoothnessTF",
+        "smoothnessCS",
+        *(f"smoothnessPF{i}" for i in range(1, 7)),
+    ),
+    "Tokamak": ("smoothnessThermal",),
+}
+
+
+def _tolerance(values: np.ndarray, rtol: float) -> float:
+    return rtol * max(float(np.max(np.abs(values), initial=0.0)), 1.0)
+
+
+def compress(
+    data: np.ndarray, rtol: float = 1e-9, discontinuities: bool = True
+) -> np.ndarray:
+    """Reduce a dense profile table to the knots defining it
+
+    Parameters
+    ----------
+    data : np.ndarray
+        two column array of increasing time and value
+    rtol : float, optional
+        tolerance relative to the largest absolute value within which
+        a point is considered to lie on the line between its neighbours,
+        by default 1E-9
+    discontinuities : bool, optional
+        represent single step changes in gradient on both sides as a
+        discontinuity with a duplicated time point, by default True
+
+    Returns
+    -------
+    np.ndarray
+        two column array of knot times and values
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the times are not strictly increasing
+    """
+    _time = np.asarray(data[:, 0], dtype=float)
+    _values = np.asarray(data[:, 1], dtype=float)
+
+    if np.any(np.diff(_time) <= 0):
+        raise pbm_exc.InvalidInputError(
+            "Cannot compress profile, times must be strictly increasing"
+        )
+
+    if len(_time) < 3:
+        return np.column_stack([_time, _values])
+
+    _atol = _tolerance(_values, rtol)
+
+    if discontinuities:
+        _slopes = np.diff(_values) / np.diff(_time)
+        _slope_tol = _atol / np.min(np.diff(_time))
+        _differs = np.abs(np.diff(_slopes)) > _slope_tol
+        _before = np.concatenate([[True], _differs])
+        _after = np.concatenate([_differs, [True]])
+        # A jump is a single segment whose gradient matches neither neighbour
+        _jumps = np.flatnonzero(_before & _after & (np.abs(np.diff(_values)) > _atol))
+        # Hold the value up to the time of the new value
+        _time = np.insert(_time, _jumps + 1, _time[_jumps + 1])
+        _values = np.insert(_values, _jumps + 1, _values[_jumps])
+
+    # Retain end points, both points of a discontinuity and any point not
+    # lying on the line between its neighbours
+    _t_prev, _t, _t_next = _time[:-2], _time[1:-1], _time[2:]
+    _v_prev, _v, _v_next = _values[:-2], _values[1:-1], _values[2:]
+
+    _repeated = (_t == _t_prev) | (_t == _t_next)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _interpolated = _v_prev + (_v_next - _v_prev) * (_t - _t_prev) / (
+            _t_next - _t_prev
+        )
+
+    _keep = np.concatenate(
+        [[True], _repeated | (np.abs(_v - _interpolated) > _atol), [True]]
+    )
+
+    return np.column_stack([_time[_keep], _values[_keep]])
+
+
+def expand(knots: np.ndarray, time: np.ndarray) -> np.ndarray:
+    """Evaluate a knot table at the given times
+
+    Tables are interpolated linearly with the value at a discontinuity
+    taken as that following it, matching the dense tables from which
+    knots are compressed.
+
+    Parameters
+    ----------
+    knots : np.ndarray
+        two column array of knot times and values
+    time : np.ndarray
+        times at which to evaluate the table
+
+    Returns
+    -------
+    np.ndarray
+        value of the table at each time
+    """
+    _knot_time = np.asarray(knots[:, 0], dtype=float)
+    _knot_values = np.asarray(knots[:, 1], dtype=float)
+    _time = np.asarray(time, dtype=float)
+
+    _lower = np.clip(
+        np.searchsorted(_knot_time, _time, side="right") - 1,
+        0,
+        len(_knot_time) - 1,
+    )
+    _upper = np.minimum(_lower + 1, len(_knot_time) - 1)
+
+    _span = _knot_time[_upper] - _knot_time[_lower]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _fraction = np.where(
+            _span > 0, np.clip((_time - _knot_time[_lower]) / _span, 0, 1), 0.0
+        )
+
+    return _knot_values[_lower] + _fraction * (
+        _knot_values[_upper] - _knot_values[_lower]
+    )
+
+
+def dense_time(knots: np.ndarray, time_step: float) -> np.ndarray:
+    """Reconstruct the dense time axis of a knot table
+
+    Parameters
+    ----------
+    knots : np.ndarray
+        two column array of knot times and values
+    time_step : float
+        step of the original dense table
+
+    Returns
+    -------
+    np.ndarray
+        evenly spaced times spanning the table
+    """
+    _start, _stop = float(knots[0, 0]), float(knots[-1, 0])
+    return np.linspace(_start, _stop, int(round((_stop - _start) / time_step)) + 1)
+
+
+def compress_file(
+    file_name: str, rtol: float = 1e-9, discontinuities: bool = True
+) -> typing.Tuple[int, int]:
+    """Rewrite a dense '.mat' profile file as a knot table
+
+    Parameters
+    ----------
+    file_name : str
+        '.mat' profile file to compress in place
+    rtol : float, optional
+        relative tolerance for removal of collinear points, by default 1E-9
+    discontinuities : bool, optional
+        represent steps as discontinuities, by default True
+
+    Returns
+    -------
+    typing.Tuple[int, int]
+        number of rows before and after compression
+    """
+    _mat = sio.loadmat(file_name)
+    _data = _mat["data"]
+
+    if TIME_STEP_KEY in _mat:
+        return len(_data), len(_data)
+
+    _knots = compress(_data, rtol, discontinuities)
+
+    sio.savemat(
+        file_name, {"data": _knots, TIME_STEP_KEY: float(_data[1, 0] - _data[0, 0])}
+    )
+
+    return len(_data), len(_knots)
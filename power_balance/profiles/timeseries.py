@@ -0,0 +1,410 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Profile Time Series
+===================
+
+Container for time series such as the '.mat' input profiles, providing
+lookup of time points via a sorted search and slicing by plasma phase.
+
+Profiles are read on first request and memoised by the hash of the file
+contents, so that each file is parsed once per process regardless of how
+many post-processing steps require it. The arrays of a memoised series are
+read-only as they are shared between all callers.
+
+Contents
+========
+
+Classes
+-------
+
+    TimeSeries - time series with a sorted time axis and plasma phase accessors
+
+Functions
+---------
+
+    time_index - locate a time point within a sorted time axis
+    is_equidistant - check whether a time axis has a constant step
+    trapezoid_average - time average over a window of an arbitrary time axis
+    read_profile - retrieve the memoised TimeSeries for a '.mat' profile file
+    clear_cache - discard all memoised profiles
+
+"""
+
+__date__ = "2026-10-19"
+
+import hashlib
+import os
+import threading
+import typing
+
+import numpy as np
+import pandas as pd
+import scipy.io as sio
+
+import power_balance.exceptions as pbm_exc
+import power_balance.profiles.knots as pbm_knots
+
+# Phases of a plasma pulse as bounding plasma scenario keys, None indicating
+# the start or end of the time series
+PLASMA_PHASES: typing.Dict[str, typing.Tuple[typing.Optional[str], ...]] = {
+    "premagnetisation": (None, "plasma_ramp_up_start"),
+    "ramp_up": ("plasma_ramp_up_start", "plasma_flat_top_start"),
+    "flat_top": ("plasma_flat_top_start", "plasma_flat_top_end"),
+    "ramp_down": ("plasma_flat_top_end", "plasma_ramp_down_end"),
+    "demagnetisation": ("plasma_ramp_down_end", None),
+}
+
+_FILE_HASHES: typing.Dict[typing.Tuple[str, int, int, int], str] = {}
+_PROFILES: typing.Dict[str, "TimeSeries"] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def time_index(time: np.ndarray, value: float, atol: float = 1e-8) -> int:
+    """Locate the first point in a sorted time axis matching a given time
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically increasing time values
+    value : float
+        time to locate
+    atol : float, optional
+        absolute tolerance when matching times, by default 1E-8
+
+    Returns
+    -------
+    int
+        index of the first matching time point
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if no time point lies within the tolerance of the given time
+    """
+    _index = int(np.searchsorted(time, value - atol, side="left"))
+    if _index >= len(time) or abs(time[_index] - value) > atol:
+        raise pbm_exc.InvalidInputError(
+            f"Time series does not contain a point at t={value}"
+        )
+    return _index
+
+
+def is_equidistant(time: np.ndarray, rtol: float = 1e-6) -> bool:
+    """Check whether a time axis has a constant step
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically increasing time values
+    rtol : float, optional
+        tolerance on each step relative to the first, by default 1E-6
+
+    Returns
+    -------
+    bool
+        True if every step matches the first within the tolerance
+    """
+    _steps = np.diff(np.asarray(time, dtype=float))
+
+    if _steps.size == 0:
+        return True
+
+    return bool(
+        _steps[0] > 0 and np.all(np.abs(_steps - _steps[0]) <= rtol * _steps[0])
+    )
+
+
+def _limit(time: np.ndarray, values: np.ndarray, point: float, side: str) -> np.ndarray:
+    # Value at a time point by linear interpolation, taking the value after
+    # ('right') or before ('left') any discontinuity at that point
+    if side == "right":
+        _lower = np.searchsorted(time, point, side="right") - 1
+        _upper = _lower + 1
+    else:
+        _upper = np.searchsorted(time, point, side="left")
+        _lower = _upper - 1
+
+    _lower = int(np.clip(_lower, 0, len(time) - 1))
+    _upper = int(np.clip(_upper, 0, len(time) - 1))
+
+    if time[_upper] == time[_lower]:
+        return values[..., _upper if side == "left" else _lower]
+
+    _fraction = (point - time[_lower]) / (time[_upper] - time[_lower])
+
+    return values[..., _lower] + _fraction * (values[..., _upper] - values[..., _lower])
+
+
+def trapezoid_average(
+    time: np.ndarray, values: np.ndarray, start: float, end: float
+) -> np.ndarray:
+    """Time average over a window using the trapezoidal rule
+
+    The time axis need not be evenly spaced and may repeat a time point
+    to represent a discontinuity. Values at the window boundaries are
+    interpolated linearly.
+
+    Parameters
+    ----------
+    time : np.ndarray
+        monotonically non-decreasing time values
+    values : np.ndarray
+        values with time along the last axis
+    start : float
+        start of the averaging window
+    end : float
+        end of the averaging window
+
+    Returns
+    -------
+    np.ndarray
+        average over the window for each series along the leading axes
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the window does not overlap the time axis
+    """
+    _time = np.asarray(time, dtype=float)
+    _values = np.asarray(values, dtype=float)
+
+    _start = max(start, _time[0])
+    _end = min(end, _time[-1])
+
+    if _end <= _start:
+        raise pbm_exc.InvalidInputError(
+            f"Cannot average over window [{start}, {end}], time series "
+            f"spans [{_time[0]}, {_time[-1]}]"
+        )
+
+    _inside = (_time > _start) & (_time < _end)
+
+    _window_time = np.concatenate([[_start], _time[_inside], [_end]])
+    _window_values = np.concatenate(
+        [
+            _limit(_time, _values, _start, "right")[..., np.newaxis],
+            _values[..., _inside],
+            _limit(_time, _values, _end, "left")[..., np.newaxis],
+        ],
+        axis=-1,
+    )
+
+    _areas = (
+        np.diff(_window_time) * (_window_values[..., 1:] + _window_values[..., :-1]) / 2
+    )
+
+    return np.sum(_areas, axis=-1) / (_end - _start)
+
+
+class TimeSeries:
+    """Time series of a single quantity with a sorted time axis"""
+
+    def __init__(self, time: np.ndarray, values: np.ndarray, name: str = "") -> None:
+        """
+        Parameters
+        ----------
+        time : np.ndarray
+            time values, sorted if not already increasing
+        values : np.ndarray
+            value at each time point
+        name : str, optional
+            label for the series
+        """
+        _time = np.asarray(time, dtype=float)
+        _values = np.asarray(values, dtype=float)
+
+        if _time.shape != _values.shape:
+            raise pbm_exc.InvalidInputError(
+                f"Time series '{name}' has {_time.shape[0]} time points "
+                f"but {_values.shape[0]} values"
+            )
+
+        if np.any(np.diff(_time) < 0):
+            _order = np.argsort(_time, kind="stable")
+            _time, _values = _time[_order], _values[_order]
+
+        self._time = _time
+        self._values = _values
+        self._name = name
+        self._phases: typing.Dict[typing.Tuple, typing.Dict[str, slice]] = {}
+
+    @property
+    def name(self) -> str:
+        """Label for the series"""
+        return self._name
+
+    @property
+    def time(self) -> np.ndarray:
+        """Time values"""
+        return self._time
+
+    @property
+    def values(self) -> np.ndarray:
+        """Value at each time point"""
+        return self._values
+
+    def __len__(self) -> int:
+        return self._time.shape[0]
+
+    def index(self, time: float, atol: float = 1e-8) -> int:
+        """Index of the first time point matching the given time
+
+        Parameters
+        ----------
+        time : float
+            time to locate
+        atol : float, optional
+            absolute tolerance when matching times, by default 1E-8
+
+        Returns
+        -------
+        int
+            index of the time point
+        """
+        return time_index(self._time, time, atol)
+
+    def phases(
+        self, plasma_scenario: typing.Mapping[str, float]
+    ) -> typing.Dict[str, slice]:
+        """Index ranges of each plasma phase within the series
+
+        Boundaries are located once for each plasma scenario. Phases whose
+        bounding times are absent from the scenario are omitted.
+
+        Parameters
+        ----------
+        plasma_scenario : typing.Mapping[str, float]
+            plasma scenario containing the phase boundary times
+
+        Returns
+        -------
+        typing.Dict[str, slice]
+            slice for each plasma phase
+        """
+        _key = tuple(sorted(plasma_scenario.items()))
+
+        if _key not in self._phases:
+            _boundaries: typing.Dict[typing.Optional[str], typing.Optional[int]] = {
+                None: None
+            }
+            _phases: typing.Dict[str, slice] = {}
+            for phase, bounds in PLASMA_PHASES.items():
+                if any(b is not None and b not in plasma_scenario for b in bounds):
+                    continue
+                for bound in bounds:
+                    if bound not in _boundaries:
+                        _boundaries[bound] = self.index(plasma_scenario[bound])
+                _phases[phase] = slice(_boundaries[bounds[0]], _boundaries[bounds[1]])
+            self._phases[_key] = _phases
+
+        return self._phases[_key]
+
+    def phase(
+        self, name: str, plasma_scenario: typing.Mapping[str, float]
+    ) -> "TimeSeries":
+        """Retrieve the portion of the series for a single plasma phase
+
+        Parameters
+        ----------
+        name : str
+            one of 'premagnetisation', 'ramp_up', 'flat_top', 'ramp_down'
+            or 'demagnetisation'
+        plasma_scenario : typing.Mapping[str, float]
+            plasma scenario containing the phase boundary times
+
+        Returns
+        -------
+        TimeSeries
+            series restricted to the phase
+        """
+        _slice = self.phases(plasma_scenario)[name]
+        return TimeSeries(self._time[_slice], self._values[_slice], self._name)
+
+    def flat_top(self, plasma_scenario: typing.Mapping[str, float]) -> "TimeSeries":
+        """Retrieve the portion of the series during the plasma flat-top"""
+        return self.phase("flat_top", plasma_scenario)
+
+    def average(self) -> float:
+        """Mean of the series values"""
+        return float(np.average(self._values))
+
+    def to_array(self) -> np.ndarray:
+        """Series as a two column array of time and value"""
+        return np.column_stack([self._time, self._values])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Series as a dataframe with columns 'time' and 'value'"""
+        return pd.DataFrame({"time": self._time, "value": self._values})
+
+
+def _file_hash(file_name: str) -> str:
+    _stat = os.stat(file_name)
+    _key = (os.path.abspath(file_name), _stat.st_ino, _stat.st_size, _stat.st_mtime_ns)
+
+    if _key not in _FILE_HASHES:
+        with open(file_name, "rb") as in_f:
+            _FILE_HASHES[_key] = hashlib.sha256(in_f.read()).hexdigest()
+
+    return _FILE_HASHES[_key]
+
+
+def read_profile(file_name: str) -> TimeSeries:
+    """Retrieve the time series for a '.mat' profile file
+
+    The file is only parsed if a file with identical contents has not
+    already been read during this process. Knot tables are expanded onto
+    the time axis of the dense table from which they were compressed.
+
+    Parameters
+    ----------
+    file_name : str
+        address of the '.mat' file
+
+    Returns
+    -------
+    TimeSeries
+        read-only time series for the profile
+
+    Raises
+    ------
+    FileNotFoundError
+        if specified input file does not exist
+    """
+    if not os.path.exists(file_name):
+        raise FileNotFoundError(
+            f"Could not load profile from '{file_name}' no such file or directory"
+        )
+
+    with _CACHE_LOCK:
+        _hash = _file_hash(file_name)
+
+        if _hash not in _PROFILES:
+            _mat = sio.loadmat(file_name)
+            _data = _mat["data"]
+
+            # Knot tables are expanded to the dense table they represent so
+            # that post-processing is independent of the profile format
+            if pbm_knots.TIME_STEP_KEY in _mat:
+                _time = pbm_knots.dense_time(
+                    _data, float(_mat[pbm_knots.TIME_STEP_KEY].squeeze())
+                )
+                _data = np.column_stack([_time, pbm_knots.expand(_data, _time)])
+
+            _series = TimeSeries(
+                _data[:, 0],
+                _data[:, 1],
+                os.path.splitext(os.path.basename(file_name))[0],
+            )
+            _series.time.setflags(write=False)
+            _series.values.setflags(write=False)
+            _PROFILES[_hash] = _series
+
+        return _PROFILES[_hash]
+
+
+def clear_cache() -> None:
+    """Discard all memoised profiles"""
+    with _CACHE_LOCK:
+        _FILE_HASHES.clear()
+        _PROFILES.clear()
@@ -0,0 +1,258 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+PyDelica Session Internals
+==========================
+
+Access to the state of PyDelica sessions and compilers which PyDelica does
+not expose publicly. Sharing a compiler between sessions, or the binaries
+built by one session with another, requires the compiler, binaries, model
+parameters and options held by a session to be read and replaced. The
+output of a simulation executable is only passed by PyDelica to the function
+checking it for errors, which prints it, hence is captured by wrapping that
+function whilst a capture is active. All such access is made through this
+module, the attributes relied upon being listed such that the unit tests
+fail should a PyDelica release remove them.
+
+Contents
+========
+
+Functions
+---------
+
+    get_compiler - compiler used by a session to build models
+    set_compiler - replace the compiler used by a session
+    add_build_directory - register a directory removed with a compiler cache
+    share_compiler - use the compiler and log level of another session
+    detach_compiler - copy of a session without its compiler
+    replicate_session - copy of a session simulating copies of its binaries
+    reset_models - discard the parameters and options applied to models
+    simulation_output - capture the output of simulations within this thread
+
+"""
+
+__date__ = "2026-10-19"
+
+import contextlib
+import copy
+import functools
+import pathlib
+import shutil
+import threading
+import typing
+
+import pydelica
+import pydelica.compiler
+import pydelica.exception
+
+# Private attributes of PyDelica objects used by this module and by
+# 'power_balance.compiler.ServerCompiler'
+SESSION_ATTRIBUTES: typing.Tuple[str, ...] = (
+    "_compiler",
+    "_log_level",
+    "_binaries",
+    "_model_parameters",
+    "_simulation_opts",
+    "_runtime_opts",
+    "_solutions",
+    "_set_input_files_directory",
+)
+COMPILER_ATTRIBUTES: typing.Tuple[str, ...] = (
+    "_binary_dirs",
+    "_omc_binary",
+    "_omc_flags",
+    "_prepare_c_incls",
+)
+MODEL_XML_ATTRIBUTE = "_model_xml"
+
+# Function to which 'pydelica.Session.simulate' passes the simulation output
+OUTPUT_CHECK_FUNCTION = "parse_error_string_simulate"
+
+# Output capture of the current thread, and the number of active captures
+# within all threads for which the output check is wrapped
+_CAPTURE = threading.local()
+_CAPTURE_LOCK = threading.Lock()
+_CAPTURE_STATE: typing.Dict[str, typing.Any] = {"active": 0, "check": None}
+
+
+def get_compiler(session: pydelica.Session) -> pydelica.compiler.Compiler:
+    """Compiler used by a session to build models"""
+    return session._compiler
+
+
+def set_compiler(
+    session: pydelica.Session, compiler: typing.Optional[pydelica.compiler.Compiler]
+) -> None:
+    """Replace the compiler used by a session to build models"""
+    session._compiler = compiler
+
+
+def add_build_directory(compiler: pydelica.compiler.Compiler, directory: str) -> None:
+    """Register a directory to be removed when a compiler clears its cache"""
+    compiler._binary_dirs.append(directory)
+
+
+def share_compiler(session: pydelica.Session, source: pydelica.Session) -> None:
+    """Use the compiler and Modelica log level of another session
+
+    Parameters
+    ----------
+    session : pydelica.Session
+        session to modify
+    source : pydelica.Session
+        session whose compiler and log level are used
+    """
+    session._compiler = source._compiler
+    session._log_level = source._log_level
+
+
+def detach_compiler(session: pydelica.Session) -> pydelica.Session:
+    """Copy of a session without its compiler
+
+    The compiler, which may hold a running OMC server, cannot be sent to
+    another process.
+
+    Parameters
+    ----------
+    session : pydelica.Session
+        session containing built models
+
+    Returns
+    -------
+    pydelica.Session
+        shallow copy of the session with no compiler
+    """
+    _session = copy.copy(session)
+    _session._compiler = None
+    return _session
+
+
+def replicate_session(session: pydelica.Session, directory: str) -> pydelica.Session:
+    """Copy of a PyDelica session simulating copies of its built binaries
+
+    Parameters
+    ----------
+    session : pydelica.Session
+        session containing the built models
+    directory : str
+        directory to copy the binaries to
+
+    Returns
+    -------
+    pydelica.Session
+        session simulating the copied binaries, sharing the compiler of the
+        original session
+    """
+    _replica = copy.copy(session)
+    _replica._binaries = {}
+    _replica._model_parameters = {}
+    _replica._simulation_opts = {}
+    _replica._runtime_opts = copy.deepcopy(session._runtime_opts)
+    _replica._solutions = copy.deepcopy(session._solutions)
+
+    _binary_dirs: typing.Dict[pathlib.Path, pathlib.Path] = {}
+
+    for model, binary in session._binaries.items():
+        if binary.parent not in _binary_dirs:
+            _binary_dirs[binary.parent] = pathlib.Path(
+                directory, f"{len(_binary_dirs)}"
+            )
+            shutil.copytree(binary.parent, _binary_dirs[binary.parent])
+
+        _binary_dir = _binary_dirs[binary.parent]
+        _replica._binaries[model] = _binary_dir.joinpath(binary.name)
+
+        # Parameters and simulation options are written to the XML file
+        # alongside the binary before each simulation
+        for store in ("_model_parameters", "_simulation_opts"):
+            _item = copy.deepcopy(getattr(session, store)[model])
+            _xml = pathlib.Path(getattr(_item, MODEL_XML_ATTRIBUTE))
+            setattr(_item, MODEL_XML_ATTRIBUTE, _binary_dir.joinpath(_xml.name))
+            getattr(_replica, store)[model] = _item
+
+    return _replica
+
+
+def reset_models(session: pydelica.Session, profiles_directory: str) -> None:
+    """Discard the parameters and options applied to the models of a session
+
+    Parameter values and simulation options are read again from the XML
+    file of each model, and runtime options reset to their defaults.
+
+    Parameters
+    ----------
+    session : pydelica.Session
+        session containing built models
+    profiles_directory : str
+        directory containing the input profiles read by the models
+    """
+    for model, parameters in session._model_parameters.items():
+        _model_xml = getattr(parameters, MODEL_XML_ATTRIBUTE)
+        session._model_parameters[model] = pydelica.Model(
+            parameters.get_source_path(), _model_xml
+        )
+        session._simulation_opts[model] = pydelica.SimulationOptions(_model_xml)
+        session._runtime_opts[model] = pydelica.RuntimeOptions()
+        session._set_input_files_directory(model, pathlib.Path(profiles_directory))
+
+
+def _capturing(check: typing.Callable) -> typing.Callable:
+    # The wrapped check is bound such that simulations holding the wrapper
+    # once it is removed still check their output
+    @functools.wraps(check)
+    def _capturing_check(out_string: str, *args, **kwargs):
+        if (_capture := getattr(_CAPTURE, "capture", None)) is not None:
+            _buffer, _printed = _capture
+            _buffer.append(out_string)
+            out_string = _printed(out_string)
+        return check(out_string, *args, **kwargs)
+
+    return _capturing_check
+
+
+def _wrap_output_check() -> None:
+    with _CAPTURE_LOCK:
+        if not _CAPTURE_STATE["active"]:
+            _check = getattr(pydelica.exception, OUTPUT_CHECK_FUNCTION)
+            _CAPTURE_STATE["check"] = _check
+            setattr(pydelica.exception, OUTPUT_CHECK_FUNCTION, _capturing(_check))
+        _CAPTURE_STATE["active"] += 1
+
+
+def _restore_output_check() -> None:
+    with _CAPTURE_LOCK:
+        _CAPTURE_STATE["active"] -= 1
+        if not _CAPTURE_STATE["active"]:
+            setattr(pydelica.exception, OUTPUT_CHECK_FUNCTION, _CAPTURE_STATE["check"])
+            _CAPTURE_STATE["check"] = None
+
+
+@contextlib.contextmanager
+def simulation_output(
+    printed: typing.Callable[[str], str] = lambda output: output,
+) -> typing.Iterator[typing.List[str]]:
+    """Capture the output of simulations run within the current thread
+
+    PyDelica is only modified whilst a capture is active within any thread,
+    simulations within other threads being checked and printed as normal.
+
+    Parameters
+    ----------
+    printed : typing.Callable[[str], str], optional
+        part of each output checked for errors and printed by PyDelica, by
+        default all of it
+
+    Yields
+    ------
+    typing.List[str]
+        output of each simulation run within the context
+    """
+    _previous = getattr(_CAPTURE, "capture", None)
+    _CAPTURE.capture = ([], printed)
+    _wrap_output_check()
+
+    try:
+        yield _CAPTURE.capture[0]
+    finally:
+        _restore_output_check()
+        _CAPTURE.capture = _previous
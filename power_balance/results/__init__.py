@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Power Balance Session Results
+=============================
+
+Containers and storage layouts for the outputs of a PBM session.
+
+Contents
+========
+
+Classes
+-------
+
+    Session - lazy reader of the outputs of a session directory
+
+Submodules
+----------
+
+    archive - single file archives of session directories
+    blobs - content-addressed store of session inputs
+    catalogue - SQLite catalogue of session directories
+    dense - array backed storage of parameter sweep results
+    handoff - memory-mapped publication of model outputs
+    manifest - hashes of the effective inputs of a session
+    session - lazy reading of session outputs
+    storage - storage back-ends for the outputs of each model
+    sweep - indexed selection of cuts within sweep results
+
+"""
+
+__date__ = "2026-10-19"
+
+from power_balance.results.session import Session  # noqa: F401
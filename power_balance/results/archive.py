@@ -0,0 +1,386 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Session Archives
+================
+
+Storage of a session directory as a single zip archive, with members read
+individually from the archive without extracting it. The data, parameters,
+configuration, profiles, plots and displays of the session are stored under
+the same relative paths as within the directory, alongside a manifest
+recording the session name and PBM version.
+
+Members which are already compressed, such as the session HDF5 files,
+Parquet files and Zarr chunks, are stored uncompressed such that they are
+read directly from the archive, the remaining members being deflated. HDF5
+members are read into memory once per open archive and opened from that
+image, and members read by functions requiring a
+path on disk, such as the '.mat' profiles, are extracted to a temporary
+directory when first requested.
+
+Contents
+========
+
+Classes
+-------
+
+    SessionFiles - access to the files of a session directory
+    SessionArchive - access to the members of a session archive
+
+Functions
+---------
+
+    is_archive - whether a path is a session archive
+    open_session - open a session directory or archive
+    write_archive - write a session directory to an archive
+
+"""
+
+__date__ = "2026-10-19"
+
+import datetime
+import fnmatch
+import glob
+import json
+import os
+import shutil
+import tempfile
+import typing
+import zipfile
+
+import pandas as pd
+import tables
+
+import power_balance
+
+ARCHIVE_EXTENSION = ".zip"
+MANIFEST_FILE = "manifest.json"
+ARCHIVE_FORMAT_VERSION = 1
+
+# Members already compressed are stored such that they are read directly
+_STORED_EXTENSIONS: typing.Tuple[str, ...] = (
+    ".h5",
+    ".parquet",
+    ".npz",
+    ".jpg",
+    ".png",
+    ".zip",
+)
+
+
+class SessionFiles:
+    """Access to the files of a session directory
+
+    Files are named by their path relative to the directory with '/'
+    separators, such that they are named as within a session archive.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Parameters
+        ----------
+        directory : str
+            session directory, or a subdirectory of one
+        """
+        self._directory = directory
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.location}')"
+
+    def __enter__(self) -> "SessionFiles":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def location(self) -> str:
+        """Path of the session directory or archive"""
+        return self._directory
+
+    @property
+    def name(self) -> str:
+        """Name of the session"""
+        return os.path.basename(os.path.normpath(self._directory))
+
+    def close(self) -> None:
+        """Release any resources held"""
+
+    def subdirectory(self, name: str) -> "SessionFiles":
+        """Files within a subdirectory of the session"""
+        return SessionFiles(self._path(name))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, *name.split("/"))
+
+    def exists(self, name: str) -> bool:
+        """Whether a file or subdirectory exists"""
+        return os.path.exists(self._path(name))
+
+    def glob(self, pattern: str) -> typing.List[str]:
+        """Names of the files matching a pattern"""
+        return sorted(
+            os.path.relpath(f, self._directory).replace(os.sep, "/")
+            for f in glob.glob(self._path(pattern))
+        )
+
+    def open(self, name: str) -> typing.BinaryIO:
+        """Open a file for binary reading"""
+        return open(self._path(name), "rb")
+
+    def read_text(self, name: str) -> str:
+        """Read the contents of a text file"""
+        with self.open(name) as in_f:
+            return in_f.read().decode()
+
+    def hdf_store(self, name: str) -> pd.HDFStore:
+        """Open a HDF5 file as a read-only pandas store"""
+        return pd.HDFStore(self._path(name), mode="r")
+
+    def hdf5(self, name: str) -> tables.File:
+        """Open a HDF5 file for reading with PyTables"""
+        return tables.open_file(self._path(name), mode="r")
+
+    def local_path(self, name: str) -> str:
+        """Path on disk of a file or subdirectory, extracting archive members"""
+        return self._path(name)
+
+
+class SessionArchive(SessionFiles):
+    """Access to the members of a session archive"""
+
+    def __init__(self, archive_file: str) -> None:
+        """
+        Parameters
+        ----------
+        archive_file : str
+            session archive
+
+        Raises
+        ------
+        FileNotFoundError
+            if the file is not a session archive
+        """
+        if not is_archive(archive_file):
+            raise FileNotFoundError(f"No session archive found at '{archive_file}'")
+        self._directory = archive_file
+        self._prefix = ""
+        # Subdirectory views share the open archive and extracted members
+        # of the archive they were created from
+        self._root = self
+        self._zip = zipfile.ZipFile(archive_file, mode="r")
+        self._names = self._zip.namelist()
+
+        # Directories are implied by the paths of the members within them
+        self._entries = set(self._names) | {
+            n.rsplit("/", i)[0] for n in self._names for i in range(1, n.count("/") + 1)
+        }
+        self._extracted: typing.Optional[tempfile.TemporaryDirectory] = None
+        self._images: typing.Dict[str, bytes] = {}
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self._directory).removesuffix(ARCHIVE_EXTENSION)
+
+    @property
+    def manifest(self) -> typing.Dict[str, typing.Any]:
+        """Manifest recorded when the archive was written"""
+        if MANIFEST_FILE not in self._root._names:
+            return {}
+        return json.loads(self._root._zip.read(MANIFEST_FILE))
+
+    def close(self) -> None:
+        """Close the archive, removing any extracted members
+
+        Closing a subdirectory view has no effect, the archive remaining
+        open until the archive the view was created from is closed.
+        """
+        if self._root is not self:
+            return
+        self._zip.close()
+        self._images.clear()
+        if self._extracted is not None:
+            self._extracted.cleanup()
+            self._extracted = None
+
+    def subdirectory(self, name: str) -> "SessionArchive":
+        _archive = SessionArchive.__new__(SessionArchive)
+        _archive._directory = self._directory
+        _archive._prefix = f"{self._prefix}{name.strip('/')}/"
+        _archive._root = self._root
+        return _archive
+
+    def member_path(self, name: str) -> str:
+        """Path of a member or subdirectory relative to the archive root"""
+        return f"{self._prefix}{name.strip('/')}"
+
+    def _member(self, name: str) -> str:
+        _name = self.member_path(name)
+        if _name not in self._root._names:
+            raise FileNotFoundError(
+                f"No member '{_name}' within session archive '{self._directory}'"
+            )
+        return _name
+
+    def exists(self, name: str) -> bool:
+        return self.member_path(name) in self._root._entries
+
+    def glob(self, pattern: str) -> typing.List[str]:
+        _pattern = f"{self._prefix}{pattern}"
+        return sorted(
+            n.removeprefix(self._prefix)
+            for n in fnmatch.filter(self._root._entries, _pattern)
+            if n.count("/") == _pattern.count("/")
+        )
+
+    def open(self, name: str) -> typing.BinaryIO:
+        return typing.cast(typing.BinaryIO, self._root._zip.open(self._member(name)))
+
+    def _core_driver(self, name: str) -> typing.Dict[str, typing.Any]:
+        """Options opening a HDF5 member as an image in memory"""
+        _name = self._member(name)
+
+        # Stores are opened repeatedly, e.g. once per sweep cut, hence each
+        # member is only read from the archive once
+        if _name not in self._root._images:
+            self._root._images[_name] = self._root._zip.read(_name)
+
+        return {
+            "driver": "H5FD_CORE",
+            "driver_core_image": self._root._images[_name],
+            "driver_core_backing_store": 0,
+        }
+
+    def hdf_store(self, name: str) -> pd.HDFStore:
+        return pd.HDFStore(name, mode="r", **self._core_driver(name))
+
+    def hdf5(self, name: str) -> tables.File:
+        return tables.open_file(name, mode="r", **self._core_driver(name))
+
+    def local_path(self, name: str) -> str:
+        _root = self._root
+        if _root._extracted is None:
+            _root._extracted = tempfile.TemporaryDirectory(prefix="pbm_archive_")
+
+        _name = self.member_path(name)
+        _members = [
+            n
+            for n in _root._names
+            if (n == _name or n.startswith(f"{_name}/")) and not n.endswith("/")
+        ]
+
+        for member in _members:
+            if not os.path.exists(os.path.join(_root._extracted.name, member)):
+                _root._zip.extract(member, _root._extracted.name)
+
+        return os.path.join(_root._extracted.name, *_name.split("/"))
+
+
+def is_archive(path: str) -> bool:
+    """Whether a path is a session archive
+
+    Parameters
+    ----------
+    path : str
+        path of a session directory or archive
+
+    Returns
+    -------
+    bool
+        True if the path is a zip archive
+    """
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def open_session(location: str) -> SessionFiles:
+    """Open a session directory or archive
+
+    Parameters
+    ----------
+    location : str
+        session directory or archive
+
+    Returns
+    -------
+    SessionFiles
+        access to the files of the session
+
+    Raises
+    ------
+    FileNotFoundError
+        if the location is neither a directory nor a session archive
+    """
+    if is_archive(location):
+        return SessionArchive(location)
+    if os.path.isdir(location):
+        return SessionFiles(location)
+    raise FileNotFoundError(f"No session directory or archive found at '{location}'")
+
+
+def write_archive(
+    session_directory: str, archive_file: typing.Optional[str] = None
+) -> str:
+    """Write a session directory to a single archive
+
+    Parameters
+    ----------
+    session_directory : str
+        session output directory
+    archive_file : str, optional
+        archive to write, by default the session directory with the
+        extension '.zip'
+
+    Returns
+    -------
+    str
+        path of the archive written
+
+    Raises
+    ------
+    FileNotFoundError
+        if the session directory does not exist
+    """
+    if not os.path.isdir(session_directory):
+        raise FileNotFoundError(
+            f"Cannot archive session, directory '{session_directory}' not found"
+        )
+
+    _directory = os.path.normpath(session_directory)
+    _archive_file = archive_file or f"{_directory}{ARCHIVE_EXTENSION}"
+
+    _members = sorted(
+        os.path.relpath(os.path.join(root, f), _directory)
+        for root, _, files in os.walk(_directory)
+        for f in files
+    )
+
+    _manifest = {
+        "format_version": ARCHIVE_FORMAT_VERSION,
+        "session": os.path.basename(_directory),
+        "pbm_version": power_balance.__version__,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "members": len(_members),
+    }
+
+    # Written alongside the final archive such that an interrupted write
+    # does not leave an incomplete archive in its place
+    _partial_file = f"{_archive_file}.partial"
+
+    with zipfile.ZipFile(_partial_file, mode="w", allowZip64=True) as archive:
+        archive.writestr(
+            MANIFEST_FILE,
+            json.dumps(_manifest, indent=2),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        for member in _members:
+            _name = member.replace(os.sep, "/")
+            _stored = _name.endswith(_STORED_EXTENSIONS) or ".zarr/" in _name
+            archive.write(
+                os.path.join(_directory, member),
+                _name,
+                compress_type=zipfile.ZIP_STORED if _stored else zipfile.ZIP_DEFLATED,
+            )
+
+    shutil.move(_partial_file, _archive_file)
+
+    return _archive_file
@@ -0,0 +1,320 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Input Blob Store
+================
+
+Content-addressed store of the session inputs shared between session
+directories. Each input file is stored once under the SHA-256 hash of its
+contents and added to a session directory as a hard link to the stored blob,
+falling back to a reflink and then to a copy where the session directory
+lies on another file system. By default the store lies within the output
+directory alongside the sessions, such that the inputs are linked rather
+than copied. The inputs of each session are recorded by
+hash within 'inputs.json' in the session directory, such that the disk use
+and write time of a campaign scale with the number of unique inputs rather
+than with the number of runs.
+
+Blobs are made read-only when stored, as a session input hard linked to a
+blob shares its inode, and hence its contents, with every other session
+using it.
+
+Contents
+========
+
+Classes
+-------
+
+    BlobStore - content-addressed store of session input files
+
+Functions
+---------
+
+    default_blob_store - location of the blob store used by default
+    file_digest - SHA-256 hash of the contents of a file
+    write_inputs - record the hashes of the inputs of a session
+    read_inputs - read the hashes of the inputs of a session
+
+"""
+
+__date__ = "2026-10-19"
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import typing
+
+# Environment variable overriding the default blob store location
+BLOB_STORE_ENV = "PBM_BLOB_STORE"
+
+INPUTS_FILE = "inputs.json"
+
+# Name of the blob store created within an output directory
+BLOB_STORE_DIR = ".pbm_blobs"
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Linux ioctl cloning the extents of one file into another
+_FICLONE = 0x40049409
+
+
+def default_blob_store(output_directory: typing.Optional[str] = None) -> str:
+    """Location of the blob store used by default
+
+    Parameters
+    ----------
+    output_directory : str, optional
+        directory containing the session directories, by default the
+        current working directory
+
+    Returns
+    -------
+    str
+        value of the 'PBM_BLOB_STORE' environment variable if set, else
+        '.pbm_blobs' within the output directory
+    """
+    return os.environ.get(BLOB_STORE_ENV) or os.path.join(
+        output_directory or os.getcwd(), BLOB_STORE_DIR
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_digest(file_name: str, size: int, modified: int, inode: int) -> str:
+    _hash = hashlib.sha256()
+    with open(file_name, "rb") as in_f:
+        while _block := in_f.read(_HASH_BLOCK_SIZE):
+            _hash.update(_block)
+    return _hash.hexdigest()
+
+
+def file_digest(file_name: str) -> str:
+    """SHA-256 hash of the contents of a file
+
+    Hashes are cached against the size, modification time and inode of the
+    file such that unchanged inputs are only read once per process.
+
+    Parameters
+    ----------
+    file_name : str
+        file to hash
+
+    Returns
+    -------
+    str
+        hexadecimal digest of the file contents
+    """
+    _stat = os.stat(file_name)
+    return _cached_digest(
+        os.path.realpath(file_name), _stat.st_size, _stat.st_mtime_ns, _stat.st_ino
+    )
+
+
+def _reflink(source: str, destination: str) -> bool:
+    """Clone a file sharing its extents on copy-on-write file systems"""
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    with open(source, "rb") as in_f, open(destination, "wb") as out_f:
+        try:
+            fcntl.ioctl(out_f.fileno(), _FICLONE, in_f.fileno())
+        except OSError:
+            out_f.close()
+            os.remove(destination)
+            return False
+    return True
+
+
+class BlobStore:
+    """Content-addressed store of session input files"""
+
+    def __init__(self, directory: typing.Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        directory : str, optional
+            root directory of the store, by default the default blob store
+        """
+        self._directory = directory or default_blob_store()
+        self._logger = logging.getLogger("PowerBalance.Blobs")
+        self._copied = False
+        os.makedirs(self._directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self._directory}')"
+
+    @property
+    def directory(self) -> str:
+        """Root directory of the store"""
+        return self._directory
+
+    def path(self, digest: str) -> str:
+        """Location of the blob with the given hash"""
+        return os.path.join(self._directory, digest[:2], digest[2:])
+
+    def __contains__(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put(self, file_name: str) -> str:
+        """Add the contents of a file to the store
+
+        Parameters
+        ----------
+        file_name : str
+            file to store
+
+        Returns
+        -------
+        str
+            hash of the file contents
+        """
+        _digest = file_digest(file_name)
+        _blob = self.path(_digest)
+
+        if os.path.exists(_blob):
+            return _digest
+
+        os.makedirs(os.path.dirname(_blob), exist_ok=True)
+
+        # Written alongside the blob then moved into place such that
+        # concurrent sessions never see a partially written blob
+        _handle, _partial = tempfile.mkstemp(
+            dir=os.path.dirname(_blob), suffix=".partial"
+        )
+        os.close(_handle)
+
+        try:
+            shutil.copyfile(file_name, _partial)
+            os.chmod(_partial, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(_partial, _blob)
+        finally:
+            if os.path.exists(_partial):
+                os.remove(_partial)
+
+        return _digest
+
+    def link(self, digest: str, destination: str) -> None:
+        """Add a stored blob to a session directory
+
+        The blob is hard linked to the destination, else cloned where the
+        file system supports reflinks, else copied.
+
+        Parameters
+        ----------
+        digest : str
+            hash of the blob
+        destination : str
+            path of the file to create
+
+        Raises
+        ------
+        FileNotFoundError
+            if no blob with the given hash is stored
+        """
+        _blob = self.path(digest)
+
+        if not os.path.exists(_blob):
+            raise FileNotFoundError(
+                f"No blob '{digest}' within blob store '{self._directory}'"
+            )
+
+        if os.path.lexists(destination):
+            os.remove(destination)
+
+        try:
+            os.link(_blob, destination)
+            return
+        except OSError:
+            pass
+
+        if _reflink(_blob, destination):
+            return
+
+        # Copies use the disk space of the blob again, warned once per store
+        if not self._copied:
+            self._logger.warning(
+                "Could not link blob store '%s' into '%s', session inputs "
+                "are copied, place the store on the same file system as the "
+                "sessions to share them",
+                self._directory,
+                os.path.dirname(destination),
+            )
+            self._copied = True
+
+        shutil.copyfile(_blob, destination)
+
+    def add(self, file_name: str, destination: str) -> str:
+        """Store a file and add it to a session directory
+
+        Parameters
+        ----------
+        file_name : str
+            file to store
+        destination : str
+            path of the file to create
+
+        Returns
+        -------
+        str
+            hash of the file contents
+        """
+        _digest = self.put(file_name)
+        self.link(_digest, destination)
+        return _digest
+
+
+def write_inputs(
+    session_directory: str, inputs: typing.Dict[str, str], store: BlobStore
+) -> None:
+    """Record the hashes of the inputs of a session
+
+    Inputs already recorded for the session are retained unless replaced.
+
+    Parameters
+    ----------
+    session_directory : str
+        session output directory
+    inputs : typing.Dict[str, str]
+        hash of each input file by its path relative to the session directory
+    store : BlobStore
+        blob store holding the inputs
+    """
+    _inputs = read_inputs(session_directory)
+    _inputs.update(inputs)
+
+    with open(os.path.join(session_directory, INPUTS_FILE), "w") as out_f:
+        json.dump(
+            {"blob_store": store.directory, "files": dict(sorted(_inputs.items()))},
+            out_f,
+            indent=2,
+        )
+
+
+def read_inputs(session_directory: str) -> typing.Dict[str, str]:
+    """Read the hashes of the inputs of a session
+
+    Parameters
+    ----------
+    session_directory : str
+        session output directory
+
+    Returns
+    -------
+    typing.Dict[str, str]
+        hash of each input file by its path relative to the session
+        directory, empty if no inputs are recorded
+    """
+    _inputs_file = os.path.join(session_directory, INPUTS_FILE)
+
+    if not os.path.exists(_inputs_file):
+        return {}
+
+    with open(_inputs_file) as in_f:
+        return json.load(in_f)["files"]
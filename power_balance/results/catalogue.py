@@ -0,0 +1,593 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Session Catalogue
+=================
+
+A SQLite database indexing the session output directories of many runs.
+Each session is recorded with its configuration hash, parameter values,
+software versions, phase timings and flat-top summary metrics such that
+sessions can be found by filtering on these without reading any of the
+session HDF5 files.
+
+Filters take the form '<name> <operator> <value>' where the operator is one
+of '==', '!=', '<', '<=', '>' or '>=', and the name either a session field,
+a parameter such as 'tokamak.interdependencies.thermalpower' or
+'plasma_flat_top_end', or a summary metric such as
+'average.netpowergeneration' or 'efficiency.thermal_to_electric'.
+
+Contents
+========
+
+Classes
+-------
+
+    Catalogue - SQLite catalogue of session directories
+
+Functions
+---------
+
+    default_catalogue_file - location of the catalogue used by default
+    parse_filter - split a filter into its name, operator and value
+    metric_name - name of a summary metric within the catalogue
+
+"""
+
+__date__ = "2026-10-19"
+
+import datetime
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import typing
+
+import pandas as pd
+import toml
+
+import power_balance.calc.summary as pbm_summary
+import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation as pbm_instr
+import power_balance.parameters as pbm_params
+import power_balance.results.storage as pbm_storage
+
+# Environment variable overriding the default catalogue location
+CATALOGUE_ENV = "PBM_CATALOGUE"
+
+SESSION_GLOB = "pbm_results_*"
+
+SESSION_FIELDS: typing.List[str] = [
+    "path",
+    "time",
+    "config_hash",
+    "pbm_version",
+    "om_version",
+    "models",
+    "elapsed",
+    "indexed",
+]
+
+OPERATORS: typing.Tuple[str, ...] = ("==", "!=", "<=", ">=", "<", ">")
+
+_FILTER_REGEX = re.compile(r"^\s*(.+?)\s*(==|!=|<=|>=|<|>)\s*(.+?)\s*$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    time TEXT,
+    config_hash TEXT,
+    pbm_version TEXT,
+    om_version TEXT,
+    models TEXT,
+    elapsed REAL,
+    indexed TEXT
+);
+CREATE TABLE IF NOT EXISTS parameters (
+    session_id INTEGER NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    value TEXT,
+    number REAL
+);
+CREATE TABLE IF NOT EXISTS cuts (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL,
+    cut TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    cut_id INTEGER NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    value REAL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    session_id INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    calls INTEGER,
+    total REAL
+);
+CREATE INDEX IF NOT EXISTS parameters_session ON parameters (session_id);
+CREATE INDEX IF NOT EXISTS parameters_name ON parameters (name, number);
+CREATE INDEX IF NOT EXISTS cuts_session ON cuts (session_id);
+CREATE INDEX IF NOT EXISTS metrics_cut ON metrics (cut_id);
+CREATE INDEX IF NOT EXISTS metrics_name ON metrics (name, value);
+CREATE INDEX IF NOT EXISTS timings_session ON timings (session_id);
+"""
+
+
+def default_catalogue_file() -> str:
+    """Location of the catalogue used by default
+
+    Returns
+    -------
+    str
+        value of the 'PBM_CATALOGUE' environment variable if set, else
+        '~/.powerbalance/catalogue.db'
+    """
+    return os.environ.get(CATALOGUE_ENV) or os.path.join(
+        os.path.expanduser("~"), ".powerbalance", "catalogue.db"
+    )
+
+
+def parse_filter(filter_str: str) -> typing.Tuple[str, str, typing.Any]:
+    """Split a filter of the form '<name> <operator> <value>'
+
+    Parameters
+    ----------
+    filter_str : str
+        filter to parse
+
+    Returns
+    -------
+    typing.Tuple[str, str, Any]
+        name, operator and value, the value being a float if numeric, 1 or 0
+        for 'true' or 'false', else a string
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the filter cannot be parsed
+    """
+    if not (_match := _FILTER_REGEX.match(filter_str)):
+        raise pbm_exc.InvalidInputError(
+            f"Invalid filter '{filter_str}', expected the form "
+            f"'<name> <operator> <value>' with operator one of {', '.join(OPERATORS)}"
+        )
+
+    _name, _operator, _value = _match.groups()
+
+    return _name, _operator, _number(_value.strip("'\""))
+
+
+def metric_name(category: str, quantity: str) -> str:
+    """Name of a summary metric within the catalogue
+
+    Parameters
+    ----------
+    category : str
+        summary category, either 'average' or 'efficiency'
+    quantity : str
+        summary quantity label
+
+    Returns
+    -------
+    str
+        '<category>.<variable>' for averages of model outputs, else
+        '<category>.<quantity>' with the label in snake case
+    """
+    if quantity in pbm_summary.STEADY_STATE_VARIABLES:
+        return f"{category}.{pbm_summary.STEADY_STATE_VARIABLES[quantity]}"
+    if quantity == pbm_summary.PLASMA_THERMAL_LABEL:
+        return f"{category}.plasmathermalpower"
+    return f"{category}.{re.sub(r'[^a-z0-9]+', '_', quantity.lower()).strip('_')}"
+
+
+def _number(value: typing.Any) -> typing.Any:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        if value.lower() in ("true", "false"):
+            return float(value.lower() == "true")
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return None
+
+
+def _session_time(
+    session_directory: str, time: typing.Optional[str]
+) -> typing.Optional[str]:
+    # Times are stored in ISO format such that they are ordered when compared
+    for value, time_format in (
+        (time, "%d/%m/%Y %H:%M:%S"),
+        (
+            os.path.basename(session_directory).replace("pbm_results_", ""),
+            "%Y_%m_%d_%H_%M_%S",
+        ),
+    ):
+        try:
+            return datetime.datetime.strptime(value or "", time_format).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _text(value: typing.Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+class Catalogue:
+    """SQLite catalogue of session output directories"""
+
+    def __init__(self, file_name: typing.Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        file_name : str, optional
+            SQLite database file, created if absent, by default that given
+            by 'default_catalogue_file'
+        """
+        self._logger = logging.getLogger("PowerBalance.Catalogue")
+        self.file_name = file_name or default_catalogue_file()
+
+        if os.path.dirname(self.file_name):
+            os.makedirs(os.path.dirname(self.file_name), exist_ok=True)
+
+        self._connection = sqlite3.connect(self.file_name)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Catalogue":
+        return self
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the database"""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def index_session(self, session_directory: str) -> int:
+        """Add a session directory to the catalogue, replacing any existing
+        entry for the same directory
+
+        Parameters
+        ----------
+        session_directory : str
+            session output directory
+
+        Returns
+        -------
+        int
+            identifier of the session within the catalogue
+
+        Raises
+        ------
+        FileNotFoundError
+            if the directory does not contain a saved session configuration
+        """
+        _path = os.path.abspath(session_directory)
+        _config_file = os.path.join(_path, "configs", "configuration.toml")
+
+        if not os.path.exists(_config_file):
+            raise FileNotFoundError(
+                f"No session configuration found in '{session_directory}'"
+            )
+
+        _configuration = toml.load(_config_file)
+        _hdf5_file = os.path.join(_path, "data", pbm_storage.SESSION_DATA_FILE)
+        _metadata, _summary, _timings = self._read_session_data(_hdf5_file)
+        _metadata |= {
+            k: v
+            for k, v in pbm_storage.read_metadata(os.path.join(_path, "data")).items()
+            if k in ("pbm_version", "om_version", "time")
+        }
+
+        _session = {
+            "path": _path,
+            "time": _session_time(_path, _metadata.get("time")),
+            "config_hash": hashlib.sha256(
+                json.dumps(_configuration, sort_keys=True, default=str).encode()
+            ).hexdigest(),
+            "pbm_version": _metadata.get("pbm_version"),
+            "om_version": _metadata.get("om_version"),
+            "models": json.dumps(_configuration.get("models", [])),
+            "elapsed": _metadata.get("elapsed"),
+            "indexed": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+
+        _parameters = self._read_parameters(_path, _configuration)
+
+        with self._connection:
+            self._remove(_path)
+            _id = self._connection.execute(
+                f"INSERT INTO sessions ({', '.join(_session)}) "
+                f"VALUES ({', '.join('?' * len(_session))})",
+                list(_session.values()),
+            ).lastrowid
+
+            self._connection.executemany(
+                "INSERT INTO parameters VALUES (?, ?, ?, ?)",
+                [
+                    (_id, name, _text(value), _number(value))
+                    for name, value in _parameters.items()
+                ],
+            )
+
+            self._connection.executemany(
+                "INSERT INTO timings VALUES (?, ?, ?, ?)",
+                [(_id, *row) for row in _timings.itertuples(index=False)],
+            )
+
+            self._insert_summary(_id, _summary)
+
+        self._logger.debug("Indexed session '%s'", _path)
+
+        return _id  # type: ignore
+
+    def _remove(self, path: str) -> None:
+        if not (
+            _row := self._connection.execute(
+                "SELECT id FROM sessions WHERE path = ?", (path,)
+            ).fetchone()
+        ):
+            return
+        _id = _row[0]
+        self._connection.execute(
+            "DELETE FROM metrics WHERE cut_id IN "
+            "(SELECT id FROM cuts WHERE session_id = ?)",
+            (_id,),
+        )
+        for table in ("cuts", "parameters", "timings"):
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE session_id = ?", (_id,)
+            )
+        self._connection.execute("DELETE FROM sessions WHERE id = ?", (_id,))
+
+    def _insert_summary(self, session_id: int, summary: pd.DataFrame) -> None:
+        if summary.empty:
+            return
+
+        _cut_columns = [
+            c for c in summary.columns if c not in ("category", "quantity", "value")
+        ]
+
+        # Each sweep cut of the summary is recorded with its sweep values
+        for cut, table in (
+            summary.groupby(_cut_columns, sort=False, dropna=False)
+            if _cut_columns
+            else [((), summary)]
+        ):
+            _cut = dict(zip(_cut_columns, cut if isinstance(cut, tuple) else (cut,)))
+            _cut_id = self._connection.execute(
+                "INSERT INTO cuts (session_id, cut) VALUES (?, ?)",
+                (session_id, json.dumps(_cut, default=str)),
+            ).lastrowid
+            self._connection.executemany(
+                "INSERT INTO metrics VALUES (?, ?, ?)",
+                [
+                    (_cut_id, metric_name(row.category, row.quantity), float(row.value))
+                    for row in table.itertuples(index=False)
+                ],
+            )
+
+    @staticmethod
+    def _read_session_data(
+        hdf5_file: str,
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], pd.DataFrame, pd.DataFrame]:
+        _metadata: typing.Dict[str, typing.Any] = {}
+        _summary = pd.DataFrame(columns=["category", "quantity", "value"])
+        _timings = pd.DataFrame(columns=["phase", "calls", "total"])
+
+        if not os.path.exists(hdf5_file):
+            return _metadata, _summary, _timings
+
+        with pd.HDFStore(hdf5_file, mode="r") as hdf_store:
+            _keys = [key.strip("/") for key in hdf_store.keys()]
+
+            # Version metadata of sessions written before the metadata file
+            # was added is attached to the datasets of each model
+            for key in _keys:
+                _attrs = hdf_store.get_storer(key).attrs
+                if "pbm_version" in _attrs:
+                    _metadata |= {
+                        k: getattr(_attrs, k)
+                        for k in ("pbm_version", "om_version", "time")
+                        if k in _attrs
+                    }
+                    break
+
+            if pbm_summary.SUMMARY_KEY in _keys:
+                _summary = hdf_store.get(pbm_summary.SUMMARY_KEY)
+
+            if pbm_instr.TIMINGS_KEY in _keys:
+                _timings = (
+                    hdf_store.get(pbm_instr.TIMINGS_KEY)
+                    .groupby("phase", sort=False)["duration"]
+                    .agg(calls="count", total="sum")
+                    .reset_index()
+                )
+                _attrs = hdf_store.get_storer(pbm_instr.TIMINGS_KEY).attrs
+                if "elapsed" in _attrs:
+                    _metadata["elapsed"] = float(_attrs.elapsed)
+
+        return _metadata, _summary, _timings
+
+    @staticmethod
+    def _read_parameters(
+        session_directory: str, configuration: typing.Mapping[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        _parameter_directory = os.path.join(session_directory, "parameters")
+
+        if not os.path.isdir(_parameter_directory):
+            return {}
+
+        _parameter_set = pbm_params.PBMParameterSet(
+            parameters_directory=_parameter_directory,
+            simulation_options_file=configuration.get(
+                "simulation_options_file", "simulation_options.toml"
+            ),
+            plasma_scenario_file=configuration.get(
+                "plasma_scenario_file", "plasma_scenario.toml"
+            ),
+            structural_params_file=configuration.get("structural_params_file", ""),
+        )
+
+        _parameters = dict(_parameter_set.items())
+        _parameters |= _parameter_set.get_plasma_scenario()
+
+        for model, values in _parameter_set.get_structural_parameters().items():
+            _parameters |= {f"{model}.{k}": v for k, v in values.items()}
+
+        return _parameters
+
+    def index_directory(
+        self, directory: str, recursive: bool = True
+    ) -> typing.List[str]:
+        """Add all session directories within a directory to the catalogue
+
+        Parameters
+        ----------
+        directory : str
+            directory to search for 'pbm_results_*' session directories
+        recursive : bool, optional
+            search subdirectories, by default True
+
+        Returns
+        -------
+        typing.List[str]
+            session directories added
+        """
+        _pattern = (
+            os.path.join(directory, "**", SESSION_GLOB)
+            if recursive
+            else os.path.join(directory, SESSION_GLOB)
+        )
+
+        _indexed: typing.List[str] = []
+
+        for session_directory in sorted(glob.glob(_pattern, recursive=recursive)):
+            if not os.path.isdir(session_directory):
+                continue
+            try:
+                self.index_session(session_directory)
+            except (FileNotFoundError, toml.TomlDecodeError, OSError) as e:
+                self._logger.warning("Skipping session '%s': %s", session_directory, e)
+                continue
+            _indexed.append(session_directory)
+
+        return _indexed
+
+    def query(
+        self,
+        filters: typing.Sequence[str] = (),
+        metrics: typing.Optional[typing.Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Find the sessions matching all the given filters
+
+        Filters on summary metrics are applied to each sweep cut, the
+        remaining filters to the session as a whole.
+
+        Parameters
+        ----------
+        filters : typing.Sequence[str], optional
+            filters of the form '<name> <operator> <value>'
+        metrics : typing.Sequence[str], optional
+            summary metrics to include, by default all
+
+        Returns
+        -------
+        pd.DataFrame
+            a row per matching session and sweep cut containing the session
+            fields, the sweep cut and the summary metrics
+        """
+        _conditions: typing.List[str] = []
+        _values: typing.List[typing.Any] = []
+
+        _metric_names = {
+            row[0].lower()
+            for row in self._connection.execute("SELECT DISTINCT name FROM metrics")
+        }
+
+        for filter_str in filters:
+            _name, _operator, _value = parse_filter(filter_str)
+            _operator = "=" if _operator == "==" else _operator
+
+            if _name in SESSION_FIELDS:
+                _conditions.append(f"s.{_name} {_operator} ?")
+                _values.append(_value)
+            elif _name.lower() in _metric_names:
+                _conditions.append(
+                    "EXISTS (SELECT 1 FROM metrics m WHERE m.cut_id = c.id "
+                    f"AND m.name = ? AND m.value {_operator} ?)"
+                )
+                _values += [_name, _value]
+            else:
+                _column = "number" if isinstance(_value, float) else "value"
+                _conditions.append(
+                    "EXISTS (SELECT 1 FROM parameters p WHERE p.session_id = s.id "
+                    f"AND p.name = ? AND p.{_column} {_operator} ?)"
+                )
+                _values += [_name, _value]
+
+        _sessions = pd.read_sql_query(
+            f"SELECT c.id AS cut_id, {', '.join(f's.{f}' for f in SESSION_FIELDS)}, "
+            "c.cut FROM sessions s LEFT JOIN cuts c ON c.session_id = s.id"
+            + (f" WHERE {' AND '.join(_conditions)}" if _conditions else "")
+            + " ORDER BY s.time, c.id",
+            self._connection,
+            params=_values,
+        )
+
+        if _sessions.empty:
+            return _sessions.drop(columns="cut_id")
+
+        _cut_ids = [int(i) for i in _sessions["cut_id"].dropna()]
+
+        _metrics = pd.read_sql_query(
+            "SELECT cut_id, name, value FROM metrics WHERE cut_id IN "
+            f"({', '.join('?' * len(_cut_ids))})",
+            self._connection,
+            params=_cut_ids,
+        )
+
+        if metrics is not None:
+            _selected = {m.lower() for m in metrics}
+            _metrics = _metrics[_metrics["name"].str.lower().isin(_selected)]
+
+        _table = _metrics.pivot(index="cut_id", columns="name", values="value")
+
+        return (
+            _sessions.merge(_table, left_on="cut_id", right_index=True, how="left")
+            .drop(columns="cut_id")
+            .reset_index(drop=True)
+        )
+
+    def parameters(self, path: str) -> typing.Dict[str, typing.Any]:
+        """Retrieve the parameter values recorded for a session
+
+        Parameters
+        ----------
+        path : str
+            session output directory
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            parameter values by name
+        """
+        return {
+            name: number if number is not None else value
+            for name, value, number in self._connection.execute(
+                "SELECT p.name, p.value, p.number FROM parameters p "
+                "JOIN sessions s ON s.id = p.session_id WHERE s.path = ?",
+                (os.path.abspath(path),),
+            )
+        }
@@ -0,0 +1,401 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Dense Sweep Results
+===================
+
+Array backed storage of parameter sweep results. Rather than a single long
+dataframe in which every sweep parameter value is repeated for each time
+point, results are held as a three dimensional array indexed by
+combination, time and variable alongside a small table of the parameter
+values for each combination and a single shared time axis.
+
+Selecting the results for a given sweep cut is then a lookup of the
+combination index followed by a slice of the array.
+
+Contents
+========
+
+Classes
+-------
+
+    DenseSweepResults - sweep results as a combination × time × variable array
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import pandas as pd
+import tables
+
+import power_balance.exceptions as pbm_exc
+
+SWEEP_DATA_FILE = "sweep_data.h5"
+
+# Upper limit on the number of array elements within a single HDF5 chunk
+_MAX_CHUNK_ELEMENTS = 2**20
+
+
+class DenseSweepResults:
+    """Parameter sweep results held as a combination × time × variable array"""
+
+    def __init__(
+        self,
+        parameters: typing.Sequence[str],
+        variables: typing.Sequence[str],
+        time: np.ndarray,
+        combinations: np.ndarray,
+        data: np.ndarray,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        parameters : typing.Sequence[str]
+            names of the swept parameters
+        variables : typing.Sequence[str]
+            names of the output variables
+        time : np.ndarray
+            time axis shared by all combinations
+        combinations : np.ndarray
+            parameter values for each combination with shape
+            (n_combinations, n_parameters)
+        data : np.ndarray
+            results with shape (n_combinations, n_time, n_variables)
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the array dimensions are inconsistent
+        """
+        self._parameters = list(parameters)
+        self._variables = list(variables)
+        self._time = np.asarray(time, dtype=float)
+        self._data = np.asarray(data, dtype=float)
+        self._combinations = np.asarray(combinations, dtype=float).reshape(
+            len(self._data), len(self._parameters)
+        )
+
+        _expected = (
+            self._combinations.shape[0],
+            self._time.shape[0],
+            len(self._variables),
+        )
+
+        if self._data.shape != _expected:
+            raise pbm_exc.InvalidInputError(
+                f"Expected sweep data array of shape {_expected}, "
+                f"but got {self._data.shape}"
+            )
+
+        self._lookup: typing.Dict[typing.Tuple[float, ...], int] = {
+            tuple(row): i for i, row in enumerate(self._combinations.tolist())
+        }
+
+    @classmethod
+    def from_cuts(
+        cls,
+        cuts: typing.Iterable[
+            typing.Tuple[typing.Mapping[str, typing.Any], pd.DataFrame]
+        ],
+    ) -> "DenseSweepResults":
+        """Assemble results from the output of each sweep combination
+
+        Parameters
+        ----------
+        cuts : typing.Iterable[typing.Tuple[typing.Mapping[str, Any], pd.DataFrame]]
+            pairs of parameter values and the dataframe of outputs for
+            the corresponding run, any parameter columns in the dataframe
+            are ignored
+
+        Returns
+        -------
+        DenseSweepResults
+            dense representation of the sweep results
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if no cuts are given or the runs do not share a common time axis
+        """
+        _combinations: typing.List[typing.List[float]] = []
+        _arrays: typing.List[np.ndarray] = []
+        _parameters: typing.List[str] = []
+        _variables: typing.List[str] = []
+        _time: np.ndarray = np.array([])
+
+        for i, (cut, dataframe) in enumerate(cuts):
+            if i == 0:
+                _parameters = [k.lower() for k in cut]
+                _variables = [
+                    c for c in dataframe.columns if c != "time" and c not in _parameters
+                ]
+                _time = dataframe["time"].to_numpy(dtype=float)
+            elif not np.array_equal(dataframe["time"].to_numpy(dtype=float), _time):
+                raise pbm_exc.InvalidInputError(
+                    "Cannot store sweep results in dense form, combination "
+                    f"{dict(cut)} does not share the time axis of previous runs"
+                )
+            _combinations.append([float(v) for v in cut.values()])
+            _arrays.append(dataframe[_variables].to_numpy(dtype=float))
+
+        if not _arrays:
+            raise pbm_exc.InvalidInputError(
+                "Cannot create dense sweep results, no sweep cuts provided"
+            )
+
+        return cls(
+            _parameters, _variables, _time, np.array(_combinations), np.stack(_arrays)
+        )
+
+    @classmethod
+    def from_frame(
+        cls, dataframe: pd.DataFrame, parameters: typing.Sequence[str]
+    ) -> "DenseSweepResults":
+        """Convert a long form sweep dataframe into dense form
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            sweep results with a column for each swept parameter
+        parameters : typing.Sequence[str]
+            names of the parameter columns
+
+        Returns
+        -------
+        DenseSweepResults
+            dense representation of the sweep results
+        """
+        _parameters = [p.lower() for p in parameters]
+        _groups = dataframe.groupby(_parameters, sort=False).indices
+
+        return cls.from_cuts(
+            (
+                dict(zip(_parameters, key if isinstance(key, tuple) else (key,))),
+                dataframe.iloc[indices],
+            )
+            for key, indices in _groups.items()
+        )
+
+    @property
+    def parameters(self) -> typing.List[str]:
+        """Names of the swept parameters"""
+        return self._parameters
+
+    @property
+    def variables(self) -> typing.List[str]:
+        """Names of the output variables"""
+        return self._variables
+
+    @property
+    def time(self) -> np.ndarray:
+        """Time axis shared by all combinations"""
+        return self._time
+
+    @property
+    def data(self) -> np.ndarray:
+        """Results array of shape (n_combinations, n_time, n_variables)"""
+        return self._data
+
+    @property
+    def combinations(self) -> pd.DataFrame:
+        """Table of parameter values for each combination"""
+        return pd.DataFrame(self._combinations, columns=self._parameters)
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def index(self, cut: typing.Mapping[str, typing.Any]) -> int:
+        """Retrieve the combination index for the given parameter values
+
+        Parameters
+        ----------
+        cut : typing.Mapping[str, Any]
+            value for each of the swept parameters
+
+        Returns
+        -------
+        int
+            index of the combination
+
+        Raises
+        ------
+        KeyError
+            if the combination is not present within the results
+        """
+        _cut = {k.lower(): v for k, v in cut.items()}
+
+        try:
+            return self._lookup[tuple(float(_cut[p]) for p in self._parameters)]
+        except KeyError as e:
+            raise KeyError(f"No sweep combination matching {dict(cut)}") from e
+
+    def cut(
+        self, cut: typing.Union[int, typing.Mapping[str, typing.Any]]
+    ) -> pd.DataFrame:
+        """Retrieve the results for a single sweep combination
+
+        Parameters
+        ----------
+        cut : int | typing.Mapping[str, Any]
+            combination index or value for each of the swept parameters
+
+        Returns
+        -------
+        pd.DataFrame
+            dataframe containing the time and output variables
+        """
+        _index = cut if isinstance(cut, (int, np.integer)) else self.index(cut)
+        _dataframe = pd.DataFrame(self._data[_index], columns=self._variables)
+        _dataframe.insert(0, "time", self._time)
+        return _dataframe
+
+    def variable(self, name: str) -> np.ndarray:
+        """Retrieve a single variable across all combinations
+
+        Parameters
+        ----------
+        name : str
+            output variable name
+
+        Returns
+        -------
+        np.ndarray
+            view of shape (n_combinations, n_time)
+        """
+        return self._data[:, :, self._variables.index(name)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Convert to the long form dataframe layout
+
+        Returns
+        -------
+        pd.DataFrame
+            dataframe with a row for every time point of every combination
+            and a column for each variable and swept parameter
+        """
+        _n_comb, _n_time, _n_var = self._data.shape
+        _dataframe = pd.DataFrame(
+            self._data.reshape(_n_comb * _n_time, _n_var), columns=self._variables
+        )
+        _dataframe.insert(0, "time", np.tile(self._time, _n_comb))
+        for i, parameter in enumerate(self._parameters):
+            _dataframe[parameter] = np.repeat(self._combinations[:, i], _n_time)
+        return _dataframe
+
+    def write_hdf5(
+        self,
+        file_name: str,
+        key: str,
+        attributes: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        complevel: int = 5,
+    ) -> None:
+        """Write the results to a group within a HDF5 file
+
+        The results array is chunked such that each chunk contains a single
+        combination (or part of one for long time series) so that reading a
+        cut only requires decompression of the relevant chunks.
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to write to, created if it does not exist
+        key : str
+            name of the group to create, replacing any existing
+        attributes : typing.Dict[str, Any], optional
+            additional metadata to store as attributes of the group
+        complevel : int, optional
+            compression level, by default 5
+        """
+        _n_time, _n_var = self._data.shape[1:]
+        _chunk_time = max(1, min(_n_time, _MAX_CHUNK_ELEMENTS // max(_n_var, 1)))
+        _filters = tables.Filters(complevel=complevel, complib="blosc", shuffle=True)
+
+        with tables.open_file(file_name, mode="a") as h5_file:
+            if f"/{key}" in h5_file:
+                h5_file.remove_node("/", key, recursive=True)
+
+            _group = h5_file.create_group("/", key)
+            h5_file.create_carray(
+                _group,
+                "data",
+                obj=self._data,
+                chunkshape=(1, _chunk_time, max(_n_var, 1)),
+                filters=_filters,
+            )
+            h5_file.create_array(_group, "time", obj=self._time)
+            h5_file.create_array(_group, "combinations", obj=self._combinations)
+
+            _group._v_attrs.parameters = self._parameters
+            _group._v_attrs.variables = self._variables
+
+            for name, value in (attributes or {}).items():
+                setattr(_group._v_attrs, name, value)
+
+    @classmethod
+    def read_hdf5(cls, file_name: str, key: str) -> "DenseSweepResults":
+        """Read results from a group within a HDF5 file
+
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file to read from
+        key : str
+            name of the group containing the results
+
+        Returns
+        -------
+        DenseSweepResults
+            sweep results
+        """
+        with tables.open_file(file_name, mode="r") as h5_file:
+            _group = h5_file.get_node("/", key)
+            return cls(
+                list(_group._v_attrs.parameters),
+                list(_group._v_attrs.variables),
+                _group.time.read(),
+                _group.combinations.read(),
+                _group.data.read(),
+            )
+
+    def write_npz(self, file_name: str) -> None:
+        """Write the results to a compressed NumPy archive
+
+        Parameters
+        ----------
+        file_name : str
+            output '.npz' file
+        """
+        np.savez_compressed(
+            file_name,
+            data=self._data,
+            time=self._time,
+            combinations=self._combinations,
+            parameters=np.array(self._parameters, dtype=str),
+            variables=np.array(self._variables, dtype=str),
+        )
+
+    @classmethod
+    def read_npz(cls, file_name: str) -> "DenseSweepResults":
+        """Read results from a NumPy archive
+
+        Parameters
+        ----------
+        file_name : str
+            input '.npz' file
+
+        Returns
+        -------
+        DenseSweepResults
+            sweep results
+        """
+        with np.load(file_name) as npz_file:
+            return cls(
+                npz_file["parameters"].tolist(),
+                npz_file["variables"].tolist(),
+                npz_file["time"],
+                npz_file["combinations"],
+                npz_file["data"],
+            )
@@ -0,0 +1,325 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Result Handoff
+==============
+
+Publication of the outputs of each model as memory-mapped files such that
+plugins and other processes read them without copying the data or reading
+the session data files. Where 'pyarrow' is installed the outputs of each
+model are written as an uncompressed Arrow IPC file, the record batches of
+which are memory mapped when read. Otherwise each column is written as a
+NumPy '.npy' array opened as a read-only memory map.
+
+Files are written to '/dev/shm' where available such that the mapped pages
+are held in shared memory, else to the temporary directory. An index of the
+published outputs is written alongside them, allowing another process to
+open the outputs given only the directory.
+
+Contents
+========
+
+Classes
+-------
+
+    ResultHandle - memory-mapped outputs of a model
+
+Functions
+---------
+
+    shared_memory_directory - directory in which outputs are published
+    publish_results - publish the outputs of each model
+    read_handles - open the outputs published within a directory
+
+"""
+
+__date__ = "2026-10-19"
+
+import json
+import os
+import tempfile
+import typing
+
+import numpy as np
+import pandas as pd
+
+import power_balance.exceptions as pbm_exc
+
+HANDOFF_FORMATS: typing.Tuple[str, ...] = ("arrow", "numpy")
+HANDOFF_INDEX_FILE = "handoff.json"
+
+_SHARED_MEMORY_DIR = "/dev/shm"
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _check_format(handoff_format: typing.Optional[str]) -> str:
+    if handoff_format is None:
+        return "arrow" if _has_pyarrow() else "numpy"
+
+    if handoff_format not in HANDOFF_FORMATS:
+        raise pbm_exc.InvalidInputError(
+            f"Result handoff format '{handoff_format}' is not recognised, "
+            f"expected one of: {', '.join(HANDOFF_FORMATS)}"
+        )
+
+    if handoff_format == "arrow" and not _has_pyarrow():
+        raise pbm_exc.InternalError(
+            "Arrow result handoff requires 'pyarrow', install it using "
+            "'pip install power_balance[arrow]'"
+        )
+
+    return handoff_format
+
+
+def shared_memory_directory() -> str:
+    """Directory in which outputs are published
+
+    Returns
+    -------
+    str
+        '/dev/shm' if it exists, else the temporary directory
+    """
+    if os.path.isdir(_SHARED_MEMORY_DIR) and os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        return _SHARED_MEMORY_DIR
+    return tempfile.gettempdir()
+
+
+class ResultHandle:
+    """Memory-mapped outputs of a model
+
+    Arrays and tables returned share the memory-mapped pages of the
+    published file, and remain valid whilst the file exists.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        path: str,
+        handoff_format: str,
+        columns: typing.Sequence[str],
+        rows: int,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        model : str
+            key of the model within the session data
+        path : str
+            published Arrow IPC file, or directory of NumPy arrays
+        handoff_format : str
+            format of the published outputs, 'arrow' or 'numpy'
+        columns : typing.Sequence[str]
+            names of the output columns
+        rows : int
+            number of rows of outputs
+        """
+        self.model = model
+        self.path = path
+        self.format = handoff_format
+        self.columns = list(columns)
+        self.rows = rows
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.model}', '{self.path}')"
+
+    def _column_file(self, column: str) -> str:
+        return os.path.join(self.path, f"{self.columns.index(column)}.npy")
+
+    def table(self) -> typing.Any:
+        """Outputs as an Arrow table of the memory-mapped record batches
+
+        Returns
+        -------
+        pyarrow.Table
+            outputs of the model
+
+        Raises
+        ------
+        power_balance.exceptions.InternalError
+            if 'pyarrow' is not installed
+        """
+        _check_format("arrow")
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        if self.format == "numpy":
+            return pa.table(self.arrays())
+
+        with pa.memory_map(self.path, "r") as source:
+            return pyarrow.ipc.open_file(source).read_all()
+
+    def arrays(
+        self, columns: typing.Optional[typing.Sequence[str]] = None
+    ) -> typing.Dict[str, np.ndarray]:
+        """Outputs as read-only NumPy arrays
+
+        Parameters
+        ----------
+        columns : typing.Sequence[str], optional
+            columns to return, by default all
+
+        Returns
+        -------
+        typing.Dict[str, np.ndarray]
+            array of each column
+        """
+        _columns = list(columns or self.columns)
+
+        if self.format == "numpy":
+            return {c: np.load(self._column_file(c), mmap_mode="r") for c in _columns}
+
+        _table = self.table()
+
+        # Single record batches of numeric columns without nulls are viewed
+        # without copying
+        return {
+            c: _table.column(c).combine_chunks().to_numpy(zero_copy_only=False)
+            for c in _columns
+        }
+
+    def to_frame(
+        self, columns: typing.Optional[typing.Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """Outputs as a data frame, copied from the memory-mapped file
+
+        Parameters
+        ----------
+        columns : typing.Sequence[str], optional
+            columns to return, by default all
+
+        Returns
+        -------
+        pd.DataFrame
+            outputs of the model
+        """
+        return pd.DataFrame(self.arrays(columns))
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Description of the handle for opening it within another process"""
+        return {
+            "model": self.model,
+            "path": self.path,
+            "format": self.format,
+            "columns": self.columns,
+            "rows": self.rows,
+        }
+
+    @classmethod
+    def from_dict(cls, description: typing.Dict[str, typing.Any]) -> "ResultHandle":
+        """Handle given its description"""
+        return cls(
+            description["model"],
+            description["path"],
+            description["format"],
+            description["columns"],
+            description["rows"],
+        )
+
+
+def _write_arrow(path: str, frame: pd.DataFrame) -> None:
+    import pyarrow as pa
+    import pyarrow.ipc
+
+    _batch = pa.RecordBatch.from_pandas(frame, preserve_index=False)
+
+    with pa.OSFile(path, "wb") as sink:
+        with pyarrow.ipc.new_file(sink, _batch.schema) as writer:
+            writer.write_batch(_batch)
+
+
+def _write_numpy(path: str, frame: pd.DataFrame) -> None:
+    os.makedirs(path, exist_ok=True)
+
+    # Files are named by column position as column names are not
+    # necessarily valid file names
+    for i, column in enumerate(frame.columns):
+        np.save(
+            os.path.join(path, f"{i}.npy"),
+            frame[column].to_numpy(),
+            allow_pickle=False,
+        )
+
+
+def publish_results(
+    power_data: typing.Dict[str, pd.DataFrame],
+    directory: str,
+    handoff_format: typing.Optional[str] = None,
+) -> typing.Dict[str, ResultHandle]:
+    """Publish the outputs of each model as memory-mapped files
+
+    Parameters
+    ----------
+    power_data : typing.Dict[str, pd.DataFrame]
+        outputs of each model
+    directory : str
+        directory to publish the outputs to
+    handoff_format : str, optional
+        'arrow' or 'numpy', by default 'arrow' if 'pyarrow' is installed
+
+    Returns
+    -------
+    typing.Dict[str, ResultHandle]
+        handle to the outputs of each model by its key within the session data
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the format is not recognised
+    """
+    _format = _check_format(handoff_format)
+    os.makedirs(directory, exist_ok=True)
+
+    _handles: typing.Dict[str, ResultHandle] = {}
+
+    for name, frame in power_data.items():
+        _key = name.lower().replace(".", "_")
+
+        if _format == "arrow":
+            _path = os.path.join(directory, f"{_key}.arrow")
+            _write_arrow(_path, frame)
+        else:
+            _path = os.path.join(directory, _key)
+            _write_numpy(_path, frame)
+
+        _handles[_key] = ResultHandle(
+            _key, _path, _format, [str(c) for c in frame.columns], len(frame)
+        )
+
+    with open(os.path.join(directory, HANDOFF_INDEX_FILE), "w") as out_f:
+        json.dump([h.to_dict() for h in _handles.values()], out_f, indent=2)
+
+    return _handles
+
+
+def read_handles(directory: str) -> typing.Dict[str, ResultHandle]:
+    """Open the outputs published within a directory
+
+    Parameters
+    ----------
+    directory : str
+        directory the outputs were published to
+
+    Returns
+    -------
+    typing.Dict[str, ResultHandle]
+        handle to the outputs of each model by its key within the session data
+
+    Raises
+    ------
+    FileNotFoundError
+        if no outputs have been published to the directory
+    """
+    _index_file = os.path.join(directory, HANDOFF_INDEX_FILE)
+
+    if not os.path.exists(_index_file):
+        raise FileNotFoundError(f"No published results found in '{directory}'")
+
+    with open(_index_file) as in_f:
+        return {h["model"]: ResultHandle.from_dict(h) for h in json.load(in_f)}
@@ -0,0 +1,194 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Input Manifests
+===============
+
+Hashes of all of the effective inputs of a session: the configuration, the
+parameter values including the simulation options, plasma scenario and
+structural parameters, the input profiles, the Modelica model sources and
+the versions of the software used. The manifest is recorded within the
+session metadata such that a run whose inputs match those of an existing
+session can return that session rather than building and simulating the
+models again.
+
+A session records the hash of the manifest of its effective inputs, which
+include the parameter defaults read from the built models, and, where its
+parameters were not modified after the models were built, the hash of its
+inputs as given. A repeated run of the same configuration therefore matches
+the first hash and a run from the saved inputs of a session the second.
+
+Options which do not affect the session outputs, and the locations of the
+parameter, profile and model directories whose contents are hashed
+separately, are excluded from the configuration hash.
+
+Contents
+========
+
+Functions
+---------
+
+    input_manifest - hashes of the effective inputs of a session
+    manifest_hash - single hash identifying an input manifest
+    find_session - most recent session with the given inputs
+
+"""
+
+__date__ = "2026-10-19"
+
+import glob
+import hashlib
+import json
+import os
+import typing
+
+import power_balance.parameters as pbm_params
+import power_balance.results.archive as pbm_archive
+import power_balance.results.blobs as pbm_blobs
+import power_balance.results.storage as pbm_storage
+
+# Keys of the input manifest and its hashes within the session metadata
+INPUT_MANIFEST_KEY = "inputs"
+INPUT_HASHES_KEY = "input_hashes"
+
+# Configuration options which do not change the session outputs
+_IGNORED_OPTIONS: typing.Tuple[str, ...] = (
+    "modelica_file_directory",
+    "parameters_directory",
+    "profiles_directory",
+    "persistent_compiler",
+    "trace",
+    "solver_statistics",
+    "catalogue",
+    "catalogue_file",
+    "blob_store",
+    "blob_store_directory",
+)
+
+_SESSION_GLOB = "pbm_results_*"
+
+
+def _json_hash(value: typing.Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _file_hashes(
+    directory: str, patterns: typing.Sequence[str]
+) -> typing.Dict[str, str]:
+    _files = {
+        f
+        for pattern in patterns
+        for f in glob.glob(os.path.join(directory, pattern), recursive=True)
+    }
+    return {
+        os.path.relpath(f, directory).replace(os.sep, "/"): pbm_blobs.file_digest(f)
+        for f in sorted(_files)
+        if os.path.isfile(f)
+    }
+
+
+def input_manifest(
+    configuration: typing.Dict[str, typing.Any],
+    parameter_set: pbm_params.PBMParameterSet,
+    versions: typing.Dict[str, str],
+) -> typing.Dict[str, typing.Any]:
+    """Hashes of the effective inputs of a session
+
+    Parameters
+    ----------
+    configuration : typing.Dict[str, typing.Any]
+        validated session configuration
+    parameter_set : pbm_params.PBMParameterSet
+        parameter values of the session
+    versions : typing.Dict[str, str]
+        versions of the software used by the session
+
+    Returns
+    -------
+    typing.Dict[str, typing.Any]
+        hash of the configuration and parameters, hash of each profile and
+        model source file, and the software versions
+    """
+    _configuration = {
+        k: v for k, v in configuration.items() if k not in _IGNORED_OPTIONS
+    }
+    _parameters = {
+        "parameters": dict(parameter_set.items()),
+        "simulation_options": parameter_set.get_simulation_options(),
+        "plasma_scenario": parameter_set.get_plasma_scenario(),
+        "structural_parameters": parameter_set.get_structural_parameters(),
+    }
+
+    return {
+        "configuration": _json_hash(_configuration),
+        "parameters": _json_hash(_parameters),
+        "profiles": _file_hashes(configuration["profiles_directory"], ["*.mat"]),
+        "models": _file_hashes(
+            configuration["modelica_file_directory"], ["*.mo", "Resources/**/*"]
+        ),
+        "versions": dict(versions),
+    }
+
+
+def manifest_hash(manifest: typing.Dict[str, typing.Any]) -> str:
+    """Single hash identifying an input manifest
+
+    Parameters
+    ----------
+    manifest : typing.Dict[str, typing.Any]
+        input manifest of a session
+
+    Returns
+    -------
+    str
+        hexadecimal SHA-256 digest of the manifest
+    """
+    return _json_hash(manifest)
+
+
+def _session_hashes(session: str) -> typing.List[str]:
+    with pbm_archive.open_session(session) as session_files:
+        _metadata = pbm_storage.read_metadata(session_files.subdirectory("data"))
+    return _metadata.get(INPUT_HASHES_KEY, [])
+
+
+def find_session(
+    locations: typing.Sequence[str], input_hash: str
+) -> typing.Optional[str]:
+    """Most recent session with the given inputs
+
+    Only sessions which were written completely record their input hashes,
+    such that interrupted sessions are never matched.
+
+    Parameters
+    ----------
+    locations : typing.Sequence[str]
+        session directories or archives, or directories containing them
+    input_hash : str
+        hash of the input manifest to match
+
+    Returns
+    -------
+    str | None
+        session directory or archive, None if no session matches
+    """
+    for location in locations:
+        if pbm_archive.is_archive(location) or os.path.exists(
+            os.path.join(location, "data", pbm_storage.METADATA_FILE)
+        ):
+            _sessions = [location]
+        else:
+            # Session names are time stamps hence sort in order of creation
+            _sessions = sorted(
+                glob.glob(os.path.join(location, _SESSION_GLOB)), reverse=True
+            )
+
+        for session in _sessions:
+            if not os.path.isdir(session) and not pbm_archive.is_archive(session):
+                continue
+            if input_hash in _session_hashes(session):
+                return session
+
+    return None
@@ -0,0 +1,576 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Session Results
+===============
+
+Lazy reading of the outputs within a session directory or archive. The
+models, variables and sweep parameters of a session are listed from the
+session metadata, with only the requested columns and rows being read
+when selecting results.
+
+Model outputs are read using the storage back-end with which they were
+written, see power_balance.results.storage, HDF5 tables and Parquet files
+selecting rows within the file. Sweeps stored in dense form are read one
+combination at a time, and outputs of older sessions written in fixed
+format are read in full and then filtered.
+
+Selections are given as a mapping of column name to either a value, a
+list of values or a tuple of an operator and a value:
+
+    session.select(
+        "tokamak_interdependencies",
+        columns=["time", "netpowergeneration"],
+        where={"tokamak.interdependencies.thermalpower": (">=", 2e9)},
+    )
+
+Contents
+========
+
+Classes
+-------
+
+    Session - lazy reader of the outputs of a session directory
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import pandas as pd
+import toml
+
+import power_balance.exceptions as pbm_exc
+import power_balance.results.archive as pbm_archive
+import power_balance.results.dense as pbm_dense
+import power_balance.results.storage as pbm_storage
+
+SESSION_DATA_FILE = pbm_storage.SESSION_DATA_FILE
+
+# Attribute of each model table listing its sweep parameter columns
+SWEEP_PARAMETERS_ATTR = pbm_storage.SWEEP_PARAMETERS_ATTR
+
+OPERATORS: typing.Tuple[str, ...] = ("==", "!=", "<", "<=", ">", ">=")
+
+# Parameters of the parameter file containing the simulation options
+_SETUP_KEYS: typing.List[str] = [
+    "startTime",
+    "stopTime",
+    "solver",
+    "stepSize",
+    "tolerance",
+]
+
+Where = typing.Optional[typing.Mapping[str, typing.Any]]
+
+
+def _conditions(
+    where: Where,
+) -> typing.List[typing.Tuple[str, str, typing.Any]]:
+    """Normalise a selection into (column, operator, value) conditions"""
+    _normalised: typing.List[typing.Tuple[str, str, typing.Any]] = []
+
+    for column, condition in (where or {}).items():
+        if isinstance(condition, tuple):
+            if len(condition) != 2 or condition[0] not in OPERATORS:
+                raise pbm_exc.InvalidInputError(
+                    f"Invalid condition {condition} for '{column}', expected "
+                    f"(operator, value) with operator one of {', '.join(OPERATORS)}"
+                )
+            _normalised.append((column.lower(), *condition))
+        elif isinstance(condition, (list, set, np.ndarray, pd.Series)):
+            _normalised.append((column.lower(), "in", list(condition)))
+        else:
+            _normalised.append((column.lower(), "==", condition))
+
+    return _normalised
+
+
+def _conditions_checked(
+    where: Where, columns: typing.Sequence[str]
+) -> typing.List[typing.Tuple[str, str, typing.Any]]:
+    """Normalise a selection, checking only indexed columns are selected on"""
+    _normalised = _conditions(where)
+
+    for column, *_ in _normalised:
+        if column not in columns:
+            raise pbm_exc.InvalidInputError(
+                f"Cannot select on '{column}', selections are limited to the "
+                f"columns: {', '.join(columns)}"
+            )
+
+    return _normalised
+
+
+def _mask(
+    frame: pd.DataFrame, conditions: typing.Sequence[typing.Tuple[str, str, typing.Any]]
+) -> np.ndarray:
+    """Rows of a dataframe satisfying all the given conditions"""
+    _mask = np.ones(len(frame), dtype=bool)
+
+    for column, operator, value in conditions:
+        if column not in frame:
+            raise pbm_exc.InvalidInputError(
+                f"Cannot select on '{column}', expected one of: "
+                f"{', '.join(frame.columns)}"
+            )
+        _values = frame[column].to_numpy()
+        _mask &= (
+            np.isin(_values, value)
+            if operator == "in"
+            else {
+                "==": np.equal,
+                "!=": np.not_equal,
+                "<": np.less,
+                "<=": np.less_equal,
+                ">": np.greater,
+                ">=": np.greater_equal,
+            }[operator](_values, value)
+        )
+
+    return _mask
+
+
+class Session:
+    """Lazy reader of the outputs within a session directory"""
+
+    def __init__(self, session_directory: str) -> None:
+        """
+        Parameters
+        ----------
+        session_directory : str
+            session output directory
+
+        Raises
+        ------
+        FileNotFoundError
+            if the directory does not contain session outputs
+        """
+        self._directory = session_directory
+        self._files = pbm_archive.open_session(session_directory)
+        self._data = self._files.subdirectory("data")
+        self._hdf5 = pbm_storage.HDF5Storage()
+        self._data_file = self._hdf5.data_file(self._data)
+        self._metadata = pbm_storage.read_metadata(self._data)
+
+        if not any(
+            self._data.exists(f)
+            for f in (
+                self._data_file,
+                pbm_dense.SWEEP_DATA_FILE,
+                pbm_storage.METADATA_FILE,
+            )
+        ):
+            self._files.close()
+            raise FileNotFoundError(f"No session data found in '{session_directory}'")
+
+        self._configuration: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self._keys: typing.Optional[typing.List[str]] = None
+        self._dense_keys: typing.Optional[typing.List[str]] = None
+        self._formats: typing.Optional[typing.Dict[str, str]] = None
+        self._backends: typing.Dict[str, pbm_storage.StorageBackend] = {}
+
+    def __repr__(self) -> str:
+        return f"Session('{self._directory}')"
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the session archive if reading from one"""
+        self._files.close()
+
+    @property
+    def directory(self) -> str:
+        """Session output directory or archive"""
+        return self._directory
+
+    @property
+    def configuration(self) -> typing.Dict[str, typing.Any]:
+        """Configuration of the session"""
+        if self._configuration is None:
+            self._configuration = toml.loads(
+                self._files.read_text("configs/configuration.toml")
+            )
+        return self._configuration
+
+    def _parameter_files(self) -> typing.Dict[str, typing.MutableMapping]:
+        return {
+            f.removeprefix("parameters/").removesuffix(".toml"): toml.loads(
+                self._files.read_text(f)
+            )
+            for f in self._files.glob("parameters/*.toml")
+        }
+
+    @property
+    def simulation_options(self) -> typing.Dict[str, typing.Any]:
+        """Simulation options of the session"""
+        for values in self._parameter_files().values():
+            if any(i in values for i in _SETUP_KEYS):
+                return dict(values)
+        return {}
+
+    @property
+    def parameters(self) -> typing.Dict[str, typing.MutableMapping]:
+        """Parameter values of the session by parameter file"""
+        return {
+            name: values
+            for name, values in self._parameter_files().items()
+            if not any(i in values for i in _SETUP_KEYS)
+        }
+
+    def _table_keys(self) -> typing.List[str]:
+        if self._keys is None:
+            self._keys = self._hdf5.keys(self._data)
+        return self._keys
+
+    def _dense(self) -> typing.List[str]:
+        if self._dense_keys is None:
+            self._dense_keys = []
+            if self._data.exists(pbm_dense.SWEEP_DATA_FILE):
+                with self._data.hdf5(pbm_dense.SWEEP_DATA_FILE) as h5_file:
+                    self._dense_keys = [i._v_name for i in h5_file.list_nodes("/")]
+        return self._dense_keys
+
+    def _storage(self) -> typing.Dict[str, str]:
+        """Storage format of the outputs of each model, 'dense' for dense sweeps"""
+        if self._formats is None:
+            if "models" in self._metadata:
+                self._formats = {
+                    key: model["storage"]
+                    for key, model in self._metadata["models"].items()
+                }
+            else:
+                # Sessions written before the metadata file was added
+                self._formats = {
+                    key: pbm_storage.HDF5Storage.name for key in self._table_keys()
+                }
+                self._formats |= {key: "dense" for key in self._dense()}
+        return self._formats
+
+    def _backend(self, key: str) -> pbm_storage.StorageBackend:
+        _format = self._storage()[key]
+        if _format not in self._backends:
+            self._backends[_format] = pbm_storage.storage_backend({"format": _format})
+        return self._backends[_format]
+
+    @property
+    def models(self) -> typing.List[str]:
+        """Keys of the models with outputs within the session"""
+        return [
+            key
+            for key in (
+                i.lower().replace(".", "_") for i in self.configuration["models"]
+            )
+            if key in self._storage()
+        ]
+
+    def _check_model(self, model: str) -> str:
+        _key = model.lower().replace(".", "_")
+        if _key not in self.models:
+            raise KeyError(
+                f"No outputs for model '{model}', expected one of: "
+                f"{', '.join(self.models)}"
+            )
+        return _key
+
+    def _is_dense(self, key: str) -> bool:
+        return self._storage()[key] == "dense"
+
+    def columns(self, model: str) -> typing.List[str]:
+        """All output columns of a model including time and sweep parameters
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+
+        Returns
+        -------
+        typing.List[str]
+            names of the columns
+        """
+        _key = self._check_model(model)
+
+        if self._is_dense(_key):
+            with self._data.hdf5(pbm_dense.SWEEP_DATA_FILE) as h5_file:
+                _attrs = h5_file.get_node("/", _key)._v_attrs
+                return ["time", *_attrs.variables, *_attrs.parameters]
+
+        return self._backend(_key).columns(self._data, _key)
+
+    def sweep_parameters(self, model: str) -> typing.List[str]:
+        """Sweep parameter columns of a model
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+
+        Returns
+        -------
+        typing.List[str]
+            names of the sweep parameters, empty if not a sweep
+        """
+        _key = self._check_model(model)
+
+        if "models" in self._metadata:
+            return list(self._metadata["models"][_key]["sweep_parameters"])
+
+        if self._is_dense(_key):
+            with self._data.hdf5(pbm_dense.SWEEP_DATA_FILE) as h5_file:
+                return list(h5_file.get_node("/", _key)._v_attrs.parameters)
+
+        with self._data.hdf_store(self._data_file) as hdf_store:
+            _attrs = hdf_store.get_storer(_key).attrs
+            if SWEEP_PARAMETERS_ATTR in _attrs:
+                return list(getattr(_attrs, SWEEP_PARAMETERS_ATTR))
+
+        # Sessions written before the sweep parameters were recorded
+        _columns = self.columns(_key)
+        return [
+            p.lower()
+            for p in self.configuration.get("sweep") or {}
+            if p.lower() in _columns
+        ]
+
+    def variables(self, model: str) -> typing.List[str]:
+        """Output variables of a model
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+
+        Returns
+        -------
+        typing.List[str]
+            names of the output variables excluding time and sweep parameters
+        """
+        _excluded = ["time", *self.sweep_parameters(model)]
+        return [c for c in self.columns(model) if c not in _excluded]
+
+    def combinations(self, model: str) -> pd.DataFrame:
+        """Sweep parameter values of each combination of a model
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+
+        Returns
+        -------
+        pd.DataFrame
+            a row per combination in order of appearance, empty if the
+            session is not a sweep
+        """
+        _key = self._check_model(model)
+        _parameters = self.sweep_parameters(_key)
+
+        if self._is_dense(_key):
+            with self._data.hdf5(pbm_dense.SWEEP_DATA_FILE) as h5_file:
+                return pd.DataFrame(
+                    h5_file.get_node("/", _key).combinations.read(),
+                    columns=_parameters,
+                )
+
+        if not _parameters:
+            return pd.DataFrame()
+
+        _values = self._backend(_key).read(self._data, _key, _parameters)
+
+        return _values.drop_duplicates().reset_index(drop=True)
+
+    def cuts(self, model: str) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Sweep parameter values of each combination of a model
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+
+        Returns
+        -------
+        typing.List[typing.Dict[str, Any]]
+            parameter values of each cut, empty if not a sweep
+        """
+        return self.combinations(model).to_dict("records")
+
+    def select(
+        self,
+        model: str,
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        where: Where = None,
+        start: typing.Optional[int] = None,
+        stop: typing.Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Read the outputs of a model
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+        columns : typing.Sequence[str], optional
+            columns to read, by default all
+        where : typing.Mapping[str, Any], optional
+            selection on the time or sweep parameter columns, each given as
+            a value, a list of values or a tuple of operator and value
+        start : int, optional
+            first row of the selection to return
+        stop : int, optional
+            row of the selection at which to stop
+
+        Returns
+        -------
+        pd.DataFrame
+            selected rows and columns
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if a selection is not on the time or a sweep parameter column
+        """
+        _key = self._check_model(model)
+        _conditions = _conditions_checked(where, ["time", *self.sweep_parameters(_key)])
+        _columns = list(columns) if columns else None
+
+        if self._is_dense(_key):
+            _frame = self._select_dense(_key, _columns, _conditions)
+        else:
+            _frame = self._backend(_key).read(self._data, _key, _columns, _conditions)
+
+        return _frame.iloc[start:stop]
+
+    def _select_dense(
+        self,
+        key: str,
+        columns: typing.Optional[typing.List[str]],
+        conditions: typing.List[typing.Tuple[str, str, typing.Any]],
+    ) -> pd.DataFrame:
+        with self._data.hdf5(pbm_dense.SWEEP_DATA_FILE) as h5_file:
+            _group = h5_file.get_node("/", key)
+            _parameters = list(_group._v_attrs.parameters)
+            _variables = list(_group._v_attrs.variables)
+            _time = _group.time.read()
+            _combinations = pd.DataFrame(
+                _group.combinations.read(), columns=_parameters
+            )
+
+            _combination_mask = _mask(
+                _combinations, [c for c in conditions if c[0] != "time"]
+            )
+            _time_mask = _mask(
+                pd.DataFrame({"time": _time}), [c for c in conditions if c[0] == "time"]
+            )
+
+            _columns = columns or ["time", *_variables, *_parameters]
+            _selected = [_variables.index(c) for c in _columns if c in _variables]
+
+            # Each combination is held within separate chunks of the array
+            _arrays = [
+                _group.data[i][_time_mask][:, _selected]
+                for i in np.flatnonzero(_combination_mask)
+            ]
+
+        _n_time = int(_time_mask.sum())
+        _frame = pd.DataFrame(
+            np.concatenate(_arrays) if _arrays else np.empty((0, len(_selected))),
+            columns=[_variables[i] for i in _selected],
+        )
+        _frame["time"] = np.tile(_time[_time_mask], len(_arrays))
+        for parameter in _parameters:
+            _frame[parameter] = np.repeat(
+                _combinations[parameter].to_numpy()[_combination_mask], _n_time
+            )
+
+        return _frame[_columns]
+
+    def cut(
+        self, model: str, cut: typing.Optional[typing.Mapping[str, typing.Any]] = None
+    ) -> pd.DataFrame:
+        """Read the time and output variables of a single sweep cut
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+        cut : typing.Mapping[str, Any], optional
+            value of each sweep parameter, by default the first cut
+
+        Returns
+        -------
+        pd.DataFrame
+            time and output variables of the cut
+
+        Raises
+        ------
+        KeyError
+            if the cut is not present within the results
+        """
+        _columns = ["time", *self.variables(model)]
+
+        if not self.sweep_parameters(model):
+            return self.select(model, columns=_columns)
+
+        if cut is None:
+            _frame = self.combinations(model)
+            cut = _frame.iloc[0].to_dict()
+
+        _frame = self.select(
+            model, columns=_columns, where={k.lower(): v for k, v in cut.items()}
+        )
+
+        if _frame.empty:
+            raise KeyError(f"No sweep cut matching {dict(cut)}")
+
+        return _frame.reset_index(drop=True)
+
+    def array(
+        self,
+        model: str,
+        columns: typing.Union[str, typing.Sequence[str]],
+        where: Where = None,
+    ) -> np.ndarray:
+        """Read columns of the outputs of a model as an array
+
+        Parameters
+        ----------
+        model : str
+            model name or key
+        columns : str | typing.Sequence[str]
+            column or columns to read
+        where : typing.Mapping[str, Any], optional
+            selection on the time or sweep parameter columns
+
+        Returns
+        -------
+        np.ndarray
+            one dimensional array for a single column, else an array of
+            shape (n_rows, n_columns)
+        """
+        _columns = [columns] if isinstance(columns, str) else list(columns)
+        _array = self.select(model, columns=_columns, where=where).to_numpy()
+        return _array[:, 0] if isinstance(columns, str) else _array
+
+    def table(self, key: str) -> typing.Optional[pd.DataFrame]:
+        """Read a table stored within the session HDF5 file
+
+        Parameters
+        ----------
+        key : str
+            key of the table, e.g. 'summary', 'solver_stats' or 'timings'
+
+        Returns
+        -------
+        pd.DataFrame | None
+            the table, None if not present
+        """
+        if key.strip("/") not in self._table_keys():
+            return None
+        with self._data.hdf_store(self._data_file) as hdf_store:
+            return hdf_store.get(key)
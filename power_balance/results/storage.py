@@ -0,0 +1,813 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Result Storage
+==============
+
+Back-ends used to write the outputs of each model to the session data
+directory, selected by the 'storage' section of the configuration:
+
+    [storage]
+    format = "parquet"
+    compression = "zstd"
+    float32 = true
+
+Model outputs are written either as compressed HDF5 tables within the
+session HDF5 file, as Parquet files, as Zarr groups or as NPZ archives,
+each back-end also reading a selection of the rows and columns such that
+sessions are read via the same interface whatever the format. Outputs are
+read from either a data directory or the data of a session archive, see
+power_balance.results.archive. Metadata
+common to all models is written once to a JSON file within the data
+directory rather than being attached to every model.
+
+Rows are chunked such that each chunk holds whole sweep cuts up to roughly
+a megabyte, and output variables may optionally be stored at single
+precision, the time and sweep parameter columns always being stored at
+full precision.
+
+Contents
+========
+
+Classes
+-------
+
+    StorageBackend - base class of the result storage back-ends
+    HDF5Storage - compressed HDF5 tables within the session HDF5 file
+    ParquetStorage - Parquet file per model
+    ZarrStorage - Zarr group per model with an array per column
+    NPZStorage - NPZ archive per model with an array per column
+
+Functions
+---------
+
+    storage_backend - create the back-end given within a configuration
+    chunk_rows - number of rows per chunk for a model's outputs
+    write_metadata - write the metadata of the model outputs of a session
+    read_metadata - read the metadata of the model outputs of a session
+
+"""
+
+__date__ = "2026-10-19"
+
+import contextlib
+import json
+import os
+import typing
+import warnings
+
+import numpy as np
+import pandas as pd
+import tables
+
+import power_balance.exceptions as pbm_exc
+import power_balance.results.archive as pbm_archive
+import power_balance.results.dense as pbm_dense
+
+SESSION_DATA_FILE = "session_data.h5"
+METADATA_FILE = "metadata.json"
+
+# Attribute of each HDF5 model table listing its sweep parameter columns
+SWEEP_PARAMETERS_ATTR = "sweep_parameters"
+
+# Approximate size of each chunk of rows before compression
+CHUNK_BYTES: int = 1 << 20
+
+Condition = typing.Tuple[str, str, typing.Any]
+
+# Session data directory or the files within the data of a session
+DataLocation = typing.Union[str, pbm_archive.SessionFiles]
+
+_COMPARISONS: typing.Dict[str, typing.Callable] = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+
+
+def chunk_rows(
+    frame: pd.DataFrame,
+    sweep_parameters: typing.Sequence[str] = (),
+    chunk_bytes: int = CHUNK_BYTES,
+) -> int:
+    """Number of rows per chunk for the outputs of a model
+
+    Chunks hold roughly the given number of bytes, rounded to a whole
+    number of sweep cuts such that reading a cut reads as few chunks as
+    possible.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        outputs of the model
+    sweep_parameters : typing.Sequence[str], optional
+        sweep parameter columns of the outputs
+    chunk_bytes : int, optional
+        approximate size of each chunk, by default one megabyte
+
+    Returns
+    -------
+    int
+        rows per chunk
+    """
+    if frame.empty:
+        return 1
+
+    _row_bytes = max(int(frame.memory_usage(index=False, deep=False).sum()), 1) / len(
+        frame
+    )
+    _rows = max(int(chunk_bytes / _row_bytes), 1)
+
+    if sweep_parameters:
+        _n_cuts = len(frame[list(sweep_parameters)].drop_duplicates())
+        _cut_rows = max(len(frame) // _n_cuts, 1)
+        _rows = max(_rows // _cut_rows, 1) * _cut_rows
+
+    return min(_rows, len(frame))
+
+
+def _files(data_directory: DataLocation) -> pbm_archive.SessionFiles:
+    if isinstance(data_directory, pbm_archive.SessionFiles):
+        return data_directory
+    return pbm_archive.SessionFiles(data_directory)
+
+
+def _mask(
+    values: typing.Mapping[str, np.ndarray], conditions: typing.Sequence[Condition]
+) -> np.ndarray:
+    """Rows satisfying all the given conditions on the given columns"""
+    _length = len(next(iter(values.values())))
+    _mask = np.ones(_length, dtype=bool)
+
+    for column, operator, value in conditions:
+        _mask &= (
+            np.isin(values[column], value)
+            if operator == "in"
+            else _COMPARISONS[operator](values[column], value)
+        )
+
+    return _mask
+
+
+class StorageBackend:
+    """Base class of the back-ends used to store model outputs"""
+
+    name: str = ""
+    compressions: typing.Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        compression: typing.Optional[str] = None,
+        complevel: int = 5,
+        float32: bool = False,
+        chunk_rows: typing.Optional[int] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        compression : str, optional
+            compression algorithm, by default the first of the algorithms
+            supported by the back-end
+        complevel : int, optional
+            compression level, by default 5
+        float32 : bool, optional
+            store output variables at single precision, by default False
+        chunk_rows : int, optional
+            rows per chunk, by default chosen from the size of the outputs
+
+        Raises
+        ------
+        power_balance.exceptions.InvalidInputError
+            if the compression is not supported by the back-end
+        """
+        self._check_requirements()
+        self.compression = compression or self.compressions[0]
+        if self.compression not in self.compressions:
+            raise pbm_exc.InvalidInputError(
+                f"Compression '{self.compression}' is not supported by "
+                f"{self.name} storage, expected one of: {', '.join(self.compressions)}"
+            )
+        self.complevel = 0 if self.compression == "none" else complevel
+        self.float32 = float32
+        self.chunk_rows = chunk_rows
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(compression='{self.compression}')"
+
+    def _check_requirements(self) -> None:
+        """Check the modules required by the back-end can be imported"""
+
+    def options(self) -> typing.Dict[str, typing.Any]:
+        """Options of the back-end as recorded within the session metadata"""
+        return {
+            "format": self.name,
+            "compression": self.compression,
+            "complevel": self.complevel,
+            "float32": self.float32,
+        }
+
+    def prepare(
+        self, frame: pd.DataFrame, sweep_parameters: typing.Sequence[str]
+    ) -> pd.DataFrame:
+        """Convert the output variables to single precision if requested"""
+        if not self.float32:
+            return frame
+        _excluded = ["time", *sweep_parameters]
+        return frame.astype(
+            {
+                column: np.float32
+                for column, dtype in frame.dtypes.items()
+                if column not in _excluded and dtype == np.float64
+            }
+        )
+
+    def _chunk_rows(
+        self, frame: pd.DataFrame, sweep_parameters: typing.Sequence[str]
+    ) -> int:
+        if self.chunk_rows:
+            return min(self.chunk_rows, max(len(frame), 1))
+        return chunk_rows(frame, sweep_parameters)
+
+    extension: str = ""
+
+    def file_name(self, key: str) -> str:
+        """Name of the file holding the outputs of a model"""
+        return f"{key}{self.extension}"
+
+    def path(self, data_directory: str, key: str) -> str:
+        """Location of the outputs of a model within the data directory"""
+        return os.path.join(data_directory, self.file_name(key))
+
+    def keys(self, data_directory: DataLocation) -> typing.List[str]:
+        """Keys of the models with outputs stored by this back-end"""
+        return [
+            f.removesuffix(self.extension)
+            for f in _files(data_directory).glob(f"*{self.extension}")
+        ]
+
+    def write(
+        self,
+        data_directory: str,
+        key: str,
+        frame: pd.DataFrame,
+        sweep_parameters: typing.Sequence[str] = (),
+    ) -> None:
+        """Write the outputs of a model
+
+        Parameters
+        ----------
+        data_directory : str
+            session data directory
+        key : str
+            key of the model
+        frame : pd.DataFrame
+            outputs of the model
+        sweep_parameters : typing.Sequence[str], optional
+            sweep parameter columns of the outputs
+        """
+        raise NotImplementedError
+
+    def columns(self, data_directory: DataLocation, key: str) -> typing.List[str]:
+        """Columns of the stored outputs of a model"""
+        raise NotImplementedError
+
+    def read(
+        self,
+        data_directory: DataLocation,
+        key: str,
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        conditions: typing.Sequence[Condition] = (),
+    ) -> pd.DataFrame:
+        """Read a selection of the outputs of a model
+
+        Parameters
+        ----------
+        data_directory : str | SessionFiles
+            session data directory, or the data files of a session archive
+        key : str
+            key of the model
+        columns : typing.Sequence[str], optional
+            columns to read, by default all
+        conditions : typing.Sequence[Tuple[str, str, Any]], optional
+            (column, operator, value) conditions which the rows must satisfy,
+            the operator being a comparison or 'in'
+
+        Returns
+        -------
+        pd.DataFrame
+            selected rows and columns
+        """
+        raise NotImplementedError
+
+
+class HDF5Storage(StorageBackend):
+    """Compressed HDF5 tables within the session HDF5 file
+
+    The time and sweep parameter columns are indexed such that rows are
+    selected within the file. Outputs of older sessions written in fixed
+    format are read in full and then filtered.
+    """
+
+    name = "hdf5"
+    compressions = (
+        "blosc:zstd",
+        "blosc:lz4",
+        "blosc:lz4hc",
+        "blosc:blosclz",
+        "blosc:zlib",
+        "zlib",
+        "bzip2",
+        "none",
+    )
+
+    extension = ".h5"
+
+    def file_name(self, key: str = "") -> str:
+        return SESSION_DATA_FILE
+
+    def data_file(self, data_directory: DataLocation) -> str:
+        """Name of the session HDF5 file within the data directory"""
+        _files_found = _files(data_directory)
+
+        # Sessions written before the data file was named
+        if not _files_found.exists(SESSION_DATA_FILE):
+            _names = [
+                f for f in _files_found.glob("*.h5") if f != pbm_dense.SWEEP_DATA_FILE
+            ]
+            return _names[0] if _names else SESSION_DATA_FILE
+
+        return SESSION_DATA_FILE
+
+    def keys(self, data_directory: DataLocation) -> typing.List[str]:
+        _data = _files(data_directory)
+        if not _data.exists(_data_file := self.data_file(_data)):
+            return []
+        with _data.hdf_store(_data_file) as hdf_store:
+            return [k.strip("/") for k in hdf_store.keys()]
+
+    def write(
+        self,
+        data_directory: str,
+        key: str,
+        frame: pd.DataFrame,
+        sweep_parameters: typing.Sequence[str] = (),
+    ) -> None:
+        _frame = self.prepare(frame, sweep_parameters)
+        _compression = (
+            {}
+            if self.compression == "none"
+            else {
+                "complib": self.compression,
+                "complevel": self.complevel,
+            }
+        )
+
+        # Sweep parameter names are not valid identifiers
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", tables.NaturalNameWarning)
+            with pd.HDFStore(self.path(data_directory, key)) as store:
+                # The expected rows determine the chunk shape within the file
+                store.append(
+                    key,
+                    _frame,
+                    format="table",
+                    append=False,
+                    data_columns=["time", *sweep_parameters],
+                    chunksize=self._chunk_rows(_frame, sweep_parameters),
+                    expectedrows=len(_frame),
+                    **_compression,
+                )
+                setattr(
+                    store.get_storer(key).attrs,
+                    SWEEP_PARAMETERS_ATTR,
+                    list(sweep_parameters),
+                )
+
+    def columns(self, data_directory: DataLocation, key: str) -> typing.List[str]:
+        _data = _files(data_directory)
+        with _data.hdf_store(self.data_file(_data)) as hdf_store:
+            _storer = hdf_store.get_storer(key)
+            if _storer.is_table:
+                return list(_storer.non_index_axes[0][1])
+            return [
+                i.decode() if isinstance(i, bytes) else str(i)
+                for i in _storer.group.axis0.read()
+            ]
+
+    def read(
+        self,
+        data_directory: DataLocation,
+        key: str,
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        conditions: typing.Sequence[Condition] = (),
+    ) -> pd.DataFrame:
+        _columns = list(columns) if columns else None
+        _data = _files(data_directory)
+
+        with _data.hdf_store(self.data_file(_data)) as hdf_store:
+            _storer = hdf_store.get_storer(key)
+
+            if not _storer.is_table:
+                _frame = hdf_store.get(key)
+                _frame = (
+                    _frame[
+                        _mask(
+                            {c: _frame[c].to_numpy() for c, *_ in conditions},
+                            conditions,
+                        )
+                    ]
+                    if conditions
+                    else _frame
+                )
+                return _frame[_columns] if _columns else _frame
+
+            # Indexed columns are read without reading the remaining columns
+            if (
+                not conditions
+                and _columns
+                and set(_columns) <= set(_storer.data_columns)
+            ):
+                return pd.DataFrame(
+                    {c: hdf_store.select_column(key, c).to_numpy() for c in _columns}
+                )
+
+            if not conditions:
+                return hdf_store.select(key, columns=_columns)
+
+            # Conditions are evaluated within the file on the indexed columns
+            # which may have names which are not valid identifiers
+            _condvars: typing.Dict[str, typing.Any] = {}
+            _terms: typing.List[str] = []
+
+            for i, (column, operator, value) in enumerate(conditions):
+                _condvars[f"c{i}"] = _storer.table.cols._f_col(column)
+                if operator == "in":
+                    _condvars |= {f"v{i}_{j}": v for j, v in enumerate(value)}
+                    _terms.append(
+                        "("
+                        + " | ".join(f"(c{i} == v{i}_{j})" for j in range(len(value)))
+                        + ")"
+                        if value
+                        else f"(c{i} != c{i})"
+                    )
+                else:
+                    _condvars[f"v{i}"] = value
+                    _terms.append(f"(c{i} {operator} v{i})")
+
+            _rows = _storer.table.get_where_list(" & ".join(_terms), condvars=_condvars)
+
+            if not len(_rows):
+                return hdf_store.select(key, columns=_columns, start=0, stop=0)
+
+            return hdf_store.select(key, where=_rows, columns=_columns)
+
+
+class ParquetStorage(StorageBackend):
+    """Parquet file per model
+
+    Row groups hold whole sweep cuts with the time and sweep parameter
+    columns dictionary encoded, the statistics of each row group allowing
+    those not satisfying a selection to be skipped.
+    """
+
+    name = "parquet"
+    compressions = ("zstd", "snappy", "lz4", "gzip", "brotli", "none")
+
+    def _check_requirements(self) -> None:
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise pbm_exc.InternalError(
+                "Parquet result storage requires 'pyarrow', install it using "
+                "'pip install power_balance[parquet]'"
+            ) from e
+
+    extension = ".parquet"
+
+    def write(
+        self,
+        data_directory: str,
+        key: str,
+        frame: pd.DataFrame,
+        sweep_parameters: typing.Sequence[str] = (),
+    ) -> None:
+        _frame = self.prepare(frame, sweep_parameters)
+        _compression = {
+            "compression": None if self.compression == "none" else self.compression
+        }
+        if self.compression in ("zstd", "gzip", "brotli"):
+            _compression["compression_level"] = self.complevel
+
+        _frame.to_parquet(
+            self.path(data_directory, key),
+            engine="pyarrow",
+            index=False,
+            row_group_size=self._chunk_rows(_frame, sweep_parameters),
+            use_dictionary=["time", *sweep_parameters],
+            **_compression,
+        )
+
+    def columns(self, data_directory: DataLocation, key: str) -> typing.List[str]:
+        import pyarrow.parquet as pq
+
+        with _files(data_directory).open(self.file_name(key)) as in_f:
+            return list(pq.read_schema(in_f).names)
+
+    def read(
+        self,
+        data_directory: DataLocation,
+        key: str,
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        conditions: typing.Sequence[Condition] = (),
+    ) -> pd.DataFrame:
+        with _files(data_directory).open(self.file_name(key)) as in_f:
+            return pd.read_parquet(
+                in_f,
+                engine="pyarrow",
+                columns=list(columns) if columns else None,
+                filters=[list(conditions)] if conditions else None,
+            )
+
+
+class _ColumnStorage(StorageBackend):
+    """Back-ends storing an array per column
+
+    Sweep parameter columns are stored as categorical codes with their
+    values held separately. Rows are selected by reading the columns on
+    which the conditions are given, the selected columns then being read
+    only between the first and last selected rows.
+    """
+
+    def _open(self, data: pbm_archive.SessionFiles, key: str) -> typing.ContextManager:
+        raise NotImplementedError
+
+    def _column_names(self, handle: typing.Any) -> typing.List[str]:
+        raise NotImplementedError
+
+    def _read_column(self, handle: typing.Any, column: str, rows: slice) -> np.ndarray:
+        raise NotImplementedError
+
+    def columns(self, data_directory: DataLocation, key: str) -> typing.List[str]:
+        with self._open(_files(data_directory), key) as handle:
+            return self._column_names(handle)
+
+    @staticmethod
+    def _encode(
+        frame: pd.DataFrame, sweep_parameters: typing.Sequence[str]
+    ) -> typing.Iterator[typing.Tuple[str, np.ndarray, typing.Optional[list]]]:
+        """Yield the array of each column with the values of sweep parameters"""
+        for column in frame.columns:
+            if column in sweep_parameters:
+                _codes, _values = pd.factorize(frame[column])
+                yield column, _codes.astype(np.int32), _values.tolist()
+            else:
+                yield column, frame[column].to_numpy(), None
+
+    def read(
+        self,
+        data_directory: DataLocation,
+        key: str,
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        conditions: typing.Sequence[Condition] = (),
+    ) -> pd.DataFrame:
+        with self._open(_files(data_directory), key) as handle:
+            _columns = list(columns) if columns else self._column_names(handle)
+
+            if not conditions:
+                return pd.DataFrame(
+                    {c: self._read_column(handle, c, slice(None)) for c in _columns}
+                )
+
+            _selected = np.flatnonzero(
+                _mask(
+                    {
+                        c: self._read_column(handle, c, slice(None))
+                        for c in {c for c, *_ in conditions}
+                    },
+                    conditions,
+                )
+            )
+
+            if not len(_selected):
+                return pd.DataFrame(
+                    {c: self._read_column(handle, c, slice(0, 0)) for c in _columns}
+                )
+
+            _rows = slice(int(_selected[0]), int(_selected[-1]) + 1)
+
+            return pd.DataFrame(
+                {
+                    c: self._read_column(handle, c, _rows)[_selected - _rows.start]
+                    for c in _columns
+                }
+            )
+
+
+class ZarrStorage(_ColumnStorage):
+    """Zarr group per model with a chunked array per column"""
+
+    name = "zarr"
+    compressions = ("zstd", "lz4", "lz4hc", "blosclz", "zlib", "none")
+
+    def _check_requirements(self) -> None:
+        try:
+            import zarr  # noqa: F401
+        except ImportError as e:
+            raise pbm_exc.InternalError(
+                "Zarr result storage requires 'zarr', install it using "
+                "'pip install power_balance[zarr]'"
+            ) from e
+
+    extension = ".zarr"
+
+    def write(
+        self,
+        data_directory: str,
+        key: str,
+        frame: pd.DataFrame,
+        sweep_parameters: typing.Sequence[str] = (),
+    ) -> None:
+        import zarr
+
+        _frame = self.prepare(frame, sweep_parameters)
+        _chunks = (self._chunk_rows(_frame, sweep_parameters),)
+        _compressors = (
+            None
+            if self.compression == "none"
+            else zarr.codecs.BloscCodec(
+                cname=self.compression, clevel=self.complevel, shuffle="shuffle"
+            )
+        )
+
+        _group = zarr.open_group(self.path(data_directory, key), mode="w")
+        _group.attrs["columns"] = list(_frame.columns)
+
+        for column, values, categories in self._encode(_frame, sweep_parameters):
+            _array = _group.create_array(
+                column,
+                shape=values.shape,
+                dtype=values.dtype,
+                chunks=_chunks,
+                compressors=_compressors,
+            )
+            _array[:] = values
+            if categories is not None:
+                _array.attrs["categories"] = categories
+
+    @contextlib.contextmanager
+    def _open(
+        self, data: pbm_archive.SessionFiles, key: str
+    ) -> typing.Iterator[typing.Any]:
+        import zarr
+
+        if not isinstance(data, pbm_archive.SessionArchive):
+            yield zarr.open_group(data.local_path(self.file_name(key)), mode="r")
+            return
+
+        # Groups are read directly from the stored members of the archive
+        with zarr.storage.ZipStore(data.location, mode="r") as store:
+            yield zarr.open_group(
+                store, mode="r", path=data.member_path(self.file_name(key))
+            )
+
+    def _column_names(self, handle: typing.Any) -> typing.List[str]:
+        return list(handle.attrs["columns"])
+
+    def _read_column(self, handle: typing.Any, column: str, rows: slice) -> np.ndarray:
+        _array = handle[column]
+        _values = _array[rows]
+        if "categories" in _array.attrs:
+            return np.asarray(_array.attrs["categories"])[_values]
+        return _values
+
+
+class NPZStorage(_ColumnStorage):
+    """NPZ archive per model with an array per column
+
+    Arrays are not chunked, each selected column being decompressed in full.
+    """
+
+    name = "npz"
+    compressions = ("zlib", "none")
+
+    _COLUMNS = "__columns__"
+    _CATEGORIES = "__categories__"
+
+    extension = ".npz"
+
+    def write(
+        self,
+        data_directory: str,
+        key: str,
+        frame: pd.DataFrame,
+        sweep_parameters: typing.Sequence[str] = (),
+    ) -> None:
+        _arrays: typing.Dict[str, np.ndarray] = {
+            self._COLUMNS: np.array(frame.columns, dtype=str)
+        }
+
+        for column, values, categories in self._encode(
+            self.prepare(frame, sweep_parameters), sweep_parameters
+        ):
+            _arrays[column] = values
+            if categories is not None:
+                _arrays[f"{column}{self._CATEGORIES}"] = np.asarray(categories)
+
+        _save = np.savez if self.compression == "none" else np.savez_compressed
+        _save(self.path(data_directory, key), **_arrays)
+
+    @contextlib.contextmanager
+    def _open(
+        self, data: pbm_archive.SessionFiles, key: str
+    ) -> typing.Iterator[typing.Any]:
+        with data.open(self.file_name(key)) as in_f:
+            with np.load(in_f, allow_pickle=False) as handle:
+                yield handle
+
+    def _column_names(self, handle: typing.Any) -> typing.List[str]:
+        return handle[self._COLUMNS].tolist()
+
+    def _read_column(self, handle: typing.Any, column: str, rows: slice) -> np.ndarray:
+        _values = handle[column][rows]
+        if f"{column}{self._CATEGORIES}" in handle.files:
+            return handle[f"{column}{self._CATEGORIES}"][_values]
+        return _values
+
+
+BACKENDS: typing.Dict[str, typing.Type[StorageBackend]] = {
+    backend.name: backend
+    for backend in (HDF5Storage, ParquetStorage, ZarrStorage, NPZStorage)
+}
+
+
+def storage_backend(
+    options: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+) -> StorageBackend:
+    """Create the storage back-end given within a configuration
+
+    Parameters
+    ----------
+    options : typing.Mapping[str, Any], optional
+        'storage' section of the configuration, by default HDF5 tables
+
+    Returns
+    -------
+    StorageBackend
+        the back-end
+
+    Raises
+    ------
+    power_balance.exceptions.InvalidInputError
+        if the format or compression is not recognised
+    power_balance.exceptions.InternalError
+        if the modules required by the back-end are not installed
+    """
+    _options = dict(options or {})
+    _format = _options.pop("format", HDF5Storage.name)
+    _format = getattr(_format, "value", _format)
+
+    if _format not in BACKENDS:
+        raise pbm_exc.InvalidInputError(
+            f"Unrecognised result storage format '{_format}', expected one "
+            f"of: {', '.join(BACKENDS)}"
+        )
+
+    return BACKENDS[_format](**_options)
+
+
+def write_metadata(
+    data_directory: str, metadata: typing.Mapping[str, typing.Any]
+) -> None:
+    """Write the metadata of the model outputs of a session
+
+    Parameters
+    ----------
+    data_directory : str
+        session data directory
+    metadata : typing.Mapping[str, Any]
+        metadata including the storage and sweep parameters of each model
+    """
+    with open(os.path.join(data_directory, METADATA_FILE), "w") as out_f:
+        json.dump(metadata, out_f, indent=2)
+
+
+def read_metadata(data_directory: DataLocation) -> typing.Dict[str, typing.Any]:
+    """Read the metadata of the model outputs of a session
+
+    Parameters
+    ----------
+    data_directory : str | SessionFiles
+        session data directory, or the data files of a session archive
+
+    Returns
+    -------
+    typing.Dict[str, Any]
+        the metadata, empty for sessions written before it was recorded
+    """
+    _data = _files(data_directory)
+    if not _data.exists(METADATA_FILE):
+        return {}
+    return json.loads(_data.read_text(METADATA_FILE))
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Sweep Cut Index
+===============
+
+Indexed selection of the cuts within long form parameter sweep results.
+The rows belonging to each combination of sweep parameter values are
+located once, after which retrieving a cut does not require filtering of
+the full dataframe. As the results of each combination are appended in
+turn the rows of a cut are contiguous, in which case the cut is returned
+as a slice of the original dataframe.
+
+Contents
+========
+
+Classes
+-------
+
+    SweepIndex - index of the sweep cuts within a results dataframe
+
+Functions
+---------
+
+    build_sweep_indexes - create a SweepIndex for each model within a session
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+class SweepIndex:
+    """Index of the rows for each sweep cut within a results dataframe"""
+
+    def __init__(
+        self, dataframe: pd.DataFrame, parameters: typing.Sequence[str]
+    ) -> None:
+        """
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            long form sweep results containing a column for each parameter
+        parameters : typing.Sequence[str]
+            names of the sweep parameter columns
+        """
+        self._dataframe = dataframe
+        self._parameters = [p.lower() for p in parameters]
+        self._rows: typing.Dict[typing.Tuple, typing.Union[slice, np.ndarray]] = {}
+
+        if not self._parameters:
+            self._rows[()] = slice(0, len(dataframe))
+            return
+
+        _groups = dataframe.groupby(self._parameters, sort=False).indices
+
+        for key, positions in _groups.items():
+            _key = key if isinstance(key, tuple) else (key,)
+            if positions[-1] - positions[0] + 1 == len(positions):
+                self._rows[_key] = slice(positions[0], positions[-1] + 1)
+            else:
+                self._rows[_key] = positions
+
+    @property
+    def parameters(self) -> typing.List[str]:
+        """Names of the sweep parameters"""
+        return self._parameters
+
+    @property
+    def cuts(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Parameter values for each cut in order of appearance"""
+        return [dict(zip(self._parameters, key)) for key in self._rows]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(
+        self,
+    ) -> typing.Iterator[typing.Tuple[typing.Dict[str, typing.Any], pd.DataFrame]]:
+        for key in self._rows:
+            yield dict(zip(self._parameters, key)), self._select(key)
+
+    def _select(self, key: typing.Tuple) -> pd.DataFrame:
+        _rows = self._rows[key]
+        return self._dataframe.iloc[_rows]
+
+    def cut(self, cut: typing.Mapping[str, typing.Any]) -> pd.DataFrame:
+        """Retrieve the rows for a single sweep cut
+
+        Parameters
+        ----------
+        cut : typing.Mapping[str, Any]
+            value for each of the sweep parameters
+
+        Returns
+        -------
+        pd.DataFrame
+            rows of the results dataframe for the cut
+
+        Raises
+        ------
+        KeyError
+            if the cut is not present within the results
+        """
+        _cut = {k.lower(): v for k, v in cut.items()}
+
+        try:
+            return self._select(tuple(_cut[p] for p in self._parameters))
+        except KeyError as e:
+            raise KeyError(f"No sweep cut matching {dict(cut)}") from e
+
+    def first(self) -> pd.DataFrame:
+        """Retrieve the rows for the first cut"""
+        return self._select(next(iter(self._rows)))
+
+    def last(self) -> pd.DataFrame:
+        """Retrieve the rows for the final cut"""
+        return self._select(next(reversed(self._rows)))
+
+
+def build_sweep_indexes(
+    data: typing.Mapping[str, pd.DataFrame],
+    configuration: typing.Mapping[str, typing.Any],
+) -> typing.Dict[str, SweepIndex]:
+    """Create a sweep index for each model dataframe within a session
+
+    Parameters
+    ----------
+    data : typing.Mapping[str, pd.DataFrame]
+        results dataframe for each model
+    configuration : typing.Mapping[str, Any]
+        session configuration
+
+    Returns
+    -------
+    typing.Dict[str, SweepIndex]
+        sweep index for each model, empty if the session is not a sweep
+    """
+    if not configuration.get("sweep"):
+        return {}
+
+    return {
+        model: SweepIndex(
+            dataframe,
+            [
+                p.lower()
+                for p in configuration["sweep"]
+                if p.lower() in dataframe.columns
+            ],
+        )
+        for model, dataframe in data.items()
+    }
@@ -0,0 +1,987 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Steady-State Screening
+======================
+
+Evaluation of the flat-top operating point of the algebraic subsystems of
+'Tokamak.Interdependencies' without running a simulation. The detritiation
+and waste heat subsystems depend only on the peak thermal power and their
+parameters, and the power generation model only on the thermal power and
+the coolant case tables, so their flat-top power can be calculated directly
+for whole tables of parameter values at once.
+
+The equations mirror those of the Modelica models and must be kept in step
+with them, the regression tests comparing the two. Where a power generation
+case lies outside of the tabulated outlet temperature range the Modelica
+model returns a negative sentinel value, the screening result being NaN.
+
+Parameters are addressed as within the 'Tokamak.Interdependencies' model,
+e.g. 'water_detrit_power.contingencyFactor', with the structural parameters
+given as '<section>.<name>', e.g. 'Tokamak.PrimaryCoolantType'. Names are
+case insensitive.
+
+Contents
+========
+
+Classes
+-------
+
+    ScreeningEvaluator - vectorised flat-top evaluation for tables of parameters
+
+Functions
+---------
+
+    isentropic_work - ideal molar work of isentropic gas compression
+    water_detritiation - power consumed by water detritiation
+    air_gas_detritiation - power consumed by air and gas detritiation
+    blanket_detritiation - power consumed by blanket detritiation
+    waste_heat - parasitic load of waste heat removal
+    power_generation_efficiency - thermal to electric conversion efficiency
+    power_generated - electrical power generated
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+import power_balance.exceptions as pbm_exc
+
+ArrayLike = typing.Union[float, np.ndarray]
+
+MODEL_NAME = "Tokamak.Interdependencies"
+
+# Peak thermal power in MW shared by all screened subsystems
+THERMAL_POWER = "thermalpower"
+
+# Heat loads in W received by the waste heat model from other subsystems
+WASTE_HEAT_INPUTS: typing.Tuple[str, ...] = (
+    "wasteheatpower.hcdheat",
+    "wasteheatpower.magnetheat",
+    "wasteheatpower.cryoheat",
+)
+
+# Modelica default values of the parameters of each screened subsystem
+DEFAULT_PARAMETERS: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+    "water_detrit_power": {
+        "contingencyfactor": 0.5,
+        "electrolysisenergy.electrolysisspecificenergy": 26895.0,
+        "waterheating.watertargettemp": 70.0,
+        "waterheating.waterambienttemp": 20.0,
+        "waterheating.vapourfraction": 0.14,
+        "waterheating.latentheatvapourisation": 2264.7,
+        "waterheating.watercp": 4.18,
+        "gascompression.comppressurein": 1e5,
+        "gascompression.comppressureout": 5e5,
+        "gascompression.comptempin": 293.0,
+        "gascompression.hydrogenratiocpcv": 1.41,
+        "gascompression.isentropicefficiency": 0.85,
+    },
+    "air_gas_power": {
+        "contingencyfactor": 0.15,
+        "recombinerheat.airtempin": 293.0,
+        "recombinerheat.recombinertemp": 773.0,
+        "recombinerheat.airheatcapacity": 1.05,
+        "compfeedgas.isentropicefficiency": 0.85,
+        "compfeedgas.pressureinlet": 1e5,
+        "compfeedgas.pressureoutlet": 20e5,
+        "compfeedgas.tempinlet": 293.0,
+        "compfeedgas.ratiocpcv": 1.40,
+        "compfeedgas.airmolweight": 28.97,
+        "regenbedheating.adsorbentbedghsv": 6500.0,
+        "regenbedheating.adsorbentbulkdensity": 705.0,
+        "regenbedheating.adsorbentsaturationcapacity": 0.22,
+        "regenbedheating.airpresin": 3e5,
+        "regenbedheating.watervapourpressure": 0.1e5,
+        "regenbedheating.adsorbentregentime": 1.0,
+        "regenbedheating.adsorbentheatcapacity": 1.0,
+        "regenbedheating.adsorbenttempoperating": 298.0,
+        "regenbedheating.adsorbenttempregen": 573.0,
+        "regenbedheating.waterlatentheatvaporisation": 2260.0,
+        "compregengas.airexcessamount": 10.0,
+        "compregengas.airspecificheat": 1.05,
+        "compregengas.airtempcompinlet": 293.0,
+        "compregengas.airratiocpcv": 1.40,
+        "compregengas.airpressureinlet": 1e5,
+        "compregengas.airpressureoutlet": 6e5,
+        "compregengas.airmolweight": 28.97,
+        "compregengas.isentropicefficiency": 0.85,
+    },
+    "blanketdetritpower": {
+        "contingencyfactor": 0.5,
+        "tritiumbreedingrate.tritiuminput": 1.0,
+        "tritiumbreedingrate.burnrate": 1.0,
+        "tritiumbreedingrate.tritiumbreedratio": 1.0,
+        "hestreamcalc.blanketvolumechangetime": 5.0,
+        "hestreamcalc.voidage": 0.5,
+        "hegascompression.comppressurein": 5e5,
+        "hegascompression.blanketpessure": 10e5,
+        "hegascompression.comptempin": 573.0,
+        "hegascompression.blanketcoolantratiocpcv": 1.67,
+        "hegascompression.blanketcoolantmr": 4.0,
+        "hegascompression.isentropicefficiency": 0.85,
+        "exchangerheatloss.exchangerdt": 20.0,
+        "exchangerheatloss.hespecificheat": 5.2,
+        "getterbedregenheating.gettersatcapacity": 0.02,
+        "getterbedregenheating.getteroperatingtime": 24.0,
+        "getterbedregenheating.getterregentime": 12.0,
+        "getterbedregenheating.gettertempoperating": 573.0,
+        "getterbedregenheating.gettertempregen": 873.0,
+        "getterbedregenheating.getterheatcapacity": 0.4,
+        "getterregengascompression.comppressurein": 1e5,
+        "getterregengascompression.comppressureout": 10e5,
+        "getterregengascompression.comptempin": 293.0,
+        "getterregengascompression.blanketcoolantratiocpcv": 1.67,
+        "getterregengascompression.isentropicefficiency": 0.85,
+        "getterregengascompression.desiredtritiummolfrac": 1e-4,
+        "getterregengascompression.coolantmolecularweight": 4.0,
+    },
+    "wasteheatpower": {
+        "hvacpower.s": 0.3,
+        "hvacpower.sf1": 0.25,
+        "hvacpower.sf2": 0.75,
+        "hvacpower.dt": 8.0,
+        "hvacpower.cpwater": 4.18,
+        "hvacpower.densitywater": 1000.0,
+        "hvacpower.velocity": 1.5,
+        "hvacpower.viscosity": 0.00117,
+        "hvacpower.fittingconstant": 70.0,
+        "hvacpower.elevationlosses": 3.0,
+        "hvacpower.pumpefficiency": 0.8,
+        "hvacpower.length": 500.0,
+        "hvacpower.diameter": 0.78,
+        "hvacpower.elecpowersupply": 8.55,
+        "hvacpower.hx": 1.286,
+        "hvacpower.pipeheatloss": 2.0,
+        "hvacpower.eleccub": 5.73,
+        "hvacpower.distboards": 2.547,
+        "hvacpower.compairsupply": 0.05,
+        "hvacpower.rf": 3.8205,
+        "pumpingpower.g": 9.81,
+        "pumpingpower.length": 1000.0,
+        "pumpingpower.diameter": 1.49,
+        "pumpingpower.v": 1.9,
+        "pumpingpower.waterdensity": 1023.0,
+        "pumpingpower.ff": 0.003,
+        "pumpingpower.inducedtowerscale": 0.0087,
+        "pumpingpower.flowratescale": 0.0159,
+        "pumpingpower.sf1": 0.25,
+        "pumpingpower.sf2": 0.75,
+        "pumpingpower.vacvessel": 6.3675,
+        "pumpingpower.primpumping": 2.547,
+        "pumpingpower.agdetrit": 0.5094,
+        "pumpingpower.wdetrit": 0.5463,
+        "pumpingpower.vacturbo": 0.12735,
+        "pumpingpower.vacroughcg": 0.12735,
+        "pumpingpower.vacmotor": 0.12735,
+        "pumpingpower.asu": 0.2547,
+        "pumpingpower.rpc": 6.3675,
+        "pumpingpower.scpump": 2.547,
+        "pumpingpower.generator": 12.735,
+        "pumpingpower.turbinewasteheat": 3.0,
+    },
+    "powergenerated": {
+        "usepowergeneffvalue": False,
+        "powergeneff": 0.45,
+    },
+}
+
+DEFAULT_STRUCTURAL_PARAMETERS: typing.Dict[str, typing.Any] = {
+    "tokamak.primarycoolanttype": "FLiBe",
+    "tokamak.secondarycoolanttype": "CO2",
+    "tokamak.ratiotype": "2.5",
+    "tokamak.systempressure": "200",
+    "powergenequations.powergenoutlettemp": 700.0,
+}
+
+# Primary coolant types without a coolant acting as tritium carrier, for
+# which the blanket detritiation system is required
+NON_CARRIER_COOLANTS: typing.Tuple[str, ...] = ("CO2_NC", "He_NC")
+
+# Power generation model used for each primary coolant type
+POWER_GENERATION_MODELS: typing.Dict[str, str] = {
+    "CO2_C": "CO2",
+    "CO2_NC": "CO2",
+    "He_C": "He",
+    "He_NC": "He",
+    "H2O": "SubCritWater",
+    "FLiBe": "FliBe",
+    "LiPb": "LiPb",
+}
+
+# Power generation efficiency polynomials 'a T^4 + b T^3 - c T^2 + d T - e'
+# in the outlet temperature T (degC) valid for 'T_min <= T < T_max', for
+# each model, secondary coolant and either compression ratio (CO2) or
+# system pressure (H2O)
+POWER_GENERATION_CASES = pd.DataFrame(
+    [
+        ("CO2", "CO2", "1.5", -2.76e-12, 1.09e-8, 1.61e-5, 1.06e-2, 2.33, 400, 999999),
+        ("CO2", "CO2", "2", -1.04e-12, 3.90e-9, 5.57e-6, 3.68e-3, 0.528, 350, 999999),
+        ("CO2", "CO2", "2.5", -1.14e-12, 4.26e-9, 6.10e-6, 4.06e-3, 0.595, 350, 999999),
+        ("CO2", "H2O", "50", -4.23e-12, 1.38e-8, 1.62e-5, 0.00823, 1.15, 425, 999999),
+        ("CO2", "H2O", "90", -5.46e-12, 1.81e-8, 2.19e-5, 0.0115, 1.80, 400, 999999),
+        ("CO2", "H2O", "200", -2.90e-12, 9.85e-9, 1.23e-5, 0.00685, 1.01, 475, 999999),
+        ("He", "CO2", "1.5", -2.54e-12, 1.01e-8, 1.52e-5, 1.02e-2, 2.27, 450, 999999),
+        ("He", "CO2", "2", -1.03e-12, 3.90e-9, 5.63e-6, 3.77e-3, 0.576, 350, 999999),
+        ("He", "CO2", "2.5", -1.15e-12, 4.33e-9, 6.23e-6, 4.19e-3, 0.648, 350, 999999),
+        ("He", "H2O", "50", 0, 1.66e-9, 3.85e-6, 3.06e-3, 0.414, 350, 999999),
+        ("He", "H2O", "90", 0, 2e-9, 4e-6, 0.0033, 0.4525, 400, 999999),
+        ("He", "H2O", "200", 0, 0, 0, 2.37e-4, 0.294, 475, 999999),
+        (
+            "SubCritWater",
+            "CO2",
+            "1.5",
+            -1.98e-12,
+            8.36e-9,
+            1.30e-5,
+            8.98e-3,
+            1.99,
+            325,
+            350,
+        ),
+        (
+            "SubCritWater",
+            "CO2",
+            "2",
+            -1.02e-12,
+            3.57e-9,
+            4.88e-6,
+            3.15e-3,
+            0.381,
+            200,
+            325,
+        ),
+        (
+            "SubCritWater",
+            "CO2",
+            "2.5",
+            -9.81e-13,
+            3.58e-9,
+            5.08e-6,
+            3.40e-3,
+            0.431,
+            250,
+            350,
+        ),
+        ("SubCritWater", "H2O", "50", 0, 0, 0, 4e-4, -0.221, 300, 325),
+        ("SubCritWater", "H2O", "90", 0, 0, 0, 4.15e-4, -0.239, 325, 350),
+        ("SubCritWater", "H2O", "200", 0, 0, 0, 0, 0, 0, 0),
+        (
+            "FliBe",
+            "CO2",
+            "1.5",
+            2.42e-13,
+            7.04e-10,
+            3.47e-6,
+            3.86e-3,
+            1.01,
+            375,
+            999999,
+        ),
+        ("FliBe", "CO2", "2", -1.22e-12, 4.12e-9, 5.42e-6, 3.37e-3, 0.416, 350, 999999),
+        (
+            "FliBe",
+            "CO2",
+            "2.5",
+            -1.06e-12,
+            3.80e-9,
+            5.30e-6,
+            3.51e-3,
+            0.448,
+            350,
+            999999,
+        ),
+        ("FliBe", "H2O", "50", 0, 0, -2.85e-7, 7.53e-4, 0.117, 300, 999999),
+        ("FliBe", "H2O", "90", 0, 0, -2.71e-7, 8.39e-4, 0.08, 325, 999999),
+        ("FliBe", "H2O", "200", 0, 0, -3.96e-7, 1.21e-3, 0.11, 400, 999999),
+        ("LiPb", "CO2", "1.5", 4.26e-13, 1.42e-10, 2.98e-6, 3.84e-3, 1.11, 425, 999999),
+        ("LiPb", "CO2", "2", -8.79e-13, 3.35e-9, 4.90e-6, 3.33e-3, 0.469, 350, 999999),
+        (
+            "LiPb",
+            "CO2",
+            "2.5",
+            -9.12e-13,
+            3.48e-9,
+            5.12e-6,
+            3.54e-3,
+            0.498,
+            350,
+            999999,
+        ),
+        ("LiPb", "H2O", "50", -2.66e-12, 8.01e-9, 8.81e-6, 0.0045, 0.461, 300, 999999),
+        ("LiPb", "H2O", "90", -1.12e-12, 3.93e-9, 5.18e-6, 0.00333, 0.353, 325, 999999),
+        ("LiPb", "H2O", "200", -3.34e-13, 1.68e-9, 3.18e-6, 0.0029, 0.415, 400, 999999),
+    ],
+    columns=["model", "secondary", "case", "a", "b", "c", "d", "e", "t_min", "t_max"],
+).set_index(["model", "secondary", "case"])
+
+_GAS_CONSTANT = 8.3145
+
+
+def _as_category(values: typing.Any) -> np.ndarray:
+    """Convert case selection values to strings, '2.0' becoming '2'"""
+    _values = np.asarray(values)
+
+    if np.issubdtype(_values.dtype, np.number):
+        return np.char.mod("%g", _values.astype(float))
+
+    return np.array(
+        [
+            f"{value:g}" if isinstance(value, (int, float, np.number)) else str(value)
+            for value in _values.ravel()
+        ]
+    ).reshape(_values.shape)
+
+
+def isentropic_work(
+    temperature_in: ArrayLike,
+    ratio_cp_cv: ArrayLike,
+    pressure_in: ArrayLike,
+    pressure_out: ArrayLike,
+) -> ArrayLike:
+    """Ideal molar work of isentropic gas compression
+
+    Parameters
+    ----------
+    temperature_in : float | np.ndarray
+        temperature at the compressor inlet (K)
+    ratio_cp_cv : float | np.ndarray
+        ratio of specific heat capacities of the gas
+    pressure_in : float | np.ndarray
+        pressure at the compressor inlet
+    pressure_out : float | np.ndarray
+        pressure at the compressor outlet
+
+    Returns
+    -------
+    float | np.ndarray
+        ideal work of compression (kJ/mol)
+    """
+    _exponent = (ratio_cp_cv - 1) / ratio_cp_cv
+    return (
+        _GAS_CONSTANT
+        * temperature_in
+        / _exponent
+        * ((pressure_out / pressure_in) ** _exponent - 1)
+        / 1000
+    )
+
+
+def water_detritiation(
+    thermal_power: ArrayLike, parameters: typing.Mapping[str, ArrayLike]
+) -> ArrayLike:
+    """Power consumed by the water detritiation system
+
+    Parameters
+    ----------
+    thermal_power : float | np.ndarray
+        peak thermal power (MW)
+    parameters : typing.Mapping[str, float | np.ndarray]
+        'water_detrit_power' parameters
+
+    Returns
+    -------
+    float | np.ndarray
+        electrical power consumed (W)
+    """
+    _p = parameters
+    _column_mass_flow = 100 * thermal_power / (1000 * 3600)
+    _electrolysis = (
+        _column_mass_flow * _p["electrolysisenergy.electrolysisspecificenergy"]
+    )
+
+    _vapour_fraction = _p["waterheating.vapourfraction"]
+    _reflux_ratio = 1 + _vapour_fraction / (1 - _vapour_fraction)
+    _heating = (
+        60
+        * thermal_power
+        / (1000 * 3600)
+        * (
+            _reflux_ratio
+            * _p["waterheating.watercp"]
+            * (_p["waterheating.watertargettemp"] - _p["waterheating.waterambienttemp"])
+            + _p["waterheating.latentheatvapourisation"] * _vapour_fraction
+        )
+    )
+
+    _compression = (
+        isentropic_work(
+            _p["gascompression.comptempin"],
+            _p["gascompression.hydrogenratiocpcv"],
+            _p["gascompression.comppressurein"],
+            _p["gascompression.comppressureout"],
+        )
+        * 1000
+        * _column_mass_flow
+        / 18
+        / _p["gascompression.isentropicefficiency"]
+    )
+
+    return (
+        1e3 * (1 + _p["contingencyfactor"]) * (_electrolysis + _heating + _compression)
+    )
+
+
+def air_gas_detritiation(
+    thermal_power: ArrayLike, parameters: typing.Mapping[str, ArrayLike]
+) -> ArrayLike:
+    """Power consumed by the air and gas detritiation system
+
+    Parameters
+    ----------
+    thermal_power : float | np.ndarray
+        peak thermal power (MW)
+    parameters : typing.Mapping[str, float | np.ndarray]
+        'air_gas_power' parameters
+
+    Returns
+    -------
+    float | np.ndarray
+        electrical power consumed (W)
+    """
+    _p = parameters
+    _vol_flow = (thermal_power / 1000) ** 0.6 * 3500
+    _mass_flow = _vol_flow / 3600 * (28.97 / 1000) * 101325 / (8.3145 * 293.15)
+
+    _recombiner = (
+        _mass_flow
+        * _p["recombinerheat.airheatcapacity"]
+        * (_p["recombinerheat.recombinertemp"] - _p["recombinerheat.airtempin"])
+    )
+
+    _feed_compressor = (
+        isentropic_work(
+            _p["compfeedgas.tempinlet"],
+            _p["compfeedgas.ratiocpcv"],
+            _p["compfeedgas.pressureinlet"],
+            _p["compfeedgas.pressureoutlet"],
+        )
+        * _mass_flow
+        * 1000
+        / (_p["compfeedgas.airmolweight"] * _p["compfeedgas.isentropicefficiency"])
+    )
+
+    _regen_time = _p["regenbedheating.adsorbentregentime"] * 3600
+    _temp_operating = _p["regenbedheating.adsorbenttempoperating"]
+    _temp_regen = _p["regenbedheating.adsorbenttempregen"]
+    _dry_mass = (
+        _p["regenbedheating.adsorbentbulkdensity"]
+        * _vol_flow
+        / _p["regenbedheating.adsorbentbedghsv"]
+    )
+    _bed_heating = (
+        _p["regenbedheating.waterlatentheatvaporisation"]
+        * _dry_mass
+        * _p["regenbedheating.adsorbentsaturationcapacity"]
+        / _regen_time
+        + _dry_mass
+        * _p["regenbedheating.adsorbentheatcapacity"]
+        * (_temp_regen - _temp_operating)
+        / _regen_time
+    )
+
+    _regen_mass_flow = (
+        (100 + _p["compregengas.airexcessamount"])
+        / 100
+        * _bed_heating
+        / (_p["compregengas.airspecificheat"] * (_temp_regen - _temp_operating))
+    )
+    _regen_compressor = (
+        isentropic_work(
+            _p["compregengas.airtempcompinlet"],
+            _p["compregengas.airratiocpcv"],
+            _p["compregengas.airpressureinlet"],
+            _p["compregengas.airpressureoutlet"],
+        )
+        * _regen_mass_flow
+        * 1000
+        / (_p["compregengas.airmolweight"] * _p["compregengas.isentropicefficiency"])
+    )
+    _regen_ratio = _p["compregengas.airratiocpcv"]
+    _temp_compressor_out = _p["compregengas.airtempcompinlet"] * (
+        _p["compregengas.airpressureoutlet"] / _p["compregengas.airpressureinlet"]
+    ) ** ((_regen_ratio - 1) / _regen_ratio)
+    _regen_air_heating = np.where(
+        _temp_compressor_out < _temp_regen,
+        _regen_mass_flow
+        * _p["compregengas.airspecificheat"]
+        * (_temp_regen - _temp_compressor_out),
+        0.0,
+    )
+
+    return (
+        1e3
+        * (1 + _p["contingencyfactor"])
+        * (
+            _bed_heating
+            + _feed_compressor
+            + _regen_compressor
+            + _regen_air_heating
+            + _recombiner
+        )
+    )
+
+
+def blanket_detritiation(
+    thermal_power: ArrayLike,
+    primary_coolant: typing.Any,
+    parameters: typing.Mapping[str, ArrayLike],
+) -> ArrayLike:
+    """Power consumed by the blanket detritiation system
+
+    Parameters
+    ----------
+    thermal_power : float | np.ndarray
+        peak thermal power (MW)
+    primary_coolant : str | np.ndarray
+        primary coolant type, the system only being required for
+        non-carrier coolants
+    parameters : typing.Mapping[str, float | np.ndarray]
+        'blanketdetritpower' parameters
+
+    Returns
+    -------
+    float | np.ndarray
+        electrical power consumed (W)
+    """
+    _p = parameters
+    _tritium_mass_flow = (
+        _p["tritiumbreedingrate.tritiuminput"]
+        * thermal_power
+        / 1e3
+        * _p["tritiumbreedingrate.burnrate"]
+        * _p["tritiumbreedingrate.tritiumbreedratio"]
+        / 100
+        * 6
+    )
+
+    _plasma_volume = 1000 * thermal_power / 1e3
+    _outer_radius = (_plasma_volume * 3 / (4 * np.pi)) ** (1 / 3) + 1
+    _blanket_volume = np.pi * 4 / 3 * _outer_radius**3 - _plasma_volume
+    _he_mass_flow = (
+        _blanket_volume
+        * _p["hestreamcalc.voidage"]
+        * _p["hestreamcalc.blanketvolumechangetime"]
+        * 4e-3
+        * 101325
+        / (8.3145 * 298 * 3600)
+    )
+
+    _he_compressor = (
+        _he_mass_flow
+        * isentropic_work(
+            _p["hegascompression.comptempin"],
+            _p["hegascompression.blanketcoolantratiocpcv"],
+            _p["hegascompression.comppressurein"],
+            _p["hegascompression.blanketpessure"],
+        )
+        * 1000
+        / (
+            _p["hegascompression.blanketcoolantmr"]
+            * _p["hegascompression.isentropicefficiency"]
+        )
+    )
+
+    _exchanger = (
+        _he_mass_flow
+        * _p["exchangerheatloss.hespecificheat"]
+        * _p["exchangerheatloss.exchangerdt"]
+    )
+
+    _getter_mass = (
+        _tritium_mass_flow
+        * 3600
+        * _p["getterbedregenheating.getteroperatingtime"]
+        / (1000 * _p["getterbedregenheating.gettersatcapacity"])
+    )
+    _getter_heating = (
+        _getter_mass
+        * _p["getterbedregenheating.getterheatcapacity"]
+        * (
+            _p["getterbedregenheating.gettertempregen"]
+            - _p["getterbedregenheating.gettertempoperating"]
+        )
+        / (_p["getterbedregenheating.getterregentime"] * 3600)
+    )
+
+    _purge_compressor = (
+        isentropic_work(
+            _p["getterregengascompression.comptempin"],
+            _p["getterregengascompression.blanketcoolantratiocpcv"],
+            _p["getterregengascompression.comppressurein"],
+            _p["getterregengascompression.comppressureout"],
+        )
+        * _tritium_mass_flow
+        / (_p["getterregengascompression.desiredtritiummolfrac"] * 6)
+        / _p["getterregengascompression.isentropicefficiency"]
+    )
+
+    _total = (
+        (1 + _p["contingencyfactor"])
+        * (_he_compressor + _getter_heating + _exchanger + _purge_compressor)
+        * 1e3
+    )
+
+    return np.where(
+        np.isin(_as_category(primary_coolant), NON_CARRIER_COOLANTS), _total, 0.0
+    )
+
+
+def waste_heat(
+    thermal_power: ArrayLike,
+    hcd_heat: ArrayLike,
+    magnet_heat: ArrayLike,
+    cryo_heat: ArrayLike,
+    parameters: typing.Mapping[str, ArrayLike],
+) -> ArrayLike:
+    """Parasitic load of the HVAC and cooling water waste heat systems
+
+    Parameters
+    ----------
+    thermal_power : float | np.ndarray
+        peak thermal power (MW)
+    hcd_heat : float | np.ndarray
+        heat dissipated by the heating and current drive system (W)
+    magnet_heat : float | np.ndarray
+        heat dissipated by the magnets (W)
+    cryo_heat : float | np.ndarray
+        heat dissipated by the cryogenic plant (W)
+    parameters : typing.Mapping[str, float | np.ndarray]
+        'wasteheatpower' parameters
+
+    Returns
+    -------
+    float | np.ndarray
+        electrical power consumed (W)
+    """
+    _p = parameters
+    _thermal_power = thermal_power / 1e3
+
+    _hvac_waste_heat = sum(
+        _p[f"hvacpower.{k}"]
+        for k in (
+            "elecpowersupply",
+            "hx",
+            "pipeheatloss",
+            "eleccub",
+            "distboards",
+            "compairsupply",
+            "rf",
+        )
+    )
+    _hvac_load = (
+        _p["hvacpower.sf1"] * _thermal_power + _p["hvacpower.sf2"]
+    ) * _hvac_waste_heat
+    _density = _p["hvacpower.densitywater"]
+    _velocity = _p["hvacpower.velocity"]
+    _velocity_head = _velocity**2 / (2 * 9.81)
+    _reynolds = (
+        _density * _velocity * _p["hvacpower.diameter"] / _p["hvacpower.viscosity"]
+    )
+    _total_head = (
+        _velocity_head
+        + _p["hvacpower.fittingconstant"] * _velocity_head
+        + 0.079
+        / _reynolds**0.25
+        * (_p["hvacpower.length"] / _p["hvacpower.diameter"])
+        * _velocity_head
+        + _p["hvacpower.elevationlosses"]
+    )
+    _hvac_pumping = (
+        _hvac_load
+        / (_p["hvacpower.dt"] * _p["hvacpower.cpwater"])
+        * 1000
+        / _density
+        * 3600
+        * _density
+        * 9.81
+        * _total_head
+        / 3.6e6
+        / _p["hvacpower.pumpefficiency"]
+        * 0.001
+    )
+    _hvac_power = _hvac_load * _p["hvacpower.s"] + _hvac_pumping
+
+    # The heat received from other subsystems replaces the default magnet,
+    # cryoplant and RF loads of the cooling water model
+    _water_waste_heat = (
+        sum(
+            _p[f"pumpingpower.{k}"]
+            for k in (
+                "vacvessel",
+                "primpumping",
+                "agdetrit",
+                "wdetrit",
+                "vacturbo",
+                "vacroughcg",
+                "vacmotor",
+                "asu",
+                "rpc",
+                "scpump",
+                "generator",
+                "turbinewasteheat",
+            )
+        )
+        + (hcd_heat + magnet_heat + cryo_heat) / 1e6
+    )
+    _cooling_load = (
+        _p["pumpingpower.sf1"] * _thermal_power + _p["pumpingpower.sf2"]
+    ) * _water_waste_heat
+    _g = _p["pumpingpower.g"]
+    _water_density = _p["pumpingpower.waterdensity"]
+    _pipe_head = _p["pumpingpower.v"] ** 2 / (2 * _g)
+    _dynamic_head = (
+        _p["pumpingpower.ff"]
+        * (_p["pumpingpower.length"] / _p["pumpingpower.diameter"])
+        * _pipe_head
+        + _pipe_head * 100
+    )
+    _flow_rate = (
+        _p["pumpingpower.flowratescale"]
+        * _cooling_load
+        * 1.025
+        / 0.00103
+        / _water_density
+    )
+    _pumping = _flow_rate * 3600 * _water_density * _g * _dynamic_head / 3.6e6
+    _cooling_power = (
+        _p["pumpingpower.inducedtowerscale"] * _cooling_load + _pumping / 1000
+    )
+
+    return (_hvac_power + _cooling_power) * 1e6
+
+
+def power_generation_efficiency(
+    primary_coolant: typing.Any,
+    secondary_coolant: typing.Any,
+    ratio_type: typing.Any,
+    system_pressure: typing.Any,
+    outlet_temperature: ArrayLike,
+) -> np.ndarray:
+    """Thermal to electric conversion efficiency of the power generation cases
+
+    Parameters
+    ----------
+    primary_coolant : str | np.ndarray
+        primary coolant type
+    secondary_coolant : str | np.ndarray
+        secondary coolant type, 'CO2' or 'H2O'
+    ratio_type : str | np.ndarray
+        compression ratio for a CO2 secondary coolant
+    system_pressure : str | np.ndarray
+        system pressure for a H2O secondary coolant
+    outlet_temperature : float | np.ndarray
+        power generation outlet temperature (degC)
+
+    Returns
+    -------
+    np.ndarray
+        efficiency, NaN where no case exists for the given selection
+    """
+    _primary, _secondary, _ratio, _pressure, _t = (
+        np.atleast_1d(a)
+        for a in np.broadcast_arrays(
+            _as_category(primary_coolant),
+            _as_category(secondary_coolant),
+            _as_category(ratio_type),
+            _as_category(system_pressure),
+            np.asarray(outlet_temperature, dtype=float),
+        )
+    )
+
+    _cases = POWER_GENERATION_CASES.reindex(
+        pd.MultiIndex.from_arrays(
+            [
+                pd.Series(_primary).map(POWER_GENERATION_MODELS).to_numpy(),
+                _secondary,
+                np.where(_secondary == "CO2", _ratio, _pressure),
+            ]
+        )
+    )
+
+    _efficiency = (
+        _cases["a"].to_numpy() * _t**4
+        + _cases["b"].to_numpy() * _t**3
+        - _cases["c"].to_numpy() * _t**2
+        + _cases["d"].to_numpy() * _t
+        - _cases["e"].to_numpy()
+    )
+    _in_range = (_t >= _cases["t_min"].to_numpy()) & (_t < _cases["t_max"].to_numpy())
+
+    return np.where(_in_range, _efficiency, np.nan)
+
+
+def power_generated(
+    thermal_power: ArrayLike,
+    efficiency: ArrayLike,
+    parameters: typing.Mapping[str, ArrayLike],
+) -> ArrayLike:
+    """Electrical power generated at the flat-top
+
+    Parameters
+    ----------
+    thermal_power : float | np.ndarray
+        flat-top thermal power (MW)
+    efficiency : float | np.ndarray
+        efficiency of the power generation case
+    parameters : typing.Mapping[str, float | np.ndarray]
+        'powergenerated' parameters, which may replace the case efficiency
+        with a fixed value
+
+    Returns
+    -------
+    float | np.ndarray
+        electrical power generated (W)
+    """
+    _efficiency = np.where(
+        np.asarray(parameters["usepowergeneffvalue"], dtype=bool),
+        parameters["powergeneff"],
+        efficiency,
+    )
+    return thermal_power * 1e6 * _efficiency
+
+
+class ScreeningEvaluator:
+    """Vectorised flat-top evaluation of the algebraic subsystems"""
+
+    def __init__(
+        self,
+        parameters: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        structural_parameters: typing.Optional[
+            typing.Mapping[str, typing.Mapping[str, typing.Any]]
+        ] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        parameters : typing.Mapping[str, typing.Any], optional
+            base parameter values addressed as within the PBM parameter set,
+            i.e. 'tokamak.interdependencies.<subsystem>.<parameter>',
+            overriding the Modelica defaults
+        structural_parameters : typing.Mapping[str, typing.Mapping[str, typing.Any]], optional
+            base structural parameter values by section as read from the
+            structural parameters file
+        """
+        _prefix = f"{MODEL_NAME.lower()}."
+
+        self._base: typing.Dict[str, typing.Any] = {
+            f"{subsystem}.{name}": value
+            for subsystem, defaults in DEFAULT_PARAMETERS.items()
+            for name, value in defaults.items()
+        }
+        self._base[THERMAL_POWER] = 1000.0
+        self._base.update(DEFAULT_STRUCTURAL_PARAMETERS)
+
+        for name, value in (parameters or {}).items():
+            _name = name.lower()
+            _name = _name[len(_prefix) :] if _name.startswith(_prefix) else _name
+            if _name in self._base:
+                self._base[_name] = value
+
+        for section, values in (structural_parameters or {}).items():
+            for name, value in values.items():
+                _name = f"{section}.{name}".lower()
+                if _name in self._base:
+                    self._base[_name] = value
+
+    @property
+    def parameters(self) -> typing.List[str]:
+        """Names of the parameters which can be varied"""
+        return [*self._base, *WASTE_HEAT_INPUTS]
+
+    def _inputs(self, table: pd.DataFrame) -> typing.Dict[str, typing.Any]:
+        _prefix = f"{MODEL_NAME.lower()}."
+        _inputs = dict(self._base)
+
+        for column in table.columns:
+            _name = str(column).lower()
+            _name = _name[len(_prefix) :] if _name.startswith(_prefix) else _name
+
+            if _name not in _inputs and _name not in WASTE_HEAT_INPUTS:
+                raise pbm_exc.UnidentifiedParameterError(
+                    f"Cannot screen parameter '{column}', available parameters "
+                    "are:\n\t- " + "\n\t- ".join(self.parameters)
+                )
+
+            _values = table[column].to_numpy()
+            _inputs[_name] = (
+                _values.astype(float)
+                if np.issubdtype(_values.dtype, np.number)
+                else _values
+            )
+
+        return _inputs
+
+    def evaluate(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Evaluate the flat-top power of each subsystem for every row
+
+        The waste heat load is only evaluated if the heat received from the
+        heating and current drive, magnet and cryogenic subsystems is given,
+        these being dynamic subsystems which cannot be screened.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            parameter values for each evaluation, parameters absent from
+            the table taking their base values
+
+        Returns
+        -------
+        pd.DataFrame
+            flat-top power (W) of each subsystem for every row, with the
+            column names of the simulation results
+
+        Raises
+        ------
+        power_balance.exceptions.UnidentifiedParameterError
+            if a column does not correspond to a screened parameter
+        """
+        _inputs = self._inputs(table)
+        _thermal_power = _inputs[THERMAL_POWER]
+
+        def _subsystem(name: str) -> typing.Dict[str, typing.Any]:
+            return {key: _inputs[f"{name}.{key}"] for key in DEFAULT_PARAMETERS[name]}
+
+        _efficiency = power_generation_efficiency(
+            _inputs["tokamak.primarycoolanttype"],
+            _inputs["tokamak.secondarycoolanttype"],
+            _inputs["tokamak.ratiotype"],
+            _inputs["tokamak.systempressure"],
+            _inputs["powergenequations.powergenoutlettemp"],
+        )
+
+        _outputs = {
+            "air_gas_power": air_gas_detritiation(
+                _thermal_power, _subsystem("air_gas_power")
+            ),
+            "blanketdetritpower": blanket_detritiation(
+                _thermal_power,
+                _inputs["tokamak.primarycoolanttype"],
+                _subsystem("blanketdetritpower"),
+            ),
+            "water_detrit_power": water_detritiation(
+                _thermal_power, _subsystem("water_detrit_power")
+            ),
+            "powergenerated": power_generated(
+                _thermal_power, _efficiency, _subsystem("powergenerated")
+            ),
+        }
+
+        if all(name in _inputs for name in WASTE_HEAT_INPUTS):
+            _outputs["wasteheatpower"] = waste_heat(
+                _thermal_power,
+                *(_inputs[name] for name in WASTE_HEAT_INPUTS),
+                _subsystem("wasteheatpower"),
+            )
+
+        return pd.DataFrame(
+            {
+                name: np.broadcast_to(values, (len(table),))
+                for name, values in _outputs.items()
+            },
+            index=table.index,
+        )
@@ -0,0 +1,374 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Solver Tuning
+=============
+
+Selection of the OpenModelica solver and tolerance for a PBM session. A
+reference simulation is run using the current simulation options, each
+candidate solver and tolerance combination is then simulated and the
+flat-top averages of every model output compared against those of the
+reference. The fastest combination whose averages all lie within the
+given error bounds is recommended.
+
+Contents
+========
+
+Classes
+-------
+
+    SolverTuner - runs and compares candidate solver settings for a session
+
+Functions
+---------
+
+    flat_top_averages - flat-top average of every output of a model
+    compare_averages - relative error of each average against a reference
+
+"""
+
+__date__ = "2026-10-19"
+
+import itertools
+import logging
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+import prettytable
+import pydelica
+
+import power_balance.calc.summary as pbm_summary
+import power_balance.exceptions as pbm_exc
+
+if typing.TYPE_CHECKING:
+    import power_balance.core
+
+DEFAULT_SOLVERS: typing.Tuple[str, ...] = ("dassl", "ida", "cvode", "rungekutta")
+DEFAULT_TOLERANCES: typing.Tuple[float, ...] = (1e-4, 1e-6, 1e-8)
+
+# Failures of a candidate simulation which disqualify it rather than
+# terminating the tuning
+_SIMULATION_ERRORS = (
+    pydelica.exception.OMExecutionError,
+    pydelica.exception.OMAssertionError,
+    ZeroDivisionError,
+    pbm_exc.InvalidInputError,
+)
+
+REPORT_COLUMNS: typing.List[str] = [
+    "solver",
+    "tolerance",
+    "time",
+    "speedup",
+    "max_error",
+    "worst_output",
+    "acceptable",
+    "status",
+]
+
+
+def flat_top_averages(
+    data: pd.DataFrame, plasma_scenario: typing.Mapping[str, float]
+) -> pd.Series:
+    """Flat-top average of every output of a model
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        outputs of a single model run including a 'time' column
+    plasma_scenario : typing.Mapping[str, float]
+        plasma scenario defining the flat-top
+
+    Returns
+    -------
+    pd.Series
+        average of each numeric output across the flat-top
+    """
+    _outputs = data.drop(columns="time").select_dtypes("number")
+    return pd.Series(
+        pbm_summary.flat_top_average(
+            data["time"].to_numpy(), _outputs.to_numpy().T, plasma_scenario
+        ),
+        index=_outputs.columns,
+    )
+
+
+def compare_averages(
+    averages: pd.Series, reference: pd.Series, atol: float = 1.0
+) -> pd.Series:
+    """Relative error of each flat-top average against a reference
+
+    Parameters
+    ----------
+    averages : pd.Series
+        flat-top averages for a candidate run
+    reference : pd.Series
+        flat-top averages for the reference run
+    atol : float, optional
+        absolute difference below which outputs are considered equal,
+        preventing outputs with a near zero reference from dominating,
+        by default 1.0
+
+    Returns
+    -------
+    pd.Series
+        relative error of each output, infinite for outputs absent from
+        the candidate run
+    """
+    _averages = averages.reindex(reference.index)
+    _difference = (_averages - reference).abs()
+    _difference[_difference <= atol] = 0.0
+    _errors = _difference / reference.abs().clip(lower=atol)
+    return _errors.fillna(np.inf)
+
+
+class SolverTuner:
+    """Runs and compares candidate solver settings for a PBM session"""
+
+    def __init__(
+        self,
+        power_balance: "power_balance.core.PowerBalance",
+        rtol: float = 1e-3,
+        atol: float = 1.0,
+        repeats: int = 1,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        power_balance : power_balance.core.PowerBalance
+            session with the models to tune already built
+        rtol : float, optional
+            maximum relative error in any flat-top average for a candidate
+            to be acceptable, by default 1E-3
+        atol : float, optional
+            absolute difference below which flat-top averages are considered
+            equal, by default 1.0
+        repeats : int, optional
+            number of times each setting is simulated, the fastest run
+            being used for the timing, by default 1
+        """
+        self._logger = logging.getLogger("PowerBalance.Tuning")
+        self._power_balance = power_balance
+        self._rtol = rtol
+        self._atol = atol
+        self._repeats = max(repeats, 1)
+        self._plasma_scenario = power_balance.plasma_scenario
+        self._reference_options = {
+            option: power_balance.get_simulation_options(option)
+            for option in ("solver", "tolerance")
+        }
+        self._reference: typing.Optional[typing.Dict[str, pd.Series]] = None
+        self._reference_time: float = np.nan
+
+    def _simulate(
+        self, solver: str, tolerance: float
+    ) -> typing.Tuple[typing.Dict[str, pd.Series], float]:
+        self._power_balance.set_simulation_options(solver=solver, tolerance=tolerance)
+
+        _times: typing.List[float] = []
+
+        for _ in range(self._repeats):
+            _start = time.perf_counter()
+            _outputs = self._power_balance._run_models()
+            _times.append(time.perf_counter() - _start)
+
+        _averages = {
+            model: flat_top_averages(data, self._plasma_scenario)
+            for model, data in _outputs.items()
+        }
+
+        return _averages, min(_times)
+
+    def reference(self) -> typing.Dict[str, pd.Series]:
+        """Flat-top averages of the reference run, simulating if required
+
+        Returns
+        -------
+        typing.Dict[str, pd.Series]
+            flat-top averages of each output for each model
+        """
+        if self._reference is None:
+            self._logger.info(
+                "Running reference simulation: solver=%s, tolerance=%s",
+                self._reference_options["solver"],
+                self._reference_options["tolerance"],
+            )
+            self._reference, self._reference_time = self._simulate(
+                **self._reference_options
+            )
+        return self._reference
+
+    def evaluate(self, solver: str, tolerance: float) -> typing.Dict[str, typing.Any]:
+        """Simulate a single candidate setting and compare to the reference
+
+        Parameters
+        ----------
+        solver : str
+            OpenModelica solver
+        tolerance : float
+            solver tolerance
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            report entry containing the run time, speedup relative to the
+            reference, the maximum relative error and the output it occurred
+            in, and whether the setting is acceptable
+        """
+        _reference = self.reference()
+
+        self._logger.info(
+            "Running candidate simulation: solver=%s, tolerance=%s",
+            solver,
+            tolerance,
+        )
+
+        _entry: typing.Dict[str, typing.Any] = {
+            "solver": solver,
+            "tolerance": tolerance,
+            "time": np.nan,
+            "speedup": np.nan,
+            "max_error": np.nan,
+            "worst_output": "",
+            "acceptable": False,
+            "status": "",
+        }
+
+        try:
+            _averages, _entry["time"] = self._simulate(solver, tolerance)
+        except _SIMULATION_ERRORS as e:
+            _entry["status"] = f"{type(e).__name__}: {e}".splitlines()[0]
+            return _entry
+
+        _errors = pd.concat(
+            {
+                model: compare_averages(
+                    _averages.get(model, pd.Series(dtype=float)),
+                    reference,
+                    self._atol,
+                )
+                for model, reference in _reference.items()
+            }
+        )
+
+        _entry["speedup"] = self._reference_time / _entry["time"]
+
+        if not _errors.empty:
+            _worst = _errors.idxmax()
+            _entry["max_error"] = _errors[_worst]
+            _entry["worst_output"] = ".".join(_worst)
+
+        _entry["acceptable"] = bool((_errors <= self._rtol).all())
+        _entry["status"] = "ok" if _entry["acceptable"] else "outside bounds"
+
+        return _entry
+
+    def run(
+        self,
+        solvers: typing.Iterable[str] = DEFAULT_SOLVERS,
+        tolerances: typing.Iterable[float] = DEFAULT_TOLERANCES,
+    ) -> pd.DataFrame:
+        """Evaluate all combinations of the given solvers and tolerances
+
+        The simulation options of the session are restored afterwards.
+
+        Parameters
+        ----------
+        solvers : typing.Iterable[str], optional
+            solvers to try
+        tolerances : typing.Iterable[float], optional
+            tolerances to try
+
+        Returns
+        -------
+        pd.DataFrame
+            report containing an entry for the reference and each candidate
+            ordered from fastest to slowest
+        """
+        try:
+            self.reference()
+
+            _entries = [
+                {
+                    **self._reference_options,
+                    "time": self._reference_time,
+                    "speedup": 1.0,
+                    "max_error": 0.0,
+                    "worst_output": "",
+                    "acceptable": True,
+                    "status": "reference",
+                }
+            ]
+
+            for solver, tolerance in itertools.product(solvers, tolerances):
+                _entries.append(self.evaluate(solver, tolerance))
+        finally:
+            self._power_balance.set_simulation_options(**self._reference_options)
+
+        return (
+            pd.DataFrame(_entries, columns=REPORT_COLUMNS)
+            .sort_values("time", kind="stable", na_position="last")
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def recommend(report: pd.DataFrame) -> typing.Dict[str, typing.Any]:
+        """Select the fastest acceptable setting from a tuning report
+
+        Parameters
+        ----------
+        report : pd.DataFrame
+            report as returned by 'run'
+
+        Returns
+        -------
+        typing.Dict[str, typing.Any]
+            the solver and tolerance of the fastest acceptable setting
+        """
+        _acceptable = report[report["acceptable"]]
+        _fastest = _acceptable.loc[_acceptable["time"].idxmin()]
+        return {"solver": _fastest["solver"], "tolerance": float(_fastest["tolerance"])}
+
+    @staticmethod
+    def report_table(report: pd.DataFrame) -> str:
+        """Tuning report as a printable table
+
+        Parameters
+        ----------
+        report : pd.DataFrame
+            report as returned by 'run'
+
+        Returns
+        -------
+        str
+            table of timings and errors for each setting
+        """
+        _table = prettytable.PrettyTable(
+            [
+                "Solver",
+                "Tolerance",
+                "Time/s",
+                "Speedup",
+                "Max Rel. Error",
+                "Worst Output",
+                "Status",
+            ]
+        )
+        _table.align["Worst Output"] = "l"
+
+        for row in report.itertuples(index=False):
+            _table.add_row(
+                [
+                    row.solver,
+                    f"{row.tolerance:.0e}",
+                    f"{row.time:.3f}",
+                    f"{row.speedup:.2f}",
+                    f"{row.max_error:.2e}",
+                    row.worst_output,
+                    row.status,
+                ]
+            )
+
+        return f"{_table}"
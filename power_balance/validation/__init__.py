@@ -13,6 +13,7 @@ Submodules
 ----------
 
     config - validation of API configuration files
+    manifest - validation of batch run manifests
     modelica_simulation_options - validation of modelica simulation option files
 
 """
@@ -14,6 +14,14 @@ Validator classes
 -----------------
 
     SweepMode - allowed options for sweep mode
+    SweepStorage - allowed layouts for storage of sweep results
+    ProfileFormat - allowed table formats for generated profiles
+    OutputGrid - allowed output time grids for simulation results
+    SurrogateMethod - allowed methods for surrogate models of sweep results
+    StorageFormat - allowed back-ends for storage of model outputs
+    CampaignModel - checks the campaign definition of a configuration
+    SurrogateModel - checks the surrogate definition of a configuration
+    StorageModel - checks the result storage options of a configuration
     ConfigModel - checks the API configuration file
 
 Functions
@@ -44,6 +52,34 @@ class SweepMode(str, enum.Enum):
     COMBINATIONS = "combinations"
 
 
+class SweepStorage(str, enum.Enum):
+    FRAME = "frame"
+    DENSE = "dense"
+
+
+class ProfileFormat(str, enum.Enum):
+    DENSE = "dense"
+    KNOTS = "knots"
+
+
+class OutputGrid(str, enum.Enum):
+    EQUIDISTANT = "equidistant"
+    EVENTS = "events"
+
+
+class SurrogateMethod(str, enum.Enum):
+    RBF = "rbf"
+    GP = "gp"
+    POLYNOMIAL = "polynomial"
+
+
+class StorageFormat(str, enum.Enum):
+    HDF5 = "hdf5"
+    PARQUET = "parquet"
+    ZARR = "zarr"
+    NPZ = "npz"
+
+
 class AssertLevels(str, enum.Enum):
     NEVER = "never"
     ERROR = "error"
@@ -55,6 +91,90 @@ class AssertLevels(str, enum.Enum):
 NOT_A_PATH_REGEX = "^[^/]+$"
 
 
+class CampaignModel(pydantic.BaseModel):
+    pulses: pydantic.PositiveInt = pydantic.Field(
+        ..., title="Pulse Count", description="Number of pulses in the campaign"
+    )
+    dwell: pydantic.NonNegativeFloat = pydantic.Field(
+        0.0,
+        title="Dwell Time",
+        description="Time between the end of one pulse and the start of the next",
+    )
+    periodicity_rtol: pydantic.PositiveFloat = pydantic.Field(
+        1e-3,
+        title="Periodicity Tolerance",
+        description="Maximum relative mismatch between the initial and final "
+        "state of a simulated pulse",
+    )
+    overrides: typing.Dict[str, typing.Dict[str, typing.Any]] = pydantic.Field(
+        {},
+        title="Pulse Overrides",
+        description="Parameter values for individual pulses keyed by pulse number",
+    )
+    model_config = pbm_check.MODEL_CONFIG
+
+    @pydantic.field_validator("overrides")
+    def check_overrides(cls, values: typing.Dict[str, typing.Dict[str, typing.Any]]):
+        for pulse in values:
+            if not pulse.isdigit():
+                raise AssertionError(
+                    f"Expected pulse number for campaign override, got '{pulse}'"
+                )
+        return {pulse: flatten_dictionary(params) for pulse, params in values.items()}
+
+
+class SurrogateModel(pydantic.BaseModel):
+    metrics: typing.List[str] = pydantic.Field(
+        ["netpowergeneration"],
+        title="Metrics",
+        description="Metrics of the model outputs approximated by the surrogate",
+    )
+    method: SurrogateMethod = pydantic.Field(
+        SurrogateMethod.RBF,
+        title="Method",
+        description="Method used to fit the surrogate to the sweep results",
+    )
+    folds: int = pydantic.Field(
+        5, ge=2, title="Folds", description="Number of cross-validation folds"
+    )
+    options: typing.Dict[str, typing.Any] = pydantic.Field(
+        {},
+        title="Method Options",
+        description="Options of the method such as the polynomial degree",
+    )
+    model_config = pbm_check.MODEL_CONFIG
+
+
+class StorageModel(pydantic.BaseModel):
+    format: StorageFormat = pydantic.Field(
+        StorageFormat.HDF5,
+        title="Storage Format",
+        description="Back-end used to store the outputs of each model",
+    )
+    compression: typing.Optional[str] = pydantic.Field(
+        None,
+        title="Compression",
+        description="Compression algorithm, by default 'blosc:zstd' for HDF5, "
+        "'zstd' for Parquet and Zarr and 'zlib' for NPZ",
+    )
+    complevel: int = pydantic.Field(
+        5, ge=0, le=9, title="Compression Level", description="Compression level"
+    )
+    float32: bool = pydantic.Field(
+        False,
+        title="Single Precision",
+        description="Store output variables at single precision, time and "
+        "sweep parameters being kept at double precision",
+    )
+    chunk_rows: typing.Optional[pydantic.PositiveInt] = pydantic.Field(
+        None,
+        title="Chunk Rows",
+        description="Rows per chunk, by default whole sweep cuts up to "
+        "roughly a megabyte",
+    )
+    model_config = pbm_check.MODEL_CONFIG
+
+
 class ConfigModel(pydantic.BaseModel):
     models: typing.List[str] = pydantic.Field(
         ..., title="Models List", description="List of modelica models to run"
@@ -105,6 +225,80 @@ class ConfigModel(pydantic.BaseModel):
         title="Sweep Definitions",
         description="Dictionary containing sweep values for parameters",
     )
+    sweep_storage: SweepStorage = pydantic.Field(
+        SweepStorage.FRAME,
+        title="Sweep Storage",
+        description="Layout used when storing parameter sweep results",
+    )
+    storage: StorageModel = pydantic.Field(
+        default_factory=StorageModel,
+        title="Result Storage",
+        description="Back-end, compression and precision used to store the "
+        "outputs of each model",
+    )
+    profile_format: ProfileFormat = pydantic.Field(
+        ProfileFormat.DENSE,
+        title="Profile Format",
+        description="Table format of generated input profiles, 'knots' "
+        "storing only the points at which a profile changes gradient",
+    )
+    output_grid: OutputGrid = pydantic.Field(
+        OutputGrid.EQUIDISTANT,
+        title="Output Grid",
+        description="Time grid of simulation outputs, 'events' retaining the "
+        "output points at each event in addition to the equidistant grid",
+    )
+    campaign: typing.Optional[CampaignModel] = pydantic.Field(
+        None,
+        title="Campaign",
+        description="Campaign of repeated pulses assembled from simulations "
+        "of the distinct pulses",
+    )
+    surrogate: typing.Optional[SurrogateModel] = pydantic.Field(
+        None,
+        title="Surrogate",
+        description="Surrogate model fitted to the results of a parameter sweep",
+    )
+    persistent_compiler: bool = pydantic.Field(
+        False,
+        title="Persistent Compiler",
+        description="Build models using a shared interactive OMC process "
+        "with the Modelica libraries preloaded",
+    )
+    trace: bool = pydantic.Field(
+        False,
+        title="Trace Session",
+        description="Record a timeline of the session phases as a Chrome "
+        "trace event file",
+    )
+    solver_statistics: bool = pydantic.Field(
+        False,
+        title="Solver Statistics",
+        description="Record the OpenModelica solver statistics of every simulation",
+    )
+    catalogue: bool = pydantic.Field(
+        True,
+        title="Catalogue Session",
+        description="Record the session within the SQLite session catalogue",
+    )
+    catalogue_file: str = pydantic.Field(
+        "Default",
+        title="Catalogue File",
+        description="SQLite session catalogue, by default the 'PBM_CATALOGUE' "
+        "environment variable or '~/.powerbalance/catalogue.db'",
+    )
+    blob_store: bool = pydantic.Field(
+        False,
+        title="Input Blob Store",
+        description="Store the session profiles and parameters once within a "
+        "content-addressed store shared between sessions",
+    )
+    blob_store_directory: str = pydantic.Field(
+        "Default",
+        title="Blob Store Directory",
+        description="Input blob store, by default the 'PBM_BLOB_STORE' "
+        "environment variable or '.pbm_blobs' within the output directory",
+    )
     model_config = pbm_check.MODEL_CONFIG
 
     @pydantic.model_validator(mode="before")
@@ -170,10 +364,38 @@ class ConfigModel(pydantic.BaseModel):
 
         return self
 
+    @pydantic.model_validator(mode="after")
+    def check_output_grid(self):
+        # Output points at the profile breakpoints are emitted as events by
+        # the profile tables, which only occurs for knot profiles
+        if self.output_grid != OutputGrid.EVENTS:
+            return self
+
+        if (
+            "profile_format" in self.model_fields_set
+            and self.profile_format != ProfileFormat.KNOTS
+        ):
+            raise AssertionError(
+                "Output grid 'events' requires the profile format 'knots'"
+            )
+
+        self.profile_format = ProfileFormat.KNOTS.value
+
+        return self
+
+    @pydantic.model_validator(mode="after")
+    def check_campaign(self):
+        if self.campaign and self.sweep:
+            raise AssertionError(
+                "Parameter sweeps cannot be combined with a campaign, "
+                "use campaign overrides to vary parameters between pulses"
+            )
+        return self
+
     # 'dummy' validators which act as post-validation tidy up methods
     @pydantic.model_validator(mode="after")
     def prepare_key_values(self):
-        """Remove keys from sweep if not required"""
+        """Remove sweep, campaign and surrogate keys if not required"""
         if hasattr(self, "sweep"):
             if self.sweep:
                 self.sweep = flatten_dictionary(self.sweep)
@@ -181,6 +403,10 @@ class ConfigModel(pydantic.BaseModel):
                 delattr(self, "sweep")
                 if hasattr(self, "sweep_mode"):
                     delattr(self, "sweep_mode")
+        if hasattr(self, "campaign") and not self.campaign:
+            delattr(self, "campaign")
+        if hasattr(self, "surrogate") and not self.surrogate:
+            delattr(self, "surrogate")
         return self
 
     @pydantic.model_validator(mode="after")
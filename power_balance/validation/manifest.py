@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Batch Manifest Validation
+=========================
+
+Validation of the manifest listing the sessions of a batch run.
+
+Contents
+========
+
+Validator classes
+-----------------
+
+    ManifestEntryModel - checks the inputs of a single batch session
+    ManifestModel - checks a batch manifest
+
+"""
+
+__date__ = "2026-10-19"
+
+import typing
+
+import pydantic
+
+import power_balance.validation as pbm_check
+from power_balance.configs import config_default
+from power_balance.validation.config import NOT_A_PATH_REGEX
+
+
+class ManifestEntryModel(pydantic.BaseModel):
+    name: typing.Optional[str] = pydantic.Field(
+        None,
+        title="Entry Name",
+        pattern=NOT_A_PATH_REGEX,
+        description="Name of the session output directory, by default 'entry_<index>'",
+    )
+    config: str = pydantic.Field(
+        config_default, title="Configuration File", description="TOML configuration"
+    )
+    param_dir: str = pydantic.Field(
+        "Default",
+        title="Parameter Directory",
+        description="Directory containing parameter files",
+    )
+    profiles_dir: str = pydantic.Field(
+        "Default",
+        title="Profiles Directory",
+        description="Directory containing profile files",
+    )
+    model_dir: str = pydantic.Field(
+        "Default",
+        title="Modelica File Directory",
+        description="Directory containing Modelica model files",
+    )
+    model_config = pbm_check.MODEL_CONFIG
+
+
+class ManifestModel(pydantic.BaseModel):
+    workers: pydantic.PositiveInt = pydantic.Field(
+        1, title="Workers", description="Number of sessions run concurrently"
+    )
+    entries: typing.List[ManifestEntryModel] = pydantic.Field(
+        ..., min_length=1, title="Entries", description="Sessions of the batch"
+    )
+    model_config = pbm_check.MODEL_CONFIG
+
+    @pydantic.field_validator("entries")
+    def check_names(cls, values: typing.List[ManifestEntryModel]):
+        for i, entry in enumerate(values):
+            entry.name = entry.name or f"entry_{i}"
+
+        _names = [entry.name for entry in values]
+
+        if _duplicates := sorted({i for i in _names if _names.count(i) > 1}):
+            raise AssertionError(
+                f"Batch entry names must be unique, duplicates: {', '.join(_duplicates)}"
+            )
+
+        return values
@@ -51,6 +51,13 @@ def _model_list():
 MODELS = _model_list()
 
 
+@pytest.fixture(autouse=True)
+def session_catalogue(tmp_path, monkeypatch):
+    # Sessions run by the tests are not recorded in the user's catalogue
+    monkeypatch.setenv("PBM_CATALOGUE", str(tmp_path / "catalogue.db"))
+    monkeypatch.setenv("PBM_BLOB_STORE", str(tmp_path / "blobs"))
+
+
 @pytest.fixture
 def test_directory():
     return os.path.dirname(__file__)
@@ -13,6 +13,7 @@ import pytest
 import toml
 
 import power_balance.core
+import power_balance.screening as pbm_screen
 from power_balance.calc.efficiencies import (
     calc_heating_to_elec_eff,
     calc_thermal_to_elec_eff,
@@ -243,3 +244,82 @@ def test_thermal2elec_eff_consistency(generate_profiles):
     assert _eff_out._denom_label == _test_data["efficiency"]._denom_label
     assert _eff_out._nums == _test_data["efficiency"]._nums
     assert _eff_out.value() == _test_data["efficiency"].value()
+
+
+def _flatten_parameters(parameters: dict, prefix: str) -> dict:
+    _flat = {}
+    for name, value in parameters.items():
+        if isinstance(value, dict):
+            _flat.update(_flatten_parameters(value, f"{prefix}.{name}"))
+        else:
+            _flat[f"{prefix}.{name}"] = value
+    return _flat
+
+
+@pytest.mark.consistency
+@pytest.mark.screening
+def test_screening_baseline_consistency():
+    _baseline_dir = os.path.join(
+        pathlib.Path(os.path.dirname(__file__)).parent, "baseline", "run_data"
+    )
+    _parameters = _flatten_parameters(
+        toml.load(
+            os.path.join(_baseline_dir, "parameters", "tokamak_interdependencies.toml")
+        ),
+        pbm_screen.MODEL_NAME.lower(),
+    )
+    _structural = toml.load(
+        os.path.join(_baseline_dir, "parameters", "structural_parameters.toml")
+    )
+    _baseline = pd.read_hdf(
+        os.path.join(_baseline_dir, "data", "session_data.h5"),
+        key="tokamak_interdependencies",
+    )
+    _plasma = toml.load(
+        os.path.join(_baseline_dir, "parameters", "plasma_scenario.toml")
+    )
+    _mid_flat_top = 0.5 * (
+        _plasma["plasma_flat_top_start"] + _plasma["plasma_flat_top_end"]
+    )
+    _flat_top = _baseline.iloc[(_baseline["time"] - _mid_flat_top).abs().argmin()]
+
+    _screened = pbm_screen.ScreeningEvaluator(_parameters, _structural).evaluate(
+        pd.DataFrame(index=[0])
+    )
+
+    for column in _screened:
+        assert np.isclose(_screened[column][0], _flat_top[column], rtol=1e-9)
+
+
+@pytest.mark.consistency
+@pytest.mark.screening
+def test_screening_simulation_consistency(pbm_instance):
+    _simulated = pbm_instance._run_models()[pbm_screen.MODEL_NAME]
+    _solutions = pbm_instance.pydelica_session.get_solutions()[
+        pbm_screen.MODEL_NAME
+    ]
+    _mid_flat_top = 0.5 * (
+        pbm_instance.plasma_scenario["plasma_flat_top_start"]
+        + pbm_instance.plasma_scenario["plasma_flat_top_end"]
+    )
+    _flat_top = _solutions.iloc[(_solutions["time"] - _mid_flat_top).abs().argmin()]
+
+    _heat_loads = pd.DataFrame(
+        {
+            name: [_flat_top[column]]
+            for name, column in zip(
+                pbm_screen.WASTE_HEAT_INPUTS,
+                (
+                    "wasteheatpower.HCDheat",
+                    "wasteheatpower.Magnetheat",
+                    "wasteheatpower.Cryoheat",
+                ),
+            )
+        }
+    )
+
+    _screened = pbm_instance.screen(_heat_loads)
+    _simulated = _simulated.iloc[(_simulated["time"] - _mid_flat_top).abs().argmin()]
+
+    for column in _screened:
+        assert np.isclose(_screened[column][0], _simulated[column], rtol=1e-6)
@@ -0,0 +1,162 @@
+import os
+import shutil
+
+import pytest
+import toml
+
+import power_balance.batch as pbm_batch
+import power_balance.exceptions as pbm_exc
+from power_balance.parameters import PBMParameterSet
+
+DEFAULT_MODEL_DIR = os.path.join(
+    os.path.dirname(pbm_batch.__file__), os.pardir, "models"
+)
+
+
+@pytest.fixture
+def manifest_file(tmp_path):
+    _manifest = {
+        "workers": 2,
+        "entries": [
+            {"name": "baseline", "config": "configs/base.toml"},
+            {"param_dir": "parameters/high", "profiles_dir": "/data/profiles"},
+        ],
+    }
+    _file = tmp_path / "manifest.toml"
+    _file.write_text(toml.dumps(_manifest))
+    return _file
+
+
+def _parameter_set(parameter_directory):
+    return PBMParameterSet(
+        parameters_directory=parameter_directory,
+        simulation_options_file="simulation_options.toml",
+        plasma_scenario_file="plasma_scenario.toml",
+        structural_params_file="structural_parameters.toml",
+    )
+
+
+@pytest.mark.batch
+def test_read_manifest(manifest_file):
+    _manifest = pbm_batch.read_manifest(str(manifest_file))
+    assert _manifest.workers == 2
+    _baseline, _second = _manifest.entries
+    assert _baseline.config == os.path.join(manifest_file.parent, "configs/base.toml")
+    assert _baseline.param_dir == "Default"
+    assert _second.name == "entry_1"
+    assert _second.param_dir == os.path.join(manifest_file.parent, "parameters/high")
+    assert _second.profiles_dir == "/data/profiles"
+
+
+@pytest.mark.batch
+def test_read_manifest_invalid(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        pbm_batch.read_manifest(str(tmp_path / "missing.toml"))
+
+    for entries in ([], [{"name": "a"}, {"name": "a"}], [{"name": "a/b"}]):
+        _file = tmp_path / "manifest.toml"
+        _file.write_text(toml.dumps({"entries": entries}))
+        with pytest.raises(pbm_exc.ValidationError):
+            pbm_batch.read_manifest(str(_file))
+
+
+@pytest.mark.batch
+def test_compiled_model_identity(tmp_path, test_directory):
+    _param_dir = tmp_path / "parameters"
+    shutil.copytree(
+        os.path.join(os.path.dirname(test_directory), "power_balance", "parameters"),
+        _param_dir,
+    )
+    _model_dir = tmp_path / "models"
+    shutil.copytree(DEFAULT_MODEL_DIR, _model_dir)
+    _config = {
+        "models": ["Tokamak.Interdependencies"],
+        "modelica_file_directory": str(_model_dir),
+    }
+    _identity = pbm_batch.compiled_model_identity(
+        _config, _parameter_set(str(_param_dir))
+    )
+
+    # Non-structural parameters leave the compiled models unchanged
+    _scenario = toml.load(_param_dir / "plasma_scenario.toml")
+    _scenario["plasma_flat_top_end"] = 45
+    (_param_dir / "plasma_scenario.toml").write_text(toml.dumps(_scenario))
+    assert (
+        pbm_batch.compiled_model_identity(_config, _parameter_set(str(_param_dir)))
+        == _identity
+    )
+
+    _structural = toml.load(_param_dir / "structural_parameters.toml")
+    _structural["Magnets"]["isMagnetTFSuperconCoil"] = True
+    (_param_dir / "structural_parameters.toml").write_text(toml.dumps(_structural))
+    _structural_identity = pbm_batch.compiled_model_identity(
+        _config, _parameter_set(str(_param_dir))
+    )
+    assert _structural_identity != _identity
+
+    assert (
+        pbm_batch.compiled_model_identity(
+            _config | {"models": ["Tokamak.Interdependencies", "Other"]},
+            _parameter_set(str(_param_dir)),
+        )
+        != _structural_identity
+    )
+
+    with open(_model_dir / "Tokamak.mo", "a") as out_f:
+        out_f.write("\n")
+    assert (
+        pbm_batch.compiled_model_identity(_config, _parameter_set(str(_param_dir)))
+        != _structural_identity
+    )
+
+
+class _StubPyDelicaSession:
+    def __init__(self):
+        self._compiler = object()
+
+
+class _StubPowerBalance:
+    def __init__(self, entry, compiled_session=None):
+        self._entry = entry
+        self._time_stamp = "stamp"
+        self.pydelica_session = _StubPyDelicaSession()
+        self.cleared = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+    def clear_cache(self):
+        self.cleared = True
+
+    def run_simulation(self, directory):
+        if self._entry.name == "entry_1":
+            raise pbm_exc.InvalidInputError("invalid parameter value")
+        _session_directory = os.path.join(directory, "pbm_results_stamp")
+        os.makedirs(_session_directory)
+        with open(os.path.join(_session_directory, "pid"), "w") as out_f:
+            out_f.write(f"{os.getpid()}")
+
+
+@pytest.mark.batch
+def test_batch_run(manifest_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(pbm_batch, "_session", _StubPowerBalance)
+    _runner = pbm_batch.BatchRunner(str(manifest_file))
+    _runner._groups = {"group": _runner.entries}
+    monkeypatch.chdir(tmp_path)
+
+    _entries = _runner.run()
+    assert _entries["status"].tolist() == [
+        "completed",
+        "failed: invalid parameter value",
+    ]
+    _session_directory = _entries["session_directory"][0]
+    assert os.path.dirname(os.path.dirname(_session_directory)).startswith(
+        os.path.join(str(tmp_path), "pbm_batch_")
+    )
+    # Entries are run within worker processes
+    with open(os.path.join(_session_directory, "pid")) as in_f:
+        assert int(in_f.read()) != os.getpid()
+    assert _runner.summary.empty
@@ -0,0 +1,99 @@
+import os
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+import toml
+
+import power_balance.exceptions as pbm_exc
+from power_balance.calc.efficiencies import calc_thermal_to_elec_eff
+from power_balance.calc.summary import (
+    flat_top_average,
+    flat_top_indices,
+    summarise_frame,
+)
+from power_balance.profiles.knots import compress
+
+BASELINE_DIR = os.path.join(pathlib.Path(__file__).parents[1], "baseline", "run_data")
+
+
+@pytest.fixture(scope="module")
+def baseline_data():
+    return pd.read_hdf(
+        os.path.join(BASELINE_DIR, "data", "session_data.h5"),
+        key="tokamak_interdependencies",
+    )
+
+
+@pytest.fixture(scope="module")
+def plasma_scenario():
+    return toml.load(os.path.join(BASELINE_DIR, "parameters", "plasma_scenario.toml"))
+
+
+@pytest.mark.calc
+def test_flat_top_indices_tolerance():
+    _time = np.arange(0, 60, 0.1)
+    _indices = flat_top_indices(
+        _time, {"plasma_flat_top_start": 20, "plasma_flat_top_end": 40}
+    )
+    assert _indices == (200, 400)
+    assert abs(_time[200] - 20) < 1e-8
+
+
+@pytest.mark.calc
+def test_flat_top_indices_missing():
+    with pytest.raises(pbm_exc.InvalidInputError):
+        flat_top_indices(
+            np.arange(0, 30, 1.0),
+            {"plasma_flat_top_start": 20, "plasma_flat_top_end": 40},
+        )
+
+
+@pytest.mark.calc
+def test_summary_single(baseline_data, plasma_scenario, generate_profiles):
+    _summary = summarise_frame(baseline_data, [], generate_profiles, plasma_scenario)
+    _thermal = _summary[_summary["quantity"] == "Thermal to Electric"]["value"]
+    _expected = calc_thermal_to_elec_eff(
+        os.path.join(generate_profiles, "ThermalPowerOut.mat"),
+        baseline_data["time"].to_numpy(),
+        baseline_data["powergenerated"].to_numpy(),
+        plasma_scenario,
+    )
+    assert _thermal.iloc[0] == pytest.approx(_expected.value())
+
+
+@pytest.mark.calc
+def test_summary_sweep(baseline_data, plasma_scenario, generate_profiles):
+    _cuts = []
+    for scale in (1.0, 2.0, 3.0):
+        _cut = baseline_data.copy()
+        _cut["powergenerated"] *= scale
+        _cut["param"] = scale
+        _cuts.append(_cut)
+    _summary = summarise_frame(
+        pd.concat(_cuts, ignore_index=True),
+        ["param"],
+        generate_profiles,
+        plasma_scenario,
+    )
+    _thermal = _summary[_summary["quantity"] == "Thermal to Electric"]
+    assert list(_thermal["param"]) == [1.0, 2.0, 3.0]
+    assert np.allclose(_thermal["value"] / _thermal["value"].iloc[0], [1, 2, 3])
+    assert set(_summary["category"]) == {"average", "efficiency"}
+
+
+@pytest.mark.calc
+def test_flat_top_average_event_grid(baseline_data, plasma_scenario):
+    _time = baseline_data["time"].to_numpy()
+    _values = baseline_data["powergenerated"].to_numpy()
+
+    # Coarse grid with the breakpoints of the output as event points
+    _breakpoints = compress(np.column_stack([_time, _values]), rtol=1e-6)[:, 0]
+    _event_time = np.unique(np.concatenate([_time[::100], _breakpoints]))
+    _event_values = np.interp(_event_time, _time, _values)
+
+    assert len(_event_time) < len(_time) / 10
+    assert flat_top_average(_event_time, _event_values, plasma_scenario) == (
+        pytest.approx(flat_top_average(_time, _values, plasma_scenario), rel=1e-3)
+    )
@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pydantic
+import pytest
+
+import power_balance.campaign as pbm_campaign
+import power_balance.exceptions as pbm_exc
+from power_balance.validation.config import CampaignModel
+
+
+def _pulse(flat_top_power: float) -> pd.DataFrame:
+    _time = np.linspace(0, 10, 11)
+    _power = np.where((_time >= 2) & (_time < 8), flat_top_power, 1e6)
+    return pd.DataFrame({"time": _time, "load": _power, "supply": 2 * _power})
+
+
+@pytest.fixture()
+def campaign():
+    _, _pulse_variant = pbm_campaign.pulse_variants(4, {"3": {"param": 1}})
+    return pbm_campaign.CampaignResults(
+        [_pulse(5e6), _pulse(1e7)], _pulse_variant, dwell=5.0
+    )
+
+
+@pytest.mark.campaign
+def test_pulse_variants():
+    _variants, _pulse_variant = pbm_campaign.pulse_variants(
+        5, {"2": {"b": 1, "a": 2}, "4": {"a": 2, "b": 1}, 5: {"a": 3}}
+    )
+    assert _variants == [{}, {"a": 2, "b": 1}, {"a": 3}]
+    assert np.array_equal(_pulse_variant, [0, 1, 0, 1, 2])
+
+
+@pytest.mark.campaign
+def test_pulse_variants_out_of_range():
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_campaign.pulse_variants(3, {"4": {"a": 1}})
+
+
+@pytest.mark.campaign
+def test_periodicity(campaign):
+    assert campaign.periodicity()["periodic"].all()
+    _ramp = pd.DataFrame({"time": [0.0, 1.0], "load": [1e6, 2e6]})
+    _results = pbm_campaign.CampaignResults([_ramp], np.zeros(2, dtype=int))
+    assert not _results.periodicity()["periodic"].any()
+
+
+@pytest.mark.campaign
+def test_time_series(campaign):
+    _series = campaign.time_series()
+    assert campaign.period == 15.0
+    assert len(_series) == 4 * 12
+    assert _series["time"].is_monotonic_increasing
+    assert _series["time"].iloc[-1] == campaign.duration
+    assert np.array_equal(_series["pulse"].unique(), [1, 2, 3, 4])
+    assert _series.loc[_series["pulse"] == 3, "load"].max() == 1e7
+    assert _series.loc[_series["pulse"] != 3, "load"].max() == 5e6
+    assert campaign.time_series([1])["time"].iloc[0] == 15.0
+
+
+@pytest.mark.campaign
+def test_energy(campaign):
+    _series = campaign.time_series()
+    _expected = np.trapezoid(_series["load"], _series["time"])
+    _energy = campaign.cumulative_energy()
+    assert _energy["load"].iloc[-1] == pytest.approx(_expected)
+    assert campaign.energy()["load"].iloc[2] == pytest.approx(
+        2 * campaign.energy()["load"].iloc[0] - 5 * 1e6 - 4 * 1e6
+    )
+    assert campaign.summary().set_index("variable").loc[
+        "load", "energy_mwh"
+    ] == pytest.approx(_expected / 3.6e9)
+
+
+@pytest.mark.campaign
+def test_hdf5_round_trip(campaign):
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, pbm_campaign.CAMPAIGN_DATA_FILE)
+        campaign.write_hdf5(_file, "tokamak_interdependencies")
+        _read = pbm_campaign.CampaignResults.read_hdf5(
+            _file, "tokamak_interdependencies"
+        )
+    pd.testing.assert_frame_equal(_read.time_series(), campaign.time_series())
+
+
+@pytest.mark.campaign
+def test_campaign_config():
+    _campaign = CampaignModel(
+        pulses=10, overrides={"2": {"tokamak": {"interdependencies": {"x": 1}}}}
+    )
+    assert _campaign.overrides == {"2": {"tokamak.interdependencies.x": 1}}
+    with pytest.raises(pydantic.ValidationError):
+        CampaignModel(pulses=0)
+    with pytest.raises(pydantic.ValidationError):
+        CampaignModel(pulses=2, overrides={"last": {"x": 1}})
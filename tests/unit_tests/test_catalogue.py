@@ -0,0 +1,179 @@
+import logging
+import os
+import shutil
+
+import pandas as pd
+import pytest
+import toml
+
+import power_balance.calc.summary as pbm_summary
+import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation as pbm_instr
+import power_balance.results.catalogue as pbm_catalogue
+from power_balance.cli.catalogue import pbm_index, pbm_query
+from power_balance.core import PowerBalance
+
+DEFAULT_PARAM_DIR = os.path.join(
+    os.path.dirname(pbm_catalogue.__file__), os.pardir, "parameters"
+)
+
+NET_POWER = "Average Net Electrical Power Output (MW)"
+
+
+def _write_session(directory, time_stamp, thermal_power, net_powers):
+    _session = directory / f"pbm_results_{time_stamp}"
+    os.makedirs(_session / "configs")
+    os.makedirs(_session / "data")
+    shutil.copytree(DEFAULT_PARAM_DIR, _session / "parameters")
+
+    _parameters = toml.load(_session / "parameters" / "tokamak_interdependencies.toml")
+    _parameters["thermalpower"] = thermal_power
+    (_session / "parameters" / "tokamak_interdependencies.toml").write_text(
+        toml.dumps(_parameters)
+    )
+
+    (_session / "configs" / "configuration.toml").write_text(
+        toml.dumps(
+            {
+                "models": ["Tokamak.Interdependencies"],
+                "simulation_options_file": "simulation_options.toml",
+                "plasma_scenario_file": "plasma_scenario.toml",
+                "structural_params_file": "structural_parameters.toml",
+            }
+        )
+    )
+
+    _summary = pd.DataFrame(
+        {
+            "x": list(range(len(net_powers))) * 2,
+            "category": ["average"] * len(net_powers) * 2,
+            "quantity": [NET_POWER] * len(net_powers)
+            + [pbm_summary.PLASMA_THERMAL_LABEL] * len(net_powers),
+            "value": list(net_powers) + [thermal_power / 1e6] * len(net_powers),
+        }
+    )
+
+    with pd.HDFStore(_session / "data" / "session_data.h5") as hdf_store:
+        hdf_store.put("tokamak_interdependencies", pd.DataFrame({"time": [0.0]}))
+        _attrs = hdf_store.get_storer("tokamak_interdependencies").attrs
+        _attrs.pbm_version = "1.5.0"
+        _attrs.om_version = "1.24.0"
+        hdf_store.put(pbm_summary.SUMMARY_KEY, _summary, format="table")
+        hdf_store.put(
+            pbm_instr.TIMINGS_KEY,
+            pd.DataFrame(
+                {
+                    "phase": ["build", "simulate", "simulate"],
+                    "iteration": [-1, 0, 1],
+                    "start": [0.0, 1.0, 2.0],
+                    "duration": [1.0, 0.5, 0.5],
+                }
+            ),
+        )
+        hdf_store.get_storer(pbm_instr.TIMINGS_KEY).attrs.elapsed = 2.0
+
+    return _session
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    return [
+        _write_session(tmp_path / "runs", "2026_01_01_10_00_00", 1.5e9, [100, 150]),
+        _write_session(tmp_path / "runs" / "old", "2025_06_01_10_00_00", 2e9, [300]),
+    ]
+
+
+@pytest.mark.catalogue
+def test_parse_filter():
+    assert pbm_catalogue.parse_filter("average.netpowergeneration>=100") == (
+        "average.netpowergeneration",
+        ">=",
+        100.0,
+    )
+    assert pbm_catalogue.parse_filter("magnets.ismagnettfsuperconcoil == true")[2] == 1
+    assert pbm_catalogue.parse_filter("pbm_version != '1.5.0'")[2] == "1.5.0"
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_catalogue.parse_filter("average.netpowergeneration ~ 100")
+
+
+@pytest.mark.catalogue
+def test_metric_name():
+    assert pbm_catalogue.metric_name("average", NET_POWER) == (
+        "average.netpowergeneration"
+    )
+    assert pbm_catalogue.metric_name("efficiency", "Thermal to Electric") == (
+        "efficiency.thermal_to_electric"
+    )
+
+
+@pytest.mark.catalogue
+def test_index_and_query(tmp_path, sessions):
+    with pbm_catalogue.Catalogue(str(tmp_path / "catalogue.db")) as catalogue:
+        assert len(catalogue.index_directory(str(tmp_path / "runs"))) == 2
+        # Re-indexing a session replaces its entry
+        catalogue.index_session(str(sessions[0]))
+        assert len(catalogue) == 2
+
+        _all = catalogue.query()
+        assert len(_all) == 3
+        assert list(_all["time"]) == [
+            "2025-06-01T10:00:00",
+            "2026-01-01T10:00:00",
+            "2026-01-01T10:00:00",
+        ]
+        assert set(_all["pbm_version"]) == {"1.5.0"}
+        assert list(_all["elapsed"]) == [2.0] * 3
+
+        _matches = catalogue.query(["average.netpowergeneration > 120"])
+        assert list(_matches["average.netpowergeneration"]) == [300, 150]
+
+        _matches = catalogue.query(
+            [
+                "Tokamak.Interdependencies.thermalpower < 1.8e9",
+                "time >= 2026-01-01",
+            ],
+            metrics=["average.netpowergeneration"],
+        )
+        assert list(_matches["average.netpowergeneration"]) == [100, 150]
+        assert "average.plasmathermalpower" not in _matches
+
+        assert catalogue.query(["plasma_flat_top_end > 1000"]).empty
+
+        _parameters = catalogue.parameters(str(sessions[1]))
+        assert _parameters["tokamak.interdependencies.thermalpower"] == 2e9
+        assert "plasma_flat_top_end" in _parameters
+
+
+@pytest.mark.catalogue
+def test_cli_index_and_query(tmp_path, sessions):
+    _catalogue = str(tmp_path / "catalogue.db")
+    assert pbm_index([str(sessions[0])], catalogue=_catalogue) == [str(sessions[0])]
+    assert len(pbm_index([str(tmp_path / "runs")], _catalogue, recursive=False)) == 1
+    _output = tmp_path / "sessions.csv"
+    _sessions = pbm_query(
+        ["average.netpowergeneration >= 100"], catalogue=_catalogue, output=_output
+    )
+    assert len(pd.read_csv(_output)) == len(_sessions) == 2
+    with pytest.raises(FileNotFoundError):
+        pbm_query(catalogue=str(tmp_path / "missing.db"))
+
+
+@pytest.mark.catalogue
+@pytest.mark.parametrize(
+    "error", [KeyError("summary"), ValueError("invalid value"), OSError("read only")]
+)
+def test_write_catalogue_failure(tmp_path, monkeypatch, caplog, error):
+    def _index_session(*_):
+        raise error
+
+    monkeypatch.setattr(pbm_catalogue.Catalogue, "index_session", _index_session)
+    _session = PowerBalance.__new__(PowerBalance)
+    _session._logger = logging.getLogger("PowerBalance")
+    _session.configuration = {
+        "catalogue": True,
+        "catalogue_file": str(tmp_path / "catalogue.db"),
+    }
+
+    # Failure to update the catalogue does not fail the session
+    _session.write_catalogue(str(tmp_path / "pbm_results_2026_01_01_12_00_00"))
+    assert "Could not update session catalogue" in caplog.text
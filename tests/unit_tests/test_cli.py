@@ -4,6 +4,7 @@ import tempfile
 
 import pytest
 
+from power_balance.cli.archive import pbm_archive_sessions
 from power_balance.cli.session import pbm_main
 
 
@@ -39,3 +40,26 @@ def test_raise_on_bad_pre_session(test_config):
     with pytest.raises(FileNotFoundError) as pytest_wrapped_e:
         pbm_main(test_config, from_session=_temp_dir)
     assert pytest_wrapped_e.type == FileNotFoundError
+
+
+@pytest.mark.cli
+def test_archive_sessions():
+    with tempfile.TemporaryDirectory() as tempd:
+        _session_dir = os.path.join(tempd, "pbm_results_2026_01_01_12_00_00")
+        os.makedirs(os.path.join(_session_dir, "configs"))
+        with open(
+            os.path.join(_session_dir, "configs", "configuration.toml"), "w"
+        ) as f:
+            f.write('models = ["Tokamak.Interdependencies"]\n')
+        with pytest.raises(FileNotFoundError):
+            pbm_archive_sessions([tempd])
+        _archives = pbm_archive_sessions(
+            [_session_dir], output=os.path.join(tempd, "archives"), remove=True
+        )
+        assert _archives == [
+            os.path.join(tempd, "archives", "pbm_results_2026_01_01_12_00_00.zip")
+        ]
+        assert os.path.isfile(_archives[0])
+        assert not os.path.exists(_session_dir)
+        with pytest.raises(FileNotFoundError):
+            pbm_main("", from_session=_archives[0])
@@ -0,0 +1,39 @@
+import os
+import pathlib
+import shutil
+
+import pytest
+
+import power_balance.compiler as pbm_compiler
+from power_balance.environment import MODELICA_ENVIRONMENT
+
+MODELS_DIR = os.path.join(pathlib.Path(__file__).parents[2], "power_balance", "models")
+
+
+@pytest.fixture(scope="module")
+def omc_server():
+    _server = pbm_compiler.get_server(shutil.which("omc"), MODELICA_ENVIRONMENT)
+    yield _server
+    pbm_compiler.shutdown_servers()
+
+
+@pytest.mark.compiler
+def test_server_shared(omc_server):
+    assert (
+        pbm_compiler.get_server(shutil.which("omc"), MODELICA_ENVIRONMENT) is omc_server
+    )
+
+
+@pytest.mark.compiler
+def test_server_repeat_build(omc_server):
+    _compiler = pbm_compiler.ServerCompiler()
+    _n_builds = omc_server.n_builds
+    for _ in range(2):
+        _build_dir = _compiler.compile(
+            os.path.join(MODELS_DIR, "WasteHeatDB.mo"),
+            model_addr="WasteHeatDB.TotalParasitcLoadWH",
+            custom_library_spec=list(MODELICA_ENVIRONMENT),
+        )
+        assert list(_build_dir.glob("*_init.xml"))
+    assert omc_server.n_builds == _n_builds + 2
+    _compiler.clear_cache()
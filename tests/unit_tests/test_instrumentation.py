@@ -0,0 +1,259 @@
+import json
+import os
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from power_balance.instrumentation import (
+    NO_ITERATION,
+    TIMINGS_KEY,
+    TRACE_FILE,
+    PhaseTimer,
+    TIMER,
+    timed,
+)
+from power_balance.instrumentation.memory import ALLOCATIONS_KEY, MEMORY_KEY
+from power_balance.instrumentation.solver import (
+    SOLVER_STATS_KEY,
+    SolverStatistics,
+    parse_statistics,
+    strip_statistics,
+)
+
+
+@pytest.fixture
+def timer():
+    _timer = PhaseTimer()
+    with _timer.phase("compile"):
+        pass
+    for i in range(3):
+        _timer.iteration = i
+        with _timer.phase("simulate"):
+            pass
+        _timer.count("simulations")
+    _timer.iteration = NO_ITERATION
+    with _timer.phase("write_hdf5"):
+        pass
+    return _timer
+
+
+@pytest.mark.instrumentation
+def test_phase_records(timer):
+    _frame = timer.to_frame()
+    assert list(_frame["phase"]) == ["compile"] + ["simulate"] * 3 + ["write_hdf5"]
+    assert list(_frame["iteration"]) == [NO_ITERATION, 0, 1, 2, NO_ITERATION]
+    assert (_frame["duration"] >= 0).all()
+    assert _frame["start"].is_monotonic_increasing
+    assert timer.counters == {"simulations": 3}
+
+
+@pytest.mark.instrumentation
+def test_phase_summary(timer):
+    _summary = timer.summary()
+    assert list(_summary["phase"]) == ["compile", "simulate", "write_hdf5"]
+    assert list(_summary["calls"]) == [1, 3, 1]
+    _table = timer.summary_table()
+    assert "simulate" in _table
+    assert "simulations: 3" in _table
+
+
+@pytest.mark.instrumentation
+def test_phase_recorded_on_error():
+    _timer = PhaseTimer()
+    with pytest.raises(ValueError):
+        with _timer.phase("failing"):
+            raise ValueError
+    assert list(_timer.to_frame()["phase"]) == ["failing"]
+    _timer.reset()
+    assert _timer.to_frame().empty
+    assert not _timer.counters
+
+
+@pytest.mark.instrumentation
+def test_timings_hdf5(timer):
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "session_data.h5")
+        timer.write_hdf5(_file)
+        # Rewriting should replace the existing table
+        timer.write_hdf5(_file)
+        _read = pd.read_hdf(_file, key=TIMINGS_KEY)
+        with pd.HDFStore(_file, mode="r") as hdf_store:
+            _attrs = hdf_store.get_storer(TIMINGS_KEY).attrs
+            assert _attrs.counters == {"simulations": 3}
+    assert _read.equals(timer.to_frame())
+
+
+@pytest.mark.instrumentation
+def test_timed_decorator():
+    @timed("decorated")
+    def _function(value):
+        return 2 * value
+
+    TIMER.reset()
+    assert _function(2) == 4
+    assert list(TIMER.to_frame()["phase"]) == ["decorated"]
+    TIMER.reset()
+
+
+@pytest.mark.instrumentation
+def test_trace_disabled(timer):
+    assert not timer.trace_events
+
+
+@pytest.mark.instrumentation
+def test_trace_events():
+    _timer = PhaseTimer()
+    _timer.tracing = True
+    _timer.iteration = 2
+    with _timer.phase("simulate", model="Tokamak.Interdependencies"):
+        pass
+    _events = _timer.trace_events
+    assert len(_events) == 1
+    assert _events[0]["ph"] == "X"
+    assert _events[0]["pid"] == os.getpid()
+    assert _events[0]["args"] == {
+        "iteration": 2,
+        "model": "Tokamak.Interdependencies",
+    }
+
+
+@pytest.mark.instrumentation
+def test_trace_file():
+    _timer = PhaseTimer()
+    _timer.tracing = True
+    with _timer.phase("compile"):
+        pass
+    _worker_event = dict(_timer.trace_events[0], pid=os.getpid() + 1)
+    _timer.merge_trace([_worker_event])
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, TRACE_FILE)
+        _timer.write_trace(_file)
+        with open(_file) as in_f:
+            _trace = json.load(in_f)
+    _metadata = [e for e in _trace["traceEvents"] if e["ph"] == "M"]
+    _spans = [e for e in _trace["traceEvents"] if e["ph"] == "X"]
+    assert len(_metadata) == 2
+    assert len(_spans) == 2
+
+
+@pytest.mark.instrumentation
+def test_timed_decorator_tags():
+    @timed("decorated", tags=("model_name",))
+    def _function(model_name, value=1):
+        return value
+
+    TIMER.reset()
+    TIMER.tracing = True
+    _function("Model", value=2)
+    assert TIMER.trace_events[0]["args"]["model_name"] == "Model"
+    TIMER.reset()
+
+
+@pytest.mark.instrumentation
+def test_memory_profiling():
+    _timer = PhaseTimer()
+    _timer.profile_memory(n_sites=3)
+    try:
+        with _timer.phase("outer"):
+            with _timer.phase("allocate"):
+                _data = np.ones(2**20)
+            del _data
+        _memory = _timer.memory.to_frame()
+        _sites = _timer.memory.allocations_frame()
+        _table = _timer.summary_table()
+    finally:
+        _timer.reset()
+    assert not tracemalloc.is_tracing()
+    assert list(_memory["phase"]) == ["allocate", "outer"]
+    # Peak of the inner phase must be propagated to the enclosing phase
+    assert (_memory["peak_traced"] >= 8 * 2**20).all()
+    assert _memory.set_index("phase").loc["outer", "net_traced"] < 2**20
+    assert len(_sites[_sites["phase"] == "allocate"]) <= 3
+    assert "Peak/MiB" in _table
+
+
+@pytest.mark.instrumentation
+def test_memory_hdf5():
+    _timer = PhaseTimer()
+    _timer.profile_memory()
+    try:
+        with _timer.phase("allocate"):
+            _data = [0] * 1000
+        with tempfile.TemporaryDirectory() as tempd:
+            _file = os.path.join(tempd, "session_data.h5")
+            _timer.write_hdf5(_file)
+            _memory = pd.read_hdf(_file, key=MEMORY_KEY)
+            _sites = pd.read_hdf(_file, key=ALLOCATIONS_KEY)
+    finally:
+        _timer.reset()
+    assert len(_data) == 1000
+    assert list(_memory["phase"]) == ["allocate"]
+    assert not _sites.empty
+
+
+_LOG_STATS_OUTPUT = """LOG_STATS         | info    | ### STATISTICS ###
+|                 | |       | | timer
+|                 | |       | | |  0.00166498s          reading init.xml
+|                 | |       | | |  0.000133694s [  0.4%] pre-initialization
+|                 | |       | | |   0.0003405s [  1.0%] initialization
+|                 | |       | | |  4.8116e-05s [  0.1%] steps
+|                 | |       | | |   0.0319734s [ 95.4%] simulation
+|                 | |       | | |   0.0335117s [100.0%] total
+|                 | |       | | events
+|                 | |       | | |     2 state events
+|                 | |       | | |     4 time events
+|                 | |       | | solver: dassl
+|                 | |       | | |   502 steps taken
+|                 | |       | | |   505 calls of functionODE
+|                 | |       | | |    51 evaluations of jacobian
+|                 | |       | | |     3 error test failures
+|                 | |       | | |     0 convergence test failures
+|                 | |       | | |  0.000131s time of jacobian evaluation
+LOG_SUCCESS       | info    | The simulation finished successfully.
+"""
+
+
+@pytest.mark.instrumentation
+def test_parse_solver_statistics():
+    assert parse_statistics(_LOG_STATS_OUTPUT) == {
+        "solver": "dassl",
+        "steps": 502,
+        "rejected_steps": 3,
+        "convergence_failures": 0,
+        "function_evaluations": 505,
+        "jacobian_evaluations": 51,
+        "state_events": 2,
+        "time_events": 4,
+        "init_time": 0.0003405,
+        "simulation_time": 0.0319734,
+        "total_time": 0.0335117,
+    }
+    assert not parse_statistics("LOG_SUCCESS | info | finished")
+
+
+@pytest.mark.instrumentation
+def test_solver_statistics_hdf5():
+    _statistics = SolverStatistics()
+    for i, value in enumerate((1.0, 2.0)):
+        _statistics.record("Model", i, _LOG_STATS_OUTPUT, {"Model.A": value})
+    _statistics.record("Other", NO_ITERATION, "")
+    _frame = _statistics.to_frame()
+    assert list(_frame.columns[:4]) == ["model", "iteration", "model.a", "solver"]
+    assert list(_frame["steps"].iloc[:2]) == [502, 502]
+    assert _frame["steps"].isna().iloc[2]
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "session_data.h5")
+        _statistics.write_hdf5(_file)
+        _read = pd.read_hdf(_file, key=SOLVER_STATS_KEY)
+    assert _read.equals(_frame)
+
+
+@pytest.mark.instrumentation
+def test_strip_statistics():
+    _output = strip_statistics(_LOG_STATS_OUTPUT)
+    assert "LOG_STATS" not in _output
+    assert not [line for line in _output.splitlines() if line.startswith("|")]
+    assert "LOG_SUCCESS" in _output
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pytest
+import scipy.io as sio
+import toml
+
+import power_balance.exceptions as pbm_exc
+import power_balance.profiles as pbm_prof
+import power_balance.profiles.knots as pbm_knots
+import power_balance.profiles.timeseries as pbm_ts
+from power_balance.parameters import DEFAULT_PARAM_DIR, PBMParameterSet
+
+
+@pytest.fixture(scope="module")
+def knot_profiles():
+    with tempfile.TemporaryDirectory() as tempd:
+        pbm_prof.generate_all(tempd, knots=True)
+        yield tempd
+
+
+@pytest.mark.knots
+def test_compress_staircase():
+    _time = np.linspace(0, 10, 101)
+    _values = np.where(_time < 4, 0.0, 5.0)
+    _knots = pbm_knots.compress(np.column_stack([_time, _values]))
+    assert np.array_equal(_knots, [[0, 0], [4, 0], [4, 5], [10, 5]])
+    assert np.array_equal(pbm_knots.expand(_knots, _time), _values)
+
+
+@pytest.mark.knots
+def test_compress_ramp():
+    _time = np.linspace(0, 10, 101)
+    _values = np.clip(_time - 2, 0, 5)
+    _knots = pbm_knots.compress(np.column_stack([_time, _values]))
+    assert np.allclose(_knots, [[0, 0], [2, 0], [7, 5], [10, 5]])
+    assert np.allclose(pbm_knots.expand(_knots, _time), _values)
+
+
+@pytest.mark.knots
+def test_compress_without_discontinuities():
+    _time = np.linspace(0, 10, 101)
+    _values = np.where(_time < 4, 0.0, 5.0)
+    _knots = pbm_knots.compress(
+        np.column_stack([_time, _values]), discontinuities=False
+    )
+    assert len(np.unique(_knots[:, 0])) == len(_knots)
+    assert np.array_equal(pbm_knots.expand(_knots, _time), _values)
+
+
+@pytest.mark.knots
+def test_compress_unordered():
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_knots.compress(np.array([[0.0, 1.0], [0.0, 2.0], [1.0, 3.0]]))
+
+
+@pytest.mark.knots
+@pytest.mark.parametrize("profile_name", pbm_prof.PROFILE_NAMES)
+def test_knot_profile_read(generate_profiles, knot_profiles, profile_name):
+    _dense = pbm_ts.read_profile(os.path.join(generate_profiles, f"{profile_name}.mat"))
+    _knot_file = os.path.join(knot_profiles, f"{profile_name}.mat")
+    _mat = sio.loadmat(_knot_file)
+    assert pbm_knots.TIME_STEP_KEY in _mat
+    assert len(_mat["data"]) < len(_dense.time)
+    _expanded = pbm_ts.read_profile(_knot_file)
+    assert np.array_equal(_expanded.time, _dense.time)
+    assert np.allclose(_expanded.values, _dense.values)
+
+
+@pytest.mark.knots
+def test_compress_file_idempotent(knot_profiles):
+    _file = os.path.join(knot_profiles, "currentTF.mat")
+    _n_knots = len(sio.loadmat(_file)["data"])
+    assert pbm_knots.compress_file(_file) == (_n_knots, _n_knots)
+
+
+@pytest.fixture()
+def knot_parameter_directory():
+    with tempfile.TemporaryDirectory() as tempd:
+        for file_name in (
+            "simulation_options.toml",
+            "plasma_scenario.toml",
+            "structural_parameters.toml",
+        ):
+            shutil.copy(os.path.join(DEFAULT_PARAM_DIR, file_name), tempd)
+        yield tempd
+
+
+def _knot_parameter_set(parameter_directory: str) -> PBMParameterSet:
+    return PBMParameterSet(
+        parameters_directory=parameter_directory,
+        simulation_options_file="simulation_options.toml",
+        plasma_scenario_file="plasma_scenario.toml",
+        structural_params_file="structural_parameters.toml",
+        profile_format="knots",
+    )
+
+
+@pytest.mark.knots
+def test_knot_smoothness(knot_parameter_directory):
+    _struct_file = os.path.join(knot_parameter_directory, "structural_parameters.toml")
+    _struct_params = toml.load(_struct_file)
+    _struct_params["Magnets"]["smoothnessTF"] = "ConstantSegments"
+
+    with open(_struct_file, "w") as out_f:
+        toml.dump(_struct_params, out_f)
+
+    _struct_params = _knot_parameter_set(
+        knot_parameter_directory
+    ).load_structural_parameters()
+
+    assert _struct_params["Magnets"]["smoothnessTF"] == "ConstantSegments"
+    assert _struct_params["Magnets"]["smoothnessPF1"] == "LinearSegments"
+    assert _struct_params["Tokamak"]["smoothnessThermal"] == "LinearSegments"
+
+
+@pytest.mark.knots
+def test_knot_smoothness_invalid(knot_parameter_directory):
+    _struct_file = os.path.join(knot_parameter_directory, "structural_parameters.toml")
+    _struct_params = toml.load(_struct_file)
+    _struct_params["Tokamak"]["smoothnessThermal"] = "ContinuousDerivative"
+
+    with open(_struct_file, "w") as out_f:
+        toml.dump(_struct_params, out_f)
+
+    with pytest.raises(pbm_exc.InvalidConfigurationError):
+        _knot_parameter_set(knot_parameter_directory)
@@ -0,0 +1,149 @@
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import power_balance.analysis.evaluation as pbm_eval
+import power_balance.analysis.optimisation as pbm_opt
+import power_balance.exceptions as pbm_exc
+from power_balance.cli.optimise import parse_variables
+
+CONSUMPTION = "max(netpowerconsumption)"
+
+BASE = {"model.a": 2.0, "model.b": 5, "model.path": "file.mat"}
+
+
+class _ParameterSet:
+    def __init__(self, parameters):
+        self._parameters = parameters
+
+    def get_parameter(self, name):
+        return self._parameters[name]
+
+
+class _AnalyticEvaluator:
+    """Evaluates an analytic objective in place of the simulations"""
+
+    batches = 0
+    workers = 0
+
+    def __init__(self, power_balance, metrics, workers=1, cache_file=None):
+        self.metrics = metrics
+        _AnalyticEvaluator.workers = workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def evaluate(self, points):
+        _AnalyticEvaluator.batches += 1
+        _table = pd.DataFrame([BASE | point for point in points])
+        _table["netpowergeneration"] = (
+            100 - (_table["model.a"] - 3) ** 2 - (_table["model.b"] - 7) ** 2
+        )
+        _table[CONSUMPTION] = _table["model.a"] + _table["model.b"]
+        # Simulations fail for large values of the first variable
+        _table.loc[_table["model.a"] > 9, ["netpowergeneration", CONSUMPTION]] = np.nan
+        _table[pbm_eval.STATUS_COLUMN] = "simulated"
+        return _table
+
+
+@pytest.fixture
+def power_balance(monkeypatch):
+    monkeypatch.setattr(pbm_eval, "ParallelEvaluator", _AnalyticEvaluator)
+    _AnalyticEvaluator.batches = 0
+    return types.SimpleNamespace(_parameter_set=_ParameterSet(BASE))
+
+
+@pytest.mark.optimisation
+def test_parse_constraint():
+    assert pbm_opt.parse_constraint(" max(magnetpower) <= 1e3") == (
+        "max(magnetpower)",
+        "<=",
+        1000.0,
+    )
+    assert pbm_opt.parse_constraint("netpowergeneration>=5")[1:] == (">=", 5.0)
+    for constraint in ("netpowergeneration < 5", "median(magnetpower) <= 1"):
+        with pytest.raises(pbm_exc.InvalidInputError):
+            pbm_opt.parse_constraint(constraint)
+
+
+@pytest.mark.optimisation
+def test_parse_variables():
+    assert parse_variables(["model.a=0:10", "model.b"]) == {
+        "model.a": (0.0, 10.0),
+        "model.b": None,
+    }
+    with pytest.raises(pbm_exc.InvalidInputError):
+        parse_variables(["model.a=0"])
+
+
+@pytest.mark.optimisation
+def test_invalid_optimiser(power_balance):
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_opt.Optimiser(power_balance, ["model.a"], sense="largest")
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_opt.Optimiser(power_balance, ["model.path"])
+
+
+@pytest.mark.optimisation
+def test_constrained_optimisation(power_balance):
+    _optimiser = pbm_opt.Optimiser(
+        power_balance,
+        {"Model.A": (0, 10), "model.b": (0, 10)},
+        constraints=[f"{CONSUMPTION} <= 8"],
+        generations=100,
+        tolerance=1e-8,
+        seed=1,
+        workers=4,
+    )
+    _result = _optimiser.run()
+    assert _AnalyticEvaluator.workers == 4
+
+    # Constrained optimum lies on the boundary a + b = 8 with integer b
+    assert _result["feasible"]
+    assert _result["variables"]["model.a"] == pytest.approx(2.0, abs=1e-3)
+    assert _result["variables"]["model.b"] == 6
+    assert isinstance(_result["variables"]["model.b"], int)
+    assert _result["objective"] == pytest.approx(98.0, abs=1e-3)
+
+    _history = _optimiser.history()
+    assert _result["generations"] == _AnalyticEvaluator.batches
+    assert list(_history[pbm_opt.GENERATION_COLUMN].unique()) == list(
+        range(_result["generations"])
+    )
+    # Failed simulations are never feasible
+    assert not _history[_history["model.a"] > 9][pbm_opt.FEASIBLE_COLUMN].any()
+
+
+@pytest.mark.optimisation
+def test_minimise_without_bounds(power_balance):
+    _optimiser = pbm_opt.Optimiser(
+        power_balance,
+        ["model.a"],
+        objective=CONSUMPTION,
+        sense="minimise",
+        tolerance=1e-6,
+        seed=2,
+    )
+    assert _optimiser.bounds == {"model.a": pytest.approx((1.8, 2.2))}
+    _result = _optimiser.run()
+    assert _result["variables"]["model.a"] == pytest.approx(1.8, abs=1e-2)
+    assert _result["objective"] == pytest.approx(6.8, abs=1e-2)
+
+
+@pytest.mark.optimisation
+def test_no_feasible_design(power_balance):
+    _optimiser = pbm_opt.Optimiser(
+        power_balance,
+        {"model.a": (0, 5)},
+        constraints=[f"{CONSUMPTION} >= 20"],
+        generations=2,
+        seed=3,
+    )
+    _result = _optimiser.run()
+    assert not _result["feasible"]
+    assert np.isfinite(_result["objective"])
@@ -7,6 +7,7 @@ import deepdiff
 import pytest
 import toml
 
+import power_balance.exceptions as pbm_exc
 from power_balance.parameters import PBMParameterSet
 
 TEST_DIR = pathlib.Path(os.path.dirname(__file__)).parent
@@ -46,6 +47,7 @@ def struct_param_dict():
             "struct_str": "deuterium",
             "struct_int": 1,
             "struct_float": 1.5,
+            "struct_enum": "LinearSegments",
         }
     }
 
@@ -73,3 +75,19 @@ def test_set_struct_parameters(parameter_obj_struct: PBMParameterSet):
         all_lines_pre_mod = pre_mod_file.readlines()
 
     assert all_lines_mod == all_lines_pre_mod
+
+
+@pytest.mark.parameters
+def test_set_simulation_options(parameter_obj_norm: PBMParameterSet):
+    parameter_obj_norm.set_simulation_options(solver="ida", tolerance=1e-6)
+    assert parameter_obj_norm.get_simulation_options(["solver", "tolerance"]) == [
+        "ida",
+        1e-6,
+    ]
+    with pytest.raises(pbm_exc.ValidationError):
+        parameter_obj_norm.set_simulation_options(solver="not_a_solver")
+    assert parameter_obj_norm.get_simulation_options("solver") == "ida"
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "simulation_options.toml")
+        parameter_obj_norm.save_simulation_options(_file)
+        assert toml.load(_file)["tolerance"] == 1e-6
@@ -4,7 +4,8 @@ import tempfile
 
 import pytest
 
-from power_balance.plotting import launch_viewer
+from power_balance.plotting import launch_viewer, viewer_directory
+from power_balance.results.archive import write_archive
 
 
 @pytest.mark.plotting
@@ -22,3 +23,20 @@ def test_launch_viewer_failure():
         launch_viewer("not_a_directory")
     _expect = "Cannot open viewer for directory 'not_a_directory', folder does not contain valid results"
     assert exc.value.args[0] == _expect
+
+
+@pytest.mark.plotting
+def test_launch_viewer_archive():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _session_dir = os.path.join(temp_dir, "session")
+        os.makedirs(os.path.join(_session_dir, "html"))
+        pathlib.Path(os.path.join(_session_dir, "html", "viewer.html")).touch()
+        launch_viewer(write_archive(_session_dir))
+        # Pages of an archive are written to one directory, emptied on reuse
+        _viewer = viewer_directory("session")
+        pathlib.Path(_viewer, "viewer.html").touch()
+        assert viewer_directory("session") == _viewer
+        assert not os.listdir(_viewer)
+        os.remove(os.path.join(_session_dir, "html", "viewer.html"))
+        with pytest.raises(FileNotFoundError):
+            launch_viewer(write_archive(_session_dir))
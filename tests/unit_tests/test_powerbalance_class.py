@@ -19,9 +19,11 @@ import pathlib
 import re
 import tempfile
 
+import pandas as pd
 import pytest
 from pydelica import logger as pde_logging
 
+from power_balance.analysis.evaluation import ParallelEvaluator
 from power_balance.core import PowerBalance
 
 
@@ -181,3 +183,63 @@ def test_sweep_assembly():
 @pytest.mark.pbm_class
 def test_browser_launch(pbm_instance: PowerBalance):
     pbm_instance.launch_browser()
+
+
+@pytest.mark.pbm_class
+@pytest.mark.sensitivity
+def test_sensitivity(pbm_instance: PowerBalance):
+    _parameters = [
+        "tokamak.interdependencies.thermalpower",
+        "tokamak.interdependencies.hcdsystem.effrf",
+    ]
+    _base = [pbm_instance._parameter_set.get_parameter(i) for i in _parameters]
+
+    with tempfile.TemporaryDirectory() as tempd:
+        _cache = os.path.join(tempd, "cache.json")
+        _report = pbm_instance.sensitivity(
+            parameters=_parameters, workers=2, cache_file=_cache
+        )
+        assert set(_report["parameter"]) == set(_parameters)
+        assert _report["swing"].iloc[0] > 0
+
+        # Session parameters are unchanged by the analysis
+        assert [
+            pbm_instance._parameter_set.get_parameter(i) for i in _parameters
+        ] == _base
+
+        # Points evaluated by the analysis are memoised
+        with ParallelEvaluator(
+            pbm_instance, ["netpowergeneration"], cache_file=_cache
+        ) as evaluator:
+            _high = _report.set_index("parameter").loc[_parameters[0], "high"]
+            _table = evaluator.evaluate([{}, {_parameters[0]: _high}])
+        assert all(_table["status"] == "cached")
+
+        pbm_instance.write_sensitivity(tempd)
+        assert os.path.exists(os.path.join(tempd, "plots", "sensitivity_tornado.jpg"))
+
+
+@pytest.mark.pbm_class
+@pytest.mark.optimisation
+def test_optimise(pbm_instance: PowerBalance):
+    _variable = "tokamak.interdependencies.thermalpower"
+    _base = pbm_instance._parameter_set.get_parameter(_variable)
+
+    _result = pbm_instance.optimise(
+        [_variable],
+        constraints=["max(netpowerconsumption) <= 1e12"],
+        population=2,
+        generations=1,
+        workers=2,
+        seed=1,
+    )
+    assert _result["feasible"]
+    assert _base * 0.9 <= _result["variables"][_variable] <= _base * 1.1
+    assert pbm_instance._parameter_set.get_parameter(_variable) == _base
+
+    with tempfile.TemporaryDirectory() as tempd:
+        pbm_instance.write_optimisation(tempd)
+        _history = pd.read_hdf(
+            os.path.join(tempd, "data", "session_data.h5"), "optimisation"
+        )
+        assert len(_history) == len(pbm_instance.optimisation_history)
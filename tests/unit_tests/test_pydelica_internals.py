@@ -0,0 +1,121 @@
+import inspect
+import pathlib
+import threading
+
+import pydelica
+import pydelica.compiler
+import pydelica.exception
+import pytest
+
+import power_balance.pydelica_internals as pbm_pydelica
+
+_MODEL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<fmiModelDescription modelName="Model">
+  <DefaultExperiment startTime="0.0" stopTime="60.0" stepSize="1.0"
+    tolerance="1e-06" solver="dassl" outputFormat="mat" variableFilter=".*"/>
+  <ModelVariables>
+    <ScalarVariable name="a" valueReference="1000" variability="parameter"
+      causality="parameter" isValueChangeable="true" alias="noAlias">
+      <Real start="2.0" fixed="true" useNominal="false"/>
+    </ScalarVariable>
+  </ModelVariables>
+</fmiModelDescription>
+"""
+
+
+@pytest.fixture
+def built_session(tmp_path, monkeypatch):
+    # The compiler only locates the OMC binary, which is never run
+    monkeypatch.setenv("OPENMODELICAHOME", str(tmp_path / "openmodelica"))
+    _session = pydelica.Session()
+
+    _binary_dir = tmp_path / "binaries"
+    _binary_dir.mkdir()
+    _binary_dir.joinpath("Model").write_text("binary")
+    _xml = _binary_dir.joinpath("Model_init.xml")
+    _xml.write_text(_MODEL_XML)
+
+    _session._binaries["Model"] = _binary_dir.joinpath("Model")
+    _session._model_parameters["Model"] = pydelica.Model(
+        tmp_path.joinpath("Model.mo"), _xml
+    )
+    _session._simulation_opts["Model"] = pydelica.SimulationOptions(_xml)
+    _session._runtime_opts["Model"] = pydelica.RuntimeOptions()
+    return _session
+
+
+@pytest.mark.pydelica_internals
+def test_internal_attributes(built_session):
+    # Failures here indicate a PyDelica release incompatible with the
+    # session internals Power Balance Models relies upon
+    for attribute in pbm_pydelica.SESSION_ATTRIBUTES:
+        assert hasattr(built_session, attribute), attribute
+    for attribute in pbm_pydelica.COMPILER_ATTRIBUTES:
+        assert hasattr(pbm_pydelica.get_compiler(built_session), attribute), attribute
+    for store in (built_session._model_parameters, built_session._simulation_opts):
+        assert hasattr(store["Model"], pbm_pydelica.MODEL_XML_ATTRIBUTE)
+    _simulate = inspect.unwrap(pydelica.Session.simulate)
+    assert pbm_pydelica.OUTPUT_CHECK_FUNCTION in _simulate.__code__.co_names
+
+
+@pytest.mark.pydelica_internals
+def test_replicate_session(built_session, tmp_path):
+    _replica = pbm_pydelica.replicate_session(built_session, tmp_path / "replica")
+    _binary = built_session.get_binary_location("Model")
+
+    assert _replica.get_binary_location("Model").read_text() == "binary"
+    assert _replica.get_binary_location("Model").parent != _binary.parent
+    for store in ("_model_parameters", "_simulation_opts"):
+        _xml = pathlib.Path(getattr(_replica, store)["Model"]._model_xml)
+        assert _xml.parent == _replica.get_binary_location("Model").parent
+        assert _xml.exists()
+    assert built_session.get_binary_location("Model") == _binary
+
+    _replica.set_parameter("a", 5.0)
+    pbm_pydelica.reset_models(_replica, str(tmp_path))
+    assert _replica.get_parameter("a") == 2.0
+    assert built_session.get_parameter("a") == 2.0
+
+
+@pytest.mark.pydelica_internals
+def test_share_compiler(built_session, tmp_path):
+    _compiler = pbm_pydelica.get_compiler(built_session)
+    _detached = pbm_pydelica.detach_compiler(built_session)
+    assert pbm_pydelica.get_compiler(_detached) is None
+    assert pbm_pydelica.get_compiler(built_session) is _compiler
+
+    pbm_pydelica.share_compiler(_detached, built_session)
+    assert pbm_pydelica.get_compiler(_detached) is _compiler
+
+    _build_dir = tmp_path / "build"
+    _build_dir.mkdir()
+    pbm_pydelica.add_build_directory(_compiler, str(_build_dir))
+    _compiler.clear_cache()
+    assert not _build_dir.exists()
+
+    pbm_pydelica.set_compiler(_detached, pydelica.compiler.Compiler())
+    assert pbm_pydelica.get_compiler(_detached) is not _compiler
+
+
+@pytest.mark.pydelica_internals
+def test_simulation_output(capsys):
+    _check = getattr(pydelica.exception, pbm_pydelica.OUTPUT_CHECK_FUNCTION)
+    _captured = {}
+
+    def _simulate(name):
+        with pbm_pydelica.simulation_output(lambda output: output.upper()) as output:
+            _check_output = getattr(
+                pydelica.exception, pbm_pydelica.OUTPUT_CHECK_FUNCTION
+            )
+            _check_output(f"output of {name}")
+        _captured[name] = output
+
+    _threads = [threading.Thread(target=_simulate, args=(n,)) for n in "ab"]
+    for thread in _threads:
+        thread.start()
+    for thread in _threads:
+        thread.join()
+
+    assert _captured == {"a": ["output of a"], "b": ["output of b"]}
+    assert "OUTPUT OF A" in capsys.readouterr().out
+    assert getattr(pydelica.exception, pbm_pydelica.OUTPUT_CHECK_FUNCTION) is _check
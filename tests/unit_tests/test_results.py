@@ -0,0 +1,686 @@
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+import tables
+import toml
+from conftest import MODELS_DIR
+
+import power_balance.exceptions as pbm_exc
+import power_balance.plugins as pbm_plugin
+from power_balance.core import PowerBalance
+from power_balance.plotting.result_plotting import OutputPlotBuilder
+from power_balance.results import Session
+from power_balance.results.archive import SessionArchive, is_archive, write_archive
+from power_balance.results.blobs import (
+    BlobStore,
+    default_blob_store,
+    read_inputs,
+    write_inputs,
+)
+from power_balance.results.dense import SWEEP_DATA_FILE, DenseSweepResults
+from power_balance.results.handoff import publish_results, read_handles
+from power_balance.results.manifest import (
+    INPUT_HASHES_KEY,
+    find_session,
+    input_manifest,
+    manifest_hash,
+)
+from power_balance.results.session import SESSION_DATA_FILE, SWEEP_PARAMETERS_ATTR
+from power_balance.results.storage import (
+    chunk_rows,
+    read_metadata,
+    storage_backend,
+    write_metadata,
+)
+from power_balance.results.sweep import SweepIndex, build_sweep_indexes
+
+
+def _sweep_cuts():
+    _time = np.linspace(0, 10, 11)
+    _cuts = []
+    for a in (1.0, 2.0):
+        for b in (0.1, 0.2, 0.3):
+            _cuts.append(
+                (
+                    {"Model.A": a, "Model.B": b},
+                    pd.DataFrame(
+                        {
+                            "magnetpower": a * _time,
+                            "netpowerconsumption": b * _time,
+                            "time": _time,
+                        }
+                    ),
+                )
+            )
+    return _cuts
+
+
+@pytest.fixture
+def dense_results():
+    return DenseSweepResults.from_cuts(_sweep_cuts())
+
+
+@pytest.mark.results
+def test_dense_shape(dense_results):
+    assert dense_results.data.shape == (6, 11, 2)
+    assert dense_results.parameters == ["model.a", "model.b"]
+    assert dense_results.variables == ["magnetpower", "netpowerconsumption"]
+    assert len(dense_results.combinations) == 6
+
+
+@pytest.mark.results
+def test_dense_cut(dense_results):
+    _cut = dense_results.cut({"model.a": 2.0, "model.b": 0.3})
+    assert dense_results.index({"Model.A": 2.0, "Model.B": 0.3}) == 5
+    assert np.allclose(_cut["magnetpower"], 2.0 * _cut["time"])
+    assert np.allclose(_cut["netpowerconsumption"], 0.3 * _cut["time"])
+    with pytest.raises(KeyError):
+        dense_results.index({"model.a": 3.0, "model.b": 0.3})
+
+
+@pytest.mark.results
+def test_dense_frame_round_trip(dense_results):
+    _frame = dense_results.to_frame()
+    assert len(_frame) == 66
+    _from_frame = DenseSweepResults.from_frame(_frame, ["model.a", "model.b"])
+    assert np.array_equal(_from_frame.data, dense_results.data)
+    assert _from_frame.combinations.equals(dense_results.combinations)
+
+
+@pytest.mark.results
+def test_dense_time_mismatch():
+    _cuts = _sweep_cuts()
+    _cuts[1] = (_cuts[1][0], _cuts[1][1].iloc[:-1])
+    with pytest.raises(pbm_exc.InvalidInputError):
+        DenseSweepResults.from_cuts(_cuts)
+
+
+@pytest.mark.results
+def test_dense_hdf5_io(dense_results):
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "sweep_data.h5")
+        dense_results.write_hdf5(_file, "model", {"pbm_version": "test"})
+        # Writing again should replace the existing group
+        dense_results.write_hdf5(_file, "model")
+        _read = DenseSweepResults.read_hdf5(_file, "model")
+    assert np.array_equal(_read.data, dense_results.data)
+    assert np.array_equal(_read.time, dense_results.time)
+    assert _read.parameters == dense_results.parameters
+    assert _read.variables == dense_results.variables
+
+
+@pytest.mark.results
+def test_dense_npz_io(dense_results):
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "sweep_data.npz")
+        dense_results.write_npz(_file)
+        _read = DenseSweepResults.read_npz(_file)
+    assert np.array_equal(_read.data, dense_results.data)
+    assert _read.combinations.equals(dense_results.combinations)
+
+
+@pytest.mark.results
+def test_sweep_index_cuts(dense_results):
+    _frame = dense_results.to_frame()
+    _index = SweepIndex(_frame, ["Model.A", "Model.B"])
+    assert len(_index) == 6
+    assert _index.cuts[0] == {"model.a": 1.0, "model.b": 0.1}
+    _cut = _index.cut({"model.a": 2.0, "model.b": 0.2})
+    _expected = _frame[(_frame["model.a"] == 2.0) & (_frame["model.b"] == 0.2)]
+    assert _cut.equals(_expected)
+    assert _index.last().equals(_frame.iloc[-11:])
+    with pytest.raises(KeyError):
+        _index.cut({"model.a": 5.0, "model.b": 0.2})
+
+
+@pytest.mark.results
+def test_sweep_index_non_contiguous(dense_results):
+    _frame = dense_results.to_frame().sort_values(["time", "model.a"])
+    _index = SweepIndex(_frame, ["model.a", "model.b"])
+    _cut = _index.cut({"model.a": 1.0, "model.b": 0.3})
+    assert len(_cut) == 11
+    assert np.allclose(_cut["netpowerconsumption"], 0.3 * _cut["time"])
+
+
+@pytest.mark.results
+def test_build_sweep_indexes(dense_results):
+    _data = {"model": dense_results.to_frame()}
+    assert not build_sweep_indexes(_data, {"models": ["Model"]})
+    _indexes = build_sweep_indexes(
+        _data, {"sweep": {"Model.A": [1.0, 2.0], "Other.C": [3.0]}}
+    )
+    assert _indexes["model"].parameters == ["model.a"]
+    assert len(_indexes["model"]) == 2
+
+
+def _write_session_directory(directory):
+    os.makedirs(os.path.join(directory, "configs"))
+    os.makedirs(os.path.join(directory, "data"))
+    os.makedirs(os.path.join(directory, "parameters"))
+
+    with open(os.path.join(directory, "configs", "configuration.toml"), "w") as f:
+        toml.dump(
+            {
+                "models": ["Tokamak.Interdependencies", "Dense.Model", "Old.Model"],
+                "sweep": {"model.a": [1.0, 2.0], "model.b": [0.1, 0.2, 0.3]},
+            },
+            f,
+        )
+    with open(
+        os.path.join(directory, "parameters", "simulation_options.toml"), "w"
+    ) as f:
+        toml.dump({"stopTime": 60, "solver": "dassl"}, f)
+    with open(os.path.join(directory, "parameters", "magnetpower.toml"), "w") as f:
+        toml.dump({"nPF": 6}, f)
+
+    _frame = DenseSweepResults.from_cuts(_sweep_cuts()).to_frame()
+    _data_file = os.path.join(directory, "data", SESSION_DATA_FILE)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", tables.NaturalNameWarning)
+        with pd.HDFStore(_data_file) as hdf_store:
+            hdf_store.put(
+                "tokamak_interdependencies",
+                _frame,
+                format="table",
+                data_columns=["time", "model.a", "model.b"],
+            )
+            setattr(
+                hdf_store.get_storer("tokamak_interdependencies").attrs,
+                SWEEP_PARAMETERS_ATTR,
+                ["model.a", "model.b"],
+            )
+            hdf_store.put("old_model", _frame)
+            hdf_store.put("summary", pd.DataFrame({"value": [1.0]}), format="table")
+
+    DenseSweepResults.from_cuts(_sweep_cuts()).write_hdf5(
+        os.path.join(directory, "data", SWEEP_DATA_FILE), "dense_model"
+    )
+
+
+@pytest.fixture
+def session():
+    with tempfile.TemporaryDirectory() as tempd:
+        _write_session_directory(tempd)
+        yield Session(tempd)
+
+
+@pytest.mark.results
+def test_session_metadata(session):
+    assert session.models == ["tokamak_interdependencies", "dense_model", "old_model"]
+    assert session.simulation_options == {"stopTime": 60, "solver": "dassl"}
+    assert session.parameters == {"magnetpower": {"nPF": 6}}
+    for model in session.models:
+        assert session.sweep_parameters(model) == ["model.a", "model.b"]
+        assert session.variables(model) == ["magnetpower", "netpowerconsumption"]
+        assert session.cuts(model)[1] == {"model.a": 1.0, "model.b": 0.2}
+    assert session.table("summary")["value"].tolist() == [1.0]
+    assert session.table("solver_stats") is None
+    with pytest.raises(KeyError):
+        session.variables("missing_model")
+
+
+@pytest.mark.results
+@pytest.mark.parametrize(
+    "model", ["Tokamak.Interdependencies", "dense_model", "old_model"]
+)
+def test_session_select(session, model):
+    _all = session.select(model)
+    assert len(_all) == 66
+
+    _selected = session.select(
+        model,
+        columns=["time", "magnetpower"],
+        where={"model.a": 2.0, "model.b": [0.1, 0.3], "time": ("<=", 4)},
+    )
+    assert list(_selected.columns) == ["time", "magnetpower"]
+    assert len(_selected) == 10
+    np.testing.assert_allclose(_selected["magnetpower"], 2.0 * _selected["time"])
+
+    _cut = session.cut(model, {"Model.A": 1.0, "Model.B": 0.3})
+    assert list(_cut.columns) == ["time", "magnetpower", "netpowerconsumption"]
+    np.testing.assert_allclose(_cut["netpowerconsumption"], 0.3 * _cut["time"])
+    np.testing.assert_allclose(
+        session.cut(model)["magnetpower"], np.linspace(0, 10, 11)
+    )
+
+    _array = session.array(model, "magnetpower", where={"model.b": (">", 0.25)})
+    assert _array.shape == (22,)
+    assert session.select(model, start=2, stop=5).shape == (3, 5)
+
+    with pytest.raises(KeyError):
+        session.cut(model, {"model.a": 3.0, "model.b": 0.1})
+    with pytest.raises(pbm_exc.InvalidInputError):
+        session.select(model, where={"magnetpower": 1.0})
+    with pytest.raises(pbm_exc.InvalidInputError):
+        session.select(model, where={"model.a": ("~", 1.0)})
+
+
+@pytest.mark.results
+def test_session_plots(session):
+    _builder = OutputPlotBuilder(session.configuration, session)
+    assert _builder.has_sweep()
+    assert all(len(_builder.get_cuts()[model]) == 6 for model in session.models)
+    assert all(len(plots) == 6 for plots in _builder.get_plots().values())
+
+
+_STORAGE_REQUIREMENTS = {"parquet": "pyarrow", "zarr": "zarr"}
+
+
+@pytest.mark.results
+@pytest.mark.parametrize("storage_format", ["hdf5", "npz", "parquet", "zarr"])
+def test_storage_round_trip(storage_format):
+    if storage_format in _STORAGE_REQUIREMENTS:
+        pytest.importorskip(_STORAGE_REQUIREMENTS[storage_format])
+
+    _frame = DenseSweepResults.from_cuts(_sweep_cuts()).to_frame()
+    _backend = storage_backend(
+        {"format": storage_format, "float32": True, "chunk_rows": 22}
+    )
+
+    with tempfile.TemporaryDirectory() as tempd:
+        _write_session_directory(tempd)
+        _data_directory = os.path.join(tempd, "data")
+        _backend.write(
+            _data_directory, "tokamak_interdependencies", _frame, ["model.a", "model.b"]
+        )
+        write_metadata(
+            _data_directory,
+            {
+                "storage": _backend.options(),
+                "models": {
+                    "tokamak_interdependencies": {
+                        "storage": storage_format,
+                        "sweep_parameters": ["model.a", "model.b"],
+                    }
+                },
+            },
+        )
+
+        assert "tokamak_interdependencies" in _backend.keys(_data_directory)
+        _read = _backend.read(_data_directory, "tokamak_interdependencies")
+        assert list(_read.columns) == list(_frame.columns)
+        assert _read["magnetpower"].dtype == np.float32
+        assert _read["time"].dtype == np.float64
+        np.testing.assert_allclose(_read["model.b"], _frame["model.b"])
+
+        _session = Session(tempd)
+        assert _session.models == ["tokamak_interdependencies"]
+        assert _session.sweep_parameters("tokamak_interdependencies") == [
+            "model.a",
+            "model.b",
+        ]
+        assert len(_session.cuts("tokamak_interdependencies")) == 6
+        _selected = _session.select(
+            "tokamak_interdependencies",
+            columns=["time", "magnetpower"],
+            where={"model.a": 2.0, "model.b": [0.1, 0.3], "time": ("<=", 4)},
+        )
+        assert len(_selected) == 10
+        np.testing.assert_allclose(_selected["magnetpower"], 2.0 * _selected["time"])
+        assert _session.select(
+            "tokamak_interdependencies", where={"model.a": 3.0}
+        ).empty
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            _archive_file = write_archive(tempd, os.path.join(archive_dir, "s.zip"))
+            with Session(_archive_file) as archived:
+                assert archived.select(
+                    "tokamak_interdependencies",
+                    columns=["time", "magnetpower"],
+                    where={"model.a": 2.0, "model.b": [0.1, 0.3], "time": ("<=", 4)},
+                ).equals(_selected)
+
+
+@pytest.mark.results
+def test_storage_options():
+    _frame = DenseSweepResults.from_cuts(_sweep_cuts()).to_frame()
+    assert chunk_rows(_frame) == 66
+    assert chunk_rows(_frame, ["model.a", "model.b"], chunk_bytes=1000) == 22
+    assert chunk_rows(_frame, ["model.a", "model.b"], chunk_bytes=1) == 11
+    assert storage_backend().compression == "blosc:zstd"
+    assert storage_backend({"format": "npz", "compression": "none"}).complevel == 0
+    with pytest.raises(pbm_exc.InvalidInputError):
+        storage_backend({"format": "csv"})
+    with pytest.raises(pbm_exc.InvalidInputError):
+        storage_backend({"format": "npz", "compression": "zstd"})
+
+
+@pytest.mark.results
+def test_session_archive():
+    with tempfile.TemporaryDirectory() as tempd:
+        _directory = os.path.join(tempd, "pbm_results_2026_01_01_12_00_00")
+        _write_session_directory(_directory)
+        storage_backend({"format": "npz"}).write(
+            os.path.join(_directory, "data"),
+            "old_model",
+            DenseSweepResults.from_cuts(_sweep_cuts()).to_frame(),
+            ["model.a", "model.b"],
+        )
+        _archive_file = write_archive(_directory)
+        assert is_archive(_archive_file)
+        assert not is_archive(_directory)
+
+        with SessionArchive(_archive_file) as archive:
+            assert archive.name == "pbm_results_2026_01_01_12_00_00"
+            assert archive.manifest["members"] == 6
+            assert archive.exists("data") and not archive.exists("plots")
+            assert archive.glob("parameters/*.toml") == [
+                "parameters/magnetpower.toml",
+                "parameters/simulation_options.toml",
+            ]
+            assert archive.subdirectory("data").glob("*.npz") == ["old_model.npz"]
+            _parameters = archive.local_path("parameters")
+            assert sorted(os.listdir(_parameters)) == [
+                "magnetpower.toml",
+                "simulation_options.toml",
+            ]
+
+            # Views share the archive, which remains open when a view is
+            # closed, and members extracted through them are removed with it
+            with archive.subdirectory("data") as data:
+                _extracted = data.local_path("old_model.npz")
+                assert os.path.exists(_extracted)
+            assert archive.exists("data/old_model.npz")
+            assert archive.read_text("parameters/magnetpower.toml")
+        assert not os.path.exists(_extracted)
+        assert not os.path.exists(_parameters)
+
+        with Session(_directory) as directory, Session(_archive_file) as archived:
+            assert archived.models == directory.models
+            assert archived.parameters == directory.parameters
+            for model in archived.models:
+                assert archived.select(
+                    model, where={"model.a": 2.0, "time": ("<=", 4)}
+                ).equals(
+                    directory.select(model, where={"model.a": 2.0, "time": ("<=", 4)})
+                )
+            assert archived.table("summary")["value"].tolist() == [1.0]
+
+        # Each HDF5 member is read from the archive once however many times
+        # its store is opened
+        with SessionArchive(_archive_file) as archive:
+            _reads = []
+            _read = archive._zip.read
+            archive._zip.read = lambda name: _reads.append(name) or _read(name)
+            with archive.subdirectory("data") as data:
+                for _ in range(3):
+                    with data.hdf_store(SESSION_DATA_FILE) as store:
+                        assert store.keys()
+            assert _reads == [f"data/{SESSION_DATA_FILE}"]
+
+
+@pytest.mark.results
+def test_blob_store(tmp_path, monkeypatch, caplog):
+    _store = BlobStore()
+    assert _store.directory == str(tmp_path / "blobs")
+
+    with monkeypatch.context() as m:
+        m.delenv("PBM_BLOB_STORE")
+        assert default_blob_store(str(tmp_path)) == str(tmp_path / ".pbm_blobs")
+
+    _sessions = [tmp_path / f"session_{i}" for i in range(3)]
+    for session in _sessions:
+        (session / "profiles").mkdir(parents=True)
+
+    _input_a = tmp_path / "a.mat"
+    _input_a.write_bytes(b"profile")
+    _input_b = tmp_path / "b.mat"
+    _input_b.write_bytes(b"profile")
+
+    _digest = _store.add(str(_input_a), str(_sessions[0] / "profiles" / "a.mat"))
+    assert _store.add(str(_input_b), str(_sessions[1] / "profiles" / "a.mat")) == (
+        _digest
+    )
+    assert _digest in _store
+    assert len(list((tmp_path / "blobs").rglob("*"))) == 2
+
+    # Sessions share the stored blob, which cannot be modified in place
+    _blob = os.stat(_store.path(_digest))
+    assert os.stat(_sessions[1] / "profiles" / "a.mat").st_ino == _blob.st_ino
+    assert not _blob.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+    def _no_link(*_):
+        raise OSError("Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", _no_link)
+    monkeypatch.setattr("power_balance.results.blobs._reflink", lambda *_: False)
+    _store.link(_digest, str(_sessions[2] / "profiles" / "a.mat"))
+    assert (_sessions[2] / "profiles" / "a.mat").read_bytes() == b"profile"
+    assert "session inputs are copied" in caplog.text
+
+    write_inputs(str(_sessions[2]), {"profiles/a.mat": _digest}, _store)
+    write_inputs(str(_sessions[2]), {"parameters/b.toml": "0" * 64}, _store)
+    assert read_inputs(str(_sessions[2])) == {
+        "parameters/b.toml": "0" * 64,
+        "profiles/a.mat": _digest,
+    }
+    assert read_inputs(str(tmp_path)) == {}
+
+    with pytest.raises(FileNotFoundError):
+        _store.link("0" * 64, str(_sessions[2] / "profiles" / "b.mat"))
+
+
+@pytest.mark.results
+def test_input_manifest(tmp_path, parameter_obj_norm):
+    _profiles = tmp_path / "profiles"
+    _profiles.mkdir()
+    (_profiles / "currentTF.mat").write_bytes(b"profile")
+    _configuration = {
+        "models": ["Tokamak.Interdependencies"],
+        "profiles_directory": str(_profiles),
+        "modelica_file_directory": MODELS_DIR,
+        "trace": False,
+    }
+    _versions = {"pbm": "1.0.0", "openmodelica": "1.22.0"}
+
+    _manifest = input_manifest(_configuration, parameter_obj_norm, _versions)
+    assert list(_manifest["profiles"]) == ["currentTF.mat"]
+    assert "Tokamak.mo" in _manifest["models"]
+    assert "Resources/Include/getTimeTableYmax.c" in _manifest["models"]
+    assert "__init__.py" not in _manifest["models"]
+    _hash = manifest_hash(_manifest)
+
+    def _hash_of(configuration, versions=_versions):
+        return manifest_hash(
+            input_manifest(configuration, parameter_obj_norm, versions)
+        )
+
+    # Input locations and options not affecting the outputs are not hashed
+    shutil.copytree(_profiles, tmp_path / "profiles_copy")
+    _moved = _configuration | {
+        "trace": True,
+        "profiles_directory": str(tmp_path / "profiles_copy"),
+    }
+    assert _hash_of(_moved) == _hash
+
+    (tmp_path / "profiles_copy" / "currentTF.mat").write_bytes(b"new profile")
+    assert _hash_of(_moved) != _hash
+    assert _hash_of(_configuration, {"pbm": "1.0.1"}) != _hash
+
+    parameter_obj_norm[next(iter(parameter_obj_norm.keys()))] = -1.0
+    assert _hash_of(_configuration) != _hash
+
+    # Sessions are matched on any of their recorded input hashes
+    _runs = tmp_path / "runs"
+    for session, hashes in (
+        ("pbm_results_2026_01_01_12_00_00", ["0" * 64, _hash]),
+        ("pbm_results_2026_01_02_12_00_00", ["1" * 64]),
+        ("pbm_results_2026_01_03_12_00_00", []),
+    ):
+        (_runs / session / "data").mkdir(parents=True)
+        write_metadata(str(_runs / session / "data"), {INPUT_HASHES_KEY: hashes})
+
+    _first = str(_runs / "pbm_results_2026_01_01_12_00_00")
+    assert find_session([str(_runs)], _hash) == _first
+    assert find_session([str(tmp_path), _first], "0" * 64) == _first
+    assert find_session([str(_runs)], "2" * 64) is None
+
+    _archive_file = write_archive(_first)
+    shutil.rmtree(_first)
+    assert find_session([str(_runs)], _hash) == _archive_file
+
+
+def _manifest_session(tmp_path, parameter_set):
+    _profiles = tmp_path / "profiles"
+    _profiles.mkdir(exist_ok=True)
+    (_profiles / "currentTF.mat").write_bytes(b"profile")
+    _session = PowerBalance.__new__(PowerBalance)
+    _session._logger = logging.getLogger("PowerBalance")
+    _session.configuration = {
+        "models": ["Tokamak.Interdependencies"],
+        "profiles_directory": str(_profiles),
+        "modelica_file_directory": MODELS_DIR,
+    }
+    _session._parameter_set = parameter_set
+    _session._om_version = "1.22.0"
+    return _session
+
+
+@pytest.mark.results
+def test_skip_matched_run(tmp_path, parameter_obj_norm, monkeypatch):
+    _session = _manifest_session(tmp_path, parameter_obj_norm)
+    _session._given_input_hash = manifest_hash(_session.input_manifest())
+    _session.matching_session = str(tmp_path / "pbm_results_2026_01_01_12_00_00")
+    _built = []
+    monkeypatch.setattr(
+        _session, "read_models_from_directory", lambda: _built.append(True)
+    )
+
+    assert _session._skip_matched_run(None)
+    assert not _built
+
+    # Parameters modified after the session was created require a run
+    _session.set_parameter_value(next(iter(parameter_obj_norm.keys())), -1.0)
+    assert not _session._skip_matched_run(None)
+    assert _built
+    assert _session.matching_session is None
+    assert _session._built_input_hash is None
+
+
+@pytest.mark.results
+def test_write_manifest_sweep(tmp_path, parameter_obj_norm):
+    _session = _manifest_session(tmp_path, parameter_obj_norm)
+    _session._given_input_hash = "0" * 64
+    _session._built_input_hash = manifest_hash(_session.input_manifest())
+    _parameter = next(iter(parameter_obj_norm.keys()))
+    (tmp_path / "session" / "data").mkdir(parents=True)
+
+    # A sweep leaves the parameters at the values of its last combination
+    _session._record_run_inputs(None)
+    _session.set_parameter_value(_parameter, -1.0)
+    _session.write_manifest(str(tmp_path / "session"))
+    _metadata = read_metadata(str(tmp_path / "session" / "data"))
+    assert _metadata[INPUT_HASHES_KEY] == [_session._built_input_hash, "0" * 64]
+
+    # A sweep given as an argument is an input of the run
+    _session._record_run_inputs({_parameter: (0.0, 1.0, 2)})
+    _session.write_manifest(str(tmp_path / "session"))
+    _metadata = read_metadata(str(tmp_path / "session" / "data"))
+    assert len(_metadata[INPUT_HASHES_KEY]) == 1
+    assert _metadata[INPUT_HASHES_KEY][0] != _session._built_input_hash
+
+
+@pytest.mark.results
+@pytest.mark.parametrize("handoff_format", ["arrow", "numpy"])
+def test_result_handoff(tmp_path, handoff_format):
+    if handoff_format == "arrow":
+        pytest.importorskip("pyarrow")
+
+    _frame = DenseSweepResults.from_cuts(_sweep_cuts()).to_frame()
+    _handles = publish_results(
+        {"Tokamak.Interdependencies": _frame}, str(tmp_path), handoff_format
+    )
+    assert list(_handles) == ["tokamak_interdependencies"]
+
+    # Handles are opened by another process from the published index
+    _handle = read_handles(str(tmp_path))["tokamak_interdependencies"]
+    assert _handle.format == handoff_format
+    assert _handle.columns == list(_frame.columns) and _handle.rows == len(_frame)
+
+    _arrays = _handle.arrays(["magnetpower"])
+    np.testing.assert_array_equal(_arrays["magnetpower"], _frame["magnetpower"])
+    assert not _arrays["magnetpower"].flags.writeable
+    assert not _arrays["magnetpower"].flags.owndata
+    pd.testing.assert_frame_equal(_handle.to_frame(), _frame)
+
+    if handoff_format == "arrow":
+        assert _handle.table().num_rows == len(_frame)
+
+    with pytest.raises(pbm_exc.InvalidInputError):
+        publish_results({}, str(tmp_path), "csv")
+    with pytest.raises(FileNotFoundError):
+        read_handles(str(tmp_path / "missing"))
+
+
+_POST_RUN_SCRIPT = """
+import json
+import os
+
+
+def record(handles, session_directory):
+    _handle = handles["tokamak_interdependencies"]
+    with open(os.path.join(session_directory, "post_run.json"), "w") as out_f:
+        json.dump(
+            {
+                "models": list(handles),
+                "session_directory": session_directory,
+                "magnetpower": _handle.arrays(["magnetpower"])["magnetpower"].tolist(),
+            },
+            out_f,
+        )
+"""
+
+
+@pytest.fixture
+def post_run_plugin(tmp_path, monkeypatch):
+    _plugins_dir = tmp_path / "plugins"
+    _plugin_dir = _plugins_dir / "pbm_test_post_run"
+    _plugin_dir.mkdir(parents=True)
+    (_plugin_dir / "__init__.py").write_text("")
+    (_plugin_dir / "post_run.py").write_text(_POST_RUN_SCRIPT)
+    (_plugin_dir / pbm_plugin.PLUGIN_FILE).write_text(
+        toml.dumps({"name": "Post Run", "post_run_script": "post_run:record"})
+    )
+    monkeypatch.setattr(pbm_plugin, "PLUGINS_DIR", str(_plugins_dir))
+    monkeypatch.setattr(
+        pbm_plugin, "__path__", [*pbm_plugin.__path__, str(_plugins_dir)]
+    )
+    yield "Post Run"
+    for module in ("pbm_test_post_run.post_run", "pbm_test_post_run"):
+        sys.modules.pop(f"power_balance.plugins.{module}", None)
+
+
+@pytest.mark.results
+def test_post_run_scripts(tmp_path, post_run_plugin):
+    _scripts = pbm_plugin.get_post_run_scripts([post_run_plugin])
+    assert [script.__name__ for script in _scripts] == ["record"]
+
+    _frame = DenseSweepResults.from_cuts(_sweep_cuts()).to_frame()
+    _session = PowerBalance.__new__(PowerBalance)
+    _session._plugins = [post_run_plugin]
+    _session.power_data = {"Tokamak.Interdependencies": _frame}
+    _session._handoff_directory = None
+    _session_directory = tmp_path / "pbm_results_2026_01_01_12_00_00"
+    _session_directory.mkdir()
+
+    _session._run_post_run_scripts(str(_session_directory))
+
+    with open(_session_directory / "post_run.json") as in_f:
+        _received = json.load(in_f)
+    assert _received["models"] == ["tokamak_interdependencies"]
+    assert _received["session_directory"] == str(_session_directory)
+    assert _received["magnetpower"] == _frame["magnetpower"].tolist()
+
+    # Outputs are published to a temporary directory held by the session
+    assert os.path.exists(_session._handoff_directory.name)
+    _session._handoff_directory.cleanup()
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import power_balance.exceptions as pbm_exc
+import power_balance.screening as pbm_screen
+
+
+@pytest.fixture(scope="module")
+def evaluator():
+    return pbm_screen.ScreeningEvaluator()
+
+
+@pytest.mark.screening
+def test_screen_defaults(evaluator):
+    _result = evaluator.evaluate(pd.DataFrame(index=[0]))
+    assert set(_result.columns) == {
+        "air_gas_power",
+        "blanketdetritpower",
+        "water_detrit_power",
+        "powergenerated",
+    }
+    assert np.isclose(_result["water_detrit_power"][0], 1148243.19, rtol=1e-8)
+    assert np.isclose(_result["air_gas_power"][0], 1517431.95, rtol=1e-8)
+    assert _result["blanketdetritpower"][0] == 0
+    assert np.isclose(_result["powergenerated"][0], 4.60894e8, rtol=1e-6)
+
+
+@pytest.mark.screening
+def test_screen_vectorised(evaluator):
+    _table = pd.DataFrame(
+        {
+            "thermalpower": [500.0, 1000.0, 1500.0],
+            "tokamak.primarycoolanttype": ["FLiBe", "CO2_NC", "He_C"],
+            "PowerGenEquations.powergenOutletTemp": [650.0, 700.0, 750.0],
+        },
+        index=["a", "b", "c"],
+    )
+    _result = evaluator.evaluate(_table)
+    assert list(_result.index) == ["a", "b", "c"]
+
+    for label, row in _table.iterrows():
+        _single = evaluator.evaluate(row.to_frame().T)
+        assert np.allclose(_single.loc[label], _result.loc[label])
+
+
+@pytest.mark.screening
+def test_screen_blanket_non_carrier(evaluator):
+    _result = evaluator.evaluate(
+        pd.DataFrame({"tokamak.primarycoolanttype": ["CO2_C", "CO2_NC", "He_NC"]})
+    )
+    assert _result["blanketdetritpower"][0] == 0
+    assert all(_result["blanketdetritpower"][1:] > 0)
+
+
+@pytest.mark.screening
+def test_screen_case_range(evaluator):
+    _result = evaluator.evaluate(
+        pd.DataFrame(
+            {
+                "tokamak.ratiotype": ["2", 2.0, "1.5"],
+                "powergenequations.powergenoutlettemp": [700.0, 700.0, 380.0],
+                "tokamak.primarycoolanttype": ["CO2_C"] * 3,
+            }
+        )
+    )
+    assert _result["powergenerated"][0] == _result["powergenerated"][1]
+    assert np.isnan(_result["powergenerated"][2])
+
+
+@pytest.mark.screening
+def test_screen_efficiency_value(evaluator):
+    _result = evaluator.evaluate(
+        pd.DataFrame(
+            {
+                "powergenerated.usepowergeneffvalue": [True],
+                "powergenerated.powergeneff": [0.3],
+            }
+        )
+    )
+    assert np.isclose(_result["powergenerated"][0], 0.3 * 1e9)
+
+
+@pytest.mark.screening
+def test_screen_unknown_parameter(evaluator):
+    with pytest.raises(pbm_exc.UnidentifiedParameterError):
+        evaluator.evaluate(pd.DataFrame({"magnetpower.notaparameter": [1.0]}))
+
+
+@pytest.mark.screening
+def test_screen_waste_heat(evaluator):
+    _heat_loads = pd.DataFrame(
+        {name: [1e6, 2e6] for name in pbm_screen.WASTE_HEAT_INPUTS}
+    )
+    _result = evaluator.evaluate(_heat_loads)
+    assert "wasteheatpower" in _result
+    assert _result["wasteheatpower"][1] > _result["wasteheatpower"][0]
+
+
+@pytest.mark.screening
+def test_screen_parameter_set_override(evaluator):
+    _override = pbm_screen.ScreeningEvaluator(
+        {"tokamak.interdependencies.water_detrit_power.contingencyfactor": 0}
+    )
+    _default = evaluator.evaluate(pd.DataFrame(index=[0]))
+    _result = _override.evaluate(pd.DataFrame(index=[0]))
+    assert np.isclose(
+        _result["water_detrit_power"][0], _default["water_detrit_power"][0] / 1.5
+    )
+    assert np.isclose(_result["air_gas_power"][0], _default["air_gas_power"][0])
@@ -0,0 +1,289 @@
+import json
+import os
+import pathlib
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import power_balance.analysis.evaluation as pbm_eval
+import power_balance.analysis.sensitivity as pbm_sens
+import power_balance.exceptions as pbm_exc
+import power_balance.instrumentation.solver as pbm_solver
+
+PLASMA_SCENARIO = {
+    "plasma_ramp_up_start": 10,
+    "plasma_flat_top_start": 20,
+    "plasma_flat_top_end": 40,
+    "plasma_ramp_down_end": 50,
+}
+
+BASE = {"model.a": 2.0, "model.b": 10, "model.c": 5.0}
+
+
+def _linear(point):
+    _values = {**BASE, **point}
+    return 3 * _values["model.a"] + 0.5 * _values["model.b"]
+
+
+@pytest.mark.sensitivity
+def test_point_key():
+    assert pbm_eval.point_key({"A": 5, "b": "x"}) == pbm_eval.point_key(
+        {"b": "x", "a": np.float64(5.0)}
+    )
+    assert pbm_eval.point_key({"a": 5}) != pbm_eval.point_key({"a": 6})
+    assert pbm_eval.point_key({"a": True}) != pbm_eval.point_key({"a": 1})
+
+
+@pytest.mark.sensitivity
+def test_metric_value():
+    _time = np.linspace(0, 60, 601)
+    _outputs = {
+        "Tokamak.Interdependencies": pd.DataFrame(
+            {
+                "time": _time,
+                "netpowergeneration": np.where((_time >= 20) & (_time < 40), 5.0, 1.0),
+            }
+        )
+    }
+    assert pbm_eval.metric_value(
+        "netpowergeneration", _outputs, PLASMA_SCENARIO
+    ) == pytest.approx(5.0)
+    assert (
+        pbm_eval.metric_value(
+            "min(Tokamak.Interdependencies.NetPowerGeneration)",
+            _outputs,
+            PLASMA_SCENARIO,
+        )
+        == 1.0
+    )
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_eval.metric_value("magnetpower", _outputs, PLASMA_SCENARIO)
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_eval.parse_metric("median(netpowergeneration)")
+
+
+@pytest.mark.sensitivity
+def test_evaluation_cache():
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "cache.json")
+        _cache = pbm_eval.EvaluationCache("context", _file)
+        _cache.put({"a": 1}, {"metric": 2.0})
+        assert _cache.get({"A": 1.0}, ["metric"]) == {"metric": 2.0}
+        assert _cache.get({"a": 1}, ["metric", "other"]) is None
+        _cache.save()
+
+        assert json.load(open(_file))
+        assert pbm_eval.EvaluationCache("context", _file).get({"a": 1}, ["metric"])
+        assert not pbm_eval.EvaluationCache("other", _file).get({"a": 1}, ["metric"])
+
+
+class _StubParameters(dict):
+    def get_parameter(self, name):
+        return self[name]
+
+
+class _StubModelXML:
+    def __init__(self, model_xml):
+        self._model_xml = model_xml
+
+
+class _StubPyDelicaSession:
+    def __init__(self, directory):
+        _binary_dir = pathlib.Path(directory, "binaries")
+        _binary_dir.mkdir()
+        _binary_dir.joinpath("Model").write_text("binary")
+        _binary_dir.joinpath("Model_init.xml").write_text("<xml/>")
+        self._binaries = {"Model": _binary_dir.joinpath("Model")}
+        self._model_parameters = {
+            "Model": _StubModelXML(_binary_dir.joinpath("Model_init.xml"))
+        }
+        self._simulation_opts = {
+            "Model": _StubModelXML(_binary_dir.joinpath("Model_init.xml"))
+        }
+        self._runtime_opts = {"Model": {}}
+        self._solutions = {}
+
+
+class _StubPowerBalance:
+    """Session simulating the linear function of two parameters"""
+
+    def __init__(self, directory):
+        self.configuration = {"models": ["Model"]}
+        self.plasma_scenario = PLASMA_SCENARIO
+        self.pydelica_session = _StubPyDelicaSession(directory)
+        self._parameter_set = _StubParameters(BASE)
+        self._models_list = {}
+        self.profile_digest = "profiles"
+        self.simulated = []
+        self.power_data = {}
+        self.solver_statistics = pbm_solver.SolverStatistics()
+        self.barrier = None
+
+    def input_manifest(self):
+        return {
+            "parameters": dict(self._parameter_set),
+            "profiles": self.profile_digest,
+        }
+
+    def set_parameter_value(self, name, value):
+        self._parameter_set[name] = value
+
+    def _run_models(self):
+        self.simulated.append(threading.get_ident())
+        self.solver_statistics.record("Model", -1, "")
+        if self.barrier:
+            self.barrier.wait()
+        _values = dict(self._parameter_set)
+        if _values["model.a"] < 0:
+            raise ZeroDivisionError("division by zero")
+        _time = np.linspace(0, 60, 61)
+        return {
+            "Model": pd.DataFrame(
+                {"time": _time, "output": np.full_like(_time, _linear(_values))}
+            )
+        }
+
+
+@pytest.mark.sensitivity
+def test_parallel_evaluator(tmp_path):
+    _session = _StubPowerBalance(tmp_path)
+    _points = [{"model.a": 1.0}, {"Model.A": 1}, {"model.b": 20}, {}]
+    _cache_file = str(tmp_path.joinpath("cache.json"))
+
+    with pbm_eval.ParallelEvaluator(
+        _session, ["output"], workers=2, cache_file=_cache_file
+    ) as evaluator:
+        _table = evaluator.evaluate(_points)
+        assert _table["output"].tolist() == pytest.approx([8.0, 8.0, 16.0, 11.0])
+        assert set(_table[pbm_eval.STATUS_COLUMN]) == {"simulated"}
+        # Repeated points are simulated once
+        assert len(_session.simulated) == 3
+        assert evaluator.evaluate([{}])[pbm_eval.STATUS_COLUMN][0] == "cached"
+
+    with pbm_eval.ParallelEvaluator(
+        _session, ["output"], cache_file=_cache_file
+    ) as evaluator:
+        _table = evaluator.evaluate(_points)
+        assert set(_table[pbm_eval.STATUS_COLUMN]) == {"cached"}
+        assert len(_session.simulated) == 3
+
+    # Points memoised for other profiles are not reused
+    _session.profile_digest = "modified"
+    with pbm_eval.ParallelEvaluator(
+        _session, ["output"], cache_file=_cache_file
+    ) as evaluator:
+        assert evaluator.evaluate([{}])[pbm_eval.STATUS_COLUMN][0] == "simulated"
+
+
+@pytest.mark.sensitivity
+def test_parallel_evaluator_concurrent(tmp_path):
+    _session = _StubPowerBalance(tmp_path)
+    # Each simulation waits for the other, failing if they are serialised
+    _session.barrier = threading.Barrier(2, timeout=10)
+
+    with pbm_eval.ParallelEvaluator(_session, ["output"], workers=2) as evaluator:
+        _table = evaluator.evaluate([{"model.a": 1.0}, {"model.a": 2.0}])
+        assert _table["output"].tolist() == pytest.approx([8.0, 11.0])
+        assert not len(_session.solver_statistics)
+
+    assert len(set(_session.simulated)) == 2
+    # Worker solver statistics are merged into the session on closing
+    assert len(_session.solver_statistics) == 2
+
+
+@pytest.mark.sensitivity
+def test_parallel_evaluator_failures(tmp_path):
+    _session = _StubPowerBalance(tmp_path)
+
+    with pbm_eval.ParallelEvaluator(_session, ["output"], workers=3) as evaluator:
+        _table = evaluator.evaluate(
+            [{"model.a": -1.0}] + [{"model.a": float(i)} for i in range(4)]
+        )
+    assert np.isnan(_table["output"][0])
+    assert _table[pbm_eval.STATUS_COLUMN][0] == "ZeroDivisionError: division by zero"
+    assert _table["output"][1:].tolist() == pytest.approx([5.0, 8.0, 11.0, 14.0])
+    assert set(_table[pbm_eval.STATUS_COLUMN][1:]) == {"simulated"}
+
+    # Metrics which cannot be evaluated invalidate the point
+    with pbm_eval.ParallelEvaluator(_session, ["max(missing)"], workers=2) as evaluator:
+        _table = evaluator.evaluate([{"model.a": 1.0}, {"model.a": 2.0}])
+        assert _table["max(missing)"].isna().all()
+        assert all(
+            s.startswith("InvalidInputError") for s in _table[pbm_eval.STATUS_COLUMN]
+        )
+        # Failed points are not memoised
+        _table = evaluator.evaluate([{"model.a": 1.0}])
+        assert _table[pbm_eval.STATUS_COLUMN][0].startswith("InvalidInputError")
+
+
+@pytest.mark.sensitivity
+def test_select_parameters():
+    _parameters = {
+        "model.a": 2.0,
+        "model.flag": True,
+        "model.zero": 0.0,
+        "model.path": "file.mat",
+        "other.b": 3,
+    }
+    assert pbm_sens.select_parameters(_parameters) == ["model.a", "other.b"]
+    assert pbm_sens.select_parameters(_parameters, ["MODEL.*"]) == ["model.a"]
+
+
+@pytest.mark.sensitivity
+def test_parameter_bounds():
+    _bounds = pbm_sens.parameter_bounds(BASE, 0.1, {"Model.C": (0, 10)})
+    assert _bounds["model.a"] == pytest.approx((1.8, 2.2))
+    assert _bounds["model.b"] == (9, 11)
+    assert isinstance(_bounds["model.b"][0], int)
+    assert _bounds["model.c"] == (0.0, 10.0)
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_sens.parameter_bounds(BASE, 0.1, {"model.a": (3, 1)})
+
+
+@pytest.mark.sensitivity
+def test_oat():
+    _bounds = pbm_sens.parameter_bounds(BASE, 0.1)
+    _points = pbm_sens.oat_points(_bounds)
+    assert len(_points) == 2 * len(BASE) + 1
+    _report = pbm_sens.oat_report(BASE, _bounds, [_linear(p) for p in _points])
+    assert list(_report["parameter"]) == ["model.a", "model.b", "model.c"]
+    assert _report["swing"].tolist() == pytest.approx([1.2, 1.0, 0.0])
+    # Elasticity of 3a relative to 3a + 0.5b
+    assert _report["elasticity"][0] == pytest.approx(6 / 11)
+    assert "model.a" in pbm_sens.report_table(_report)
+
+
+@pytest.mark.sensitivity
+def test_morris():
+    _bounds = pbm_sens.parameter_bounds(BASE, 0.1, {"model.b": (0, 30)})
+    _points, _steps = pbm_sens.morris_points(_bounds, trajectories=6, seed=1)
+    assert len(_points) == 6 * (len(BASE) + 1)
+    assert len(_steps) == 6 * len(BASE)
+    _report = pbm_sens.morris_report(_bounds, _steps, [_linear(p) for p in _points])
+    assert list(_report["parameter"]) == ["model.b", "model.a", "model.c"]
+    # Effects of a linear function are the gradient times the range
+    assert _report["mu_star"].tolist() == pytest.approx([15.0, 1.2, 0.0])
+    assert _report["sigma"].tolist() == pytest.approx([0, 0, 0], abs=1e-9)
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_sens.morris_points(_bounds, levels=1)
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_sens.morris_points(_bounds, levels=5)
+    # Points remain within the bounds for any even number of levels
+    _points, _ = pbm_sens.morris_points(_bounds, trajectories=20, levels=6, seed=2)
+    for point in _points:
+        for name, (low, high) in _bounds.items():
+            assert low <= point[name] <= high
+
+
+@pytest.mark.sensitivity
+def test_plot_tornado():
+    _bounds = pbm_sens.parameter_bounds(BASE, 0.1)
+    _points = pbm_sens.oat_points(_bounds)
+    _report = pbm_sens.oat_report(BASE, _bounds, [_linear(p) for p in _points])
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, "tornado.jpg")
+        pbm_sens.plot_tornado(_report, _file, "netpowergeneration")
+        assert os.path.exists(_file)
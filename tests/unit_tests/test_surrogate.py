@@ -0,0 +1,121 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import power_balance.analysis.surrogate as pbm_surr
+import power_balance.exceptions as pbm_exc
+import power_balance.results.sweep as pbm_sweep
+
+PLASMA_SCENARIO = {
+    "plasma_ramp_up_start": 10,
+    "plasma_flat_top_start": 20,
+    "plasma_flat_top_end": 40,
+    "plasma_ramp_down_end": 50,
+}
+
+
+def _metric(a, b):
+    return np.sin(a) + 0.1 * b**1.5
+
+
+@pytest.fixture
+def sweep_data():
+    _a, _b = np.meshgrid(np.linspace(1, 3, 5), np.linspace(10, 20, 5))
+    _data = pd.DataFrame(
+        {
+            "model.a": _a.ravel(),
+            "model.b": _b.ravel().astype(int),
+            "model.c": 1.0,
+            "variant": "pulse",
+        }
+    )
+    _data["netpowergeneration"] = _metric(_data["model.a"], _data["model.b"])
+    _data["max(magnetpower)"] = _data["model.a"] * _data["model.b"]
+    return _data
+
+
+@pytest.mark.surrogate
+def test_training_data():
+    _time = np.linspace(0, 60, 61)
+    _frames = [
+        pd.DataFrame(
+            {
+                "time": _time,
+                "netpowergeneration": np.where((_time >= 20) & (_time < 40), a, 0.0),
+                "model.a": a,
+            }
+        )
+        for a in (1.0, 2.0, 3.0)
+    ]
+    _index = pbm_sweep.SweepIndex(pd.concat(_frames, ignore_index=True), ["model.a"])
+    _data = pbm_surr.training_data(
+        {"Tokamak.Interdependencies": _index},
+        ["netpowergeneration", "max(netpowergeneration)"],
+        PLASMA_SCENARIO,
+    )
+    assert _data["model.a"].tolist() == [1.0, 2.0, 3.0]
+    assert _data["netpowergeneration"].tolist() == pytest.approx([1.0, 2.0, 3.0])
+
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_surr.training_data(
+            {"Tokamak.Interdependencies": pbm_sweep.SweepIndex(_frames[0], [])},
+            ["netpowergeneration"],
+            PLASMA_SCENARIO,
+        )
+
+
+@pytest.mark.surrogate
+@pytest.mark.parametrize("method", list(pbm_surr.METHODS))
+def test_surrogate_methods(sweep_data, method):
+    _metrics = ["netpowergeneration", "max(magnetpower)"]
+    _surrogate = pbm_surr.Surrogate(sweep_data, _metrics, method)
+    assert _surrogate.inputs == ["model.a", "model.b"]
+
+    _prediction = _surrogate.predict({"Model.A": 2.2, "model.b": 13})
+    assert _prediction["netpowergeneration"][0] == pytest.approx(
+        _metric(2.2, 13), rel=1e-2
+    )
+    assert _prediction["max(magnetpower)"][0] == pytest.approx(28.6, rel=1e-2)
+
+    _cross_validation = _surrogate.cross_validation
+    assert list(_cross_validation.columns) == pbm_surr.CROSS_VALIDATION_COLUMNS
+    assert list(_cross_validation["metric"]) == _metrics
+    assert all(_cross_validation["nrmse"] < 0.05)
+
+
+@pytest.mark.surrogate
+def test_surrogate_save_load(sweep_data):
+    _surrogate = pbm_surr.Surrogate(
+        sweep_data, ["netpowergeneration", "max(magnetpower)"], "polynomial", degree=3
+    )
+    with tempfile.TemporaryDirectory() as tempd:
+        _file = os.path.join(tempd, pbm_surr.SURROGATE_FILE)
+        _surrogate.save(_file)
+        _loaded = pbm_surr.Surrogate.load(_file)
+
+    pd.testing.assert_frame_equal(
+        _loaded.predict(sweep_data), _surrogate.predict(sweep_data)
+    )
+    pd.testing.assert_frame_equal(_loaded.cross_validation, _surrogate.cross_validation)
+
+
+@pytest.mark.surrogate
+def test_surrogate_invalid(sweep_data):
+    _data = sweep_data.drop(columns="max(magnetpower)")
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_surr.Surrogate(_data, ["netpowergeneration"], "spline")
+    # No sweep parameter varies
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_surr.Surrogate(
+            _data.drop(columns=["model.a", "model.b"]), ["netpowergeneration"]
+        )
+    # More polynomial terms than sweep cuts
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_surr.Surrogate(
+            _data.iloc[:3], ["netpowergeneration"], "polynomial", degree=3
+        )
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_surr.Surrogate(_data, ["netpowergeneration"]).predict({"model.a": 2.0})
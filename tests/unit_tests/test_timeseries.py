@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+import power_balance.exceptions as pbm_exc
+import power_balance.profiles.timeseries as pbm_ts
+from power_balance.profiles import read_profile_to_df
+
+PLASMA_SCENARIO = {
+    "plasma_ramp_up_start": 10,
+    "plasma_flat_top_start": 20,
+    "plasma_flat_top_end": 40,
+    "plasma_ramp_down_end": 50,
+}
+
+
+@pytest.mark.timeseries
+def test_profile_memoised(generate_profiles):
+    _file = os.path.join(generate_profiles, "ThermalPowerOut.mat")
+    _series = pbm_ts.read_profile(_file)
+    assert pbm_ts.read_profile(_file) is _series
+    assert not _series.values.flags.writeable
+    assert np.array_equal(read_profile_to_df(_file)["value"], _series.values)
+
+
+@pytest.mark.timeseries
+def test_profile_missing():
+    with pytest.raises(FileNotFoundError):
+        pbm_ts.read_profile("not_a_file.mat")
+
+
+@pytest.mark.timeseries
+def test_phases():
+    _series = pbm_ts.TimeSeries(np.linspace(0, 60, 601), np.arange(601.0))
+    _phases = _series.phases(PLASMA_SCENARIO)
+    assert list(_phases) == list(pbm_ts.PLASMA_PHASES)
+    assert _phases["flat_top"] == slice(200, 400)
+    assert _phases["premagnetisation"] == slice(None, 100)
+    _flat_top = _series.flat_top(PLASMA_SCENARIO)
+    assert _flat_top.time[0] == pytest.approx(20)
+    assert len(_flat_top) == 200
+
+
+@pytest.mark.timeseries
+def test_unsorted_series():
+    _series = pbm_ts.TimeSeries(np.array([2.0, 0.0, 1.0]), np.array([4.0, 0.0, 2.0]))
+    assert np.array_equal(_series.time, [0.0, 1.0, 2.0])
+    assert np.array_equal(_series.values, [0.0, 2.0, 4.0])
+    with pytest.raises(pbm_exc.InvalidInputError):
+        _series.index(1.5)
+
+
+@pytest.mark.timeseries
+def test_is_equidistant():
+    assert pbm_ts.is_equidistant(np.linspace(0, 60, 601))
+    assert not pbm_ts.is_equidistant(np.array([0.0, 1.0, 1.0, 2.0]))
+    assert not pbm_ts.is_equidistant(np.array([0.0, 1.0, 3.0]))
+
+
+@pytest.mark.timeseries
+def test_trapezoid_average_discontinuity():
+    # Step from 0 to 4 at t=2 represented by a repeated time point
+    _time = np.array([0.0, 2.0, 2.0, 5.0, 6.0])
+    _values = np.array([[0.0, 0.0, 4.0, 4.0, 4.0], [1.0, 1.0, 1.0, 1.0, 1.0]])
+    assert np.allclose(pbm_ts.trapezoid_average(_time, _values, 1, 3), [2, 1])
+    assert np.allclose(pbm_ts.trapezoid_average(_time, _values, 2, 6), [4, 1])
+    assert np.allclose(pbm_ts.trapezoid_average(_time, _values, 0, 2), [0, 1])
+
+
+@pytest.mark.timeseries
+def test_trapezoid_average_outside():
+    with pytest.raises(pbm_exc.InvalidInputError):
+        pbm_ts.trapezoid_average(np.arange(5.0), np.arange(5.0), 6, 8)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from power_balance.tuning import SolverTuner, compare_averages, flat_top_averages
+
+PLASMA_SCENARIO = {
+    "plasma_ramp_up_start": 10,
+    "plasma_flat_top_start": 20,
+    "plasma_flat_top_end": 40,
+    "plasma_ramp_down_end": 50,
+}
+
+
+@pytest.mark.tuning
+def test_flat_top_averages():
+    _time = np.linspace(0, 60, 601)
+    _data = pd.DataFrame(
+        {
+            "time": _time,
+            "magnetpower": np.where((_time >= 20) & (_time < 40), 5.0, 1.0),
+            "label": ["a"] * len(_time),
+        }
+    )
+    _averages = flat_top_averages(_data, PLASMA_SCENARIO)
+    assert list(_averages.index) == ["magnetpower"]
+    assert _averages["magnetpower"] == pytest.approx(5.0)
+
+
+@pytest.mark.tuning
+def test_compare_averages():
+    _reference = pd.Series({"a": 100.0, "b": 0.5, "c": 10.0})
+    _errors = compare_averages(pd.Series({"a": 102.0, "b": 0.9}), _reference, 1.0)
+    assert _errors["a"] == pytest.approx(0.02)
+    # Differences within the absolute tolerance are not errors
+    assert _errors["b"] == 0.0
+    # Outputs missing from the candidate are never acceptable
+    assert np.isinf(_errors["c"])
+
+
+@pytest.mark.tuning
+def test_recommend():
+    _report = pd.DataFrame(
+        {
+            "solver": ["euler", "ida", "dassl"],
+            "tolerance": [1e-4, 1e-6, 1e-12],
+            "time": [0.5, 1.0, 2.0],
+            "speedup": [4.0, 2.0, 1.0],
+            "max_error": [0.1, 1e-4, 0.0],
+            "worst_output": ["model.a", "model.a", ""],
+            "acceptable": [False, True, True],
+            "status": ["outside bounds", "ok", "reference"],
+        }
+    )
+    assert SolverTuner.recommend(_report) == {"solver": "ida", "tolerance": 1e-6}
+    _table = SolverTuner.report_table(_report)
+    assert "outside bounds" in _table
+    assert "1e-06" in _table
+
+
+class _StubSession:
+    """Session simulating an output whose error grows with the tolerance"""
+
+    plasma_scenario = PLASMA_SCENARIO
+
+    def __init__(self):
+        self._options = {"solver": "dassl", "tolerance": 1e-6}
+
+    def get_simulation_options(self, option_names=None):
+        if isinstance(option_names, list):
+            return [self._options[i] for i in option_names]
+        return self._options[option_names] if option_names else self._options
+
+    def set_simulation_options(self, **options):
+        self._options.update(options)
+
+    def _run_models(self):
+        _time = np.linspace(0, 60, 61)
+        _power = 100.0 * (1.0 + self._options["tolerance"])
+        return {"model": pd.DataFrame({"time": _time, "magnetpower": _power})}
+
+
+@pytest.mark.tuning
+def test_solver_tuner():
+    _session = _StubSession()
+    _tuner = SolverTuner(_session, rtol=1e-3, atol=1e-3)
+    _report = _tuner.run(solvers=["euler"], tolerances=[1e-4, 1e-2])
+
+    assert _report["status"].tolist().count("reference") == 1
+    _entries = _report.set_index("tolerance")
+    assert bool(_entries.loc[1e-4, "acceptable"])
+    assert not bool(_entries.loc[1e-2, "acceptable"])
+    # Simulation options of the session are restored
+    assert _session.get_simulation_options() == {"solver": "dassl", "tolerance": 1e-6}
@@ -5,7 +5,9 @@ import pydantic
 import pytest
 import toml
 
+from power_balance.configs import config_default
 from power_balance.validation.config import ConfigModel
+from power_balance.validation.manifest import ManifestModel
 from power_balance.validation.modelica_simulation_options import (
     PlasmaScenario,
     SimOptsModel,
@@ -49,6 +51,28 @@ def test_config_validator_pass():
     ConfigModel(**_config)
 
 
+@pytest.mark.validation
+def test_config_output_grid():
+    _config = toml.load(_GOOD_CONFIG)
+    _config["output_grid"] = "events"
+    _model = ConfigModel(**_config)
+    assert _model.profile_format == "knots"
+    assert 'profile_format = "knots"' in toml.dumps(_model.model_dump())
+    _config["profile_format"] = "dense"
+    with pytest.raises(pydantic.ValidationError):
+        ConfigModel(**_config)
+
+
+@pytest.mark.validation
+def test_config_surrogate():
+    _config = toml.load(_GOOD_CONFIG)
+    _config["surrogate"] = {"metrics": ["max(magnetpower)"], "method": "gp"}
+    assert ConfigModel(**_config).surrogate.folds == 5
+    _config["surrogate"]["method"] = "spline"
+    with pytest.raises(pydantic.ValidationError):
+        ConfigModel(**_config)
+
+
 @pytest.mark.validation
 def test_simopts_validator_pass():
     _config = toml.load(_GOOD_SIMOPTS)
@@ -116,3 +140,15 @@ def test_plasma_validator_fail():
     _test["not_an_option"] = 10
     with pytest.raises(pydantic.ValidationError):
         PlasmaScenario(**_test)
+
+
+@pytest.mark.validation
+def test_manifest_validator():
+    _manifest = ManifestModel(entries=[{"name": "base"}, {"param_dir": "params"}])
+    assert [entry.name for entry in _manifest.entries] == ["base", "entry_1"]
+    assert _manifest.entries[1].config == config_default
+    for entries in ([], [{"name": "base"}, {"name": "base"}]):
+        with pytest.raises(pydantic.ValidationError):
+            ManifestModel(entries=entries)
+    with pytest.raises(pydantic.ValidationError):
+        ManifestModel(workers=0, entries=[{}])